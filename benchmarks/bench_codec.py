@@ -0,0 +1,72 @@
+"""Micro-benchmark: decoding depth messages and encoding order bodies per JSON codec.
+
+Usage:
+    python benchmarks/bench_codec.py [iterations]
+"""
+
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from weex_sdk.codec import CODECS, get_codec
+
+DEPTH_MESSAGE = json.dumps(
+    {
+        "event": "payload",
+        "channel": "depth.cmt_btcusdt.200",
+        "data": [
+            {
+                "startVersion": "1716710918113",
+                "endVersion": "1716710918114",
+                "depthType": "CHANGED",
+                "asks": [[f"{50000 + i * 0.1:.1f}", f"{0.01 * (i + 1):.3f}"] for i in range(200)],
+                "bids": [[f"{49999 - i * 0.1:.1f}", f"{0.01 * (i + 1):.3f}"] for i in range(200)],
+            }
+        ],
+    }
+)
+ORDER_BODY = {
+    "symbol": "cmt_btcusdt",
+    "client_oid": "grid_open_cmt_btcusdt_1716710918113_50000",
+    "size": "0.01",
+    "type": "1",
+    "order_type": "0",
+    "match_price": "0",
+    "price": "50000",
+}
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+    print(f"iterations: {iterations}")
+    baseline = None
+    for name in CODECS:
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            print(f"{name:>6}: not installed")
+            continue
+
+        loads_t = min(
+            timeit.repeat(lambda: codec.loads(DEPTH_MESSAGE), number=iterations, repeat=3)
+        )
+        dumps_t = min(timeit.repeat(lambda: codec.dumps(ORDER_BODY), number=iterations, repeat=3))
+        if name == "json":
+            baseline = (loads_t, dumps_t)
+        print(
+            f"{name:>6}: loads {loads_t / iterations * 1e6:8.3f} us/op, "
+            f"dumps {dumps_t / iterations * 1e6:8.3f} us/op"
+        )
+
+    # Compare against the stdlib as used before (json.loads / json.dumps(...).encode())
+    if baseline:
+        best = get_codec()
+        loads_t = min(timeit.repeat(lambda: best.loads(DEPTH_MESSAGE), number=iterations, repeat=3))
+        print(f"default ({best.name}) loads speedup over json: {baseline[0] / loads_t:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
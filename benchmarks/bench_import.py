@@ -0,0 +1,103 @@
+"""Import-time benchmark: cost of importing weex_sdk and its public entry points.
+
+Runs each statement in a fresh interpreter with ``python -X importtime`` and
+reports the cumulative import time of the top-level modules it loaded, minus
+the interpreter's own startup imports.
+
+Usage:
+    python benchmarks/bench_import.py [runs]
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict, List, Set
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+STATEMENTS = [
+    "import weex_sdk",
+    "from weex_sdk import WeexClient",
+    "from weex_sdk import AsyncWeexClient; AsyncWeexClient('k', 's', 'p')",
+    "from weex_sdk import WeexWebSocket",
+    "from weex_sdk import AsyncWeexWebSocket",
+]
+
+# Modules that must not be loaded by a bare "import weex_sdk"
+HEAVY_MODULES = ["requests", "aiohttp", "asyncio", "websocket", "websockets"]
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    """Run the statement in a fresh interpreter and collect top-level import times.
+
+    Args:
+        statement: Python statement to run
+
+    Returns:
+        Mapping of top-level module name to cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Top-level entries have exactly one space after the separator
+        if name.startswith(" ") and not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def import_time_us(statement: str, startup: Set[str]) -> int:
+    """Get the import time of a statement, excluding interpreter startup imports.
+
+    Args:
+        statement: Python statement to run
+        startup: Top-level modules imported by the bare interpreter
+
+    Returns:
+        Cumulative import time in microseconds
+    """
+    return sum(us for name, us in import_times(statement).items() if name not in startup)
+
+
+def loaded_heavy_modules(statement: str) -> List[str]:
+    """List heavy modules loaded by a statement.
+
+    Args:
+        statement: Python statement to run
+
+    Returns:
+        Names of HEAVY_MODULES present in sys.modules afterwards
+    """
+    check = (
+        f"import sys; {statement}; "
+        f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", check], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return result.stdout.split()
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    startup = set(import_times("pass"))
+    timings: Dict[str, int] = {}
+    for statement in STATEMENTS:
+        timings[statement] = min(import_time_us(statement, startup) for _ in range(runs))
+
+    print(f"runs: {runs} (best of)")
+    for statement, elapsed in timings.items():
+        print(f"{elapsed / 1000:8.1f} ms  {statement}  {loaded_heavy_modules(statement)}")
+
+
+if __name__ == "__main__":
+    main()
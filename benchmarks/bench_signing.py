@@ -0,0 +1,68 @@
+"""Micro-benchmark: per-request signing and header building, old vs new path.
+
+Usage:
+    python benchmarks/bench_signing.py [iterations]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from weex_sdk.auth import SignatureGenerator, Signer
+
+API_KEY = "bench_api_key_0123456789"
+SECRET_KEY = "bench_secret_key_0123456789abcdef"
+PASSPHRASE = "bench_passphrase"
+PATH = "/capi/v2/order/placeOrder"
+BODY = (
+    '{"symbol": "cmt_btcusdt", "client_oid": "grid_open_cmt_btcusdt_1716710918113_50000", '
+    '"size": "0.01", "type": "1", "order_type": "0", "match_price": "0", "price": "50000"}'
+)
+TIMESTAMP = "1716710918113"
+
+
+def legacy_headers() -> dict:
+    """Header building as done before Signer (fresh HMAC and dict per call)."""
+    signature = SignatureGenerator.generate_signature(
+        secret_key=SECRET_KEY,
+        timestamp=TIMESTAMP,
+        method="POST",
+        request_path=PATH,
+        body=BODY,
+    )
+    return {
+        "ACCESS-KEY": API_KEY,
+        "ACCESS-SIGN": signature,
+        "ACCESS-TIMESTAMP": TIMESTAMP,
+        "ACCESS-PASSPHRASE": PASSPHRASE,
+        "Content-Type": "application/json",
+        "locale": "en-US",
+    }
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    signer = Signer(API_KEY, SECRET_KEY, PASSPHRASE)
+    body_bytes = BODY.encode("utf-8")
+
+    new = signer.get_headers("POST", PATH, body=body_bytes, timestamp=TIMESTAMP)
+    assert new["ACCESS-SIGN"] == legacy_headers()["ACCESS-SIGN"]
+
+    old_t = min(timeit.repeat(legacy_headers, number=iterations, repeat=3))
+    new_t = min(
+        timeit.repeat(
+            lambda: signer.get_headers("POST", PATH, body=body_bytes, timestamp=TIMESTAMP),
+            number=iterations,
+            repeat=3,
+        )
+    )
+
+    print(f"iterations: {iterations}")
+    print(f"legacy: {old_t / iterations * 1e6:8.3f} us/op")
+    print(f"signer: {new_t / iterations * 1e6:8.3f} us/op")
+    print(f"speedup: {old_t / new_t:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -34,6 +34,12 @@ setup(
     python_requires=">=3.8",
     install_requires=requirements,
     extras_require={
+        "fast": [
+            "orjson>=3.6.0",
+        ],
+        "frames": [
+            "numpy>=1.20",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "black>=23.0.0",
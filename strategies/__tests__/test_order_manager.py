@@ -0,0 +1,51 @@
+"""Unit tests for OrderManager."""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from strategies.grid_level import GridLevel, GridState
+from strategies.order_manager import MAX_CLIENT_OID_LENGTH, OrderManager
+from weex_sdk.api.trade import TradeAPI
+
+
+class FakeClient:
+    """Client answering batchOrders with one order ID per client_oid."""
+
+    def __init__(self):
+        self.trade = TradeAPI(self)
+        self.sent = []
+
+    def post(self, path, data=None):
+        orders = data["orderDataList"]
+        self.sent.extend(orders)
+        return {
+            "order_info": [
+                {"order_id": f"id-{i}", "client_oid": order["client_oid"], "result": True}
+                for i, order in enumerate(orders)
+            ],
+            "result": True,
+        }
+
+
+class TestOrderManager:
+    """Test OrderManager order placement."""
+
+    def test_batch_client_oids_are_unique(self):
+        """Test grids priced below 1 in one batch get distinct client order IDs."""
+        client = FakeClient()
+        manager = OrderManager(client, "cmt_dogeusdt", margin_mode=1)
+        grids = [GridLevel(price=0.100 + i * 0.001, size=100, direction="long") for i in range(4)]
+
+        assert manager.place_open_orders(grids) == 4
+
+        oids = [order["client_oid"] for order in client.sent]
+        assert len(set(oids)) == 4
+        assert all(len(oid) <= MAX_CLIENT_OID_LENGTH for oid in oids)
+        assert len({grid.open_order_id for grid in grids}) == 4
+        assert all(grid.state == GridState.OPENING for grid in grids)
+
+    def test_client_oid_fits_exchange_limit(self):
+        """Test long symbols are shortened to keep the ID within 40 characters."""
+        manager = OrderManager(FakeClient(), "cmt_1000000shibusdt", margin_mode=1)
+        assert len(manager._generate_client_oid("close")) <= MAX_CLIENT_OID_LENGTH
@@ -90,7 +90,7 @@ class GridStrategy:
 
         if state_file is None:
             state_file = f"grid_strategy_{symbol}_{direction}_{int(time.time())}.json"
-        self.state_manager = StateManager(state_file)
+        self.state_manager = StateManager(state_file, json_codec=client.codec)
 
         logger.info(
             f"GridStrategy initialized: {symbol} {direction} "
@@ -149,15 +149,10 @@ class GridStrategy:
         logger.info("=" * 60)
 
     def _fetch_tick_size(self) -> None:
-        """Fetch tick size from contract info."""
+        """Fetch tick size from the client's contract registry."""
         try:
-            contracts = self.client.market.get_contracts(symbol=self.symbol)
-            if contracts and len(contracts) > 0:
-                self._tick_size = float(contracts[0].get("tick_size", "0.01"))
-                logger.info(f"Fetched tick_size for {self.symbol}: {self._tick_size}")
-            else:
-                logger.warning(f"Could not fetch tick_size, using default: 0.01")
-                self._tick_size = 0.01
+            self._tick_size = self.client.contracts.get(self.symbol).price_step
+            logger.info(f"Fetched tick_size for {self.symbol}: {self._tick_size}")
         except Exception as e:
             logger.error(f"Error fetching tick_size: {e}, using default: 0.01")
             self._tick_size = 0.01
@@ -261,14 +256,7 @@ class GridStrategy:
         """Place initial opening orders for all grid levels."""
         logger.info("Placing initial opening orders...")
 
-        success_count = 0
-        for grid in self._grid_levels:
-            if grid.state == GridState.EMPTY:
-                order_id = self.order_manager.place_open_order(grid)
-                if order_id:
-                    success_count += 1
-                else:
-                    logger.error(f"Failed to place order at {grid.price}")
+        success_count = self.order_manager.place_open_orders(self._grid_levels)
 
         logger.info(f"Placed {success_count}/{len(self._grid_levels)} initial orders")
         return success_count == len(self._grid_levels)
@@ -416,18 +404,17 @@ class GridStrategy:
         """Rebuild grid when price moves outside current range."""
         logger.info("Rebuilding grid...")
 
-        cancel_failed = False
-        for grid in self._grid_levels:
-            if grid.state in [GridState.EMPTY, GridState.OPENING]:
-                if grid.open_order_id:
-                    cancel_success = self.order_manager.cancel_order(grid.open_order_id)
-                    if not cancel_success:
-                        logger.warning(f"Failed to cancel order {grid.open_order_id}")
-                        cancel_failed = True
-                    grid.open_order_id = None
-                grid.state = GridState.EMPTY
+        open_grids = [
+            grid for grid in self._grid_levels if grid.state in [GridState.EMPTY, GridState.OPENING]
+        ]
+        cancelled = self.order_manager.cancel_orders(
+            [grid.open_order_id for grid in open_grids if grid.open_order_id]
+        )
+        for grid in open_grids:
+            grid.open_order_id = None
+            grid.state = GridState.EMPTY
 
-        if cancel_failed:
+        if not all(cancelled.values()):
             logger.warning("Some orders failed to cancel during grid rebuild")
 
         new_lower, new_upper, new_prices = PriceCalculator.calculate_grid_prices(
@@ -474,9 +461,7 @@ class GridStrategy:
 
         self._grid_levels = new_grid_levels
 
-        for grid in self._grid_levels:
-            if grid.state == GridState.EMPTY:
-                self.order_manager.place_open_order(grid)
+        self.order_manager.place_open_orders(self._grid_levels)
 
         self._save_state()
 
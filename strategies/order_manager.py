@@ -1,6 +1,8 @@
 """Order management for grid strategy."""
 
+import itertools
 import time
+import uuid
 from typing import List, Optional, Dict
 from weex_sdk import WeexClient
 from weex_sdk.logger import get_logger
@@ -9,6 +11,9 @@ from .grid_level import GridLevel, GridState
 
 logger = get_logger("grid_strategy.order_manager")
 
+# Exchange limit for client order IDs
+MAX_CLIENT_OID_LENGTH = 40
+
 
 class OrderManager:
     """Manages orders for grid strategy."""
@@ -26,6 +31,9 @@ class OrderManager:
         self.client = client
         self.symbol = symbol
         self.margin_mode = margin_mode
+        # Tells apart managers creating orders in the same millisecond
+        self._oid_tag = uuid.uuid4().hex[:3]
+        self._oid_sequence = itertools.count()
         logger.info(f"OrderManager initialized for {symbol}")
 
     def place_open_order(self, grid: GridLevel) -> Optional[str]:
@@ -42,7 +50,7 @@ class OrderManager:
             return None
 
         try:
-            client_oid = self._generate_client_oid("open", grid.price)
+            client_oid = self._generate_client_oid("open")
 
             result = self.client.trade.place_order(
                 symbol=self.symbol,
@@ -71,6 +79,51 @@ class OrderManager:
             logger.error(f"Failed to place open order at {grid.price}: {e}")
             return None
 
+    def place_open_orders(self, grids: List[GridLevel]) -> int:
+        """Place opening orders for several grid levels with batch requests.
+
+        Args:
+            grids: GridLevel objects; levels that are not empty are skipped
+
+        Returns:
+            Number of orders placed
+        """
+        pending = [grid for grid in grids if grid.state == GridState.EMPTY]
+        if not pending:
+            return 0
+
+        orders = [
+            {
+                "client_oid": self._generate_client_oid("open"),
+                "size": str(grid.size),
+                "order_type": "0",
+                "match_price": "0",
+                "price": str(grid.price),
+                "type": self.ORDER_TYPE[grid.direction]["open"],
+            }
+            for grid in pending
+        ]
+        result = self.client.trade.place_orders_bulk(
+            self.symbol, orders, margin_mode=self.margin_mode
+        )
+
+        placed = 0
+        for grid, outcome in zip(pending, result.outcomes):
+            if outcome.success and outcome.order_id:
+                grid.open_order_id = outcome.order_id
+                grid.state = GridState.OPENING
+                placed += 1
+            else:
+                logger.error(
+                    f"Failed to place open order at {grid.price}: "
+                    f"[{outcome.error_code}] {outcome.error_message}"
+                )
+        logger.info(
+            f"Placed {placed}/{len(pending)} {self.symbol} open orders "
+            f"in {result.requests} batch requests"
+        )
+        return placed
+
     def place_close_order(self, grid: GridLevel, target_price: float) -> Optional[str]:
         """Place closing order for a grid level.
 
@@ -88,7 +141,7 @@ class OrderManager:
             return None
 
         try:
-            client_oid = self._generate_client_oid("close", grid.price)
+            client_oid = self._generate_client_oid("close")
 
             result = self.client.trade.place_order(
                 symbol=self.symbol,
@@ -136,6 +189,26 @@ class OrderManager:
             logger.error(f"Failed to cancel order {order_id}: {e}")
             return False
 
+    def cancel_orders(self, order_ids: List[str]) -> Dict[str, bool]:
+        """Cancel several orders with concurrent batch requests.
+
+        Args:
+            order_ids: Order IDs to cancel
+
+        Returns:
+            Whether each order was cancelled, by order ID
+        """
+        if not order_ids:
+            return {}
+
+        outcomes = self.client.trade.cancel_orders_bulk(order_ids=order_ids)
+        for order_id, outcome in outcomes.items():
+            if not outcome.success:
+                logger.error(f"Failed to cancel order {order_id}: {outcome.error_message}")
+        cancelled = sum(outcome.success for outcome in outcomes.values())
+        logger.info(f"Cancelled {cancelled}/{len(outcomes)} orders")
+        return {order_id: outcome.success for order_id, outcome in outcomes.items()}
+
     def cancel_all_orders(self) -> bool:
         """Cancel all open orders for symbol.
 
@@ -225,15 +298,25 @@ class OrderManager:
             logger.error(f"Failed to calculate floating PnL: {e}")
             return 0.0
 
-    def _generate_client_oid(self, order_type: str, price: float) -> str:
+    def _generate_client_oid(self, order_type: str) -> str:
         """Generate unique client order ID.
 
+        The millisecond timestamp is followed by a random tag of this manager
+        and a sequence number, so orders built in the same millisecond, such
+        as one batch, never share an ID. The symbol is shortened to keep the
+        ID within the exchange's 40 character limit.
+
         Args:
             order_type: 'open' or 'close'
-            price: Order price
 
         Returns:
             Client order ID string
         """
         timestamp = int(time.time() * 1000)
-        return f"grid_{order_type}_{self.symbol}_{timestamp}_{int(price)}"
+        sequence = next(self._oid_sequence) % 10000
+        prefix = f"grid_{order_type}_"
+        suffix = f"_{timestamp}{self._oid_tag}{sequence:04d}"
+        symbol = self.symbol.replace("cmt_", "")[
+            : MAX_CLIENT_OID_LENGTH - len(prefix) - len(suffix)
+        ]
+        return f"{prefix}{symbol}{suffix}"
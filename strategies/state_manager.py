@@ -1,9 +1,9 @@
 """State persistence management for grid strategy."""
 
-import json
 import os
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Union
 from .grid_level import GridLevel
+from weex_sdk.codec import JsonCodec, get_codec
 from weex_sdk.logger import get_logger
 
 logger = get_logger("grid_strategy.state_manager")
@@ -12,13 +12,15 @@ logger = get_logger("grid_strategy.state_manager")
 class StateManager:
     """Manages strategy state persistence."""
 
-    def __init__(self, state_file: str):
+    def __init__(self, state_file: str, json_codec: Union[None, str, JsonCodec] = None):
         """Initialize StateManager.
 
         Args:
             state_file: Path to state file
+            json_codec: JSON codec instance or backend name (default: fastest installed)
         """
         self.state_file = state_file
+        self.codec = get_codec(json_codec)
         logger.info(f"StateManager initialized with state file: {state_file}")
 
     def save(
@@ -79,8 +81,8 @@ class StateManager:
             }
 
             temp_file = self.state_file + ".tmp"
-            with open(temp_file, "w") as f:
-                json.dump(state, f, indent=2)
+            with open(temp_file, "wb") as f:
+                f.write(self.codec.dumps(state, pretty=True))
 
             os.rename(temp_file, self.state_file)
 
@@ -102,8 +104,8 @@ class StateManager:
                 logger.info(f"State file not found: {self.state_file}")
                 return None
 
-            with open(self.state_file, "r") as f:
-                state = json.load(f)
+            with open(self.state_file, "rb") as f:
+                state = self.codec.loads(f.read())
 
             grid_levels = [
                 GridLevel.from_dict(level_data) for level_data in state.get("grid_levels", [])
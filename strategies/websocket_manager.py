@@ -22,10 +22,16 @@ class WebSocketManager:
         self._position_callback: Optional[Callable] = None
         logger.info("WebSocketManager initialized")
 
-    def connect(self) -> None:
-        """Connect WebSocket."""
+    def connect(self, timeout: float = 10.0) -> None:
+        """Start the WebSocket on its background thread and wait for the connection.
+
+        Args:
+            timeout: Seconds to wait for the connection (default: 10)
+        """
         logger.info("Connecting WebSocket...")
-        self.ws.connect()
+        self.ws.start()
+        if not self.ws.wait_connected(timeout):
+            logger.warning("WebSocket not connected yet; subscriptions are sent once it is")
 
     def subscribe_ticker(self, symbol: str, callback: Callable[[Dict[str, Any]], None]) -> None:
         """Subscribe to ticker updates.
@@ -69,4 +75,4 @@ class WebSocketManager:
     def close(self) -> None:
         """Close WebSocket connection."""
         logger.info("Closing WebSocket connection...")
-        self.ws.close()
+        self.ws.stop(timeout=5.0)
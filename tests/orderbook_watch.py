@@ -6,9 +6,10 @@ import argparse
 import sys
 import threading
 import time
-from typing import Dict, Iterable, Optional, Tuple
+from typing import Dict, Optional
 
 from weex_sdk import WeexWebSocket
+from weex_sdk.orderbook import OrderBook as LocalOrderBook
 
 
 def _format_number(value: Optional[float | str | int]) -> str:
@@ -31,49 +32,16 @@ def _format_number(value: Optional[float | str | int]) -> str:
         return str(value)
 
 
-def _parse_level(entry: object) -> Optional[Tuple[float, float]]:
-    if isinstance(entry, dict):
-        price = entry.get("price")
-        size = entry.get("size")
-    elif isinstance(entry, (list, tuple)) and len(entry) >= 2:
-        price, size = entry[0], entry[1]
-    else:
-        return None
+class OrderBook(LocalOrderBook):
+    """Local order book that renders its top levels to the terminal."""
 
-    try:
-        return float(price), float(size)
-    except (TypeError, ValueError):
-        return None
-
-
-class OrderBook:
-    def __init__(self, levels: int = 5) -> None:
+    def __init__(
+        self, symbol: Optional[str] = None, levels: int = 5, max_levels: Optional[int] = None
+    ) -> None:
+        super().__init__(symbol, max_levels=max_levels)
         self.levels = levels
-        self.asks: Dict[float, float] = {}
-        self.bids: Dict[float, float] = {}
-        self.ready = False
         self.last_render = 0.0
 
-    def apply_snapshot(self, asks: Iterable[object], bids: Iterable[object]) -> None:
-        self.asks = self._build_side(asks)
-        self.bids = self._build_side(bids)
-        self.ready = True
-
-    def apply_changes(self, asks: Iterable[object], bids: Iterable[object]) -> None:
-        self._update_side(self.asks, asks)
-        self._update_side(self.bids, bids)
-
-    def best_prices(self) -> Tuple[Optional[float], Optional[float]]:
-        if not self.asks or not self.bids:
-            return None, None
-        return min(self.asks), max(self.bids)
-
-    def top_asks(self) -> Iterable[Tuple[float, float]]:
-        return sorted(self.asks.items())[: self.levels]
-
-    def top_bids(self) -> Iterable[Tuple[float, float]]:
-        return sorted(self.bids.items(), key=lambda item: item[0], reverse=True)[: self.levels]
-
     def render(self, symbol: str, trades: Optional[list[dict]] = None) -> None:
         if not self.ready:
             return
@@ -82,13 +50,11 @@ class OrderBook:
             return
         self.last_render = now
 
-        best_ask, best_bid = self.best_prices()
-        spread_text = (
-            _format_number(best_ask - best_bid) if best_ask is not None and best_bid is not None else "N/A"
-        )
+        spread = self.spread()
+        spread_text = _format_number(spread) if spread is not None else "N/A"
 
-        asks = list(self.top_asks())
-        bids = list(self.top_bids())
+        asks = self.top_asks(self.levels)
+        bids = self.top_bids(self.levels)
 
         lines = [
             f"Symbol: {symbol}  Spread: {spread_text}",
@@ -150,28 +116,6 @@ class OrderBook:
 
         sys.stdout.flush()
 
-    def _build_side(self, levels: Iterable[object]) -> Dict[float, float]:
-        side: Dict[float, float] = {}
-        for entry in levels:
-            parsed = _parse_level(entry)
-            if not parsed:
-                continue
-            price, size = parsed
-            if size > 0:
-                side[price] = size
-        return side
-
-    def _update_side(self, side: Dict[float, float], updates: Iterable[object]) -> None:
-        for entry in updates:
-            parsed = _parse_level(entry)
-            if not parsed:
-                continue
-            price, size = parsed
-            if size <= 0:
-                side.pop(price, None)
-            else:
-                side[price] = size
-
 
 class TradeHistory:
     """Manages recent trade history."""
@@ -195,18 +139,25 @@ class TradeHistory:
 
 
 def _run_self_test() -> None:
-    book = OrderBook(levels=5)
+    book = OrderBook("cmt_btcusdt", levels=5)
     book.apply_snapshot(
         asks=[{"price": "101", "size": "1"}, {"price": "102", "size": "2"}],
         bids=[{"price": "99", "size": "3"}, {"price": "98", "size": "4"}],
     )
-    best_ask, best_bid = book.best_prices()
-    assert best_ask == 101.0
-    assert best_bid == 99.0
-
-    book.apply_changes(
-        asks=[{"price": "101", "size": "0"}, {"price": "103", "size": "5"}],
-        bids=[{"price": "98", "size": "0"}, {"price": "100", "size": "6"}],
+    assert book.best_ask() == (101.0, 1.0)
+    assert book.best_bid() == (99.0, 3.0)
+
+    book.apply_message(
+        {
+            "data": [
+                {
+                    "symbol": "cmt_btcusdt",
+                    "depthType": "CHANGED",
+                    "asks": [{"price": "101", "size": "0"}, {"price": "103", "size": "5"}],
+                    "bids": [{"price": "98", "size": "0"}, {"price": "100", "size": "6"}],
+                }
+            ]
+        }
     )
     asks = dict(book.top_asks())
     bids = dict(book.top_bids())
@@ -231,24 +182,11 @@ def main() -> None:
         _run_self_test()
         return
 
-    book = OrderBook(levels=max(1, args.levels))
+    book = OrderBook(args.symbol, levels=max(1, args.levels), max_levels=15)
     trade_history = TradeHistory(max_trades=5)
     ws = WeexWebSocket(is_private=False)
 
-    def on_depth(message: Dict[str, object]) -> None:
-        data_list = message.get("data") if isinstance(message, dict) else None
-        if not data_list:
-            return
-        for payload in data_list:
-            if not isinstance(payload, dict):
-                continue
-            depth_type = payload.get("depthType")
-            asks = payload.get("asks", [])
-            bids = payload.get("bids", [])
-            if depth_type == "SNAPSHOT" or not book.ready:
-                book.apply_snapshot(asks, bids)
-            else:
-                book.apply_changes(asks, bids)
+    def on_book(book: OrderBook) -> None:
         book.render(args.symbol, trade_history.get_trades())
 
     def on_trade(message: Dict[str, object]) -> None:
@@ -262,17 +200,13 @@ def main() -> None:
         if book.ready:
             book.render(args.symbol, trade_history.get_trades())
 
-    thread = threading.Thread(target=ws.connect, daemon=True)
-    thread.start()
-
-    start_time = time.monotonic()
-    while not ws.connected:
-        if time.monotonic() - start_time > 10:
-            ws.close()
-            raise RuntimeError("WebSocket connection timeout")
-        time.sleep(0.1)
+    ws.start()
+    if not ws.wait_connected(timeout=10):
+        ws.stop()
+        raise RuntimeError("WebSocket connection timeout")
 
-    ws.subscribe_depth(args.symbol, limit=15, callback=on_depth)
+    # Resubscribes for a new snapshot when an update is missed
+    ws.subscribe_order_book(args.symbol, limit=15, callback=on_book, book=book)
     ws.subscribe_trades(args.symbol, callback=on_trade)
 
     try:
@@ -281,7 +215,7 @@ def main() -> None:
     except KeyboardInterrupt:
         pass
     finally:
-        ws.close()
+        ws.stop()
 
 
 if __name__ == "__main__":
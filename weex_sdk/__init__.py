@@ -1,28 +1,95 @@
-"""Weex SDK - A comprehensive Python SDK for Weex exchange API."""
-
-from weex_sdk.api.account import AccountAPI, AsyncAccountAPI
-from weex_sdk.api.ai import AIAPI, AsyncAIAPI
-from weex_sdk.api.market import AsyncMarketAPI, MarketAPI
-from weex_sdk.api.trade import AsyncTradeAPI, TradeAPI
-from weex_sdk.client import AsyncWeexClient, WeexClient
-from weex_sdk.exceptions import (
-    WeexAPIError,
-    WeexAuthenticationError,
-    WeexNetworkError,
-    WeexRateLimitError,
-    WeexValidationError,
-    WeexWebSocketError,
-)
-from weex_sdk.websocket import AsyncWeexWebSocket, WeexWebSocket
+"""Weex SDK - A comprehensive Python SDK for Weex exchange API.
+
+Public names are imported on first access, so ``import weex_sdk`` stays
+cheap and only the transports that are actually used (requests, aiohttp,
+websocket-client, websockets) get loaded.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
 __version__ = "1.0.10"
 
+# Public name -> module defining it
+_LAZY_IMPORTS: Dict[str, str] = {
+    # Clients
+    "WeexClient": "weex_sdk.client",
+    "AsyncWeexClient": "weex_sdk.async_client",
+    "WeexWebSocket": "weex_sdk.websocket",
+    "AsyncWeexWebSocket": "weex_sdk.async_websocket",
+    "CallbackDispatcher": "weex_sdk.dispatch",
+    "AsyncCallbackDispatcher": "weex_sdk.dispatch",
+    "Delivery": "weex_sdk.dispatch",
+    "RateLimiter": "weex_sdk.ratelimit",
+    "RetryPolicy": "weex_sdk.retry",
+    "ResponseCache": "weex_sdk.cache",
+    "JsonCodec": "weex_sdk.codec",
+    "ClockSync": "weex_sdk.clock",
+    "CandleDownloader": "weex_sdk.downloader",
+    "ContractRegistry": "weex_sdk.contracts",
+    "OrderBook": "weex_sdk.orderbook",
+    # Exceptions
+    "WeexAPIError": "weex_sdk.exceptions",
+    "WeexAuthenticationError": "weex_sdk.exceptions",
+    "WeexRateLimitError": "weex_sdk.exceptions",
+    "WeexNetworkError": "weex_sdk.exceptions",
+    "WeexWebSocketError": "weex_sdk.exceptions",
+    "WeexValidationError": "weex_sdk.exceptions",
+    # API modules
+    "AccountAPI": "weex_sdk.api.account",
+    "AsyncAccountAPI": "weex_sdk.api.account",
+    "MarketAPI": "weex_sdk.api.market",
+    "AsyncMarketAPI": "weex_sdk.api.market",
+    "TradeAPI": "weex_sdk.api.trade",
+    "AsyncTradeAPI": "weex_sdk.api.trade",
+    "AIAPI": "weex_sdk.api.ai",
+    "AsyncAIAPI": "weex_sdk.api.ai",
+}
+
+if TYPE_CHECKING:
+    from weex_sdk.api.account import AccountAPI, AsyncAccountAPI
+    from weex_sdk.api.ai import AIAPI, AsyncAIAPI
+    from weex_sdk.api.market import AsyncMarketAPI, MarketAPI
+    from weex_sdk.api.trade import AsyncTradeAPI, TradeAPI
+    from weex_sdk.async_client import AsyncWeexClient
+    from weex_sdk.async_websocket import AsyncWeexWebSocket
+    from weex_sdk.cache import ResponseCache
+    from weex_sdk.client import WeexClient
+    from weex_sdk.clock import ClockSync
+    from weex_sdk.codec import JsonCodec
+    from weex_sdk.contracts import ContractRegistry
+    from weex_sdk.dispatch import AsyncCallbackDispatcher, CallbackDispatcher, Delivery
+    from weex_sdk.downloader import CandleDownloader
+    from weex_sdk.exceptions import (
+        WeexAPIError,
+        WeexAuthenticationError,
+        WeexNetworkError,
+        WeexRateLimitError,
+        WeexValidationError,
+        WeexWebSocketError,
+    )
+    from weex_sdk.orderbook import OrderBook
+    from weex_sdk.ratelimit import RateLimiter
+    from weex_sdk.retry import RetryPolicy
+    from weex_sdk.websocket import WeexWebSocket
+
 __all__ = [
     # Clients
     "WeexClient",
     "AsyncWeexClient",
     "WeexWebSocket",
     "AsyncWeexWebSocket",
+    "CallbackDispatcher",
+    "AsyncCallbackDispatcher",
+    "Delivery",
+    "RateLimiter",
+    "RetryPolicy",
+    "ResponseCache",
+    "JsonCodec",
+    "ClockSync",
+    "CandleDownloader",
+    "ContractRegistry",
+    "OrderBook",
     # Exceptions
     "WeexAPIError",
     "WeexAuthenticationError",
@@ -40,3 +107,20 @@ __all__ = [
     "AIAPI",
     "AsyncAIAPI",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_path), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes including lazily imported names."""
+    return sorted(set(globals()) | set(__all__))
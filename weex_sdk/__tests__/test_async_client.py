@@ -0,0 +1,141 @@
+"""Unit tests for AsyncWeexClient session handling."""
+
+import asyncio
+import os
+import sys
+from typing import Any, List
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from weex_sdk.async_client import AsyncResponse, AsyncWeexClient
+from weex_sdk.codec import JsonCodec
+
+
+class TaggingCodec(JsonCodec):
+    """Codec marking every decoded object so its use can be observed."""
+
+    name = "tagging"
+
+    def loads(self, data: Any) -> Any:
+        decoded = super().loads(data)
+        decoded["decoded_by"] = self.name
+        return decoded
+
+
+def run_with_server(scenario: Any) -> Any:
+    """Run scenario(client, ports) against a local server and return its result.
+
+    ports collects the client-side port of every request, so reused
+    connections show up as repeated ports.
+    """
+    ports: List[int] = []
+
+    async def server_time(request: web.Request) -> web.Response:
+        ports.append(request.transport.get_extra_info("peername")[1])
+        return web.json_response({"epoch": "1700000000.000"})
+
+    async def main() -> Any:
+        app = web.Application()
+        app.router.add_get("/capi/v2/market/time", server_time)
+        async with TestServer(app) as server:
+            client = AsyncWeexClient(
+                "key", "secret", "pass", base_url=str(server.make_url("")), json_codec="json"
+            )
+            try:
+                return await scenario(client, ports)
+            finally:
+                await client.close()
+
+    return asyncio.run(main())
+
+
+class TestSessionLifecycle:
+    """Test that one session and connector serve the client until it is closed."""
+
+    def test_open_reuses_session_until_closed(self):
+        """Test open() is idempotent, close() releases the connector and reopening works."""
+
+        async def scenario(client, ports):
+            session = await client.open()
+            assert await client.open() is session
+            connector = session.connector
+            assert connector.limit == client.connector_limit
+            assert connector.limit_per_host == client.connector_limit_per_host
+
+            await client.close()
+            assert client.session is None and session.closed and connector.closed
+            await client.close()
+
+            reopened = await client.open()
+            assert reopened is not session and not reopened.closed
+
+        run_with_server(scenario)
+
+    def test_context_manager_closes_session(self):
+        """Test leaving the async context closes the session."""
+
+        async def scenario(client, ports):
+            async with client as entered:
+                session = entered.session
+                assert entered is client and not session.closed
+            assert client.session is None and session.closed
+
+        run_with_server(scenario)
+
+    def test_requests_share_the_connector(self):
+        """Test sequential requests reuse one pooled connection."""
+
+        async def scenario(client, ports):
+            for _ in range(3):
+                await client.market.get_server_time()
+            return ports
+
+        ports = run_with_server(scenario)
+        assert len(ports) == 3 and len(set(ports)) == 1
+
+
+class TestWarmup:
+    """Test connection warmup for the async client."""
+
+    def test_warmed_connections_are_reused(self):
+        """Test warmup opens concurrent connections that later requests pick up."""
+
+        async def scenario(client, ports):
+            opened = await client.warmup(connections=3)
+            warmed = set(ports)
+            await client.market.get_server_time()
+            return opened, warmed, ports[-1]
+
+        opened, warmed, last_port = run_with_server(scenario)
+        assert opened == 3 and len(warmed) == 3
+        assert last_port in warmed
+
+    def test_failed_warmup_returns_zero(self):
+        """Test requests that cannot connect are not counted as warmed."""
+
+        async def scenario(client, ports):
+            client.base_url = "http://127.0.0.1:9"
+            return await client.warmup(connections=2)
+
+        assert run_with_server(scenario) == 0
+
+
+class TestAsyncResponse:
+    """Test the buffered response adapter."""
+
+    def test_json_uses_client_codec(self):
+        """Test responses decode with the codec of the client that sent the request."""
+
+        async def scenario(client, ports):
+            client.codec = TaggingCodec()
+            session = await client.open()
+            async with session.get(f"{client.base_url}/capi/v2/market/time") as response:
+                content = await response.read()
+            buffered = AsyncResponse(response.status, content, response.headers, client.codec)
+            return buffered.json(), await client.market.get_server_time()
+
+        decoded, parsed = run_with_server(scenario)
+        assert decoded["decoded_by"] == "tagging"
+        assert parsed["decoded_by"] == "tagging"
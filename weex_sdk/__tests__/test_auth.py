@@ -0,0 +1,75 @@
+"""Unit tests for request signing."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from weex_sdk.auth import RequestHeaders, SignatureGenerator, Signer
+
+
+class TestSigner:
+    """Test Signer against the reference SignatureGenerator."""
+
+    def setup_method(self):
+        self.signer = Signer("key", "secret", "pass", locale="zh-CN")
+
+    def test_rest_signature_matches_reference(self):
+        """Test GET and POST signatures match the stateless implementation."""
+        headers = self.signer.get_headers(
+            "get",
+            "/capi/v2/market/depth",
+            query_string="symbol=cmt_btcusdt&limit=15",
+            timestamp="1716710918113",
+        )
+        expected = SignatureGenerator.generate_signature(
+            "secret",
+            "1716710918113",
+            "GET",
+            "/capi/v2/market/depth",
+            query_string="symbol=cmt_btcusdt&limit=15",
+        )
+        assert headers["ACCESS-SIGN"] == expected
+
+        body = '{"symbol": "cmt_btcusdt"}'
+        headers = self.signer.get_headers(
+            "POST", "/capi/v2/order/placeOrder", body=body.encode("utf-8"), timestamp="1"
+        )
+        expected = SignatureGenerator.generate_signature(
+            "secret", "1", "POST", "/capi/v2/order/placeOrder", body=body
+        )
+        assert headers["ACCESS-SIGN"] == expected
+
+    def test_signing_does_not_mutate_keyed_state(self):
+        """Test repeated signing of the same message is stable."""
+        message = Signer.build_message("1", "GET", "/path")
+        assert self.signer.sign(message) == self.signer.sign(message)
+
+    def test_headers_template(self):
+        """Test static headers are present and template is not shared."""
+        first = self.signer.get_headers("GET", "/a", timestamp="1")
+        first["ACCESS-KEY"] = "changed"
+        second = self.signer.get_headers("GET", "/a", timestamp="2")
+        assert second["ACCESS-KEY"] == "key"
+        assert second["ACCESS-PASSPHRASE"] == "pass"
+        assert second["locale"] == "zh-CN"
+        assert second["ACCESS-TIMESTAMP"] == "2"
+
+    def test_websocket_signature_matches_reference(self):
+        """Test WebSocket signature matches the stateless implementation."""
+        headers = self.signer.get_websocket_headers(timestamp="1716710918113")
+        expected = SignatureGenerator.generate_websocket_signature("secret", "1716710918113")
+        assert headers["ACCESS-SIGN"] == expected
+        assert headers["User-Agent"] == "weex-sdk-python"
+
+    def test_request_headers_delegates(self):
+        """Test RequestHeaders keeps its interface on top of Signer."""
+        builder = RequestHeaders("key", "secret", "pass")
+        headers = builder.get_headers("GET", "/capi/v2/market/time")
+        assert set(headers) == {
+            "ACCESS-KEY",
+            "ACCESS-SIGN",
+            "ACCESS-TIMESTAMP",
+            "ACCESS-PASSPHRASE",
+            "Content-Type",
+            "locale",
+        }
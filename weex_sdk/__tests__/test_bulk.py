@@ -0,0 +1,169 @@
+"""Unit tests for bulk order placement."""
+
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from weex_sdk.api.trade import AsyncTradeAPI, TradeAPI
+from weex_sdk.exceptions import WeexNetworkError
+
+
+def make_orders(count):
+    return [
+        {
+            "client_oid": f"oid-{i}",
+            "size": "1",
+            "type": "1",
+            "order_type": "0",
+            "match_price": "0",
+            "price": str(100 + i),
+        }
+        for i in range(count)
+    ]
+
+
+def batch_response(data, fail_chunk_with=None, reject=()):
+    """Build a batchOrders response, answering entries in reverse order."""
+    orders = data["orderDataList"]
+    if fail_chunk_with and any(o["client_oid"] == fail_chunk_with for o in orders):
+        raise WeexNetworkError("timeout")
+    info = [
+        {
+            "order_id": None if o["client_oid"] in reject else f"id-{o['client_oid']}",
+            "client_oid": o["client_oid"],
+            "result": o["client_oid"] not in reject,
+            "error_code": "40015" if o["client_oid"] in reject else "",
+            "error_message": "rejected" if o["client_oid"] in reject else "",
+        }
+        for o in orders
+    ]
+    return {"order_info": info[::-1], "result": True}
+
+
+class FakeClient:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.sizes = []
+        self.threads = set()
+
+    def post(self, path, data=None):
+        assert path == "/capi/v2/order/batchOrders"
+        self.sizes.append(len(data["orderDataList"]))
+        self.threads.add(threading.get_ident())
+        return batch_response(data, **self.kwargs)
+
+
+class FakeAsyncClient(FakeClient):
+    async def post(self, path, data=None):
+        await asyncio.sleep(0)
+        return FakeClient.post(self, path, data)
+
+
+class TestPlaceOrdersBulk:
+    """Test chunking, merging and partial failures."""
+
+    def test_chunks_and_merges_in_input_order(self):
+        """Test 45 orders are sent as 20/20/5 and outcomes keep input order."""
+        client = FakeClient()
+        result = TradeAPI(client).place_orders_bulk("cmt_btcusdt", make_orders(45))
+
+        assert sorted(client.sizes) == [5, 20, 20]
+        assert result.requests == 3
+        assert result.ok
+        assert [o.client_oid for o in result.outcomes] == [f"oid-{i}" for i in range(45)]
+        assert result.by_client_oid()["oid-7"].order_id == "id-oid-7"
+
+    def test_partial_failures(self):
+        """Test rejected orders and failed chunks are reported per order."""
+        client = FakeClient(fail_chunk_with="oid-25", reject={"oid-3"})
+        result = TradeAPI(client).place_orders_bulk("cmt_btcusdt", make_orders(30))
+
+        failed = {o.client_oid: o for o in result.failed}
+        assert set(failed) == {"oid-3"} | {f"oid-{i}" for i in range(20, 30)}
+        assert failed["oid-3"].error_code == "40015"
+        assert failed["oid-25"].error_message == "timeout"
+        assert len(result.errors) == 1
+        assert len(result.succeeded) == 19
+
+    def test_duplicate_client_oids_rejected(self):
+        """Test orders sharing a client_oid are refused before anything is sent."""
+        client = FakeClient()
+        orders = make_orders(3)
+        orders[2]["client_oid"] = "oid-0"
+        with pytest.raises(ValueError, match="oid-0"):
+            TradeAPI(client).place_orders_bulk("cmt_btcusdt", orders)
+        assert client.sizes == []
+
+    def test_batch_orders_limit(self):
+        """Test batch_orders refuses more than 20 orders."""
+        with pytest.raises(ValueError):
+            TradeAPI(FakeClient()).batch_orders("cmt_btcusdt", make_orders(21))
+
+    def test_async(self):
+        """Test the async variant merges results the same way."""
+        client = FakeAsyncClient(reject={"oid-40"})
+        result = asyncio.run(
+            AsyncTradeAPI(client).place_orders_bulk("cmt_btcusdt", make_orders(41), concurrency=2)
+        )
+        assert client.sizes == [20, 20, 1]
+        assert [o.client_oid for o in result.failed] == ["oid-40"]
+
+
+class FakeCancelClient:
+    """Answer cancel_batch_orders, failing IDs listed in ``fail``."""
+
+    def __init__(self, fail=(), error_on=None):
+        self.fail = set(fail)
+        self.error_on = error_on
+        self.requests = []
+
+    def post(self, path, data=None):
+        assert path == "/capi/v2/order/cancel_batch_orders"
+        self.requests.append(data)
+        key, ids = ("order_id", data["ids"]) if "ids" in data else ("client_oid", data["cids"])
+        if self.error_on in ids:
+            raise WeexNetworkError("timeout")
+        return {
+            "result": True,
+            "cancelOrderResultList": [
+                {key: i, "result": i not in self.fail, "err_msg": "not found" * (i in self.fail)}
+                for i in ids
+                if i != "ghost"
+            ],
+            "failInfos": [],
+        }
+
+
+class TestCancelOrdersBulk:
+    """Test chunked bulk cancellation."""
+
+    def test_outcome_per_id(self):
+        """Test every ID gets an outcome across chunks and ID kinds."""
+        client = FakeCancelClient(fail={"o3"}, error_on="o25")
+        ids = ["ghost"] + [f"o{i}" for i in range(30)] + ["o1"]
+        outcomes = TradeAPI(client).cancel_orders_bulk(order_ids=ids, client_oids=["c1"])
+
+        assert len(client.requests) == 3
+        assert len(outcomes) == 32
+        assert outcomes["o1"].success and outcomes["c1"].client_oid == "c1"
+        assert outcomes["o3"].error_message == "not found"
+        assert outcomes["o25"].error_message == "timeout"
+        assert outcomes["ghost"].error_message == "Order missing from response"
+        # 19 of the first chunk minus o3, plus c1; the second chunk failed
+        assert sum(o.success for o in outcomes.values()) == 18 + 1
+
+    def test_async(self):
+        """Test the async variant returns the same outcome map."""
+
+        class AsyncClient(FakeCancelClient):
+            async def post(self, path, data=None):
+                return FakeCancelClient.post(self, path, data)
+
+        outcomes = asyncio.run(
+            AsyncTradeAPI(AsyncClient(fail={"c2"})).cancel_orders_bulk(client_oids=["c1", "c2"])
+        )
+        assert {k: o.success for k, o in outcomes.items()} == {"c1": True, "c2": False}
@@ -0,0 +1,129 @@
+"""Unit tests for the response cache."""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from weex_sdk.cache import ResponseCache
+from weex_sdk.exceptions import WeexNetworkError
+
+TICKERS = "/capi/v2/market/tickers"
+ORDERS = "/capi/v2/order/current"
+
+
+class TestResponseCache:
+    """Test TTLs, LRU eviction and single-flight loading."""
+
+    def test_ttl_and_uncached_paths(self):
+        """Test cached paths are served until expiry and others always load."""
+        cache = ResponseCache(ttls={TICKERS: 0.05})
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return len(calls)
+
+        assert cache.fetch(TICKERS, None, loader) == 1
+        assert cache.fetch(TICKERS, None, loader) == 1
+        assert cache.fetch(ORDERS, None, loader) == 2
+        time.sleep(0.06)
+        assert cache.fetch(TICKERS, None, loader) == 3
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+
+    def test_key_ignores_param_order_and_separates_namespaces(self):
+        """Test parameter order does not matter but namespaces do."""
+        cache = ResponseCache(ttls={TICKERS: 60})
+        assert cache.fetch(TICKERS, {"a": 1, "b": 2}, lambda: "x") == "x"
+        assert cache.fetch(TICKERS, {"b": 2, "a": 1}, lambda: "y") == "x"
+        assert cache.fetch(TICKERS, {"a": 1, "b": 2}, lambda: "z", namespace="k2") == "z"
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first."""
+        cache = ResponseCache(ttls={TICKERS: 60}, max_entries=2)
+        cache.fetch(TICKERS, {"s": 1}, lambda: 1)
+        cache.fetch(TICKERS, {"s": 2}, lambda: 2)
+        cache.fetch(TICKERS, {"s": 1}, lambda: None)  # refresh recency of s=1
+        cache.fetch(TICKERS, {"s": 3}, lambda: 3)
+        assert cache.fetch(TICKERS, {"s": 1}, lambda: "reloaded") == 1
+        assert cache.fetch(TICKERS, {"s": 2}, lambda: "reloaded") == "reloaded"
+        assert cache.stats()["evictions"] == 2
+
+    def test_threads_share_one_request(self):
+        """Test concurrent threads coalesce onto one in-flight request."""
+        cache = ResponseCache(ttls={TICKERS: 60})
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            release.wait(1)
+            return "tickers"
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(cache.fetch, TICKERS, None, loader) for _ in range(8)]
+            time.sleep(0.05)
+            release.set()
+            assert [f.result() for f in futures] == ["tickers"] * 8
+        assert len(calls) == 1
+        assert cache.stats()["coalesced"] == 7
+
+    def test_errors_are_shared_and_not_cached(self):
+        """Test every waiter sees the error and the next call retries."""
+        cache = ResponseCache(ttls={TICKERS: 60})
+
+        def failing():
+            raise WeexNetworkError("down")
+
+        with pytest.raises(WeexNetworkError):
+            cache.fetch(TICKERS, None, failing)
+        assert cache.fetch(TICKERS, None, lambda: "ok") == "ok"
+
+    def test_async_tasks_share_one_request(self):
+        """Test concurrent tasks coalesce and a cancelled waiter does not cancel others."""
+        cache = ResponseCache(ttls={TICKERS: 60})
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "tickers"
+
+        async def main():
+            tasks = [
+                asyncio.ensure_future(cache.fetch_async(TICKERS, None, loader)) for _ in range(5)
+            ]
+            await asyncio.sleep(0)
+            tasks[0].cancel()
+            results = await asyncio.gather(*tasks[1:])
+            return results, await cache.fetch_async(TICKERS, None, loader)
+
+        results, cached = asyncio.run(main())
+        assert results == ["tickers"] * 4
+        assert cached == "tickers"
+        assert len(calls) == 1
+
+
+class TestClientCache:
+    """Test the client routes GETs through its cache."""
+
+    def test_get_uses_cache(self):
+        """Test repeated cacheable GETs send one request."""
+        from weex_sdk.client import WeexClient
+
+        client = WeexClient("key", "secret", "pass", response_cache=True)
+        sent = []
+        client._request = lambda method, path, params=None, data=None: sent.append(path) or path
+        client.market.get_tickers()
+        client.market.get_tickers()
+        client.get(ORDERS)
+        client.get(ORDERS)
+        assert sent == [TICKERS, ORDERS, ORDERS]
+        assert client.response_cache.stats()["hits"] == 1
+        client.close()
@@ -0,0 +1,257 @@
+"""Unit tests for WeexClient request handling."""
+
+import json
+import os
+import socket
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from weex_sdk.auth import SignatureGenerator
+from weex_sdk.client import TunedHTTPAdapter, WeexClient
+from weex_sdk.exceptions import WeexAPIError
+from weex_sdk.retry import RetryPolicy
+from weex_sdk.utils.helpers import build_query_string
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, payload: Any, status_code: int = 200) -> None:
+        self.status_code = status_code
+        self.text = json.dumps(payload)
+        self.content = self.text.encode("utf-8")
+        self.headers: Dict[str, str] = {}
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class FakeSession:
+    """Record outgoing requests and replay canned responses."""
+
+    def __init__(self, responses: List[FakeResponse]) -> None:
+        self.responses = responses
+        self.calls: List[Dict[str, Any]] = []
+
+    def request(self, method: str, url: str, **kwargs: Any) -> FakeResponse:
+        self.calls.append({"method": method, "url": url, **kwargs})
+        return self.responses.pop(0)
+
+    def close(self) -> None:
+        pass
+
+
+def make_client(responses: List[FakeResponse], **kwargs: Any) -> WeexClient:
+    client = WeexClient("key", "secret", "pass", base_url="https://example.test", **kwargs)
+    client.session = FakeSession(responses)
+    return client
+
+
+class TestRequestPreparation:
+    """Test that the signed bytes are exactly the bytes sent."""
+
+    def test_build_query_string(self):
+        """Test canonical query encoding."""
+        params = {"symbol": "cmt_btcusdt", "skip": None, "ids": [1, 2], "q": "a b&c"}
+        assert build_query_string(params) == "symbol=cmt_btcusdt&ids=1&ids=2&q=a%20b%26c"
+        assert build_query_string({}) == ""
+        assert build_query_string(None) == ""
+
+    def test_get_sends_signed_query(self):
+        """Test GET sends the pre-built URL without re-encoding params."""
+        client = make_client([FakeResponse({"ok": True})])
+        client.get("/capi/v2/market/depth", params={"symbol": "cmt_btcusdt", "limit": 15})
+
+        call = client.session.calls[0]
+        assert (
+            call["url"] == "https://example.test/capi/v2/market/depth?symbol=cmt_btcusdt&limit=15"
+        )
+        assert "params" not in call
+        assert call["data"] == b""
+        headers = call["headers"]
+        expected = SignatureGenerator.generate_signature(
+            "secret",
+            headers["ACCESS-TIMESTAMP"],
+            "GET",
+            "/capi/v2/market/depth",
+            query_string="symbol=cmt_btcusdt&limit=15",
+        )
+        assert headers["ACCESS-SIGN"] == expected
+
+    def test_post_sends_signed_body(self):
+        """Test POST sends the exact body bytes that were signed."""
+        client = make_client([FakeResponse({"order_id": "1"})])
+        client.post("/capi/v2/order/placeOrder", data={"symbol": "cmt_btcusdt"})
+
+        call = client.session.calls[0]
+        headers = call["headers"]
+        expected = SignatureGenerator.generate_signature(
+            "secret",
+            headers["ACCESS-TIMESTAMP"],
+            "POST",
+            "/capi/v2/order/placeOrder",
+            body=call["data"].decode("utf-8"),
+        )
+        assert headers["ACCESS-SIGN"] == expected
+
+
+class TestRetry:
+    """Test retry behaviour for transient failures."""
+
+    def make_client(self, responses: List[FakeResponse]) -> WeexClient:
+        return make_client(responses, retry_policy=RetryPolicy(backoff_base=0, jitter=0))
+
+    def test_get_is_retried(self):
+        """Test GET requests are retried on retryable status codes."""
+        client = self.make_client([FakeResponse({"msg": "busy"}, 503), FakeResponse({"ok": 1})])
+        assert client.get("/capi/v2/market/time") == {"ok": 1}
+        assert len(client.session.calls) == 2
+
+    def test_post_without_client_oid_is_not_retried(self):
+        """Test non-idempotent POST requests fail on the first error."""
+        client = self.make_client([FakeResponse({"msg": "busy"}, 503), FakeResponse({})])
+        with pytest.raises(WeexAPIError) as exc_info:
+            client.post("/capi/v2/order/cancel_order", data={"orderId": "1"})
+        assert exc_info.value.status_code == 503
+        assert len(client.session.calls) == 1
+
+    def test_post_with_client_oid_is_retried(self):
+        """Test POST requests carrying a client order ID are retried."""
+        client = self.make_client([FakeResponse({"msg": "busy"}, 502), FakeResponse({"id": 1})])
+        assert client.post("/capi/v2/order/placeOrder", data={"client_oid": "a"}) == {"id": 1}
+        assert len(client.session.calls) == 2
+
+    def test_client_errors_are_not_retried(self):
+        """Test 4xx validation errors are raised immediately."""
+        client = self.make_client([FakeResponse({"code": "40017", "msg": "bad"}, 400)])
+        with pytest.raises(WeexAPIError):
+            client.get("/capi/v2/market/depth")
+        assert len(client.session.calls) == 1
+
+    def test_gives_up_after_max_attempts(self):
+        """Test retries stop at max_attempts."""
+        client = self.make_client([FakeResponse({}, 500) for _ in range(3)])
+        with pytest.raises(WeexAPIError):
+            client.get("/capi/v2/market/time")
+        assert len(client.session.calls) == 3
+
+    def test_is_idempotent(self):
+        """Test batch orders are idempotent only if every order has a client ID."""
+        batch = {"orderDataList": [{"client_oid": "a"}, {"client_oid": "b"}]}
+        assert RetryPolicy.is_idempotent("POST", batch)
+        batch["orderDataList"].append({"size": "1"})
+        assert not RetryPolicy.is_idempotent("POST", batch)
+
+
+class WarmupSession:
+    """Answer warmup GETs, failing the first ``failures`` of them."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.urls: List[str] = []
+        self.lock = threading.Lock()
+
+    def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        with self.lock:
+            self.urls.append(url)
+            if len(self.urls) <= self.failures:
+                raise requests.exceptions.ConnectionError("refused")
+        return FakeResponse({"epoch": "1"})
+
+
+class TestConnectionPool:
+    """Test connection pool configuration and warmup."""
+
+    def test_adapter_uses_pool_settings(self):
+        """Test both schemes mount one adapter configured with the pool sizes."""
+        client = WeexClient(
+            "key", "secret", "pass", pool_connections=3, pool_maxsize=7, pool_block=True
+        )
+        adapter = client.session.get_adapter("https://api-contract.weex.com")
+        assert isinstance(adapter, TunedHTTPAdapter)
+        assert client.session.get_adapter("http://example.test") is adapter
+        assert adapter.poolmanager.pools._maxsize == 3
+        pool_kw = adapter.poolmanager.connection_pool_kw
+        assert pool_kw["maxsize"] == 7 and pool_kw["block"] is True
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in pool_kw["socket_options"]
+        assert adapter.max_retries.total == 0
+        assert client.session.headers["Connection"] == "keep-alive"
+
+    def test_keep_alive_disabled(self):
+        """Test disabling keep-alive drops the socket options and closes connections."""
+        client = WeexClient("key", "secret", "pass", keep_alive=False, tcp_nodelay=False)
+        adapter = client.session.get_adapter("https://api-contract.weex.com")
+        assert adapter.poolmanager.connection_pool_kw["socket_options"] == []
+        assert client.session.headers["Connection"] == "close"
+
+    def test_warmup_returns_opened_connections(self):
+        """Test warmup hits the public endpoint once per connection."""
+        client = make_client([])
+        client.session = WarmupSession()
+        assert client.warmup(connections=4) == 4
+        assert client.session.urls == ["https://example.test/capi/v2/market/time"] * 4
+
+    def test_warmup_counts_only_successes(self):
+        """Test failed warmup requests are logged and not counted."""
+        client = make_client([])
+        client.session = WarmupSession(failures=2)
+        assert client.warmup(connections=3) == 1
+        client.session = WarmupSession(failures=1)
+        assert client.warmup() == 0
+
+    def test_warmup_is_capped_at_pool_size(self):
+        """Test warmup never opens more connections than the pool keeps."""
+        client = make_client([], pool_maxsize=2)
+        client.session = WarmupSession()
+        assert client.warmup(connections=5) == 2
+        assert len(client.session.urls) == 2
+        assert client.warmup(connections=0) == 0
+
+
+class TestApiModules:
+    """Test API module properties."""
+
+    def test_api_modules_are_cached(self):
+        """Test each property returns the same instance bound to its client."""
+        client = make_client([])
+        assert client.trade is client.trade
+        assert client.market is client.market
+        assert client.trade.client is client
+        assert make_client([]).trade is not client.trade
+
+    def test_concurrent_access_creates_one_instance(self):
+        """Test threads racing on first access share a single instance."""
+        client = make_client([])
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            apis = list(executor.map(lambda _: client.account, range(32)))
+        assert all(api is apis[0] for api in apis)
+
+    @pytest.mark.parametrize(
+        "module, name",
+        [
+            ("account", "AccountAPI"),
+            ("ai", "AIAPI"),
+            ("market", "MarketAPI"),
+            ("trade", "TradeAPI"),
+        ],
+    )
+    def test_async_api_matches_sync_api(self, module, name):
+        """Test every public sync API method has an async twin with the same parameters."""
+        import importlib
+        import inspect
+
+        api = importlib.import_module(f"weex_sdk.api.{module}")
+        sync_cls, async_cls = getattr(api, name), getattr(api, f"Async{name}")
+        for method, func in inspect.getmembers(sync_cls, inspect.isfunction):
+            if method.startswith("_"):
+                continue
+            assert hasattr(async_cls, method), f"{async_cls.__name__}.{method} is missing"
+            assert list(inspect.signature(func).parameters) == list(
+                inspect.signature(getattr(async_cls, method)).parameters
+            ), f"{async_cls.__name__}.{method} parameters differ"
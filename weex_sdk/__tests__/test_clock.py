@@ -0,0 +1,78 @@
+"""Unit tests for server clock synchronization."""
+
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from weex_sdk.auth import Signer
+from weex_sdk.clock import ClockSync, parse_server_time
+from weex_sdk.exceptions import WeexNetworkError
+
+
+def make_client(skew: float = 0.0, fail: bool = False):
+    """Build a stand-in client whose server clock runs `skew` seconds ahead."""
+
+    def get_server_time():
+        if fail:
+            raise WeexNetworkError("down")
+        return {"timestamp": int((time.time() + skew) * 1000)}
+
+    return SimpleNamespace(market=SimpleNamespace(get_server_time=get_server_time))
+
+
+class TestClockSync:
+    """Test offset estimation and timestamp generation."""
+
+    def test_lowest_rtt_samples_win(self):
+        """Test slow round trips do not skew the estimate."""
+        clock = ClockSync(make_client(), best_samples=2)
+        server = clock.local_time() + 2.0
+        mono = time.monotonic()
+        clock.add_sample(mono - 0.010, mono, server - 0.005)  # rtt 10ms, offset ~2.0
+        clock.add_sample(mono - 0.020, mono, server - 0.010)  # rtt 20ms, offset ~2.0
+        clock.add_sample(mono - 1.000, mono, server + 0.400)  # rtt 1s, asymmetric delay
+        assert clock.offset == pytest.approx(2.0, abs=0.001)
+        assert clock.rtt == pytest.approx(0.010)
+        assert clock.metrics()["samples"] == 3
+
+    def test_sync(self):
+        """Test sync measures the server offset and feeds the signer."""
+        clock = ClockSync(make_client(skew=-30.0))
+        clock.sync()
+        assert clock.offset == pytest.approx(-30.0, abs=0.05)
+        assert clock.metrics()["syncs"] == 1
+
+        signer = Signer("key", "secret", "pass", timestamp_provider=clock.timestamp)
+        timestamp = int(signer.get_headers("GET", "/capi/v2/market/time")["ACCESS-TIMESTAMP"])
+        assert timestamp == pytest.approx((time.time() - 30.0) * 1000, abs=100)
+
+    def test_sync_async(self):
+        """Test async sync awaits the client's server time call."""
+
+        async def get_server_time():
+            return {"timestamp": int((time.time() + 5.0) * 1000)}
+
+        client = SimpleNamespace(market=SimpleNamespace(get_server_time=get_server_time))
+        clock = ClockSync(client, samples_per_sync=2)
+        asyncio.run(clock.sync_async())
+        assert clock.offset == pytest.approx(5.0, abs=0.05)
+
+    def test_sync_failure(self):
+        """Test a sync without any successful sample raises and is counted."""
+        clock = ClockSync(make_client(fail=True), samples_per_sync=2)
+        with pytest.raises(WeexNetworkError):
+            clock.sync()
+        assert clock.metrics()["failures"] == 1
+        assert clock.offset == 0.0
+
+    def test_parse_server_time(self):
+        """Test server time parsing from the documented response fields."""
+        assert parse_server_time({"timestamp": 1716710918113}) == 1716710918.113
+        assert parse_server_time({"epoch": "1716710918.113"}) == 1716710918.113
+        with pytest.raises(ValueError):
+            parse_server_time({})
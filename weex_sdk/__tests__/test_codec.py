@@ -0,0 +1,56 @@
+"""Unit tests for JSON codecs."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from weex_sdk.codec import CODECS, JsonCodec, get_codec
+
+
+def installed_codecs():
+    codecs = []
+    for name in CODECS:
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            pass
+    return codecs
+
+
+@pytest.mark.parametrize("codec", installed_codecs(), ids=lambda codec: codec.name)
+class TestCodec:
+    """Test every installed backend behaves the same."""
+
+    def test_round_trip(self, codec):
+        """Test bytes, str and memoryview input decode identically."""
+        obj = {"symbol": "cmt_btcusdt", "size": "0.01", "levels": [[1.5, 2]], "note": "é"}
+        encoded = codec.dumps(obj)
+        assert isinstance(encoded, bytes)
+        assert b" " not in encoded
+        assert codec.loads(encoded) == obj
+        assert codec.loads(encoded.decode("utf-8")) == obj
+        assert codec.loads(memoryview(encoded)) == obj
+        assert codec.dumps_text(obj) == encoded.decode("utf-8")
+
+    def test_pretty(self, codec):
+        """Test pretty output is indented and still decodes."""
+        encoded = codec.dumps({"a": [1]}, pretty=True)
+        assert b"\n  " in encoded
+        assert codec.loads(encoded) == {"a": [1]}
+
+    def test_decode_error_is_value_error(self, codec):
+        """Test invalid input raises ValueError for every backend."""
+        with pytest.raises(ValueError):
+            codec.loads(b"{not json")
+
+
+def test_get_codec():
+    """Test codec resolution by name, instance and default."""
+    codec = JsonCodec()
+    assert get_codec(codec) is codec
+    assert get_codec("json").name == "json"
+    assert get_codec() is get_codec("auto")
+    with pytest.raises(ValueError):
+        get_codec("simplejson")
@@ -0,0 +1,110 @@
+"""Unit tests for the contract metadata registry."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from weex_sdk.contracts import ContractRegistry, ContractSpec
+from weex_sdk.exceptions import WeexAPIError, WeexValidationError
+
+BTC = {
+    "symbol": "cmt_btcusdt",
+    "size_increment": "5",
+    "tick_size": "1",
+    "priceEndStep": 1,
+    "minLeverage": 1,
+    "maxLeverage": 500,
+    "makerFeeRate": "0.0002",
+    "takerFeeRate": "0.0006",
+    "minOrderSize": "0.0001",
+    "maxOrderSize": "100000",
+    "maxPositionSize": "1000000",
+}
+
+
+class FakeMarket:
+    """Count get_contracts calls and optionally fail them."""
+
+    def __init__(self):
+        self.calls = 0
+        self.error = None
+
+    def get_contracts(self, symbol=None):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return [BTC, {**BTC, "symbol": "cmt_dogeusdt", "tick_size": "5", "priceEndStep": 5}]
+
+
+class FakeClient:
+    def __init__(self):
+        self.market = FakeMarket()
+
+
+class TestContractSpec:
+    """Test precision parsing and rounding."""
+
+    def test_precision_fields(self):
+        """Test tick_size and size_increment are decimal places."""
+        spec = ContractSpec.from_contract(BTC)
+        assert (spec.price_decimals, spec.price_step) == (1, 0.1)
+        assert (spec.size_decimals, spec.size_step) == (5, 0.00001)
+        assert spec.min_order_size == 0.0001
+        assert spec.max_leverage == 500
+
+        doge = ContractSpec.from_contract({"symbol": "d", "tick_size": "5", "priceEndStep": 5})
+        assert doge.price_step == 0.00005
+        step = ContractSpec.from_contract({"symbol": "x", "tick_size": "0.5"})
+        assert (step.price_decimals, step.price_step) == (1, 0.5)
+
+    def test_rounding(self):
+        """Test rounding modes and formatting."""
+        spec = ContractSpec.from_contract(BTC)
+        assert spec.round_price(68734.84) == 68734.8
+        assert spec.round_price(68734.81, mode="up") == 68734.9
+        assert spec.round_price(0.3, mode="down") == 0.3
+        assert spec.round_size(0.123456789) == 0.12345
+        assert spec.format_price(50000) == "50000.0"
+        assert spec.prepare_order(0.0012345678, 68734.84) == ("0.00123", "68734.8")
+
+    def test_validate_size(self):
+        """Test order sizes outside the limits are rejected."""
+        spec = ContractSpec.from_contract(BTC)
+        with pytest.raises(WeexValidationError):
+            spec.prepare_order(0.000099)
+        with pytest.raises(WeexValidationError):
+            spec.validate_size(100001)
+        spec.validate_size(0.0001)
+
+
+class TestContractRegistry:
+    """Test caching, TTL and failure handling."""
+
+    def test_cached_until_ttl(self):
+        """Test lookups reuse one fetch until the TTL expires."""
+        client = FakeClient()
+        registry = ContractRegistry(client, ttl=60)
+        assert registry.get("cmt_btcusdt").price_step == 0.1
+        assert registry.get("cmt_dogeusdt").price_step == 0.00005
+        assert client.market.calls == 1
+        assert registry.symbols() == ["cmt_btcusdt", "cmt_dogeusdt"]
+
+        registry.invalidate()
+        registry.get("cmt_btcusdt")
+        assert client.market.calls == 2
+
+        with pytest.raises(WeexValidationError):
+            registry.get("cmt_unknown")
+
+    def test_serves_stale_on_failure(self):
+        """Test a failed refresh keeps cached metadata and raises without it."""
+        client = FakeClient()
+        registry = ContractRegistry(client, ttl=0)
+        registry.get("cmt_btcusdt")
+        client.market.error = WeexAPIError("down")
+        assert registry.get("cmt_btcusdt").symbol == "cmt_btcusdt"
+
+        with pytest.raises(WeexAPIError):
+            ContractRegistry(client).get("cmt_btcusdt")
@@ -0,0 +1,203 @@
+"""Unit tests for WebSocket callback dispatchers."""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from weex_sdk.dispatch import AsyncCallbackDispatcher, CallbackDispatcher, Delivery, _BaseDispatcher
+from weex_sdk.websocket import WeexWebSocket
+
+
+class TestCallbackDispatcher:
+    """Test the threaded dispatcher."""
+
+    def test_slow_channel_does_not_block_others(self):
+        """Test ordered delivery per channel while another channel is stuck."""
+        dispatcher = CallbackDispatcher(workers=2)
+        release = threading.Event()
+        slow, fast = [], []
+        fast_done, slow_done = threading.Event(), threading.Event()
+
+        def on_slow(message):
+            release.wait(5)
+            slow.append(message["n"])
+            if len(slow) == 3:
+                slow_done.set()
+
+        def on_fast(message):
+            fast.append(message["n"])
+            if len(fast) == 20:
+                fast_done.set()
+
+        for n in range(3):
+            dispatcher.submit("depth", on_slow, {"n": n})
+        for n in range(20):
+            dispatcher.submit("ticker", on_fast, {"n": n})
+
+        assert fast_done.wait(5)
+        assert fast == list(range(20))
+        release.set()
+        assert slow_done.wait(5)
+        dispatcher.close(timeout=5)
+        assert slow == [0, 1, 2]
+
+    def test_base_dispatcher_is_abstract(self):
+        """Test the shared base cannot be used without worker hooks."""
+        with pytest.raises(TypeError):
+            _BaseDispatcher()
+
+    def test_websocket_close_stops_owned_workers(self):
+        """Test close() without stop() shuts down a dispatcher the client created."""
+        ws = WeexWebSocket(dispatcher=True)
+        done = threading.Event()
+        ws.subscribe_ticker("cmt_btcusdt", callback=lambda data: done.set())
+        message = {"event": "payload", "channel": "ticker.cmt_btcusdt", "data": []}
+        ws._on_message(None, json.dumps(message))
+        assert done.wait(5)
+        threads = list(ws.dispatcher._threads)
+
+        ws.close(timeout=5)
+        assert threads and not any(thread.is_alive() for thread in threads)
+        # Late messages are dropped instead of restarting the workers
+        ws._on_message(None, json.dumps(message))
+        assert ws.dispatcher._threads == []
+
+    def test_bounded_queue_drops_oldest(self):
+        """Test a full channel queue drops its oldest messages and counts them."""
+        dispatcher = CallbackDispatcher(workers=1, max_queue=2)
+        started, release, done = threading.Event(), threading.Event(), threading.Event()
+        seen = []
+
+        def callback(message):
+            started.set()
+            release.wait(5)
+            seen.append(message["n"])
+            if len(seen) == 3:
+                done.set()
+
+        dispatcher.submit("depth", callback, {"n": 0})
+        assert started.wait(5)
+        for n in range(1, 6):
+            dispatcher.submit("depth", callback, {"n": n})
+        release.set()
+
+        assert done.wait(5)
+        dispatcher.close(timeout=5)
+        assert seen == [0, 4, 5]
+        stats = dispatcher.stats()["depth"]
+        assert stats["dropped"] == 3 and stats["delivered"] == 3 and stats["high_water"] == 2
+
+
+class TestDelivery:
+    """Test conflated and sampled delivery."""
+
+    def test_conflate_keeps_newest(self):
+        """Test a busy conflated channel only receives the newest pending message."""
+        dispatcher = CallbackDispatcher(workers=2)
+        dispatcher.configure("ticker", delivery="conflate")
+        started, release, done = threading.Event(), threading.Event(), threading.Event()
+        seen = []
+
+        def callback(message):
+            started.set()
+            release.wait(5)
+            seen.append(message["n"])
+            if message["n"] == 5:
+                done.set()
+
+        dispatcher.submit("ticker", callback, {"n": 0})
+        assert started.wait(5)
+        for n in range(1, 6):
+            dispatcher.submit("ticker", callback, {"n": n})
+        release.set()
+
+        assert done.wait(5)
+        dispatcher.close(timeout=5)
+        assert seen == [0, 5]
+        assert dispatcher.stats()["ticker"]["dropped"] == 4
+
+    def test_sample_delivers_newest_once_per_interval(self):
+        """Test a burst after a delivery arrives once, as its newest message, an interval later."""
+        dispatcher = CallbackDispatcher()
+        dispatcher.configure("depth", delivery=Delivery.sample(0.05))
+        seen, first, done = [], threading.Event(), threading.Event()
+
+        def callback(message):
+            seen.append((message["n"], time.monotonic()))
+            (done if message["n"] == 9 else first).set()
+
+        dispatcher.submit("depth", callback, {"n": 0})
+        assert first.wait(5)
+        for n in range(1, 10):
+            dispatcher.submit("depth", callback, {"n": n})
+
+        assert done.wait(5)
+        dispatcher.close(timeout=5)
+        assert [n for n, _ in seen] == [0, 9]
+        assert seen[1][1] - seen[0][1] >= 0.04
+
+    def test_websocket_policy_creates_dispatcher(self):
+        """Test subscribing with a policy other than all routes the channel through a dispatcher."""
+        ws = WeexWebSocket()
+        ws.subscribe_ticker("cmt_btcusdt", callback=lambda data: None)
+        assert ws.dispatcher is None
+        ws.subscribe_ticker("cmt_ethusdt", callback=lambda data: None, delivery="conflate")
+        assert isinstance(ws.dispatcher, CallbackDispatcher)
+        with pytest.raises(ValueError):
+            ws.set_delivery("ticker.cmt_btcusdt", Delivery("latest"))
+        ws.stop()
+
+    def test_implicit_dispatcher_only_runs_policy_channels(self):
+        """Test channels without a policy stay inline when set_delivery created the dispatcher."""
+        ws = WeexWebSocket()
+        threads, done = {}, threading.Event()
+
+        def record(name):
+            def callback(data):
+                threads[name] = threading.current_thread()
+                if name == "conflated":
+                    done.set()
+
+            return callback
+
+        ws.subscribe_ticker("cmt_btcusdt", callback=record("inline"))
+        ws.subscribe_ticker("cmt_ethusdt", callback=record("conflated"), delivery="conflate")
+        for channel in ("ticker.cmt_btcusdt", "ticker.cmt_ethusdt"):
+            ws._on_message(None, json.dumps({"event": "payload", "channel": channel, "data": []}))
+
+        assert done.wait(5)
+        assert threads["inline"] is threading.current_thread()
+        assert threads["conflated"] is not threading.current_thread()
+        assert list(ws.dispatcher.stats()) == ["ticker.cmt_ethusdt"]
+        ws.stop(timeout=5)
+
+
+class TestAsyncCallbackDispatcher:
+    """Test the asyncio dispatcher."""
+
+    def test_delivers_in_order_with_coroutine_callbacks(self):
+        """Test coroutine and plain callbacks run on worker tasks in order."""
+        seen = []
+
+        async def on_order(message):
+            await asyncio.sleep(0)
+            seen.append(("order", message["n"]))
+
+        async def main():
+            dispatcher = AsyncCallbackDispatcher(workers=2)
+            for n in range(5):
+                dispatcher.submit("orders", on_order, {"n": n})
+                dispatcher.submit("ticker", lambda m: seen.append(("ticker", m["n"])), {"n": n})
+            while sum(s["delivered"] for s in dispatcher.stats().values()) < 10:
+                await asyncio.sleep(0.01)
+            await dispatcher.close()
+
+        asyncio.run(main())
+        assert [n for kind, n in seen if kind == "order"] == list(range(5))
+        assert [n for kind, n in seen if kind == "ticker"] == list(range(5))
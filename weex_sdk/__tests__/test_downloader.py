@@ -0,0 +1,90 @@
+"""Unit tests for the historical candle downloader."""
+
+import asyncio
+import os
+import sys
+from typing import Any, Dict, List, Set
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from weex_sdk.downloader import CandleDownloader, MemorySink, align_time
+
+MINUTE = 60_000
+START = 1_700_000_040_000  # aligned to the minute
+
+
+class FakeMarket:
+    """Serve 1m candles, optionally dropping some once or for good."""
+
+    def __init__(self, flaky: Set[int] = frozenset(), missing: Set[int] = frozenset()):
+        self.flaky = set(flaky)
+        self.missing = set(missing)
+        self.calls: List[Dict[str, Any]] = []
+
+    async def get_history_candles(
+        self, symbol, granularity, start_time, end_time, limit, price_type
+    ):
+        self.calls.append({"start": start_time, "end": end_time})
+        await asyncio.sleep(0)
+        rows = []
+        # Exclusive bounds, plus one extra candle on each side like an overlapping page
+        first = align_time(start_time, granularity, round_up=True) - MINUTE
+        for timestamp in range(first, end_time + MINUTE, MINUTE):
+            if timestamp in self.missing:
+                continue
+            if timestamp in self.flaky:
+                self.flaky.discard(timestamp)
+                continue
+            rows.append([str(timestamp), "1", "2", "0.5", "1.5", "10", "15"])
+        return rows[:limit]
+
+
+def download(market, sink, **kwargs):
+    downloader = CandleDownloader(market, sink, concurrency=3, window_size=10)
+    return asyncio.run(
+        downloader.download_series("cmt_btcusdt", "1m", START, START + 45 * MINUTE, **kwargs)
+    )
+
+
+class TestCandleDownloader:
+    """Test windowing, gap refilling and resume."""
+
+    def test_downloads_range_in_order(self):
+        """Test every candle in the range is written once, in order."""
+        market, sink = FakeMarket(), MemorySink()
+        stats = download(market, sink)
+        timestamps = [int(c[0]) for c in sink.candles("cmt_btcusdt", "1m")]
+        assert timestamps == list(range(START, START + 45 * MINUTE, MINUTE))
+        assert stats.candles == 45
+        assert stats.requests == len(market.calls) == 5
+        assert stats.missing == 0
+
+    def test_refills_and_reports_gaps(self):
+        """Test transient gaps are refilled and permanent gaps are reported."""
+        flaky = {START + 3 * MINUTE, START + 4 * MINUTE}
+        missing = {START + 20 * MINUTE}
+        market, sink = FakeMarket(flaky=flaky, missing=missing), MemorySink()
+        stats = download(market, sink)
+        assert stats.candles == 44
+        assert stats.missing == 1
+        assert stats.gaps == [(START + 20 * MINUTE, START + 20 * MINUTE)]
+        # One refill for the flaky run and one for the permanent gap
+        assert stats.requests == 7
+
+    def test_resume_from_sink(self):
+        """Test a second run only requests candles after the last stored one."""
+        sink = MemorySink()
+        sink.write("cmt_btcusdt", "1m", "LAST", [[str(START + 29 * MINUTE), "1", "1", "1", "1"]])
+        market = FakeMarket()
+        stats = download(market, sink)
+        assert stats.candles == 15
+        assert market.calls[0]["start"] == START + 30 * MINUTE - 1
+
+    def test_multiple_series(self):
+        """Test several symbols and granularities download in one run."""
+        market, sink = FakeMarket(), MemorySink()
+        downloader = CandleDownloader(market, sink, window_size=10)
+        results = asyncio.run(downloader.download(["a", "b"], ["1m"], START, START + 10 * MINUTE))
+        assert {key: stats.candles for key, stats in results.items()} == {
+            ("a", "1m", "LAST"): 10,
+            ("b", "1m", "LAST"): 10,
+        }
@@ -0,0 +1,44 @@
+"""Unit tests for the endpoint metadata table."""
+
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from weex_sdk.cache import DEFAULT_TTLS
+from weex_sdk.endpoints import ENDPOINTS
+from weex_sdk.ratelimit import RateLimiter
+from weex_sdk.retry import RetryPolicy
+
+API_DIR = os.path.join(os.path.dirname(__file__), "..", "api")
+CALL = re.compile(r'self\.client\.(get|post)\(\s*"(/capi/[^"]+)"')
+
+
+class TestEndpointTable:
+    """Test the table covers the API modules and drives the client layers."""
+
+    def test_every_api_call_is_described(self):
+        """Test each path called by an API module is listed with its HTTP method."""
+        calls = set()
+        for name in os.listdir(API_DIR):
+            if name.endswith(".py"):
+                with open(os.path.join(API_DIR, name), encoding="utf-8") as f:
+                    calls.update(CALL.findall(f.read()))
+        assert calls
+        for method, path in calls:
+            assert path in ENDPOINTS, f"{path} missing from ENDPOINTS"
+            assert ENDPOINTS[path].method == method.upper()
+
+    def test_metadata_is_applied(self):
+        """Test weights, cache TTLs and idempotency come from the table."""
+        assert RateLimiter.weight_for("/capi/v2/market/tickers") == 40
+        assert RateLimiter.weight_for("/capi/v2/order/placeOrder") == 1
+        assert RateLimiter.weight_for("/capi/v2/unknown") == 1
+        assert DEFAULT_TTLS["/capi/v2/market/contracts"] == 60.0
+        assert "/capi/v2/market/depth" not in DEFAULT_TTLS
+
+        assert RetryPolicy.is_idempotent("POST", {"symbol": "x"}, "/capi/v2/account/leverage")
+        assert not RetryPolicy.is_idempotent(
+            "POST", {"client_oid": "a"}, "/capi/v2/order/closePositions"
+        )
+        assert RetryPolicy.is_idempotent("POST", {"client_oid": "a"}, "/capi/v2/order/placeOrder")
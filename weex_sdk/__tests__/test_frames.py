@@ -0,0 +1,121 @@
+"""Unit tests for NumPy candle and trade frames."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from weex_sdk.api.market import MarketAPI
+
+np = pytest.importorskip("numpy")
+from weex_sdk.frames import CandleFrame, TradeFrame  # noqa: E402
+
+MINUTE = 60_000
+START = 1_716_707_460_000
+
+
+def candle_rows(count, start=START):
+    """Build API-style candle rows, newest first like the exchange."""
+    rows = []
+    for i in range(count):
+        price = 50000 + i
+        rows.append(
+            [str(start + i * MINUTE), f"{price}", f"{price + 5}.5", f"{price - 5}", f"{price + 1}"]
+            + ["1.25", "62500.5"]
+        )
+    return rows[::-1]
+
+
+class TestCandleFrame:
+    """Tests for CandleFrame."""
+
+    def test_from_rows(self):
+        """Rows are parsed into typed columns sorted by open time."""
+        frame = CandleFrame.from_rows(candle_rows(3))
+
+        assert len(frame) == 3
+        assert frame.timestamp.dtype == np.int64
+        assert frame.timestamp.tolist() == [START, START + MINUTE, START + 2 * MINUTE]
+        assert frame.close.tolist() == [50001.0, 50002.0, 50003.0]
+        assert frame.high[0] == 50005.5
+        assert frame.quote_volume[2] == 62500.5
+        assert len(CandleFrame.from_rows([])) == 0
+
+    def test_malformed_rows(self):
+        """Short or non-numeric rows are rejected."""
+        with pytest.raises(ValueError):
+            CandleFrame.from_rows([["1", "2", "3"]])
+        with pytest.raises(ValueError):
+            CandleFrame.from_rows([["x"] * 7])
+
+    def test_between_and_getitem(self):
+        """Time slicing is start-inclusive and end-exclusive."""
+        frame = CandleFrame.from_rows(candle_rows(10))
+
+        window = frame.between(START + 2 * MINUTE, START + 5 * MINUTE)
+        assert window.timestamp.tolist() == [START + i * MINUTE for i in (2, 3, 4)]
+        assert frame[-1].timestamp.tolist() == [START + 9 * MINUTE]
+        assert len(frame[frame.close > 50005]) == 5
+
+    def test_concat_dedupes(self):
+        """Overlapping pages are joined in order, keeping the later copy."""
+        older = CandleFrame.from_rows(candle_rows(5))
+        newer_rows = candle_rows(5, start=START + 3 * MINUTE)
+        newer_rows[-1][4] = "1"  # revised close for START + 3m
+        newer = CandleFrame.from_rows(newer_rows)
+
+        joined = CandleFrame.concat([newer, older])
+        assert joined.timestamp.tolist() == [START + i * MINUTE for i in range(8)]
+        assert joined.close[3] == 50004.0  # older page came last
+
+        joined = CandleFrame.concat([older, newer])
+        assert joined.close[3] == 1.0
+        assert len(CandleFrame.concat([older, newer], dedupe=False)) == 10
+
+
+class TestTradeFrame:
+    """Tests for TradeFrame."""
+
+    def test_from_records(self):
+        """Trade dictionaries are parsed into typed columns."""
+        records = [
+            {
+                "ticketId": "b",
+                "time": START + 1,
+                "price": "50001.5",
+                "size": "0.002",
+                "value": "100.003",
+                "isBuyerMaker": True,
+            },
+            {
+                "ticketId": "a",
+                "time": START,
+                "price": "50000",
+                "size": "0.001",
+                "value": "50",
+                "isBuyerMaker": False,
+            },
+        ]
+        frame = TradeFrame.from_records(records)
+
+        assert frame.ticket_id.tolist() == ["a", "b"]
+        assert frame.time.tolist() == [START, START + 1]
+        assert frame.price.tolist() == [50000.0, 50001.5]
+        assert frame.is_buyer_maker.tolist() == [False, True]
+        assert len(TradeFrame.concat([frame, frame])) == 2
+
+
+class TestMarketFrames:
+    """Tests for the frame-returning market methods."""
+
+    def test_get_candles_frame(self):
+        """The raw response is parsed into a CandleFrame."""
+
+        class FakeClient:
+            def get(self, path, params=None):
+                return candle_rows(4)
+
+        frame = MarketAPI(FakeClient()).get_candles_frame("cmt_btcusdt", "1m")
+        assert isinstance(frame, CandleFrame)
+        assert len(frame) == 4
@@ -0,0 +1,56 @@
+"""Guard tests for lazy package imports."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(__file__), "..", "..")
+
+
+def loaded_modules(statement: str, modules):
+    """Run a statement in a fresh interpreter and report which modules it loaded."""
+    check = f"import sys; {statement}; print(' '.join(m for m in {modules!r} if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", check], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "statement, unexpected",
+    [
+        ("import weex_sdk", ["requests", "aiohttp", "asyncio", "websocket", "websockets"]),
+        ("from weex_sdk import WeexClient", ["aiohttp", "websocket", "websockets"]),
+        ("from weex_sdk import WeexWebSocket", ["requests", "aiohttp", "websockets"]),
+        ("from weex_sdk import AsyncWeexClient", ["websocket", "websockets"]),
+        ("from weex_sdk import AsyncWeexWebSocket", ["requests", "aiohttp"]),
+        ("from weex_sdk.api.market import MarketAPI", ["aiohttp", "websockets"]),
+    ],
+)
+def test_import_loads_only_what_is_used(statement, unexpected):
+    """Test transports are only imported by the entry points that need them."""
+    assert loaded_modules(statement, unexpected) == set()
+
+
+def test_public_names_resolve():
+    """Test every name in __all__ resolves and unknown names raise AttributeError."""
+    import weex_sdk
+
+    for name in weex_sdk.__all__:
+        assert getattr(weex_sdk, name).__name__ == name
+    assert "WeexClient" in dir(weex_sdk)
+    with pytest.raises(AttributeError):
+        weex_sdk.NotAName
+
+
+def test_async_clients_resolve_from_sync_modules():
+    """Test the async clients stay importable from the modules they moved out of."""
+    from weex_sdk import async_client, async_websocket, client, websocket
+
+    assert client.AsyncWeexClient is async_client.AsyncWeexClient
+    assert client.AsyncResponse is async_client.AsyncResponse
+    assert websocket.AsyncWeexWebSocket is async_websocket.AsyncWeexWebSocket
+    with pytest.raises(AttributeError):
+        client.NotAName
@@ -0,0 +1,208 @@
+"""Unit tests for the local order book."""
+
+import json
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from weex_sdk.orderbook import OrderBook
+from weex_sdk.retry import RetryPolicy
+from weex_sdk.websocket import WeexWebSocket
+
+
+def _depth(depth_type, asks, bids, symbol="cmt_btcusdt", version=None, start=None):
+    """Build a depth channel message."""
+    payload = {
+        "symbol": symbol,
+        "depthType": depth_type,
+        "asks": [{"price": str(p), "size": str(s)} for p, s in asks],
+        "bids": [{"price": str(p), "size": str(s)} for p, s in bids],
+    }
+    if version is not None:
+        payload["endVersion"] = str(version)
+    if start is not None:
+        payload["startVersion"] = str(start)
+    return {"data": [payload]}
+
+
+@pytest.fixture
+def book():
+    """Book with three levels per side."""
+    book = OrderBook("cmt_btcusdt")
+    book.apply_message(
+        _depth(
+            "SNAPSHOT",
+            asks=[(102, 2), (101, 1), (103, 3)],
+            bids=[(99, 3), (100, 1), (98, 4)],
+            version=10,
+        )
+    )
+    return book
+
+
+class TestOrderBook:
+    """Test book maintenance and derived prices."""
+
+    def test_snapshot_and_changes(self, book):
+        """Test snapshots sort levels and changes update, insert and remove them."""
+        assert book.ready and book.version == 10
+        assert book.best_ask() == (101.0, 1.0)
+        assert book.best_bid() == (100.0, 1.0)
+        assert [p for p, _ in book.top_bids()] == [100.0, 99.0, 98.0]
+
+        book.apply_message(
+            _depth("CHANGED", asks=[(101, 0), (100.5, 7)], bids=[(99, 5), (97, 1)], version=11)
+        )
+        assert book.top_asks(2) == [(100.5, 7.0), (102.0, 2.0)]
+        assert book.top_bids() == [(100.0, 1.0), (99.0, 5.0), (98.0, 4.0), (97.0, 1.0)]
+        assert book.version == 11
+
+    def test_ignores_other_symbols_and_early_changes(self):
+        """Test updates before the first snapshot and other symbols are skipped."""
+        book = OrderBook("cmt_btcusdt")
+        book.apply_message(_depth("CHANGED", asks=[(101, 1)], bids=[]))
+        book.apply_message(_depth("SNAPSHOT", asks=[(5, 1)], bids=[], symbol="cmt_ethusdt"))
+        assert not book.ready and book.best_ask() is None
+
+    def test_max_levels_trims_far_levels(self, book):
+        """Test levels pushed beyond max_levels are dropped."""
+        book.max_levels = 2
+        book.apply_changes(asks=[[100.5, 1]], bids=[])
+        assert book.top_asks() == [(100.5, 1.0), (101.0, 1.0)]
+        assert len(book.bids) == 2
+
+    def test_derived_prices(self, book):
+        """Test spread, mid, microprice, cumulative depth and VWAP."""
+        assert book.spread() == 1.0
+        assert book.mid_price() == 100.5
+        book.apply_changes(asks=[], bids=[[100, 3]])
+        # More size on the bid pushes the microprice towards the ask
+        assert book.microprice() == pytest.approx((100 * 1 + 101 * 3) / 4)
+        assert book.cumulative("asks") == [(101.0, 1.0), (102.0, 3.0), (103.0, 6.0)]
+
+        assert book.vwap("buy", 2) == pytest.approx((101 + 102) / 2)
+        assert book.vwap("sell", 4) == pytest.approx((100 * 3 + 99) / 4)
+        assert book.vwap("buy", 100) is None
+        assert not book.is_crossed()
+
+    def test_rest_depth(self):
+        """Test a MarketAPI.get_depth response replaces the book."""
+        book = OrderBook()
+        book.apply_depth(
+            {"asks": [["101.5", "2"]], "bids": [["101.6", "1"]], "timestamp": "1700000000000"}
+        )
+        assert book.best_ask() == (101.5, 2.0)
+        assert book.timestamp == 1700000000000
+        assert book.is_crossed()
+
+
+class TestResync:
+    """Test version tracking and recovery from gaps."""
+
+    def test_gap_buffers_until_snapshot_and_replays(self, book):
+        """Test a gap stops updates until a snapshot, then newer buffered updates replay."""
+        assert book.apply_message(_depth("CHANGED", [(101, 2)], [], version=12, start=11))
+        # Versions 13-14 are lost
+        assert not book.apply_message(_depth("CHANGED", [(101, 3)], [], version=16, start=15))
+        assert not book.apply_message(_depth("CHANGED", [], [(100, 9)], version=18, start=17))
+        assert not book.ready and book.resyncs == 1
+        assert book.best_ask() == (101.0, 2.0)
+
+        assert book.apply_message(_depth("SNAPSHOT", [(101, 5), (104, 1)], [(100, 1)], version=16))
+        # The update ending at 16 is part of the snapshot, the one ending at 18 is replayed
+        assert book.best_ask() == (101.0, 5.0)
+        assert book.best_bid() == (100.0, 9.0)
+        assert book.version == 18
+
+    def test_stale_updates_are_ignored(self, book):
+        """Test updates already covered by the book's version are skipped."""
+        assert book.apply_message(_depth("CHANGED", [(101, 9)], [], version=10, start=9))
+        assert book.best_ask() == (101.0, 1.0) and book.ready
+
+    def test_crossed_book_triggers_resync(self, book):
+        """Test an update leaving the bid at or above the ask puts the book out of sync."""
+        assert not book.apply_changes([], [[101.5, 1]], version=11, start_version=11)
+        assert not book.ready and book.resyncs == 1
+
+
+class Connection:
+    """Stand-in for the socket recording sent messages."""
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(json.loads(message))
+
+    def close(self):
+        pass
+
+
+def _wait_for(condition, timeout=5.0):
+    """Poll until condition() is true."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.005)
+
+
+class TestSubscribeOrderBook:
+    """Test the WebSocket order book subscription."""
+
+    def _subscribe(self, **kwargs):
+        """Connected client with an order book subscription."""
+        ws = WeexWebSocket()
+        ws.ws, ws.connected = Connection(), True
+        seen = []
+        book = ws.subscribe_order_book(
+            "cmt_btcusdt", 15, callback=lambda b: seen.append(b.version), **kwargs
+        )
+
+        def push(message):
+            message.update(event="payload", channel="depth.cmt_btcusdt.15")
+            ws._on_message(ws.ws, json.dumps(message))
+
+        return ws, book, seen, push
+
+    @staticmethod
+    def _resubscribes(ws):
+        return sum(m["event"] == "unsubscribe" for m in ws.ws.sent)
+
+    def test_gap_resubscribes_channel(self):
+        """Test a gap requests a new snapshot and the callback only sees synced books."""
+        ws, book, seen, push = self._subscribe()
+        push(_depth("SNAPSHOT", [(101, 1)], [(100, 1)], version=10))
+        push(_depth("CHANGED", [(101, 2)], [], version=13, start=12))
+        _wait_for(lambda: len(ws.ws.sent) == 3)
+        push(_depth("SNAPSHOT", [(101, 3)], [(100, 1)], version=13))
+
+        events = [(m["event"], m["channel"]) for m in ws.ws.sent]
+        assert events == [
+            ("subscribe", "depth.cmt_btcusdt.15"),
+            ("unsubscribe", "depth.cmt_btcusdt.15"),
+            ("subscribe", "depth.cmt_btcusdt.15"),
+        ]
+        assert seen == [10, 13]
+        assert book.ready and book.best_ask() == (101.0, 3.0)
+        ws.stop()
+
+    def test_unanswered_request_is_retried_with_backoff(self):
+        """Test the snapshot request repeats with growing delays until a snapshot arrives."""
+        policy = RetryPolicy(backoff_base=0.05, backoff_max=1.0, jitter=0)
+        ws, book, seen, push = self._subscribe(snapshot_retry=policy)
+        push(_depth("SNAPSHOT", [(101, 1)], [(100, 1)], version=10))
+        started = time.monotonic()
+        push(_depth("CHANGED", [(101, 2)], [], version=13, start=12))
+        push(_depth("CHANGED", [(101, 2)], [], version=15, start=14))
+
+        # Requests go out at 0, 0.05 and 0.15 seconds, the next would at 0.35
+        _wait_for(lambda: self._resubscribes(ws) == 3)
+        assert time.monotonic() - started >= 0.15
+        push(_depth("SNAPSHOT", [(101, 3)], [(100, 1)], version=15))
+        time.sleep(0.5)
+        assert self._resubscribes(ws) == 3
+        assert book.ready and book.resyncs == 1
+        ws.stop()
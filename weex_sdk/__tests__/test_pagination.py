@@ -0,0 +1,119 @@
+"""Unit tests for time-cursor pagination."""
+
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from weex_sdk.api.account import AccountAPI
+from weex_sdk.api.trade import AsyncTradeAPI, TradeAPI
+
+# Fills at 100..91 ms, two of them sharing the 95 ms boundary
+FILLS = [
+    {"tradeId": i, "createdTime": ts}
+    for i, ts in enumerate([100, 99, 98, 97, 96, 95, 95, 94, 93, 92, 91])
+]
+
+
+def fills_page(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Serve fills newest first with an inclusive end time, like the exchange."""
+    end = params.get("endTime")
+    start = params.get("startTime")
+    matching = [
+        f
+        for f in FILLS
+        if (end is None or f["createdTime"] <= end) and (start is None or f["createdTime"] >= start)
+    ]
+    page = matching[: params["limit"]]
+    return {"list": page, "nextFlag": len(matching) > len(page)}
+
+
+class FakeClient:
+    """Serve paginated responses and count requests."""
+
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        self.calls.append(params or {})
+        if path == "/capi/v2/order/fills":
+            return fills_page(params or {})
+        # Order history: a bare list, no has-more flag
+        end = (params or {}).get("createDate")
+        orders = [
+            {"order_id": str(i), "createTime": str(ts)}
+            for i, ts in enumerate([50, 40, 40, 30])
+            if end is None or ts <= end
+        ]
+        return orders[: params["pageSize"]]
+
+
+class AsyncFakeClient(FakeClient):
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        await asyncio.sleep(0)
+        return FakeClient.get(self, path, params)
+
+
+class TestPagination:
+    """Test iter_* methods walk pages without gaps or duplicates."""
+
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_iter_order_fills(self, prefetch):
+        """Test overlapping boundary records are yielded once."""
+        client = FakeClient()
+        fills = list(TradeAPI(client).iter_order_fills(page_size=3, prefetch=prefetch))
+        assert [f["tradeId"] for f in fills] == list(range(len(FILLS)))
+        assert client.calls[1]["endTime"] == 98
+
+    def test_start_time_stops_paging(self):
+        """Test iteration stops once the start time is reached."""
+        client = FakeClient()
+        fills = list(TradeAPI(client).iter_order_fills(start_time=96, page_size=3))
+        assert [f["createdTime"] for f in fills] == [100, 99, 98, 97, 96]
+        assert len(client.calls) == 2
+
+    def test_iter_is_lazy(self):
+        """Test pages are only requested as records are consumed."""
+        client = FakeClient()
+        fills = TradeAPI(client).iter_order_fills(page_size=3)
+        assert client.calls == []
+        next(fills)
+        assert len(client.calls) == 1
+
+    def test_iter_order_history(self):
+        """Test list responses page by createDate until a short page."""
+        client = FakeClient()
+        orders = list(TradeAPI(client).iter_order_history(page_size=2))
+        assert [o["order_id"] for o in orders] == ["0", "1", "2", "3"]
+        # A full page at one millisecond is re-requested once, then stepped past
+        assert [c.get("createDate") for c in client.calls] == [None, 40, 40, 39]
+
+    def test_iter_bills(self):
+        """Test bills read items/hasNextPage and the lowercase ctime field."""
+        pages = [
+            {
+                "hasNextPage": True,
+                "items": [{"billId": 2, "ctime": 20}, {"billId": 1, "ctime": 10}],
+            },
+            {
+                "hasNextPage": False,
+                "items": [{"billId": 1, "ctime": 10}, {"billId": 0, "ctime": 5}],
+            },
+        ]
+        client = SimpleNamespace(post=lambda path, data: pages.pop(0))
+        assert [b["billId"] for b in AccountAPI(client).iter_bills(page_size=2)] == [2, 1, 0]
+
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_async_iter_order_fills(self, prefetch):
+        """Test the async iterator yields the same records."""
+
+        async def collect():
+            api = AsyncTradeAPI(AsyncFakeClient())
+            return [f async for f in api.iter_order_fills(page_size=4, prefetch=prefetch)]
+
+        fills = asyncio.run(collect())
+        assert [f["tradeId"] for f in fills] == list(range(len(FILLS)))
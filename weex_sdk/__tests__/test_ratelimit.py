@@ -0,0 +1,60 @@
+"""Unit tests for client-side rate limiting."""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from weex_sdk.ratelimit import RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """Test TokenBucket reservations."""
+
+    def test_burst_then_wait(self):
+        """Test burst capacity is free and later tokens are paced."""
+        bucket = TokenBucket(rate=10.0, capacity=2.0)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    def test_pause(self):
+        """Test pause blocks even when tokens are available."""
+        bucket = TokenBucket(rate=100.0, capacity=100.0)
+        bucket.pause(0.5)
+        assert bucket.reserve() == pytest.approx(0.5, abs=0.02)
+
+    def test_acquire_async(self):
+        """Test async acquisition shares the same reservations."""
+        bucket = TokenBucket(rate=1000.0, capacity=1.0)
+        asyncio.run(bucket.acquire_async())
+        assert bucket.reserve() > 0
+
+
+class TestRateLimiter:
+    """Test RateLimiter grouping and configuration."""
+
+    def test_group_for(self):
+        """Test endpoint path classification."""
+        assert RateLimiter.group_for("/capi/v2/order/placeOrder") == "order"
+        assert RateLimiter.group_for("/capi/v2/order/cancel_batch_orders") == "cancel"
+        assert RateLimiter.group_for("/capi/v2/market/depth") == "market"
+        assert RateLimiter.group_for("/capi/v2/order/detail") == "account"
+        assert RateLimiter.group_for("/capi/v2/account/assets") == "account"
+
+    def test_configure_from_account(self):
+        """Test seeding the order bucket from createOrderRateLimitPerMinute."""
+        limiter = RateLimiter()
+        limiter.configure_from_account({"account": {"createOrderRateLimitPerMinute": 120}})
+        bucket = limiter.buckets["order"]
+        assert bucket.rate == pytest.approx(2.0)
+        assert bucket.capacity == 10.0
+
+    def test_disabled(self):
+        """Test an empty limit mapping never waits."""
+        limiter = RateLimiter(limits={})
+        limiter.penalize("order", 10)
+        limiter.acquire("order")
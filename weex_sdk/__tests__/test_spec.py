@@ -0,0 +1,340 @@
+"""Unit tests for API methods generated from operation specs."""
+
+import ast
+import asyncio
+import inspect
+import os
+import sys
+import textwrap
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from weex_sdk.api import account, market, trade
+from weex_sdk.api.account import AccountAPI, AsyncAccountAPI
+from weex_sdk.api.market import AsyncMarketAPI, MarketAPI
+from weex_sdk.api.spec import OMIT_EMPTY, OMIT_NONE, Operation, Param, generate
+from weex_sdk.api.trade import AsyncTradeAPI, TradeAPI
+
+GENERATED = [
+    (MarketAPI, market.MARKET_OPERATIONS, False),
+    (AsyncMarketAPI, market.MARKET_OPERATIONS, True),
+    (AccountAPI, account.ACCOUNT_OPERATIONS, False),
+    (AsyncAccountAPI, account.ACCOUNT_OPERATIONS, True),
+    (TradeAPI, trade.ORDER_OPERATIONS + trade.PLAN_OPERATIONS, False),
+    (AsyncTradeAPI, trade.ORDER_OPERATIONS + trade.PLAN_OPERATIONS, True),
+]
+
+
+def declarations(cls: type) -> Dict[str, Any]:
+    """Compile the methods a class declares under ``if TYPE_CHECKING:``."""
+    tree = ast.parse(textwrap.dedent(inspect.getsource(cls)))
+    body = [
+        node
+        for statement in tree.body[0].body
+        if isinstance(statement, ast.If)
+        and isinstance(statement.test, ast.Name)
+        and statement.test.id == "TYPE_CHECKING"
+        for node in statement.body
+    ]
+    code = compile(ast.Module(body=body, type_ignores=[]), inspect.getsourcefile(cls), "exec")
+    declared: Dict[str, Any] = {}
+    exec(code, dict(vars(sys.modules[cls.__module__])), declared)
+    return declared
+
+
+class RecordingClient:
+    """Record requests and answer them with a canned response."""
+
+    def __init__(self, response: Any = None) -> None:
+        self.response = response
+        self.calls: List[tuple] = []
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        self.calls.append(("GET", path, params))
+        return self.response
+
+    def post(self, path: str, data: Optional[Dict[str, Any]] = None) -> Any:
+        self.calls.append(("POST", path, data))
+        return self.response
+
+
+class AsyncRecordingClient(RecordingClient):
+    """Async variant of RecordingClient."""
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return super().get(path, params)
+
+    async def post(self, path: str, data: Optional[Dict[str, Any]] = None) -> Any:
+        return super().post(path, data)
+
+
+class TestParam:
+    """Test how arguments map to request fields."""
+
+    def test_omit_modes(self):
+        """Test omitted, converted and substituted values."""
+        fields: Dict[str, Any] = {}
+        Param("a", Optional[int], "", omit=OMIT_EMPTY).add_to(fields, 0)
+        Param("b", Optional[int], "", omit=OMIT_NONE).add_to(fields, 0)
+        Param("c", Optional[int], "", omit=OMIT_NONE).add_to(fields, None)
+        Param("d", str, "", key="dKey", convert=str).add_to(fields, 1.5)
+        Param("e", Optional[str], "", convert=str, empty="0").add_to(fields, None)
+        Param("f", Optional[str], "", convert=str, empty="0").add_to(fields, 2)
+        assert fields == {"b": 0, "dKey": "1.5", "e": "0", "f": "2"}
+
+    def test_invalid_omit_mode(self):
+        """Test unknown omit modes are rejected."""
+        with pytest.raises(ValueError):
+            Param("a", int, "", omit="sometimes")
+
+
+class TestGeneratedMethods:
+    """Test the generated Market API methods."""
+
+    def test_get_sends_mapped_params(self):
+        """Test arguments are renamed and empty optional ones left out."""
+        client = RecordingClient([])
+        MarketAPI(client).get_history_candles("cmt_btcusdt", "1m", end_time=1700000000000)
+        assert client.calls == [
+            (
+                "GET",
+                "/capi/v2/market/historyCandles",
+                {
+                    "symbol": "cmt_btcusdt",
+                    "granularity": "1m",
+                    "endTime": 1700000000000,
+                    "limit": 100,
+                    "priceType": "LAST",
+                },
+            )
+        ]
+
+    def test_response_model(self):
+        """Test list models turn other responses into an empty list."""
+        assert MarketAPI(RecordingClient({"code": "0"})).get_tickers() == []
+        assert MarketAPI(RecordingClient([{"symbol": "x"}])).get_contracts() == [{"symbol": "x"}]
+        depth = {"asks": [], "bids": []}
+        assert MarketAPI(RecordingClient(depth)).get_depth("cmt_btcusdt") is depth
+
+    def test_signature_and_docstring(self):
+        """Test generated methods look like hand-written ones."""
+        method = MarketAPI.get_depth
+        assert method.__qualname__ == "MarketAPI.get_depth"
+        assert str(inspect.signature(method)) == (
+            "(self, symbol: str, limit: int = 15) -> weex_sdk.models.Depth"
+        )
+        doc = inspect.getdoc(method)
+        assert doc.startswith("Get market depth.\n\nArgs:\n    symbol: Trading pair\n")
+        assert doc.endswith("Raises:\n    WeexAPIError: On API errors")
+        assert inspect.getdoc(AsyncMarketAPI.get_depth) == "Get market depth (async)."
+
+    def test_invalid_arguments(self):
+        """Test wrong arguments raise TypeError like a normal method."""
+        api = MarketAPI(RecordingClient())
+        with pytest.raises(TypeError):
+            api.get_ticker()
+        with pytest.raises(TypeError):
+            api.get_ticker("cmt_btcusdt", sym="x")
+
+    def test_async_methods(self):
+        """Test async methods are coroutines sending the same request."""
+        client = AsyncRecordingClient({"code": "0"})
+        api = AsyncMarketAPI(client)
+        assert inspect.iscoroutinefunction(AsyncMarketAPI.get_contracts)
+        assert asyncio.run(api.get_contracts(symbol="cmt_btcusdt")) == []
+        assert client.calls == [("GET", "/capi/v2/market/contracts", {"symbol": "cmt_btcusdt"})]
+
+
+class TestPlanOrders:
+    """Test the generated plan and TP/SL order methods."""
+
+    def test_place_plan_order_body(self):
+        """Test the plan order body keeps client_oid, so it stays retryable."""
+        client = RecordingClient({"order_id": "1"})
+        TradeAPI(client).place_plan_order("cmt_btcusdt", "p1", 1, 1, 0, 50000, 49000)
+        assert client.calls == [
+            (
+                "POST",
+                "/capi/v2/order/plan_order",
+                {
+                    "symbol": "cmt_btcusdt",
+                    "client_oid": "p1",
+                    "size": "1",
+                    "type": "1",
+                    "match_type": "0",
+                    "execute_price": "50000",
+                    "trigger_price": "49000",
+                },
+            )
+        ]
+
+    def test_tp_sl_execute_price_defaults_to_market(self):
+        """Test a missing execution price is sent as 0 (market price)."""
+        client = AsyncRecordingClient({"code": "0"})
+        api = AsyncTradeAPI(client)
+        placed = asyncio.run(
+            api.place_tp_sl_order("cmt_btcusdt", "t1", "loss_plan", 49000, 1, "long", margin_mode=3)
+        )
+        asyncio.run(api.modify_tp_sl_order(7, 48000, execute_price=47990))
+        assert placed == []
+        assert client.calls[0][2] == {
+            "symbol": "cmt_btcusdt",
+            "clientOrderId": "t1",
+            "planType": "loss_plan",
+            "triggerPrice": "49000",
+            "size": "1",
+            "positionSide": "long",
+            "executePrice": "0",
+            "marginMode": 3,
+        }
+        assert client.calls[1][2] == {
+            "orderId": 7,
+            "triggerPrice": "48000",
+            "executePrice": "47990",
+        }
+
+    def test_current_plan_keeps_page_zero(self):
+        """Test page 0 is sent while empty filters are left out."""
+        client = RecordingClient([{"order_id": "1"}])
+        assert TradeAPI(client).get_current_plan(symbol="", limit=0, page=0) == [{"order_id": "1"}]
+        TradeAPI(client).cancel_plan(12)
+        assert client.calls == [
+            ("GET", "/capi/v2/order/currentPlan", {"page": 0}),
+            ("POST", "/capi/v2/order/cancel_plan", {"orderId": "12"}),
+        ]
+
+
+class TestBatchAndHistory:
+    """Test the generated batch order and history methods."""
+
+    def test_batch_orders_limit(self):
+        """Test oversized batches are rejected before sending, pointing to the bulk helper."""
+        client = AsyncRecordingClient({"code": "0"})
+        api = AsyncTradeAPI(client)
+        with pytest.raises(ValueError, match="place_orders_bulk"):
+            asyncio.run(api.batch_orders("cmt_btcusdt", [{}] * 21))
+        asyncio.run(api.batch_orders("cmt_btcusdt", [{"client_oid": "a"}], margin_mode=0))
+        assert client.calls == [
+            (
+                "POST",
+                "/capi/v2/order/batchOrders",
+                {"symbol": "cmt_btcusdt", "orderDataList": [{"client_oid": "a"}]},
+            )
+        ]
+
+    def test_cancel_batch_orders_ids(self):
+        """Test IDs are sent as strings and at least one ID list is required."""
+        client = RecordingClient({"code": "0"})
+        api = TradeAPI(client)
+        with pytest.raises(ValueError, match="Either ids or cids must be provided"):
+            api.cancel_batch_orders(ids=[], cids=None)
+        api.cancel_batch_orders(ids=[1, 2])
+        assert client.calls == [("POST", "/capi/v2/order/cancel_batch_orders", {"ids": ["1", "2"]})]
+
+    def test_history_queries(self):
+        """Test order and plan history leave out empty filters."""
+        client = RecordingClient({"code": "0"})
+        api = TradeAPI(client)
+        assert api.get_order_history(page_size=50, create_date=0) == []
+        api.get_history_plan("cmt_btcusdt", end_time=1700000000000, page_size=100)
+        assert client.calls == [
+            ("GET", "/capi/v2/order/history", {"pageSize": 50}),
+            (
+                "GET",
+                "/capi/v2/order/historyPlan",
+                {"symbol": "cmt_btcusdt", "endTime": 1700000000000, "pageSize": 100},
+            ),
+        ]
+
+
+class TestAccountAndOrders:
+    """Test the generated account and order methods."""
+
+    def test_set_leverage_defaults_short_side(self):
+        """Test the short leverage falls back to the long leverage."""
+        client = RecordingClient({"code": "0"})
+        api = AccountAPI(client)
+        api.set_leverage("cmt_btcusdt", 3, 10)
+        api.set_leverage("cmt_btcusdt", 1, 10, short_leverage=5)
+        assert [call[2] for call in client.calls] == [
+            {"symbol": "cmt_btcusdt", "marginMode": 3, "longLeverage": "10", "shortLeverage": "10"},
+            {"symbol": "cmt_btcusdt", "marginMode": 1, "longLeverage": "10", "shortLeverage": "5"},
+        ]
+
+    def test_empty_filters_are_left_out(self):
+        """Test empty optional filters are not sent and GET/POST follow the endpoint."""
+        client = AsyncRecordingClient({"code": "0"})
+        api = AsyncAccountAPI(client)
+        asyncio.run(api.get_bills(coin="USDT", start_time=0, limit=50))
+        assert asyncio.run(api.get_all_positions()) == []
+        assert client.calls == [
+            ("POST", "/capi/v2/account/bills", {"coin": "USDT", "limit": 50}),
+            ("GET", "/capi/v2/account/position/allPosition", {}),
+        ]
+
+    def test_place_order_body(self):
+        """Test order fields are sent as strings and empty presets left out."""
+        client = RecordingClient({"order_id": "1"})
+        TradeAPI(client).place_order(
+            "cmt_btcusdt", "c1", 1, 0, 0, 50000, 1, preset_stop_loss_price=49000
+        )
+        assert client.calls[0][2] == {
+            "symbol": "cmt_btcusdt",
+            "client_oid": "c1",
+            "size": "1",
+            "order_type": "0",
+            "match_price": "0",
+            "price": "50000",
+            "type": "1",
+            "presetStopLossPrice": "49000",
+        }
+
+    def test_cancel_order_requires_an_id(self):
+        """Test the argument check runs before anything is sent."""
+        client = AsyncRecordingClient({"code": "0"})
+        api = AsyncTradeAPI(client)
+        with pytest.raises(ValueError, match="order_id or client_oid"):
+            asyncio.run(api.cancel_order())
+        asyncio.run(api.cancel_order(client_oid=12))
+        assert client.calls == [("POST", "/capi/v2/order/cancel_order", {"clientOid": "12"})]
+        assert "ValueError: If neither order_id nor client_oid provided" in inspect.getdoc(
+            TradeAPI.cancel_order
+        )
+
+
+class TestDeclarations:
+    """Test the type checker declarations of generated methods."""
+
+    @pytest.mark.parametrize(
+        "cls, operations, asynchronous", GENERATED, ids=[cls.__name__ for cls, _, _ in GENERATED]
+    )
+    def test_declarations_match_operations(self, cls, operations, asynchronous):
+        """Test every generated method is declared with the operation's signature."""
+        declared = declarations(cls)
+        assert sorted(declared) == sorted(operation.name for operation in operations)
+        for operation in operations:
+            stub = declared[operation.name]
+            assert inspect.signature(stub) == operation.signature(), operation.name
+            assert inspect.iscoroutinefunction(stub) == asynchronous, operation.name
+
+
+class TestGenerate:
+    """Test spec validation."""
+
+    def test_unknown_path_is_rejected(self):
+        """Test operations must use an endpoint from the endpoint table."""
+        with pytest.raises(ValueError):
+            Operation("get_nothing", "/capi/v2/market/nothing", "Get nothing.", dict, "Nothing")
+
+    def test_existing_method_is_not_replaced(self):
+        """Test generation refuses to overwrite a hand-written method."""
+        operation = Operation("get_server_time", "/capi/v2/market/time", "Get time.", dict, "Time")
+
+        class API:
+            def get_server_time(self):
+                return None
+
+        with pytest.raises(TypeError):
+            generate(operation)(API)
@@ -0,0 +1,174 @@
+"""Unit tests for the on-disk market data store."""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+np = pytest.importorskip("numpy")
+from weex_sdk.downloader import CandleDownloader  # noqa: E402
+from weex_sdk.frames import CandleFrame, TradeFrame  # noqa: E402
+from weex_sdk.store import MarketStore  # noqa: E402
+
+MINUTE = 60_000
+START = 1_700_000_040_000  # aligned to the minute
+
+
+class FakeMarket:
+    """Serve every 1m candle between the requested bounds."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def get_history_candles(
+        self, symbol, granularity, start_time, end_time, limit, price_type
+    ):
+        self.calls.append({"start": start_time, "end": end_time})
+        first = start_time - start_time % MINUTE + MINUTE
+        return [
+            [str(t), "1", "2", "0.5", "1.5", "10", "15"] for t in range(first, end_time, MINUTE)
+        ][:limit]
+
+
+def candles(first, count, close="1.5"):
+    """Build a CandleFrame of consecutive 1m candles."""
+    rows = [
+        [str(START + (first + i) * MINUTE), "1", "2", "0.5", close, "10", "15"]
+        for i in range(count)
+    ]
+    return CandleFrame.from_rows(rows)
+
+
+class TestMarketStore:
+    """Test appends, inserts, range reads and downloader integration."""
+
+    def test_append_and_range_read(self, tmp_path):
+        """Test appended candles persist and range reads are memory-mapped."""
+        store = MarketStore(tmp_path)
+        assert store.write_candles("cmt_btcusdt", "1m", candles(0, 10)) == 10
+        assert store.write_candles("cmt_btcusdt", "1m", candles(8, 5)) == 3
+
+        frame = MarketStore(tmp_path).candles(
+            "cmt_btcusdt", "1m", START + 2 * MINUTE, START + 5 * MINUTE
+        )
+        assert frame.timestamp.tolist() == [START + i * MINUTE for i in (2, 3, 4)]
+        assert isinstance(frame.close.base, np.memmap)
+        assert store.last_timestamp("cmt_btcusdt", "1m", "LAST") == START + 12 * MINUTE
+
+    def test_insert_rewrites_and_keeps_stored_rows(self, tmp_path):
+        """Test older candles are merged in and stored candles are not overwritten."""
+        store = MarketStore(tmp_path)
+        store.write_candles("cmt_btcusdt", "1m", candles(5, 5))
+        assert store.write_candles("cmt_btcusdt", "1m", candles(0, 7, close="9")) == 5
+
+        frame = store.candles("cmt_btcusdt", "1m")
+        assert frame.timestamp.tolist() == [START + i * MINUTE for i in range(10)]
+        assert frame.close.tolist() == [9.0] * 5 + [1.5] * 5
+
+    def test_torn_append_is_ignored(self, tmp_path):
+        """Test extra values left in one column by a crash are not read."""
+        store = MarketStore(tmp_path)
+        store.write_candles("cmt_btcusdt", "1m", candles(0, 3))
+        path = os.path.join(tmp_path, "candles", "cmt_btcusdt", "1m", "LAST", "open.bin")
+        with open(path, "ab") as f:
+            f.write(np.zeros(2).tobytes())
+
+        assert len(store.candles("cmt_btcusdt", "1m")) == 3
+        store.write_candles("cmt_btcusdt", "1m", candles(3, 1))
+        assert store.candles("cmt_btcusdt", "1m").open.tolist() == [1.0] * 4
+
+    def test_reads_during_rewrite(self, tmp_path, monkeypatch):
+        """Test readers never see the series missing while a rewrite swaps it in."""
+        replace = os.replace
+
+        def slow_replace(src, dst):
+            # Widen the window in which the series directory is moved aside
+            replace(src, dst)
+            if dst.endswith(".old"):
+                time.sleep(0.002)
+
+        monkeypatch.setattr(os, "replace", slow_replace)
+        store = MarketStore(tmp_path)
+        store.write_candles("cmt_btcusdt", "1m", candles(100, 200))
+        stop = threading.Event()
+        lengths = []
+        errors = []
+
+        def read():
+            while not stop.is_set():
+                try:
+                    lengths.append(len(store.candles("cmt_btcusdt", "1m")))
+                    store.missing_ranges("cmt_btcusdt", "1m", "LAST", START, START + MINUTE)
+                except Exception as e:
+                    errors.append(e)
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        try:
+            # Each older candle is inserted by rewriting the whole series
+            for i in range(99, 79, -1):
+                assert store.write_candles("cmt_btcusdt", "1m", candles(i, 1)) == 1
+        finally:
+            stop.set()
+            reader.join()
+
+        assert errors == []
+        assert lengths and min(lengths) >= 200
+        assert len(store.candles("cmt_btcusdt", "1m")) == 220
+
+    def test_missing_ranges(self, tmp_path):
+        """Test gaps inside and around the stored data are reported."""
+        store = MarketStore(tmp_path)
+        store.write_candles("cmt_btcusdt", "1m", candles(5, 5))
+        store.write_candles("cmt_btcusdt", "1m", candles(12, 3))
+
+        ranges = store.missing_ranges(
+            "cmt_btcusdt", "1m", "LAST", START + 2 * MINUTE, START + 20 * MINUTE
+        )
+        assert ranges == [
+            (START + 2 * MINUTE, START + 5 * MINUTE),
+            (START + 10 * MINUTE, START + 12 * MINUTE),
+            (START + 15 * MINUTE, START + 20 * MINUTE),
+        ]
+
+    def test_downloader_fetches_only_missing(self, tmp_path):
+        """Test a downloader writing into the store skips stored candles."""
+        store = MarketStore(tmp_path)
+        store.write_candles("cmt_btcusdt", "1m", candles(10, 20))
+        market = FakeMarket()
+        downloader = CandleDownloader(market, store, concurrency=3, window_size=10)
+        stats = asyncio.run(
+            downloader.download_series("cmt_btcusdt", "1m", START, START + 45 * MINUTE)
+        )
+
+        assert stats.candles == 25
+        assert [call["start"] for call in market.calls] == [
+            START - 1,
+            START + 30 * MINUTE - 1,
+            START + 40 * MINUTE - 1,
+        ]
+        frame = store.candles("cmt_btcusdt", "1m")
+        assert frame.timestamp.tolist() == [START + i * MINUTE for i in range(45)]
+
+    def test_trades_dedupe_by_id(self, tmp_path):
+        """Test trades at the last stored millisecond are appended once."""
+        store = MarketStore(tmp_path)
+
+        def trades(*ids):
+            return TradeFrame(
+                ticket_id=list(ids),
+                time=[START + int(i[-1]) // 2 for i in ids],
+                price=[1.0] * len(ids),
+                size=[1.0] * len(ids),
+                value=[1.0] * len(ids),
+                is_buyer_maker=[False] * len(ids),
+            )
+
+        assert store.write_trades("cmt_btcusdt", trades("t0", "t1", "t2")) == 3
+        assert store.write_trades("cmt_btcusdt", trades("t2", "t3", "t4")) == 2
+        assert store.trades("cmt_btcusdt").ticket_id.tolist() == ["t0", "t1", "t2", "t3", "t4"]
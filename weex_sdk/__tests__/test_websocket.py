@@ -0,0 +1,105 @@
+"""Unit tests for the WebSocket connection loop."""
+
+import inspect
+import json
+import os
+import sys
+import threading
+from typing import Any, List
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from weex_sdk import websocket as ws_module
+from weex_sdk.websocket import WeexWebSocket
+
+
+class FakeApp:
+    """Stand-in for websocket.WebSocketApp driven by a script of connections."""
+
+    instances: List["FakeApp"] = []
+    # Per connection: True opens and then drops, False fails, "block" stays open
+    script: List[Any] = []
+
+    def __init__(
+        self, url, header=None, on_message=None, on_error=None, on_close=None, on_open=None
+    ):
+        self.on_open = on_open
+        self.on_close = on_close
+        self.sent: List[str] = []
+        self.depth = 0
+        self.closed = threading.Event()
+        FakeApp.instances.append(self)
+
+    def run_forever(self):
+        self.depth = len(inspect.stack())
+        step = FakeApp.script.pop(0) if FakeApp.script else False
+        if step:
+            self.on_open(self)
+            if step == "block":
+                self.closed.wait(5)
+            self.on_close(self, 1006, "dropped")
+
+    def send(self, message):
+        self.sent.append(message)
+
+    def close(self):
+        self.closed.set()
+
+
+@pytest.fixture
+def fake_app(monkeypatch):
+    """Replace WebSocketApp with FakeApp."""
+    FakeApp.instances = []
+    FakeApp.script = []
+    monkeypatch.setattr(ws_module.websocket, "WebSocketApp", FakeApp)
+    return FakeApp
+
+
+class TestReconnectLoop:
+    """Test supervised reconnection."""
+
+    def test_reconnects_iteratively_and_resubscribes(self, fake_app):
+        """Test reconnects do not nest and deferred subscriptions go out on open."""
+        fake_app.script = [True, True, False, False]
+        ws = WeexWebSocket(reconnect_attempts=2, reconnect_delay=0)
+        ws.subscribe_ticker("cmt_btcusdt", callback=lambda data: None)
+        ws.connect()
+
+        # Two successful connections, then two failed attempts before giving up
+        assert len(fake_app.instances) == 4
+        assert len({app.depth for app in fake_app.instances}) == 1
+        for app in fake_app.instances[:2]:
+            assert [json.loads(m)["channel"] for m in app.sent] == ["ticker.cmt_btcusdt"]
+
+    def test_start_and_stop(self, fake_app):
+        """Test start() runs in the background and stop() ends the loop."""
+        fake_app.script = ["block"]
+        ws = WeexWebSocket(reconnect_delay=0)
+        ws.start()
+        assert ws.wait_connected(timeout=5)
+        ws.stop(timeout=5)
+
+        assert not ws._thread.is_alive()
+        assert not ws.connected
+        assert len(fake_app.instances) == 1
+
+    def test_subscribe_during_resubscribe(self):
+        """Test channels registered while reconnecting do not break the open handler."""
+        ws = WeexWebSocket()
+        ws.subscribe_ticker("cmt_btcusdt", callback=lambda data: None)
+        ws.subscribe_ticker("cmt_ethusdt", callback=lambda data: None)
+        sent = []
+
+        def send(message):
+            # Another thread subscribes while the socket thread resubscribes
+            sent.append(json.loads(message)["channel"])
+            ws.subscriptions.setdefault(
+                "trades.cmt_btcusdt", ws.subscriptions["ticker.cmt_btcusdt"]
+            )
+
+        ws.send = send
+        ws._on_open(None)
+
+        assert ws.wait_connected(timeout=0)
+        assert sent == ["ticker.cmt_btcusdt", "ticker.cmt_ethusdt"]
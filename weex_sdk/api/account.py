@@ -1,15 +1,218 @@
-"""Account API module for Weex SDK."""
+"""Account API module for Weex SDK.
 
-from typing import Any, Dict, List, Optional
-
-from weex_sdk.client import AsyncWeexClient, WeexClient
-from weex_sdk.models import Asset, Position
+The request methods are generated from ACCOUNT_OPERATIONS, see
+weex_sdk.api.spec; the bill iterators are written out below.
+"""
 
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Optional
 
+from weex_sdk.api.spec import OMIT_EMPTY, Operation, Param, generate
+from weex_sdk.models import Asset, Position
+from weex_sdk.pagination import PageSpec, TimeCursor, aiter_time_pages, iter_time_pages
+
+if TYPE_CHECKING:
+    from weex_sdk.async_client import AsyncWeexClient
+    from weex_sdk.client import WeexClient
+
+BILLS_PAGE = PageSpec(
+    id_key="billId", time_keys=("cTime", "ctime"), items_key="items", has_more_key="hasNextPage"
+)
+
+SYMBOL = Param("symbol", str, "Trading pair")
+MARGIN_MODE = Param(
+    "margin_mode", int, "Margin mode (1: Cross Mode, 3: Isolated Mode)", key="marginMode"
+)
+
+
+def _default_short_leverage(arguments: Dict[str, Any]) -> None:
+    """Use the long leverage for the short side unless one is given."""
+    if not arguments["short_leverage"]:
+        arguments["short_leverage"] = arguments["long_leverage"]
+
+
+ACCOUNT_OPERATIONS = (
+    Operation(
+        "get_accounts",
+        "/capi/v2/account/getAccounts",
+        "Get all account information.",
+        Dict[str, Any],
+        "Account information including account settings and collateral",
+    ),
+    Operation(
+        "get_account",
+        "/capi/v2/account/getAccount",
+        "Get account information for a specific coin.",
+        Dict[str, Any],
+        "Account information for the specified coin",
+        (Param("coin", str, "Coin name (e.g., 'USDT')"),),
+    ),
+    Operation(
+        "get_assets",
+        "/capi/v2/account/assets",
+        "Get account assets.",
+        List[Asset],
+        "List of asset information",
+    ),
+    Operation(
+        "get_bills",
+        "/capi/v2/account/bills",
+        "Get contract account bill history.",
+        Dict[str, Any],
+        "Bill history with items and pagination info",
+        (
+            Param("coin", Optional[str], "Currency name", default=None, omit=OMIT_EMPTY),
+            Param("symbol", Optional[str], "Trading pair", default=None, omit=OMIT_EMPTY),
+            Param(
+                "business_type",
+                Optional[str],
+                "Business type (deposit, withdraw, transfer_in, etc.)",
+                key="businessType",
+                default=None,
+                omit=OMIT_EMPTY,
+            ),
+            Param(
+                "start_time",
+                Optional[int],
+                "Start timestamp (milliseconds)",
+                key="startTime",
+                default=None,
+                omit=OMIT_EMPTY,
+            ),
+            Param(
+                "end_time",
+                Optional[int],
+                "End timestamp (milliseconds)",
+                key="endTime",
+                default=None,
+                omit=OMIT_EMPTY,
+            ),
+            Param(
+                "limit",
+                Optional[int],
+                "Return record limit (default: 20, min: 1, max: 100)",
+                default=None,
+                omit=OMIT_EMPTY,
+            ),
+        ),
+    ),
+    Operation(
+        "get_settings",
+        "/capi/v2/account/settings",
+        "Get account settings.",
+        Dict[str, Any],
+        "Account settings including leverage settings",
+        (
+            Param(
+                "symbol",
+                Optional[str],
+                "Trading pair (optional, returns all if not specified)",
+                default=None,
+                omit=OMIT_EMPTY,
+            ),
+        ),
+    ),
+    Operation(
+        "set_leverage",
+        "/capi/v2/account/leverage",
+        "Set leverage for a trading pair.",
+        Dict[str, Any],
+        "Response with success status",
+        (
+            SYMBOL,
+            MARGIN_MODE,
+            Param("long_leverage", str, "Long position leverage", key="longLeverage", convert=str),
+            Param(
+                "short_leverage",
+                Optional[str],
+                "Short position leverage (default: long_leverage)",
+                key="shortLeverage",
+                default=None,
+                convert=str,
+            ),
+        ),
+        prepare=_default_short_leverage,
+    ),
+    Operation(
+        "adjust_margin",
+        "/capi/v2/account/adjustMargin",
+        "Adjust margin for isolated position.",
+        Dict[str, Any],
+        "Response with success status",
+        (
+            Param(
+                "isolated_position_id",
+                int,
+                "Isolated margin position ID",
+                key="isolatedPositionId",
+            ),
+            Param(
+                "collateral_amount",
+                str,
+                "Collateral amount (positive to increase, negative to decrease)",
+                key="collateralAmount",
+                convert=str,
+            ),
+            Param("coin_id", int, "Collateral ID (default: 2 for USDT)", key="coinId", default=2),
+        ),
+    ),
+    Operation(
+        "modify_auto_append_margin",
+        "/capi/v2/account/modifyAutoAppendMargin",
+        "Modify auto-append margin setting.",
+        Dict[str, Any],
+        "Response with success status",
+        (
+            Param("position_id", int, "Isolated margin position ID", key="positionId"),
+            Param(
+                "auto_append_margin",
+                bool,
+                "Whether to enable automatic margin call",
+                key="autoAppendMargin",
+            ),
+        ),
+    ),
+    Operation(
+        "get_all_positions",
+        "/capi/v2/account/position/allPosition",
+        "Get all positions.",
+        List[Position],
+        "List of position information",
+    ),
+    Operation(
+        "get_single_position",
+        "/capi/v2/account/position/singlePosition",
+        "Get single position for a trading pair.",
+        Dict[str, Any],
+        "Position information",
+        (SYMBOL,),
+    ),
+    Operation(
+        "change_hold_model",
+        "/capi/v2/account/position/changeHoldModel",
+        "Change position holding model.",
+        Dict[str, Any],
+        "Response with success status",
+        (
+            SYMBOL,
+            MARGIN_MODE,
+            Param(
+                "separated_mode",
+                Optional[int],
+                "Position segregation mode (1: Combined mode, default: 1)",
+                key="separatedMode",
+                default=None,
+                omit=OMIT_EMPTY,
+            ),
+        ),
+    ),
+)
+
+
+@generate(*ACCOUNT_OPERATIONS)
 class AccountAPI:
     """Account API methods."""
 
-    def __init__(self, client: WeexClient) -> None:
+    def __init__(self, client: "WeexClient") -> None:
         """Initialize Account API.
 
         Args:
@@ -17,246 +220,90 @@ class AccountAPI:
         """
         self.client = client
 
-    def get_accounts(self) -> Dict[str, Any]:
-        """Get all account information.
-
-        Returns:
-            Account information including account settings and collateral
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        return self.client.get("/capi/v2/account/getAccounts")
-
-    def get_account(self, coin: str) -> Dict[str, Any]:
-        """Get account information for a specific coin.
-
-        Args:
-            coin: Coin name (e.g., 'USDT')
-
-        Returns:
-            Account information for the specified coin
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        return self.client.get("/capi/v2/account/getAccount", params={"coin": coin})
-
-    def get_assets(self) -> List[Asset]:
-        """Get account assets.
-
-        Returns:
-            List of asset information
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        response = self.client.get("/capi/v2/account/assets")
-        if isinstance(response, list):
-            return response
-        return []
-
-    def get_bills(
+    if TYPE_CHECKING:
+        # Generated from ACCOUNT_OPERATIONS; declared for type checkers
+        def get_accounts(self) -> Dict[str, Any]: ...
+        def get_account(self, coin: str) -> Dict[str, Any]: ...
+        def get_assets(self) -> List[Asset]: ...
+        def get_bills(
+            self,
+            coin: Optional[str] = None,
+            symbol: Optional[str] = None,
+            business_type: Optional[str] = None,
+            start_time: Optional[int] = None,
+            end_time: Optional[int] = None,
+            limit: Optional[int] = None,
+        ) -> Dict[str, Any]: ...
+        def get_settings(self, symbol: Optional[str] = None) -> Dict[str, Any]: ...
+        def set_leverage(
+            self,
+            symbol: str,
+            margin_mode: int,
+            long_leverage: str,
+            short_leverage: Optional[str] = None,
+        ) -> Dict[str, Any]: ...
+        def adjust_margin(
+            self, isolated_position_id: int, collateral_amount: str, coin_id: int = 2
+        ) -> Dict[str, Any]: ...
+        def modify_auto_append_margin(
+            self, position_id: int, auto_append_margin: bool
+        ) -> Dict[str, Any]: ...
+        def get_all_positions(self) -> List[Position]: ...
+        def get_single_position(self, symbol: str) -> Dict[str, Any]: ...
+        def change_hold_model(
+            self, symbol: str, margin_mode: int, separated_mode: Optional[int] = None
+        ) -> Dict[str, Any]: ...
+
+    def iter_bills(
         self,
         coin: Optional[str] = None,
         symbol: Optional[str] = None,
         business_type: Optional[str] = None,
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
-        limit: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """Get contract account bill history.
+        page_size: int = 100,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over bill history across pages, newest first.
+
+        Pages are requested lazily by time cursor, so only one or two pages
+        are held in memory. Records repeated at page boundaries are dropped.
 
         Args:
             coin: Currency name
             symbol: Trading pair
             business_type: Business type (deposit, withdraw, transfer_in, etc.)
-            start_time: Start timestamp (milliseconds)
-            end_time: End timestamp (milliseconds)
-            limit: Return record limit (default: 20, min: 1, max: 100)
-
-        Returns:
-            Bill history with items and pagination info
+            start_time: Oldest bill time to return (milliseconds)
+            end_time: Newest bill time to return (milliseconds, default: now)
+            page_size: Bills per request (max: 100)
+            prefetch: Fetch the next page while the current one is consumed
 
-        Raises:
-            WeexAPIError: On API errors
-        """
-        data: Dict[str, Any] = {}
-        if coin:
-            data["coin"] = coin
-        if symbol:
-            data["symbol"] = symbol
-        if business_type:
-            data["businessType"] = business_type
-        if start_time:
-            data["startTime"] = start_time
-        if end_time:
-            data["endTime"] = end_time
-        if limit:
-            data["limit"] = limit
-
-        return self.client.post("/capi/v2/account/bills", data=data)
-
-    def get_settings(self, symbol: Optional[str] = None) -> Dict[str, Any]:
-        """Get account settings.
-
-        Args:
-            symbol: Trading pair (optional, returns all if not specified)
-
-        Returns:
-            Account settings including leverage settings
+        Yields:
+            Bill records
 
         Raises:
             WeexAPIError: On API errors
         """
-        params = {}
-        if symbol:
-            params["symbol"] = symbol
-        return self.client.get("/capi/v2/account/settings", params=params)
-
-    def set_leverage(
-        self,
-        symbol: str,
-        margin_mode: int,
-        long_leverage: str,
-        short_leverage: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Set leverage for a trading pair.
+        cursor = TimeCursor(BILLS_PAGE, page_size, start_time=start_time, end_time=end_time)
 
-        Args:
-            symbol: Trading pair
-            margin_mode: Margin mode (1: Cross Mode, 3: Isolated Mode)
-            long_leverage: Long position leverage
-            short_leverage: Short position leverage (required for isolated mode)
+        def fetch(page_end: Optional[int]) -> Dict[str, Any]:
+            return self.get_bills(
+                coin=coin,
+                symbol=symbol,
+                business_type=business_type,
+                start_time=start_time,
+                end_time=page_end,
+                limit=page_size,
+            )
 
-        Returns:
-            Response with success status
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        if margin_mode == 3 and not short_leverage:
-            short_leverage = long_leverage
-
-        data = {
-            "symbol": symbol,
-            "marginMode": margin_mode,
-            "longLeverage": str(long_leverage),
-            "shortLeverage": str(short_leverage) if short_leverage else str(long_leverage),
-        }
-        return self.client.post("/capi/v2/account/leverage", data=data)
-
-    def adjust_margin(
-        self,
-        isolated_position_id: int,
-        collateral_amount: str,
-        coin_id: int = 2,
-    ) -> Dict[str, Any]:
-        """Adjust margin for isolated position.
-
-        Args:
-            isolated_position_id: Isolated margin position ID
-            collateral_amount: Collateral amount (positive to increase, negative to decrease)
-            coin_id: Collateral ID (default: 2 for USDT)
-
-        Returns:
-            Response with success status
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        data = {
-            "coinId": coin_id,
-            "isolatedPositionId": isolated_position_id,
-            "collateralAmount": str(collateral_amount),
-        }
-        return self.client.post("/capi/v2/account/adjustMargin", data=data)
-
-    def modify_auto_append_margin(
-        self,
-        position_id: int,
-        auto_append_margin: bool,
-    ) -> Dict[str, Any]:
-        """Modify auto-append margin setting.
-
-        Args:
-            position_id: Isolated margin position ID
-            auto_append_margin: Whether to enable automatic margin call
-
-        Returns:
-            Response with success status
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        data = {
-            "positionId": position_id,
-            "autoAppendMargin": auto_append_margin,
-        }
-        return self.client.post("/capi/v2/account/modifyAutoAppendMargin", data=data)
-
-    def get_all_positions(self) -> List[Position]:
-        """Get all positions.
-
-        Returns:
-            List of position information
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        response = self.client.get("/capi/v2/account/position/allPosition")
-        if isinstance(response, list):
-            return response
-        return []
-
-    def get_single_position(self, symbol: str) -> Dict[str, Any]:
-        """Get single position for a trading pair.
-
-        Args:
-            symbol: Trading pair
-
-        Returns:
-            Position information
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        return self.client.get(
-            "/capi/v2/account/position/singlePosition", params={"symbol": symbol}
-        )
-
-    def change_hold_model(
-        self,
-        symbol: str,
-        margin_mode: int,
-        separated_mode: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """Change position holding model.
-
-        Args:
-            symbol: Trading pair
-            margin_mode: Margin mode (1: Cross Mode, 3: Isolated Mode)
-            separated_mode: Position segregation mode (1: Combined mode, default: 1)
-
-        Returns:
-            Response with success status
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        data = {
-            "symbol": symbol,
-            "marginMode": margin_mode,
-        }
-        if separated_mode:
-            data["separatedMode"] = separated_mode
-        return self.client.post("/capi/v2/account/position/changeHoldModel", data=data)
+        return iter_time_pages(fetch, cursor, prefetch=prefetch)
 
 
+@generate(*ACCOUNT_OPERATIONS, asynchronous=True)
 class AsyncAccountAPI:
     """Async Account API methods."""
 
-    def __init__(self, client: AsyncWeexClient) -> None:
+    def __init__(self, client: "AsyncWeexClient") -> None:
         """Initialize Async Account API.
 
         Args:
@@ -264,121 +311,64 @@ class AsyncAccountAPI:
         """
         self.client = client
 
-    async def get_accounts(self) -> Dict[str, Any]:
-        """Get all account information (async)."""
-        return await self.client.get("/capi/v2/account/getAccounts")
-
-    async def get_account(self, coin: str) -> Dict[str, Any]:
-        """Get account information for a specific coin (async)."""
-        return await self.client.get("/capi/v2/account/getAccount", params={"coin": coin})
-
-    async def get_assets(self) -> List[Asset]:
-        """Get account assets (async)."""
-        response = await self.client.get("/capi/v2/account/assets")
-        if isinstance(response, list):
-            return response
-        return []
-
-    async def get_bills(
+    if TYPE_CHECKING:
+        # Generated from ACCOUNT_OPERATIONS; declared for type checkers
+        async def get_accounts(self) -> Dict[str, Any]: ...
+        async def get_account(self, coin: str) -> Dict[str, Any]: ...
+        async def get_assets(self) -> List[Asset]: ...
+        async def get_bills(
+            self,
+            coin: Optional[str] = None,
+            symbol: Optional[str] = None,
+            business_type: Optional[str] = None,
+            start_time: Optional[int] = None,
+            end_time: Optional[int] = None,
+            limit: Optional[int] = None,
+        ) -> Dict[str, Any]: ...
+        async def get_settings(self, symbol: Optional[str] = None) -> Dict[str, Any]: ...
+        async def set_leverage(
+            self,
+            symbol: str,
+            margin_mode: int,
+            long_leverage: str,
+            short_leverage: Optional[str] = None,
+        ) -> Dict[str, Any]: ...
+        async def adjust_margin(
+            self, isolated_position_id: int, collateral_amount: str, coin_id: int = 2
+        ) -> Dict[str, Any]: ...
+        async def modify_auto_append_margin(
+            self, position_id: int, auto_append_margin: bool
+        ) -> Dict[str, Any]: ...
+        async def get_all_positions(self) -> List[Position]: ...
+        async def get_single_position(self, symbol: str) -> Dict[str, Any]: ...
+        async def change_hold_model(
+            self, symbol: str, margin_mode: int, separated_mode: Optional[int] = None
+        ) -> Dict[str, Any]: ...
+
+    def iter_bills(
         self,
         coin: Optional[str] = None,
         symbol: Optional[str] = None,
         business_type: Optional[str] = None,
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
-        limit: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """Get contract account bill history (async)."""
-        data: Dict[str, Any] = {}
-        if coin:
-            data["coin"] = coin
-        if symbol:
-            data["symbol"] = symbol
-        if business_type:
-            data["businessType"] = business_type
-        if start_time:
-            data["startTime"] = start_time
-        if end_time:
-            data["endTime"] = end_time
-        if limit:
-            data["limit"] = limit
-        return await self.client.post("/capi/v2/account/bills", data=data)
-
-    async def get_settings(self, symbol: Optional[str] = None) -> Dict[str, Any]:
-        """Get account settings (async)."""
-        params = {}
-        if symbol:
-            params["symbol"] = symbol
-        return await self.client.get("/capi/v2/account/settings", params=params)
-
-    async def set_leverage(
-        self,
-        symbol: str,
-        margin_mode: int,
-        long_leverage: str,
-        short_leverage: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Set leverage for a trading pair (async)."""
-        if margin_mode == 3 and not short_leverage:
-            short_leverage = long_leverage
-        data = {
-            "symbol": symbol,
-            "marginMode": margin_mode,
-            "longLeverage": str(long_leverage),
-            "shortLeverage": str(short_leverage) if short_leverage else str(long_leverage),
-        }
-        return await self.client.post("/capi/v2/account/leverage", data=data)
-
-    async def adjust_margin(
-        self,
-        isolated_position_id: int,
-        collateral_amount: str,
-        coin_id: int = 2,
-    ) -> Dict[str, Any]:
-        """Adjust margin for isolated position (async)."""
-        data = {
-            "coinId": coin_id,
-            "isolatedPositionId": isolated_position_id,
-            "collateralAmount": str(collateral_amount),
-        }
-        return await self.client.post("/capi/v2/account/adjustMargin", data=data)
+        page_size: int = 100,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over bill history across pages, newest first (async).
 
-    async def modify_auto_append_margin(
-        self,
-        position_id: int,
-        auto_append_margin: bool,
-    ) -> Dict[str, Any]:
-        """Modify auto-append margin setting (async)."""
-        data = {
-            "positionId": position_id,
-            "autoAppendMargin": auto_append_margin,
-        }
-        return await self.client.post("/capi/v2/account/modifyAutoAppendMargin", data=data)
-
-    async def get_all_positions(self) -> List[Position]:
-        """Get all positions (async)."""
-        response = await self.client.get("/capi/v2/account/position/allPosition")
-        if isinstance(response, list):
-            return response
-        return []
-
-    async def get_single_position(self, symbol: str) -> Dict[str, Any]:
-        """Get single position for a trading pair (async)."""
-        return await self.client.get(
-            "/capi/v2/account/position/singlePosition", params={"symbol": symbol}
-        )
-
-    async def change_hold_model(
-        self,
-        symbol: str,
-        margin_mode: int,
-        separated_mode: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """Change position holding model (async)."""
-        data = {
-            "symbol": symbol,
-            "marginMode": margin_mode,
-        }
-        if separated_mode:
-            data["separatedMode"] = separated_mode
-        return await self.client.post("/capi/v2/account/position/changeHoldModel", data=data)
+        Use with ``async for``; see AccountAPI.iter_bills.
+        """
+        cursor = TimeCursor(BILLS_PAGE, page_size, start_time=start_time, end_time=end_time)
+
+        async def fetch(page_end: Optional[int]) -> Dict[str, Any]:
+            return await self.get_bills(
+                coin=coin,
+                symbol=symbol,
+                business_type=business_type,
+                start_time=start_time,
+                end_time=page_end,
+                limit=page_size,
+            )
+
+        return aiter_time_pages(fetch, cursor, prefetch=prefetch)
@@ -1,14 +1,16 @@
 """AI API module for Weex SDK."""
 
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from weex_sdk.client import AsyncWeexClient, WeexClient
+if TYPE_CHECKING:
+    from weex_sdk.async_client import AsyncWeexClient
+    from weex_sdk.client import WeexClient
 
 
 class AIAPI:
     """AI API methods."""
 
-    def __init__(self, client: WeexClient) -> None:
+    def __init__(self, client: "WeexClient") -> None:
         """Initialize AI API.
 
         Args:
@@ -68,7 +70,7 @@ class AIAPI:
 class AsyncAIAPI:
     """Async AI API methods."""
 
-    def __init__(self, client: AsyncWeexClient) -> None:
+    def __init__(self, client: "AsyncWeexClient") -> None:
         """Initialize Async AI API.
 
         Args:
@@ -1,15 +1,202 @@
-"""Market API module for Weex SDK."""
+"""Market API module for Weex SDK.
 
-from typing import Any, Dict, List, Optional
+The request methods are generated from MARKET_OPERATIONS, see
+weex_sdk.api.spec; the NumPy frame helpers are written out below.
+"""
 
-from weex_sdk.client import AsyncWeexClient, WeexClient
-from weex_sdk.models import Contract, Depth, Ticker, Trade
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from weex_sdk.api.spec import OMIT_EMPTY, Operation, Param, generate
+from weex_sdk.models import Contract, Depth, Ticker, Trade
 
+if TYPE_CHECKING:
+    from weex_sdk.async_client import AsyncWeexClient
+    from weex_sdk.client import WeexClient
+    from weex_sdk.frames import CandleFrame, TradeFrame
+
+SYMBOL = Param("symbol", str, "Trading pair")
+OPTIONAL_SYMBOL = Param(
+    "symbol",
+    Optional[str],
+    "Trading pair (optional, returns all if not specified)",
+    default=None,
+    omit=OMIT_EMPTY,
+)
+GRANULARITY = Param("granularity", str, "Candlestick interval [1m,5m,15m,30m,1h,4h,12h,1d,1w]")
+
+MARKET_OPERATIONS = (
+    Operation(
+        "get_server_time",
+        "/capi/v2/market/time",
+        "Get server time.",
+        Dict[str, Any],
+        "Server time information (epoch, iso, timestamp)",
+    ),
+    Operation(
+        "get_contracts",
+        "/capi/v2/market/contracts",
+        "Get contract information.",
+        List[Contract],
+        "List of contract information",
+        (OPTIONAL_SYMBOL,),
+    ),
+    Operation(
+        "get_depth",
+        "/capi/v2/market/depth",
+        "Get market depth.",
+        Depth,
+        "Market depth data (asks, bids, timestamp)",
+        (
+            SYMBOL,
+            Param("limit", int, "Fixed gear enumeration value: 15/200 (default: 15)", default=15),
+        ),
+    ),
+    Operation(
+        "get_tickers",
+        "/capi/v2/market/tickers",
+        "Get all tickers.",
+        List[Ticker],
+        "List of ticker information for all trading pairs",
+    ),
+    Operation(
+        "get_ticker",
+        "/capi/v2/market/ticker",
+        "Get ticker for a specific trading pair.",
+        Ticker,
+        "Ticker information",
+        (SYMBOL,),
+    ),
+    Operation(
+        "get_trades",
+        "/capi/v2/market/trades",
+        "Get recent trades.",
+        List[Trade],
+        "List of recent trades",
+        (
+            SYMBOL,
+            Param(
+                "limit", int, "Number of trades to return (default: 100, max: 1000)", default=100
+            ),
+        ),
+    ),
+    Operation(
+        "get_candles",
+        "/capi/v2/market/candles",
+        "Get K-line/candlestick data.",
+        List[List[str]],
+        "List of candlestick data arrays",
+        (
+            SYMBOL,
+            GRANULARITY,
+            Param(
+                "limit", int, "Number of candles to return (default: 100, max: 1000)", default=100
+            ),
+            Param(
+                "price_type",
+                str,
+                "Price Type: LAST (latest market price), MARK (mark), INDEX (index)",
+                key="priceType",
+                default="LAST",
+            ),
+        ),
+    ),
+    Operation(
+        "get_history_candles",
+        "/capi/v2/market/historyCandles",
+        "Get historical K-line/candlestick data.",
+        List[List[str]],
+        "List of historical candlestick data arrays",
+        (
+            SYMBOL,
+            GRANULARITY,
+            Param(
+                "start_time",
+                Optional[int],
+                "Start timestamp (milliseconds)",
+                key="startTime",
+                default=None,
+                omit=OMIT_EMPTY,
+            ),
+            Param(
+                "end_time",
+                Optional[int],
+                "End timestamp (milliseconds)",
+                key="endTime",
+                default=None,
+                omit=OMIT_EMPTY,
+            ),
+            Param(
+                "limit", int, "Number of candles to return (default: 100, max: 100)", default=100
+            ),
+            Param(
+                "price_type",
+                str,
+                "Price Type: LAST, MARK, INDEX",
+                key="priceType",
+                default="LAST",
+            ),
+        ),
+    ),
+    Operation(
+        "get_index",
+        "/capi/v2/market/index",
+        "Get index price.",
+        Dict[str, Any],
+        "Index price information",
+        (
+            SYMBOL,
+            Param(
+                "price_type",
+                str,
+                "Price Type: MARK (mark), INDEX (index, default)",
+                key="priceType",
+                default="INDEX",
+            ),
+        ),
+    ),
+    Operation(
+        "get_open_interest",
+        "/capi/v2/market/open_interest",
+        "Get open interest.",
+        List[Dict[str, Any]],
+        "Open interest information",
+        (SYMBOL,),
+    ),
+    Operation(
+        "get_funding_time",
+        "/capi/v2/market/funding_time",
+        "Get funding fee settlement time.",
+        Dict[str, Any],
+        "Funding time information",
+        (SYMBOL,),
+    ),
+    Operation(
+        "get_history_fund_rate",
+        "/capi/v2/market/getHistoryFundRate",
+        "Get historical funding rates.",
+        List[Dict[str, Any]],
+        "List of historical funding rate information",
+        (
+            SYMBOL,
+            Param("limit", int, "Number of records to return (default: 10, max: 100)", default=10),
+        ),
+    ),
+    Operation(
+        "get_current_fund_rate",
+        "/capi/v2/market/currentFundRate",
+        "Get current funding rate.",
+        List[Dict[str, Any]],
+        "List of current funding rate information",
+        (OPTIONAL_SYMBOL,),
+    ),
+)
+
+
+@generate(*MARKET_OPERATIONS)
 class MarketAPI:
     """Market API methods."""
 
-    def __init__(self, client: WeexClient) -> None:
+    def __init__(self, client: "WeexClient") -> None:
         """Initialize Market API.
 
         Args:
@@ -17,108 +204,57 @@ class MarketAPI:
         """
         self.client = client
 
-    def get_server_time(self) -> Dict[str, Any]:
-        """Get server time.
-
-        Returns:
-            Server time information (epoch, iso, timestamp)
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        return self.client.get("/capi/v2/market/time")
-
-    def get_contracts(self, symbol: Optional[str] = None) -> List[Contract]:
-        """Get contract information.
-
-        Args:
-            symbol: Trading pair (optional, returns all if not specified)
-
-        Returns:
-            List of contract information
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        params = {}
-        if symbol:
-            params["symbol"] = symbol
-        response = self.client.get("/capi/v2/market/contracts", params=params)
-        if isinstance(response, list):
-            return response
-        return []
-
-    def get_depth(self, symbol: str, limit: int = 15) -> Depth:
-        """Get market depth.
-
-        Args:
-            symbol: Trading pair
-            limit: Fixed gear enumeration value: 15/200 (default: 15)
-
-        Returns:
-            Market depth data (asks, bids, timestamp)
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        return self.client.get("/capi/v2/market/depth", params={"symbol": symbol, "limit": limit})
-
-    def get_tickers(self) -> List[Ticker]:
-        """Get all tickers.
-
-        Returns:
-            List of ticker information for all trading pairs
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        response = self.client.get("/capi/v2/market/tickers")
-        if isinstance(response, list):
-            return response
-        return []
-
-    def get_ticker(self, symbol: str) -> Ticker:
-        """Get ticker for a specific trading pair.
-
-        Args:
-            symbol: Trading pair
-
-        Returns:
-            Ticker information
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        return self.client.get("/capi/v2/market/ticker", params={"symbol": symbol})
-
-    def get_trades(self, symbol: str, limit: int = 100) -> List[Trade]:
-        """Get recent trades.
+    if TYPE_CHECKING:
+        # Generated from MARKET_OPERATIONS; declared for type checkers
+        def get_server_time(self) -> Dict[str, Any]: ...
+        def get_contracts(self, symbol: Optional[str] = None) -> List[Contract]: ...
+        def get_depth(self, symbol: str, limit: int = 15) -> Depth: ...
+        def get_tickers(self) -> List[Ticker]: ...
+        def get_ticker(self, symbol: str) -> Ticker: ...
+        def get_trades(self, symbol: str, limit: int = 100) -> List[Trade]: ...
+        def get_candles(
+            self, symbol: str, granularity: str, limit: int = 100, price_type: str = "LAST"
+        ) -> List[List[str]]: ...
+        def get_history_candles(
+            self,
+            symbol: str,
+            granularity: str,
+            start_time: Optional[int] = None,
+            end_time: Optional[int] = None,
+            limit: int = 100,
+            price_type: str = "LAST",
+        ) -> List[List[str]]: ...
+        def get_index(self, symbol: str, price_type: str = "INDEX") -> Dict[str, Any]: ...
+        def get_open_interest(self, symbol: str) -> List[Dict[str, Any]]: ...
+        def get_funding_time(self, symbol: str) -> Dict[str, Any]: ...
+        def get_history_fund_rate(self, symbol: str, limit: int = 10) -> List[Dict[str, Any]]: ...
+        def get_current_fund_rate(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]: ...
+
+    def get_trades_frame(self, symbol: str, limit: int = 100) -> "TradeFrame":
+        """Get recent trades as NumPy columns (requires numpy).
 
         Args:
             symbol: Trading pair
             limit: Number of trades to return (default: 100, max: 1000)
 
         Returns:
-            List of recent trades
+            TradeFrame ordered by time
 
         Raises:
             WeexAPIError: On API errors
         """
-        response = self.client.get(
-            "/capi/v2/market/trades", params={"symbol": symbol, "limit": limit}
-        )
-        if isinstance(response, list):
-            return response
-        return []
+        from weex_sdk.frames import TradeFrame
+
+        return TradeFrame.from_records(self.get_trades(symbol, limit))
 
-    def get_candles(
+    def get_candles_frame(
         self,
         symbol: str,
         granularity: str,
         limit: int = 100,
         price_type: str = "LAST",
-    ) -> List[List[str]]:
-        """Get K-line/candlestick data.
+    ) -> "CandleFrame":
+        """Get K-line/candlestick data as NumPy columns (requires numpy).
 
         Args:
             symbol: Trading pair
@@ -127,23 +263,16 @@ class MarketAPI:
             price_type: Price Type: LAST (latest market price), MARK (mark), INDEX (index)
 
         Returns:
-            List of candlestick data arrays
+            CandleFrame ordered by open time
 
         Raises:
             WeexAPIError: On API errors
         """
-        params = {
-            "symbol": symbol,
-            "granularity": granularity,
-            "limit": limit,
-            "priceType": price_type,
-        }
-        response = self.client.get("/capi/v2/market/candles", params=params)
-        if isinstance(response, list):
-            return response
-        return []
-
-    def get_history_candles(
+        from weex_sdk.frames import CandleFrame
+
+        return CandleFrame.from_rows(self.get_candles(symbol, granularity, limit, price_type))
+
+    def get_history_candles_frame(
         self,
         symbol: str,
         granularity: str,
@@ -151,8 +280,8 @@ class MarketAPI:
         end_time: Optional[int] = None,
         limit: int = 100,
         price_type: str = "LAST",
-    ) -> List[List[str]]:
-        """Get historical K-line/candlestick data.
+    ) -> "CandleFrame":
+        """Get historical K-line/candlestick data as NumPy columns (requires numpy).
 
         Args:
             symbol: Trading pair
@@ -163,121 +292,23 @@ class MarketAPI:
             price_type: Price Type: LAST, MARK, INDEX
 
         Returns:
-            List of historical candlestick data arrays
+            CandleFrame ordered by open time
 
         Raises:
             WeexAPIError: On API errors
         """
-        params = {
-            "symbol": symbol,
-            "granularity": granularity,
-            "limit": limit,
-            "priceType": price_type,
-        }
-        if start_time:
-            params["startTime"] = start_time
-        if end_time:
-            params["endTime"] = end_time
-
-        response = self.client.get("/capi/v2/market/historyCandles", params=params)
-        if isinstance(response, list):
-            return response
-        return []
-
-    def get_index(self, symbol: str, price_type: str = "INDEX") -> Dict[str, Any]:
-        """Get index price.
-
-        Args:
-            symbol: Trading pair
-            price_type: Price Type: MARK (mark), INDEX (index, default)
+        from weex_sdk.frames import CandleFrame
 
-        Returns:
-            Index price information
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        return self.client.get(
-            "/capi/v2/market/index", params={"symbol": symbol, "priceType": price_type}
-        )
-
-    def get_open_interest(self, symbol: str) -> List[Dict[str, Any]]:
-        """Get open interest.
-
-        Args:
-            symbol: Trading pair
-
-        Returns:
-            Open interest information
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        response = self.client.get("/capi/v2/market/open_interest", params={"symbol": symbol})
-        if isinstance(response, list):
-            return response
-        return []
-
-    def get_funding_time(self, symbol: str) -> Dict[str, Any]:
-        """Get funding fee settlement time.
-
-        Args:
-            symbol: Trading pair
-
-        Returns:
-            Funding time information
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        return self.client.get("/capi/v2/market/funding_time", params={"symbol": symbol})
-
-    def get_history_fund_rate(self, symbol: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get historical funding rates.
-
-        Args:
-            symbol: Trading pair
-            limit: Number of records to return (default: 10, max: 100)
-
-        Returns:
-            List of historical funding rate information
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        response = self.client.get(
-            "/capi/v2/market/getHistoryFundRate",
-            params={"symbol": symbol, "limit": limit},
+        return CandleFrame.from_rows(
+            self.get_history_candles(symbol, granularity, start_time, end_time, limit, price_type)
         )
-        if isinstance(response, list):
-            return response
-        return []
-
-    def get_current_fund_rate(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get current funding rate.
-
-        Args:
-            symbol: Trading pair (optional, returns all if not specified)
-
-        Returns:
-            List of current funding rate information
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        params = {}
-        if symbol:
-            params["symbol"] = symbol
-        response = self.client.get("/capi/v2/market/currentFundRate", params=params)
-        if isinstance(response, list):
-            return response
-        return []
 
 
+@generate(*MARKET_OPERATIONS, asynchronous=True)
 class AsyncMarketAPI:
     """Async Market API methods."""
 
-    def __init__(self, client: AsyncWeexClient) -> None:
+    def __init__(self, client: "AsyncWeexClient") -> None:
         """Initialize Async Market API.
 
         Args:
@@ -285,66 +316,55 @@ class AsyncMarketAPI:
         """
         self.client = client
 
-    async def get_server_time(self) -> Dict[str, Any]:
-        """Get server time (async)."""
-        return await self.client.get("/capi/v2/market/time")
-
-    async def get_contracts(self, symbol: Optional[str] = None) -> List[Contract]:
-        """Get contract information (async)."""
-        params = {}
-        if symbol:
-            params["symbol"] = symbol
-        response = await self.client.get("/capi/v2/market/contracts", params=params)
-        if isinstance(response, list):
-            return response
-        return []
-
-    async def get_depth(self, symbol: str, limit: int = 15) -> Depth:
-        """Get market depth (async)."""
-        return await self.client.get(
-            "/capi/v2/market/depth", params={"symbol": symbol, "limit": limit}
-        )
-
-    async def get_tickers(self) -> List[Ticker]:
-        """Get all tickers (async)."""
-        response = await self.client.get("/capi/v2/market/tickers")
-        if isinstance(response, list):
-            return response
-        return []
-
-    async def get_ticker(self, symbol: str) -> Ticker:
-        """Get ticker for a specific trading pair (async)."""
-        return await self.client.get("/capi/v2/market/ticker", params={"symbol": symbol})
-
-    async def get_trades(self, symbol: str, limit: int = 100) -> List[Trade]:
-        """Get recent trades (async)."""
-        response = await self.client.get(
-            "/capi/v2/market/trades", params={"symbol": symbol, "limit": limit}
-        )
-        if isinstance(response, list):
-            return response
-        return []
-
-    async def get_candles(
+    if TYPE_CHECKING:
+        # Generated from MARKET_OPERATIONS; declared for type checkers
+        async def get_server_time(self) -> Dict[str, Any]: ...
+        async def get_contracts(self, symbol: Optional[str] = None) -> List[Contract]: ...
+        async def get_depth(self, symbol: str, limit: int = 15) -> Depth: ...
+        async def get_tickers(self) -> List[Ticker]: ...
+        async def get_ticker(self, symbol: str) -> Ticker: ...
+        async def get_trades(self, symbol: str, limit: int = 100) -> List[Trade]: ...
+        async def get_candles(
+            self, symbol: str, granularity: str, limit: int = 100, price_type: str = "LAST"
+        ) -> List[List[str]]: ...
+        async def get_history_candles(
+            self,
+            symbol: str,
+            granularity: str,
+            start_time: Optional[int] = None,
+            end_time: Optional[int] = None,
+            limit: int = 100,
+            price_type: str = "LAST",
+        ) -> List[List[str]]: ...
+        async def get_index(self, symbol: str, price_type: str = "INDEX") -> Dict[str, Any]: ...
+        async def get_open_interest(self, symbol: str) -> List[Dict[str, Any]]: ...
+        async def get_funding_time(self, symbol: str) -> Dict[str, Any]: ...
+        async def get_history_fund_rate(
+            self, symbol: str, limit: int = 10
+        ) -> List[Dict[str, Any]]: ...
+        async def get_current_fund_rate(
+            self, symbol: Optional[str] = None
+        ) -> List[Dict[str, Any]]: ...
+
+    async def get_trades_frame(self, symbol: str, limit: int = 100) -> "TradeFrame":
+        """Get recent trades as NumPy columns (async, requires numpy)."""
+        from weex_sdk.frames import TradeFrame
+
+        return TradeFrame.from_records(await self.get_trades(symbol, limit))
+
+    async def get_candles_frame(
         self,
         symbol: str,
         granularity: str,
         limit: int = 100,
         price_type: str = "LAST",
-    ) -> List[List[str]]:
-        """Get K-line/candlestick data (async)."""
-        params = {
-            "symbol": symbol,
-            "granularity": granularity,
-            "limit": limit,
-            "priceType": price_type,
-        }
-        response = await self.client.get("/capi/v2/market/candles", params=params)
-        if isinstance(response, list):
-            return response
-        return []
-
-    async def get_history_candles(
+    ) -> "CandleFrame":
+        """Get K-line/candlestick data as NumPy columns (async, requires numpy)."""
+        from weex_sdk.frames import CandleFrame
+
+        return CandleFrame.from_rows(await self.get_candles(symbol, granularity, limit, price_type))
+
+    async def get_history_candles_frame(
         self,
         symbol: str,
         granularity: str,
@@ -352,56 +372,12 @@ class AsyncMarketAPI:
         end_time: Optional[int] = None,
         limit: int = 100,
         price_type: str = "LAST",
-    ) -> List[List[str]]:
-        """Get historical K-line/candlestick data (async)."""
-        params = {
-            "symbol": symbol,
-            "granularity": granularity,
-            "limit": limit,
-            "priceType": price_type,
-        }
-        if start_time:
-            params["startTime"] = start_time
-        if end_time:
-            params["endTime"] = end_time
-        response = await self.client.get("/capi/v2/market/historyCandles", params=params)
-        if isinstance(response, list):
-            return response
-        return []
-
-    async def get_index(self, symbol: str, price_type: str = "INDEX") -> Dict[str, Any]:
-        """Get index price (async)."""
-        return await self.client.get(
-            "/capi/v2/market/index", params={"symbol": symbol, "priceType": price_type}
-        )
-
-    async def get_open_interest(self, symbol: str) -> List[Dict[str, Any]]:
-        """Get open interest (async)."""
-        response = await self.client.get("/capi/v2/market/open_interest", params={"symbol": symbol})
-        if isinstance(response, list):
-            return response
-        return []
-
-    async def get_funding_time(self, symbol: str) -> Dict[str, Any]:
-        """Get funding fee settlement time (async)."""
-        return await self.client.get("/capi/v2/market/funding_time", params={"symbol": symbol})
-
-    async def get_history_fund_rate(self, symbol: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get historical funding rates (async)."""
-        response = await self.client.get(
-            "/capi/v2/market/getHistoryFundRate",
-            params={"symbol": symbol, "limit": limit},
+    ) -> "CandleFrame":
+        """Get historical K-line/candlestick data as NumPy columns (async, requires numpy)."""
+        from weex_sdk.frames import CandleFrame
+
+        return CandleFrame.from_rows(
+            await self.get_history_candles(
+                symbol, granularity, start_time, end_time, limit, price_type
+            )
         )
-        if isinstance(response, list):
-            return response
-        return []
-
-    async def get_current_fund_rate(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get current funding rate (async)."""
-        params = {}
-        if symbol:
-            params["symbol"] = symbol
-        response = await self.client.get("/capi/v2/market/currentFundRate", params=params)
-        if isinstance(response, list):
-            return response
-        return []
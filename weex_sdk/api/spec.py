@@ -0,0 +1,263 @@
+"""Declarative specs from which API methods are generated.
+
+An Operation describes one REST call: its endpoint path, the method
+arguments and the request field each one maps to, and the response model.
+The sync and async API classes are generated from the same Operation, so
+the two variants share one definition of every request. The HTTP method
+is taken from the endpoint table in weex_sdk.endpoints.
+
+Type checkers cannot see generated methods, so each API class also
+declares them in an ``if TYPE_CHECKING:`` block. The unit tests compare
+those declarations with the operation signatures.
+"""
+
+import inspect
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+from weex_sdk.endpoints import ENDPOINTS
+
+T = TypeVar("T")
+
+# Marker for arguments without a default value
+REQUIRED = inspect.Parameter.empty
+
+# When an argument is left out of the request
+OMIT_NEVER = "never"
+OMIT_NONE = "none"  # the argument is None
+OMIT_EMPTY = "empty"  # the argument is None, 0 or an empty string
+OMIT_MODES = (OMIT_NEVER, OMIT_NONE, OMIT_EMPTY)
+
+
+@dataclass(frozen=True)
+class Param:
+    """Method argument mapped to a query parameter or body field.
+
+    Attributes:
+        name: Argument name
+        annotation: Argument type
+        doc: Argument description for the generated docstring
+        key: Request field name (default: the argument name)
+        default: Default value, REQUIRED for positional arguments without one
+        convert: Applied to the value before it is sent, e.g. str
+        omit: When the field is left out of the request (never, none, empty)
+        empty: Value sent instead of an empty argument, e.g. "0"
+    """
+
+    name: str
+    annotation: Any
+    doc: str
+    key: Optional[str] = None
+    default: Any = REQUIRED
+    convert: Optional[Callable[[Any], Any]] = None
+    omit: str = OMIT_NEVER
+    empty: Any = None
+
+    def __post_init__(self) -> None:
+        """Validate the omit mode."""
+        if self.omit not in OMIT_MODES:
+            raise ValueError(f"omit must be one of {OMIT_MODES}, got {self.omit!r}")
+
+    def add_to(self, fields: Dict[str, Any], value: Any) -> None:
+        """Add the argument value to the request fields unless it is omitted.
+
+        Args:
+            fields: Query parameters or body fields being built
+            value: Argument value
+        """
+        if not value and self.empty is not None:
+            value = self.empty
+        elif value is None and self.omit != OMIT_NEVER:
+            return
+        elif not value and self.omit == OMIT_EMPTY:
+            return
+        elif self.convert is not None:
+            value = self.convert(value)
+        fields[self.key or self.name] = value
+
+
+@dataclass(frozen=True)
+class Operation:
+    """One REST call and the API method generated for it.
+
+    Attributes:
+        name: Method name
+        path: API endpoint path, listed in weex_sdk.endpoints.ENDPOINTS
+        summary: First docstring line, ending with a period
+        returns: Response model; for List models, a response that is not a
+            list is returned as an empty list
+        returns_doc: Description of the return value
+        params: Method arguments in signature order
+        prepare: Called with the bound arguments (by name) before the request
+            is built; raises on invalid argument combinations and may fill in
+            derived values
+        raises: Extra docstring Raises lines for errors raised by prepare
+    """
+
+    name: str
+    path: str
+    summary: str
+    returns: Any
+    returns_doc: str
+    params: Tuple[Param, ...] = ()
+    prepare: Optional[Callable[[Dict[str, Any]], None]] = None
+    raises: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        """Check that the endpoint is described in the endpoint table."""
+        if self.path not in ENDPOINTS:
+            raise ValueError(f"{self.path} is missing from weex_sdk.endpoints.ENDPOINTS")
+
+    @property
+    def method(self) -> str:
+        """HTTP method of the endpoint."""
+        return ENDPOINTS[self.path].method
+
+    @property
+    def many(self) -> bool:
+        """Whether the response model is a list."""
+        return getattr(self.returns, "__origin__", None) is list
+
+    def signature(self) -> inspect.Signature:
+        """Signature of the generated method, including self."""
+        parameters = [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+        for param in self.params:
+            parameters.append(
+                inspect.Parameter(
+                    param.name,
+                    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                    default=param.default,
+                    annotation=param.annotation,
+                )
+            )
+        return inspect.Signature(parameters, return_annotation=self.returns)
+
+    def docstring(self, asynchronous: bool = False) -> str:
+        """Docstring of the generated method.
+
+        Args:
+            asynchronous: Short form used by the async API classes
+
+        Returns:
+            Google style docstring
+        """
+        if asynchronous:
+            return f"{self.summary.rstrip('.')} (async)."
+
+        sections = [self.summary]
+        if self.params:
+            args = "\n".join(f"    {param.name}: {param.doc}" for param in self.params)
+            sections.append(f"Args:\n{args}")
+        sections.append(f"Returns:\n    {self.returns_doc}")
+        raises = "\n".join(f"    {line}" for line in ("WeexAPIError: On API errors",) + self.raises)
+        sections.append(f"Raises:\n{raises}")
+        return "\n\n".join(sections)
+
+    def fields(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Build query parameters or body fields from bound arguments.
+
+        Args:
+            arguments: Argument values by name, defaults applied
+
+        Returns:
+            Request fields
+        """
+        fields: Dict[str, Any] = {}
+        for param in self.params:
+            param.add_to(fields, arguments[param.name])
+        return fields
+
+    def send(self, client: Any, fields: Dict[str, Any]) -> Any:
+        """Send the request through a client.
+
+        Args:
+            client: WeexClient or AsyncWeexClient
+            fields: Request fields
+
+        Returns:
+            Parsed response, or an awaitable of it for async clients
+        """
+        if self.method == "GET":
+            return client.get(self.path, params=fields)
+        return client.post(self.path, data=fields)
+
+    def parse(self, response: Any) -> Any:
+        """Shape a response according to the response model.
+
+        Args:
+            response: Parsed JSON response
+
+        Returns:
+            Response, an empty list for list models that got something else
+        """
+        if self.many and not isinstance(response, list):
+            return []
+        return response
+
+    def build(self, asynchronous: bool = False) -> Callable[..., Any]:
+        """Create the API method.
+
+        Args:
+            asynchronous: Create a coroutine method for AsyncWeexClient
+
+        Returns:
+            Function taking self and the operation's arguments
+        """
+        signature = self.signature()
+
+        def bind(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            api = arguments.pop("self")
+            if self.prepare is not None:
+                self.prepare(arguments)
+            return api, self.fields(arguments)
+
+        if asynchronous:
+
+            async def method(*args: Any, **kwargs: Any) -> Any:
+                api, fields = bind(args, kwargs)
+                return self.parse(await self.send(api.client, fields))
+
+        else:
+
+            def method(*args: Any, **kwargs: Any) -> Any:
+                api, fields = bind(args, kwargs)
+                return self.parse(self.send(api.client, fields))
+
+        method.__name__ = self.name
+        method.__doc__ = self.docstring(asynchronous)
+        method.__signature__ = signature  # type: ignore[attr-defined]
+        method.__annotations__ = {
+            **{param.name: param.annotation for param in self.params},
+            "return": self.returns,
+        }
+        return method
+
+
+def generate(*operations: Operation, asynchronous: bool = False) -> Callable[[Type[T]], Type[T]]:
+    """Class decorator adding a generated method for every operation.
+
+    Args:
+        *operations: Operations to add
+        asynchronous: Generate coroutine methods (for the Async* API classes)
+
+    Returns:
+        Decorator returning the class it is applied to
+
+    Raises:
+        TypeError: If the class already defines a method of the same name
+    """
+
+    def decorate(cls: Type[T]) -> Type[T]:
+        for operation in operations:
+            if operation.name in cls.__dict__:
+                raise TypeError(f"{cls.__name__}.{operation.name} is already defined")
+            method = operation.build(asynchronous)
+            method.__qualname__ = f"{cls.__qualname__}.{operation.name}"
+            method.__module__ = cls.__module__
+            setattr(cls, operation.name, method)
+        return cls
+
+    return decorate
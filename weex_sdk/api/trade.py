@@ -1,15 +1,517 @@
-"""Trade API module for Weex SDK."""
-
-from typing import Any, Dict, List, Optional
-
-from weex_sdk.client import AsyncWeexClient, WeexClient
+"""Trade API module for Weex SDK.
+
+Order methods are generated from ORDER_OPERATIONS, and plan and TP/SL
+order methods from PLAN_OPERATIONS, see weex_sdk.api.spec. The bulk
+helpers and the history iterators are written out below.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from weex_sdk.api.spec import OMIT_EMPTY, OMIT_NONE, Operation, Param, generate
+from weex_sdk.bulk import (
+    BATCH_CANCEL_LIMIT,
+    BATCH_ORDER_LIMIT,
+    BulkOrderResult,
+    CancelOutcome,
+    OrderOutcome,
+    check_unique_client_oids,
+    chunked,
+    failed_cancel_chunk,
+    failed_chunk,
+    merge_batch_response,
+    merge_cancel_response,
+)
+from weex_sdk.exceptions import WeexAPIError
 from weex_sdk.models import Order
-
-
+from weex_sdk.pagination import PageSpec, TimeCursor, aiter_time_pages, iter_time_pages
+
+if TYPE_CHECKING:
+    from weex_sdk.async_client import AsyncWeexClient
+    from weex_sdk.client import WeexClient
+
+ORDER_HISTORY_PAGE = PageSpec(id_key="order_id", time_keys=("createTime",))
+FILLS_PAGE = PageSpec(
+    id_key="tradeId", time_keys=("createdTime",), items_key="list", has_more_key="nextFlag"
+)
+HISTORY_PLAN_PAGE = PageSpec(
+    id_key="order_id", time_keys=("createTime",), items_key="list", has_more_key="nextPage"
+)
+
+
+MARGIN_MODE = Param(
+    "margin_mode",
+    Optional[int],
+    "Margin mode (1: Cross Mode, 3: Isolated Mode, default: 1)",
+    key="marginMode",
+    default=None,
+    omit=OMIT_EMPTY,
+)
+EXECUTE_PRICE = Param(
+    "execute_price",
+    Optional[str],
+    "Execution price (optional, market price if 0 or not provided)",
+    key="executePrice",
+    default=None,
+    convert=str,
+    empty="0",
+)
+
+OPTIONAL_SYMBOL = Param(
+    "symbol", Optional[str], "Trading pair (optional)", default=None, omit=OMIT_EMPTY
+)
+START_TIME = Param(
+    "start_time",
+    Optional[int],
+    "Start timestamp (Unix milliseconds, optional)",
+    key="startTime",
+    default=None,
+    omit=OMIT_EMPTY,
+)
+END_TIME = Param(
+    "end_time",
+    Optional[int],
+    "End timestamp (Unix milliseconds, optional)",
+    key="endTime",
+    default=None,
+    omit=OMIT_EMPTY,
+)
+PAGE_SIZE = Param(
+    "page_size",
+    Optional[int],
+    "Items per page (optional)",
+    key="pageSize",
+    default=None,
+    omit=OMIT_EMPTY,
+)
+# Filters shared by get_current_orders and get_current_plan
+CURRENT_ORDER_FILTERS = (
+    OPTIONAL_SYMBOL,
+    Param(
+        "order_id",
+        Optional[str],
+        "Order ID (optional)",
+        key="orderId",
+        default=None,
+        omit=OMIT_EMPTY,
+    ),
+    Param(
+        "start_time",
+        Optional[int],
+        "Query record start time (Unix milliseconds, optional)",
+        key="startTime",
+        default=None,
+        omit=OMIT_EMPTY,
+    ),
+    Param(
+        "end_time",
+        Optional[int],
+        "Query record end time (Unix milliseconds, optional)",
+        key="endTime",
+        default=None,
+        omit=OMIT_EMPTY,
+    ),
+    Param(
+        "limit",
+        Optional[int],
+        "Limit number (default: 100, max: 100)",
+        default=None,
+        omit=OMIT_EMPTY,
+    ),
+    Param("page", Optional[int], "Page number (default: 0)", default=None, omit=OMIT_NONE),
+)
+
+
+def _require_order_id(arguments: Dict[str, Any]) -> None:
+    """Reject a cancel request naming neither an order ID nor a client order ID."""
+    if not arguments["order_id"] and not arguments["client_oid"]:
+        raise ValueError("Either order_id or client_oid must be provided")
+
+
+def _require_ids(arguments: Dict[str, Any]) -> None:
+    """Reject a batch cancel request without order IDs or client order IDs."""
+    if not arguments["ids"] and not arguments["cids"]:
+        raise ValueError("Either ids or cids must be provided")
+
+
+def _check_batch_size(arguments: Dict[str, Any]) -> None:
+    """Reject batches the endpoint would refuse, pointing to place_orders_bulk."""
+    if len(arguments["order_data_list"]) > BATCH_ORDER_LIMIT:
+        raise ValueError(
+            f"batch_orders accepts at most {BATCH_ORDER_LIMIT} orders; "
+            "use place_orders_bulk for more"
+        )
+
+
+def _strings(values: Sequence[Any]) -> List[str]:
+    """Convert IDs to the strings the API expects."""
+    return [str(value) for value in values]
+
+
+ORDER_OPERATIONS = (
+    Operation(
+        "place_order",
+        "/capi/v2/order/placeOrder",
+        "Place an order.",
+        Dict[str, Any],
+        "Order placement response with order_id",
+        (
+            Param("symbol", str, "Trading pair"),
+            Param("client_oid", str, "Custom order ID (no more than 40 characters)"),
+            Param("size", str, "Order quantity (cannot be zero or negative)", convert=str),
+            Param(
+                "order_type",
+                str,
+                "Order type (0: Normal, 1: Post-Only, 2: Fill-Or-Kill, 3: Immediate Or Cancel)",
+                convert=str,
+            ),
+            Param("match_price", str, "Price type (0: Limit price, 1: Market price)", convert=str),
+            Param("price", str, "Order price (required for limit orders)", convert=str),
+            Param(
+                "type",
+                str,
+                "Order direction (1: Open long, 2: Open short, 3: Close long, 4: Close short)",
+                convert=str,
+            ),
+            Param(
+                "preset_take_profit_price",
+                Optional[str],
+                "Preset take-profit price (optional)",
+                key="presetTakeProfitPrice",
+                default=None,
+                convert=str,
+                omit=OMIT_EMPTY,
+            ),
+            Param(
+                "preset_stop_loss_price",
+                Optional[str],
+                "Preset stop-loss price (optional)",
+                key="presetStopLossPrice",
+                default=None,
+                convert=str,
+                omit=OMIT_EMPTY,
+            ),
+            MARGIN_MODE,
+        ),
+    ),
+    Operation(
+        "batch_orders",
+        "/capi/v2/order/batchOrders",
+        "Place batch orders (max 20 orders).",
+        Dict[str, Any],
+        "Batch order placement response",
+        (
+            Param("symbol", str, "Trading pair"),
+            Param(
+                "order_data_list",
+                List[Dict[str, Any]],
+                "List of order data (same structure as place_order)",
+                key="orderDataList",
+            ),
+            MARGIN_MODE,
+        ),
+        prepare=_check_batch_size,
+        raises=("ValueError: If more than 20 orders are given",),
+    ),
+    Operation(
+        "cancel_order",
+        "/capi/v2/order/cancel_order",
+        "Cancel an order.",
+        Dict[str, Any],
+        "Cancellation response",
+        (
+            Param(
+                "order_id",
+                Optional[str],
+                "Order ID (either order_id or client_oid required)",
+                key="orderId",
+                default=None,
+                convert=str,
+                omit=OMIT_EMPTY,
+            ),
+            Param(
+                "client_oid",
+                Optional[str],
+                "Client order ID (either order_id or client_oid required)",
+                key="clientOid",
+                default=None,
+                convert=str,
+                omit=OMIT_EMPTY,
+            ),
+        ),
+        prepare=_require_order_id,
+        raises=("ValueError: If neither order_id nor client_oid provided",),
+    ),
+    Operation(
+        "cancel_batch_orders",
+        "/capi/v2/order/cancel_batch_orders",
+        "Cancel batch orders.",
+        Dict[str, Any],
+        "Batch cancellation response",
+        (
+            Param(
+                "ids",
+                Optional[List[str]],
+                "List of order IDs (either ids or cids required)",
+                default=None,
+                convert=_strings,
+                omit=OMIT_EMPTY,
+            ),
+            Param(
+                "cids",
+                Optional[List[str]],
+                "List of client order IDs (either ids or cids required)",
+                default=None,
+                convert=_strings,
+                omit=OMIT_EMPTY,
+            ),
+        ),
+        prepare=_require_ids,
+        raises=("ValueError: If neither ids nor cids provided",),
+    ),
+    Operation(
+        "get_order_detail",
+        "/capi/v2/order/detail",
+        "Get order details.",
+        Order,
+        "Order details",
+        (Param("order_id", str, "Order ID", key="orderId"),),
+    ),
+    Operation(
+        "get_order_history",
+        "/capi/v2/order/history",
+        "Get order history.",
+        List[Order],
+        "List of historical orders",
+        (
+            OPTIONAL_SYMBOL,
+            PAGE_SIZE,
+            Param(
+                "create_date",
+                Optional[int],
+                "Creation time (Unix milliseconds, must be ≤ 90 and cannot be negative)",
+                key="createDate",
+                default=None,
+                omit=OMIT_EMPTY,
+            ),
+        ),
+    ),
+    Operation(
+        "get_current_orders",
+        "/capi/v2/order/current",
+        "Get current open orders.",
+        List[Order],
+        "List of current orders",
+        CURRENT_ORDER_FILTERS,
+    ),
+    Operation(
+        "get_order_fills",
+        "/capi/v2/order/fills",
+        "Get order fill details.",
+        Dict[str, Any],
+        "Order fill details with list and pagination info",
+        (
+            Param(
+                "symbol",
+                Optional[str],
+                "Trading pair name (optional)",
+                default=None,
+                omit=OMIT_EMPTY,
+            ),
+            Param(
+                "order_id",
+                Optional[str],
+                "Order ID (optional)",
+                key="orderId",
+                default=None,
+                omit=OMIT_EMPTY,
+            ),
+            START_TIME,
+            END_TIME,
+            Param(
+                "limit",
+                Optional[int],
+                "Number of queries (max: 100, default: 100)",
+                default=None,
+                omit=OMIT_EMPTY,
+            ),
+        ),
+    ),
+    Operation(
+        "close_positions",
+        "/capi/v2/order/closePositions",
+        "Close all positions (one-click close).",
+        List[Dict[str, Any]],
+        "List of close position results",
+        (
+            Param(
+                "symbol",
+                Optional[str],
+                "Trading pair (optional, closes all if not provided)",
+                default=None,
+                omit=OMIT_EMPTY,
+            ),
+        ),
+    ),
+    Operation(
+        "cancel_all_orders",
+        "/capi/v2/order/cancelAllOrders",
+        "Cancel all orders.",
+        List[Dict[str, Any]],
+        "List of cancellation results",
+        (
+            Param(
+                "cancel_order_type",
+                str,
+                "Order type to cancel ('normal' or 'plan')",
+                key="cancelOrderType",
+            ),
+            Param(
+                "symbol",
+                Optional[str],
+                "Trading pair (optional, cancels all if not provided)",
+                default=None,
+                omit=OMIT_EMPTY,
+            ),
+        ),
+    ),
+)
+
+PLAN_OPERATIONS = (
+    Operation(
+        "place_plan_order",
+        "/capi/v2/order/plan_order",
+        "Place a plan/trigger order.",
+        Dict[str, Any],
+        "Plan order placement response",
+        (
+            Param("symbol", str, "Trading pair"),
+            Param("client_oid", str, "Custom order ID (≤40 chars, no special characters)"),
+            Param("size", str, "Order quantity in lots", convert=str),
+            Param(
+                "type",
+                str,
+                "Order direction (1: Open long, 2: Open short, 3: Close long, 4: Close short)",
+                convert=str,
+            ),
+            Param("match_type", str, "Price type (0: Limit price, 1: Market price)", convert=str),
+            Param("execute_price", str, "Execution price", convert=str),
+            Param("trigger_price", str, "Trigger price", convert=str),
+            MARGIN_MODE,
+        ),
+    ),
+    Operation(
+        "cancel_plan",
+        "/capi/v2/order/cancel_plan",
+        "Cancel a plan order.",
+        Dict[str, Any],
+        "Cancellation response",
+        (Param("order_id", str, "Plan order ID", key="orderId", convert=str),),
+    ),
+    Operation(
+        "get_current_plan",
+        "/capi/v2/order/currentPlan",
+        "Get current plan orders.",
+        List[Dict[str, Any]],
+        "List of current plan orders",
+        CURRENT_ORDER_FILTERS,
+    ),
+    Operation(
+        "get_history_plan",
+        "/capi/v2/order/historyPlan",
+        "Get history plan orders.",
+        Dict[str, Any],
+        "History plan orders with pagination info",
+        (
+            Param("symbol", str, "Trading pair"),
+            START_TIME,
+            END_TIME,
+            Param(
+                "delegate_type",
+                Optional[int],
+                "Order type (1: Open long, 2: Open short, 3: Close long, 4: Close short)",
+                key="delegateType",
+                default=None,
+                omit=OMIT_EMPTY,
+            ),
+            PAGE_SIZE,
+        ),
+    ),
+    Operation(
+        "place_tp_sl_order",
+        "/capi/v2/order/placeTpSlOrder",
+        "Place take-profit/stop-loss order.",
+        List[Dict[str, Any]],
+        "TP/SL order placement response",
+        (
+            Param("symbol", str, "Trading pair"),
+            Param(
+                "client_order_id",
+                str,
+                "Custom order ID (no more than 40 characters)",
+                key="clientOrderId",
+            ),
+            Param("plan_type", str, "TP/SL type ('profit_plan' or 'loss_plan')", key="planType"),
+            Param("trigger_price", str, "Trigger price", key="triggerPrice", convert=str),
+            Param("size", str, "Order quantity", convert=str),
+            Param(
+                "position_side", str, "Position direction ('long' or 'short')", key="positionSide"
+            ),
+            EXECUTE_PRICE,
+            MARGIN_MODE,
+        ),
+    ),
+    Operation(
+        "modify_tp_sl_order",
+        "/capi/v2/order/modifyTpSlOrder",
+        "Modify take-profit/stop-loss order.",
+        Dict[str, Any],
+        "Modification response",
+        (
+            Param("order_id", int, "Order ID of the TP/SL order to modify", key="orderId"),
+            Param("trigger_price", str, "New trigger price", key="triggerPrice", convert=str),
+            EXECUTE_PRICE,
+            Param(
+                "trigger_price_type",
+                Optional[int],
+                "Trigger price type (1: Last price, 3: Mark price, default: 1)",
+                key="triggerPriceType",
+                default=None,
+                omit=OMIT_EMPTY,
+            ),
+        ),
+    ),
+)
+
+
+def _cancel_chunks(
+    order_ids: Optional[Sequence[str]], client_oids: Optional[Sequence[str]], chunk_size: int
+) -> List[Tuple[str, List[str]]]:
+    """Split IDs into (result field, IDs) chunks; each chunk holds one kind of ID."""
+    chunks = []
+    for id_key, ids in (("order_id", order_ids), ("client_oid", client_oids)):
+        # Drop duplicates, keeping the first occurrence
+        unique = list(dict.fromkeys(str(i) for i in ids or []))
+        chunks.extend((id_key, list(chunk)) for chunk in chunked(unique, chunk_size))
+    return chunks
+
+
+@generate(*ORDER_OPERATIONS, *PLAN_OPERATIONS)
 class TradeAPI:
     """Trade API methods."""
 
-    def __init__(self, client: WeexClient) -> None:
+    def __init__(self, client: "WeexClient") -> None:
         """Initialize Trade API.
 
         Args:
@@ -17,543 +519,333 @@ class TradeAPI:
         """
         self.client = client
 
-    def place_order(
+    if TYPE_CHECKING:
+        # Generated from ORDER_OPERATIONS and PLAN_OPERATIONS; declared for type checkers
+        def place_order(
+            self,
+            symbol: str,
+            client_oid: str,
+            size: str,
+            order_type: str,
+            match_price: str,
+            price: str,
+            type: str,
+            preset_take_profit_price: Optional[str] = None,
+            preset_stop_loss_price: Optional[str] = None,
+            margin_mode: Optional[int] = None,
+        ) -> Dict[str, Any]: ...
+        def batch_orders(
+            self,
+            symbol: str,
+            order_data_list: List[Dict[str, Any]],
+            margin_mode: Optional[int] = None,
+        ) -> Dict[str, Any]: ...
+        def cancel_order(
+            self, order_id: Optional[str] = None, client_oid: Optional[str] = None
+        ) -> Dict[str, Any]: ...
+        def cancel_batch_orders(
+            self, ids: Optional[List[str]] = None, cids: Optional[List[str]] = None
+        ) -> Dict[str, Any]: ...
+        def get_order_detail(self, order_id: str) -> Order: ...
+        def get_order_history(
+            self,
+            symbol: Optional[str] = None,
+            page_size: Optional[int] = None,
+            create_date: Optional[int] = None,
+        ) -> List[Order]: ...
+        def get_current_orders(
+            self,
+            symbol: Optional[str] = None,
+            order_id: Optional[str] = None,
+            start_time: Optional[int] = None,
+            end_time: Optional[int] = None,
+            limit: Optional[int] = None,
+            page: Optional[int] = None,
+        ) -> List[Order]: ...
+        def get_order_fills(
+            self,
+            symbol: Optional[str] = None,
+            order_id: Optional[str] = None,
+            start_time: Optional[int] = None,
+            end_time: Optional[int] = None,
+            limit: Optional[int] = None,
+        ) -> Dict[str, Any]: ...
+        def close_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]: ...
+        def cancel_all_orders(
+            self, cancel_order_type: str, symbol: Optional[str] = None
+        ) -> List[Dict[str, Any]]: ...
+        def place_plan_order(
+            self,
+            symbol: str,
+            client_oid: str,
+            size: str,
+            type: str,
+            match_type: str,
+            execute_price: str,
+            trigger_price: str,
+            margin_mode: Optional[int] = None,
+        ) -> Dict[str, Any]: ...
+        def cancel_plan(self, order_id: str) -> Dict[str, Any]: ...
+        def get_current_plan(
+            self,
+            symbol: Optional[str] = None,
+            order_id: Optional[str] = None,
+            start_time: Optional[int] = None,
+            end_time: Optional[int] = None,
+            limit: Optional[int] = None,
+            page: Optional[int] = None,
+        ) -> List[Dict[str, Any]]: ...
+        def get_history_plan(
+            self,
+            symbol: str,
+            start_time: Optional[int] = None,
+            end_time: Optional[int] = None,
+            delegate_type: Optional[int] = None,
+            page_size: Optional[int] = None,
+        ) -> Dict[str, Any]: ...
+        def place_tp_sl_order(
+            self,
+            symbol: str,
+            client_order_id: str,
+            plan_type: str,
+            trigger_price: str,
+            size: str,
+            position_side: str,
+            execute_price: Optional[str] = None,
+            margin_mode: Optional[int] = None,
+        ) -> List[Dict[str, Any]]: ...
+        def modify_tp_sl_order(
+            self,
+            order_id: int,
+            trigger_price: str,
+            execute_price: Optional[str] = None,
+            trigger_price_type: Optional[int] = None,
+        ) -> Dict[str, Any]: ...
+
+    def place_orders_bulk(
         self,
         symbol: str,
-        client_oid: str,
-        size: str,
-        order_type: str,
-        match_price: str,
-        price: str,
-        type: str,
-        preset_take_profit_price: Optional[str] = None,
-        preset_stop_loss_price: Optional[str] = None,
+        orders: Sequence[Dict[str, Any]],
         margin_mode: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """Place an order.
+        concurrency: int = 4,
+        chunk_size: int = BATCH_ORDER_LIMIT,
+    ) -> BulkOrderResult:
+        """Place any number of orders as concurrent batch requests.
+
+        Orders are split into chunks of at most 20, and chunks are sent from
+        a thread pool; each request still waits for the client's rate limiter.
+        A chunk whose request fails marks all of its orders as failed. If the
+        failure happened after the request was sent (e.g. a timeout), some of
+        those orders may still have been placed, so give every order a
+        ``client_oid`` to reconcile them.
 
         Args:
             symbol: Trading pair
-            client_oid: Custom order ID (no more than 40 characters)
-            size: Order quantity (cannot be zero or negative)
-            order_type: Order type (0: Normal, 1: Post-Only, 2: Fill-Or-Kill,
-                3: Immediate Or Cancel)
-            match_price: Price type (0: Limit price, 1: Market price)
-            price: Order price (required for limit orders)
-            type: Order direction (1: Open long, 2: Open short, 3: Close long, 4: Close short)
-            preset_take_profit_price: Preset take-profit price (optional)
-            preset_stop_loss_price: Preset stop-loss price (optional)
+            orders: Order data (same structure as place_order)
             margin_mode: Margin mode (1: Cross Mode, 3: Isolated Mode, default: 1)
+            concurrency: Maximum batch requests in flight (default: 4)
+            chunk_size: Orders per batch request, at most 20 (default: 20)
 
         Returns:
-            Order placement response with order_id
+            Per-order outcomes in input order
 
         Raises:
-            WeexAPIError: On API errors
+            ValueError: If two orders share a client_oid
         """
-        data: Dict[str, Any] = {
-            "symbol": symbol,
-            "client_oid": client_oid,
-            "size": str(size),
-            "type": str(type),
-            "order_type": str(order_type),
-            "match_price": str(match_price),
-            "price": str(price),
-        }
-
-        if preset_take_profit_price:
-            data["presetTakeProfitPrice"] = str(preset_take_profit_price)
-        if preset_stop_loss_price:
-            data["presetStopLossPrice"] = str(preset_stop_loss_price)
-        if margin_mode:
-            data["marginMode"] = margin_mode
-
-        return self.client.post("/capi/v2/order/placeOrder", data=data)
-
-    def batch_orders(
+        check_unique_client_oids(orders)
+        chunks = list(chunked(list(orders), min(chunk_size, BATCH_ORDER_LIMIT)))
+
+        def send(chunk: Sequence[Dict[str, Any]]) -> Tuple[List[OrderOutcome], Any]:
+            try:
+                response = self.batch_orders(symbol, list(chunk), margin_mode)
+            except WeexAPIError as e:
+                return failed_chunk(chunk, e), e
+            return merge_batch_response(chunk, response), None
+
+        if len(chunks) <= 1 or concurrency <= 1:
+            sent = [send(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(concurrency, len(chunks)), thread_name_prefix="weex-bulk"
+            ) as executor:
+                sent = list(executor.map(send, chunks))
+
+        result = BulkOrderResult(requests=len(chunks))
+        for outcomes, error in sent:
+            result.outcomes.extend(outcomes)
+            if error is not None:
+                result.errors.append(error)
+        return result
+
+    def cancel_orders_bulk(
         self,
-        symbol: str,
-        order_data_list: List[Dict[str, Any]],
-        margin_mode: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """Place batch orders (max 20 orders).
-
-        Args:
-            symbol: Trading pair
-            order_data_list: List of order data (same structure as place_order)
-            margin_mode: Margin mode (1: Cross Mode, 3: Isolated Mode, default: 1)
-
-        Returns:
-            Batch order placement response
+        order_ids: Optional[Sequence[str]] = None,
+        client_oids: Optional[Sequence[str]] = None,
+        concurrency: int = 4,
+        chunk_size: int = BATCH_CANCEL_LIMIT,
+    ) -> Dict[str, CancelOutcome]:
+        """Cancel any number of orders as concurrent batch requests.
 
-        Raises:
-            WeexAPIError: On API errors
-        """
-        data: Dict[str, Any] = {
-            "symbol": symbol,
-            "orderDataList": order_data_list,
-        }
-        if margin_mode:
-            data["marginMode"] = margin_mode
-
-        return self.client.post("/capi/v2/order/batchOrders", data=data)
-
-    def cancel_order(
-        self,
-        order_id: Optional[str] = None,
-        client_oid: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Cancel an order.
+        IDs are split into chunks of ``chunk_size`` and chunks are sent from a
+        thread pool; each request still waits for the client's rate limiter.
 
         Args:
-            order_id: Order ID (either order_id or client_oid required)
-            client_oid: Client order ID (either order_id or client_oid required)
+            order_ids: Order IDs to cancel
+            client_oids: Client order IDs to cancel
+            concurrency: Maximum batch requests in flight (default: 4)
+            chunk_size: IDs per batch request (default: 20)
 
         Returns:
-            Cancellation response
-
-        Raises:
-            WeexAPIError: On API errors
-            ValueError: If neither order_id nor client_oid provided
+            Outcome per given ID (order IDs and client order IDs alike)
         """
-        if not order_id and not client_oid:
-            raise ValueError("Either order_id or client_oid must be provided")
-
-        data: Dict[str, Any] = {}
-        if order_id:
-            data["orderId"] = str(order_id)
-        if client_oid:
-            data["clientOid"] = str(client_oid)
-
-        return self.client.post("/capi/v2/order/cancel_order", data=data)
-
-    def cancel_batch_orders(
-        self,
-        ids: Optional[List[str]] = None,
-        cids: Optional[List[str]] = None,
-    ) -> Dict[str, Any]:
-        """Cancel batch orders.
-
-        Args:
-            ids: List of order IDs (either ids or cids required)
-            cids: List of client order IDs (either ids or cids required)
-
-        Returns:
-            Batch cancellation response
-
-        Raises:
-            WeexAPIError: On API errors
-            ValueError: If neither ids nor cids provided
-        """
-        if not ids and not cids:
-            raise ValueError("Either ids or cids must be provided")
-
-        data: Dict[str, Any] = {}
-        if ids:
-            data["ids"] = [str(id) for id in ids]
-        if cids:
-            data["cids"] = [str(cid) for cid in cids]
-
-        return self.client.post("/capi/v2/order/cancel_batch_orders", data=data)
-
-    def get_order_detail(self, order_id: str) -> Order:
-        """Get order details.
-
-        Args:
-            order_id: Order ID
-
-        Returns:
-            Order details
+        chunks = _cancel_chunks(order_ids, client_oids, chunk_size)
+
+        def send(chunk: Tuple[str, List[str]]) -> Dict[str, CancelOutcome]:
+            id_key, ids = chunk
+            try:
+                if id_key == "order_id":
+                    response = self.cancel_batch_orders(ids=ids)
+                else:
+                    response = self.cancel_batch_orders(cids=ids)
+            except WeexAPIError as e:
+                return failed_cancel_chunk(ids, id_key, e)
+            return merge_cancel_response(ids, response, id_key)
+
+        if len(chunks) <= 1 or concurrency <= 1:
+            sent = [send(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(concurrency, len(chunks)), thread_name_prefix="weex-bulk"
+            ) as executor:
+                sent = list(executor.map(send, chunks))
 
-        Raises:
-            WeexAPIError: On API errors
-        """
-        return self.client.get("/capi/v2/order/detail", params={"orderId": order_id})
+        outcomes: Dict[str, CancelOutcome] = {}
+        for chunk_outcomes in sent:
+            outcomes.update(chunk_outcomes)
+        return outcomes
 
-    def get_order_history(
+    def iter_order_history(
         self,
         symbol: Optional[str] = None,
-        page_size: Optional[int] = None,
-        create_date: Optional[int] = None,
-    ) -> List[Order]:
-        """Get order history.
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        page_size: int = 100,
+        prefetch: bool = False,
+    ) -> Iterator[Order]:
+        """Iterate over order history across pages, newest first.
+
+        Pages are requested lazily using ``createDate`` as a time cursor, so
+        only one or two pages are held in memory. Orders repeated at page
+        boundaries are dropped.
 
         Args:
             symbol: Trading pair (optional)
-            page_size: Items per page (optional)
-            create_date: Creation time (Unix milliseconds, must be ≤ 90 and cannot be negative)
+            start_time: Oldest creation time to return (milliseconds)
+            end_time: Newest creation time to return (milliseconds, default: now)
+            page_size: Orders per request
+            prefetch: Fetch the next page while the current one is consumed
 
-        Returns:
-            List of historical orders
+        Yields:
+            Historical orders
 
         Raises:
             WeexAPIError: On API errors
         """
-        params: Dict[str, Any] = {}
-        if symbol:
-            params["symbol"] = symbol
-        if page_size:
-            params["pageSize"] = page_size
-        if create_date:
-            params["createDate"] = create_date
-
-        response = self.client.get("/capi/v2/order/history", params=params)
-        if isinstance(response, list):
-            return response
-        return []
-
-    def get_current_orders(
-        self,
-        symbol: Optional[str] = None,
-        order_id: Optional[str] = None,
-        start_time: Optional[int] = None,
-        end_time: Optional[int] = None,
-        limit: Optional[int] = None,
-        page: Optional[int] = None,
-    ) -> List[Order]:
-        """Get current open orders.
+        cursor = TimeCursor(ORDER_HISTORY_PAGE, page_size, start_time=start_time, end_time=end_time)
 
-        Args:
-            symbol: Trading pair (optional)
-            order_id: Order ID (optional)
-            start_time: Query record start time (Unix milliseconds, optional)
-            end_time: Query record end time (Unix milliseconds, optional)
-            limit: Limit number (default: 100, max: 100)
-            page: Page number (default: 0)
+        def fetch(page_end: Optional[int]) -> List[Order]:
+            return self.get_order_history(symbol=symbol, page_size=page_size, create_date=page_end)
 
-        Returns:
-            List of current orders
+        return iter_time_pages(fetch, cursor, prefetch=prefetch)  # type: ignore[return-value]
 
-        Raises:
-            WeexAPIError: On API errors
-        """
-        params: Dict[str, Any] = {}
-        if symbol:
-            params["symbol"] = symbol
-        if order_id:
-            params["orderId"] = order_id
-        if start_time:
-            params["startTime"] = start_time
-        if end_time:
-            params["endTime"] = end_time
-        if limit:
-            params["limit"] = limit
-        if page is not None:
-            params["page"] = page
-
-        response = self.client.get("/capi/v2/order/current", params=params)
-        if isinstance(response, list):
-            return response
-        return []
-
-    def get_order_fills(
+    def iter_order_fills(
         self,
         symbol: Optional[str] = None,
         order_id: Optional[str] = None,
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
-        limit: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """Get order fill details.
+        page_size: int = 100,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over order fills across pages, newest first.
+
+        Pages are requested lazily by time cursor, so only one or two pages
+        are held in memory. Fills repeated at page boundaries are dropped.
 
         Args:
             symbol: Trading pair name (optional)
             order_id: Order ID (optional)
-            start_time: Start timestamp (Unix milliseconds, optional)
-            end_time: End timestamp (Unix milliseconds, optional)
-            limit: Number of queries (max: 100, default: 100)
+            start_time: Oldest fill time to return (milliseconds)
+            end_time: Newest fill time to return (milliseconds, default: now)
+            page_size: Fills per request (max: 100)
+            prefetch: Fetch the next page while the current one is consumed
 
-        Returns:
-            Order fill details with list and pagination info
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        params: Dict[str, Any] = {}
-        if symbol:
-            params["symbol"] = symbol
-        if order_id:
-            params["orderId"] = order_id
-        if start_time:
-            params["startTime"] = start_time
-        if end_time:
-            params["endTime"] = end_time
-        if limit:
-            params["limit"] = limit
-
-        return self.client.get("/capi/v2/order/fills", params=params)
-
-    def place_plan_order(
-        self,
-        symbol: str,
-        client_oid: str,
-        size: str,
-        type: str,
-        match_type: str,
-        execute_price: str,
-        trigger_price: str,
-        margin_mode: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """Place a plan/trigger order.
-
-        Args:
-            symbol: Trading pair
-            client_oid: Custom order ID (≤40 chars, no special characters)
-            size: Order quantity in lots
-            type: Order direction (1: Open long, 2: Open short, 3: Close long, 4: Close short)
-            match_type: Price type (0: Limit price, 1: Market price)
-            execute_price: Execution price
-            trigger_price: Trigger price
-            margin_mode: Margin mode (1: Cross Mode, 3: Isolated Mode, default: 1)
-
-        Returns:
-            Plan order placement response
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        data: Dict[str, Any] = {
-            "symbol": symbol,
-            "client_oid": client_oid,
-            "size": str(size),
-            "type": str(type),
-            "match_type": str(match_type),
-            "execute_price": str(execute_price),
-            "trigger_price": str(trigger_price),
-        }
-        if margin_mode:
-            data["marginMode"] = margin_mode
-
-        return self.client.post("/capi/v2/order/plan_order", data=data)
-
-    def cancel_plan(self, order_id: str) -> Dict[str, Any]:
-        """Cancel a plan order.
-
-        Args:
-            order_id: Plan order ID
-
-        Returns:
-            Cancellation response
+        Yields:
+            Fill records
 
         Raises:
             WeexAPIError: On API errors
         """
-        return self.client.post("/capi/v2/order/cancel_plan", data={"orderId": str(order_id)})
+        cursor = TimeCursor(FILLS_PAGE, page_size, start_time=start_time, end_time=end_time)
 
-    def get_current_plan(
-        self,
-        symbol: Optional[str] = None,
-        order_id: Optional[str] = None,
-        start_time: Optional[int] = None,
-        end_time: Optional[int] = None,
-        limit: Optional[int] = None,
-        page: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
-        """Get current plan orders.
+        def fetch(page_end: Optional[int]) -> Dict[str, Any]:
+            return self.get_order_fills(
+                symbol=symbol,
+                order_id=order_id,
+                start_time=start_time,
+                end_time=page_end,
+                limit=page_size,
+            )
 
-        Args:
-            symbol: Trading pair (optional)
-            order_id: Order ID (optional)
-            start_time: Query record start time (Unix milliseconds, optional)
-            end_time: Query record end time (Unix milliseconds, optional)
-            limit: Limit number (default: 100, max: 100)
-            page: Page number (default: 0)
+        return iter_time_pages(fetch, cursor, prefetch=prefetch)
 
-        Returns:
-            List of current plan orders
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        params: Dict[str, Any] = {}
-        if symbol:
-            params["symbol"] = symbol
-        if order_id:
-            params["orderId"] = order_id
-        if start_time:
-            params["startTime"] = start_time
-        if end_time:
-            params["endTime"] = end_time
-        if limit:
-            params["limit"] = limit
-        if page is not None:
-            params["page"] = page
-
-        response = self.client.get("/capi/v2/order/currentPlan", params=params)
-        if isinstance(response, list):
-            return response
-        return []
-
-    def get_history_plan(
+    def iter_history_plan(
         self,
         symbol: str,
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
         delegate_type: Optional[int] = None,
-        page_size: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """Get history plan orders.
-
-        Args:
-            symbol: Trading pair
-            start_time: Start time (Unix milliseconds, optional)
-            end_time: End time (Unix milliseconds, optional)
-            delegate_type: Order type (1: Open long, 2: Open short, 3: Close long, 4: Close short)
-            page_size: Items per page (1-100, default: 100)
-
-        Returns:
-            History plan orders with pagination info
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        params: Dict[str, Any] = {"symbol": symbol}
-        if start_time:
-            params["startTime"] = start_time
-        if end_time:
-            params["endTime"] = end_time
-        if delegate_type:
-            params["delegateType"] = delegate_type
-        if page_size:
-            params["pageSize"] = page_size
-
-        return self.client.get("/capi/v2/order/historyPlan", params=params)
-
-    def close_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Close all positions (one-click close).
-
-        Args:
-            symbol: Trading pair (optional, closes all if not provided)
-
-        Returns:
-            List of close position results
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        data: Dict[str, Any] = {}
-        if symbol:
-            data["symbol"] = symbol
-
-        response = self.client.post("/capi/v2/order/closePositions", data=data)
-        if isinstance(response, list):
-            return response
-        return []
-
-    def cancel_all_orders(
-        self,
-        cancel_order_type: str,
-        symbol: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
-        """Cancel all orders.
-
-        Args:
-            cancel_order_type: Order type to cancel ('normal' or 'plan')
-            symbol: Trading pair (optional, cancels all if not provided)
-
-        Returns:
-            List of cancellation results
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        data: Dict[str, Any] = {"cancelOrderType": cancel_order_type}
-        if symbol:
-            data["symbol"] = symbol
-
-        response = self.client.post("/capi/v2/order/cancelAllOrders", data=data)
-        if isinstance(response, list):
-            return response
-        return []
+        page_size: int = 100,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over history plan orders across pages, newest first.
 
-    def place_tp_sl_order(
-        self,
-        symbol: str,
-        client_order_id: str,
-        plan_type: str,
-        trigger_price: str,
-        size: str,
-        position_side: str,
-        execute_price: Optional[str] = None,
-        margin_mode: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
-        """Place take-profit/stop-loss order.
+        Pages are requested lazily by time cursor, so only one or two pages
+        are held in memory. Orders repeated at page boundaries are dropped.
 
         Args:
             symbol: Trading pair
-            client_order_id: Custom order ID (no more than 40 characters)
-            plan_type: TP/SL type ('profit_plan' or 'loss_plan')
-            trigger_price: Trigger price
-            size: Order quantity
-            position_side: Position direction ('long' or 'short')
-            execute_price: Execution price (optional, market price if 0 or not provided)
-            margin_mode: Margin mode (1: Cross Mode, 3: Isolated Mode, default: 1)
+            start_time: Oldest creation time to return (milliseconds)
+            end_time: Newest creation time to return (milliseconds, default: now)
+            delegate_type: Order type (1: Open long, 2: Open short, 3: Close long, 4: Close short)
+            page_size: Orders per request (1-100)
+            prefetch: Fetch the next page while the current one is consumed
 
-        Returns:
-            TP/SL order placement response
+        Yields:
+            History plan orders
 
         Raises:
             WeexAPIError: On API errors
         """
-        data: Dict[str, Any] = {
-            "symbol": symbol,
-            "clientOrderId": client_order_id,
-            "planType": plan_type,
-            "triggerPrice": str(trigger_price),
-            "size": str(size),
-            "positionSide": position_side,
-        }
-        if execute_price:
-            data["executePrice"] = str(execute_price)
-        else:
-            data["executePrice"] = "0"
-        if margin_mode:
-            data["marginMode"] = margin_mode
-
-        response = self.client.post("/capi/v2/order/placeTpSlOrder", data=data)
-        if isinstance(response, list):
-            return response
-        return []
+        cursor = TimeCursor(HISTORY_PLAN_PAGE, page_size, start_time=start_time, end_time=end_time)
 
-    def modify_tp_sl_order(
-        self,
-        order_id: int,
-        trigger_price: str,
-        execute_price: Optional[str] = None,
-        trigger_price_type: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """Modify take-profit/stop-loss order.
+        def fetch(page_end: Optional[int]) -> Dict[str, Any]:
+            return self.get_history_plan(
+                symbol,
+                start_time=start_time,
+                end_time=page_end,
+                delegate_type=delegate_type,
+                page_size=page_size,
+            )
 
-        Args:
-            order_id: Order ID of the TP/SL order to modify
-            trigger_price: New trigger price
-            execute_price: New execution price (optional, market price if 0 or not provided)
-            trigger_price_type: Trigger price type (1: Last price, 3: Mark price, default: 1)
-
-        Returns:
-            Modification response
-
-        Raises:
-            WeexAPIError: On API errors
-        """
-        data: Dict[str, Any] = {
-            "orderId": order_id,
-            "triggerPrice": str(trigger_price),
-        }
-        if execute_price:
-            data["executePrice"] = str(execute_price)
-        else:
-            data["executePrice"] = "0"
-        if trigger_price_type:
-            data["triggerPriceType"] = trigger_price_type
-
-        return self.client.post("/capi/v2/order/modifyTpSlOrder", data=data)
+        return iter_time_pages(fetch, cursor, prefetch=prefetch)
 
 
+@generate(*ORDER_OPERATIONS, *PLAN_OPERATIONS, asynchronous=True)
 class AsyncTradeAPI:
     """Async Trade API methods."""
 
-    def __init__(self, client: AsyncWeexClient) -> None:
+    def __init__(self, client: "AsyncWeexClient") -> None:
         """Initialize Async Trade API.
 
         Args:
@@ -561,126 +853,240 @@ class AsyncTradeAPI:
         """
         self.client = client
 
-    async def place_order(
+    if TYPE_CHECKING:
+        # Generated from ORDER_OPERATIONS and PLAN_OPERATIONS; declared for type checkers
+        async def place_order(
+            self,
+            symbol: str,
+            client_oid: str,
+            size: str,
+            order_type: str,
+            match_price: str,
+            price: str,
+            type: str,
+            preset_take_profit_price: Optional[str] = None,
+            preset_stop_loss_price: Optional[str] = None,
+            margin_mode: Optional[int] = None,
+        ) -> Dict[str, Any]: ...
+        async def batch_orders(
+            self,
+            symbol: str,
+            order_data_list: List[Dict[str, Any]],
+            margin_mode: Optional[int] = None,
+        ) -> Dict[str, Any]: ...
+        async def cancel_order(
+            self, order_id: Optional[str] = None, client_oid: Optional[str] = None
+        ) -> Dict[str, Any]: ...
+        async def cancel_batch_orders(
+            self, ids: Optional[List[str]] = None, cids: Optional[List[str]] = None
+        ) -> Dict[str, Any]: ...
+        async def get_order_detail(self, order_id: str) -> Order: ...
+        async def get_order_history(
+            self,
+            symbol: Optional[str] = None,
+            page_size: Optional[int] = None,
+            create_date: Optional[int] = None,
+        ) -> List[Order]: ...
+        async def get_current_orders(
+            self,
+            symbol: Optional[str] = None,
+            order_id: Optional[str] = None,
+            start_time: Optional[int] = None,
+            end_time: Optional[int] = None,
+            limit: Optional[int] = None,
+            page: Optional[int] = None,
+        ) -> List[Order]: ...
+        async def get_order_fills(
+            self,
+            symbol: Optional[str] = None,
+            order_id: Optional[str] = None,
+            start_time: Optional[int] = None,
+            end_time: Optional[int] = None,
+            limit: Optional[int] = None,
+        ) -> Dict[str, Any]: ...
+        async def close_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]: ...
+        async def cancel_all_orders(
+            self, cancel_order_type: str, symbol: Optional[str] = None
+        ) -> List[Dict[str, Any]]: ...
+        async def place_plan_order(
+            self,
+            symbol: str,
+            client_oid: str,
+            size: str,
+            type: str,
+            match_type: str,
+            execute_price: str,
+            trigger_price: str,
+            margin_mode: Optional[int] = None,
+        ) -> Dict[str, Any]: ...
+        async def cancel_plan(self, order_id: str) -> Dict[str, Any]: ...
+        async def get_current_plan(
+            self,
+            symbol: Optional[str] = None,
+            order_id: Optional[str] = None,
+            start_time: Optional[int] = None,
+            end_time: Optional[int] = None,
+            limit: Optional[int] = None,
+            page: Optional[int] = None,
+        ) -> List[Dict[str, Any]]: ...
+        async def get_history_plan(
+            self,
+            symbol: str,
+            start_time: Optional[int] = None,
+            end_time: Optional[int] = None,
+            delegate_type: Optional[int] = None,
+            page_size: Optional[int] = None,
+        ) -> Dict[str, Any]: ...
+        async def place_tp_sl_order(
+            self,
+            symbol: str,
+            client_order_id: str,
+            plan_type: str,
+            trigger_price: str,
+            size: str,
+            position_side: str,
+            execute_price: Optional[str] = None,
+            margin_mode: Optional[int] = None,
+        ) -> List[Dict[str, Any]]: ...
+        async def modify_tp_sl_order(
+            self,
+            order_id: int,
+            trigger_price: str,
+            execute_price: Optional[str] = None,
+            trigger_price_type: Optional[int] = None,
+        ) -> Dict[str, Any]: ...
+
+    async def place_orders_bulk(
         self,
         symbol: str,
-        client_oid: str,
-        size: str,
-        order_type: str,
-        match_price: str,
-        price: str,
-        type: str,
-        preset_take_profit_price: Optional[str] = None,
-        preset_stop_loss_price: Optional[str] = None,
+        orders: Sequence[Dict[str, Any]],
         margin_mode: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """Place an order (async)."""
-        data: Dict[str, Any] = {
-            "symbol": symbol,
-            "client_oid": client_oid,
-            "size": str(size),
-            "type": str(type),
-            "order_type": str(order_type),
-            "match_price": str(match_price),
-            "price": str(price),
-        }
-        if preset_take_profit_price:
-            data["presetTakeProfitPrice"] = str(preset_take_profit_price)
-        if preset_stop_loss_price:
-            data["presetStopLossPrice"] = str(preset_stop_loss_price)
-        if margin_mode:
-            data["marginMode"] = margin_mode
-        return await self.client.post("/capi/v2/order/placeOrder", data=data)
-
-    async def cancel_order(
+        concurrency: int = 4,
+        chunk_size: int = BATCH_ORDER_LIMIT,
+    ) -> BulkOrderResult:
+        """Place any number of orders as concurrent batch requests (async).
+
+        See TradeAPI.place_orders_bulk; chunks are sent with asyncio.gather.
+        """
+        check_unique_client_oids(orders)
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+        chunks = list(chunked(list(orders), min(chunk_size, BATCH_ORDER_LIMIT)))
+
+        async def send(chunk: Sequence[Dict[str, Any]]) -> Tuple[List[OrderOutcome], Any]:
+            async with semaphore:
+                try:
+                    response = await self.batch_orders(symbol, list(chunk), margin_mode)
+                except WeexAPIError as e:
+                    return failed_chunk(chunk, e), e
+            return merge_batch_response(chunk, response), None
+
+        result = BulkOrderResult(requests=len(chunks))
+        for outcomes, error in await asyncio.gather(*(send(chunk) for chunk in chunks)):
+            result.outcomes.extend(outcomes)
+            if error is not None:
+                result.errors.append(error)
+        return result
+
+    async def cancel_orders_bulk(
         self,
-        order_id: Optional[str] = None,
-        client_oid: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Cancel an order (async)."""
-        if not order_id and not client_oid:
-            raise ValueError("Either order_id or client_oid must be provided")
-        data: Dict[str, Any] = {}
-        if order_id:
-            data["orderId"] = str(order_id)
-        if client_oid:
-            data["clientOid"] = str(client_oid)
-        return await self.client.post("/capi/v2/order/cancel_order", data=data)
-
-    async def get_order_detail(self, order_id: str) -> Order:
-        """Get order details (async)."""
-        return await self.client.get("/capi/v2/order/detail", params={"orderId": order_id})
-
-    async def get_current_orders(
+        order_ids: Optional[Sequence[str]] = None,
+        client_oids: Optional[Sequence[str]] = None,
+        concurrency: int = 4,
+        chunk_size: int = BATCH_CANCEL_LIMIT,
+    ) -> Dict[str, CancelOutcome]:
+        """Cancel any number of orders as concurrent batch requests (async).
+
+        See TradeAPI.cancel_orders_bulk; chunks are sent with asyncio.gather.
+        """
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+        chunks = _cancel_chunks(order_ids, client_oids, chunk_size)
+
+        async def send(chunk: Tuple[str, List[str]]) -> Dict[str, CancelOutcome]:
+            id_key, ids = chunk
+            async with semaphore:
+                try:
+                    if id_key == "order_id":
+                        response = await self.cancel_batch_orders(ids=ids)
+                    else:
+                        response = await self.cancel_batch_orders(cids=ids)
+                except WeexAPIError as e:
+                    return failed_cancel_chunk(ids, id_key, e)
+            return merge_cancel_response(ids, response, id_key)
+
+        outcomes: Dict[str, CancelOutcome] = {}
+        for chunk_outcomes in await asyncio.gather(*(send(chunk) for chunk in chunks)):
+            outcomes.update(chunk_outcomes)
+        return outcomes
+
+    def iter_order_fills(
         self,
         symbol: Optional[str] = None,
         order_id: Optional[str] = None,
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
-        limit: Optional[int] = None,
-        page: Optional[int] = None,
-    ) -> List[Order]:
-        """Get current open orders (async)."""
-        params: Dict[str, Any] = {}
-        if symbol:
-            params["symbol"] = symbol
-        if order_id:
-            params["orderId"] = order_id
-        if start_time:
-            params["startTime"] = start_time
-        if end_time:
-            params["endTime"] = end_time
-        if limit:
-            params["limit"] = limit
-        if page is not None:
-            params["page"] = page
-        response = await self.client.get("/capi/v2/order/current", params=params)
-        if isinstance(response, list):
-            return response
-        return []
-
-    async def get_order_fills(
+        page_size: int = 100,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over order fills across pages, newest first (async).
+
+        Use with ``async for``; see TradeAPI.iter_order_fills.
+        """
+        cursor = TimeCursor(FILLS_PAGE, page_size, start_time=start_time, end_time=end_time)
+
+        async def fetch(page_end: Optional[int]) -> Dict[str, Any]:
+            return await self.get_order_fills(
+                symbol=symbol,
+                order_id=order_id,
+                start_time=start_time,
+                end_time=page_end,
+                limit=page_size,
+            )
+
+        return aiter_time_pages(fetch, cursor, prefetch=prefetch)
+
+    def iter_order_history(
         self,
         symbol: Optional[str] = None,
-        order_id: Optional[str] = None,
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
-        limit: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """Get order fill details (async)."""
-        params: Dict[str, Any] = {}
-        if symbol:
-            params["symbol"] = symbol
-        if order_id:
-            params["orderId"] = order_id
-        if start_time:
-            params["startTime"] = start_time
-        if end_time:
-            params["endTime"] = end_time
-        if limit:
-            params["limit"] = limit
-        return await self.client.get("/capi/v2/order/fills", params=params)
-
-    async def close_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Close all positions (async)."""
-        data: Dict[str, Any] = {}
-        if symbol:
-            data["symbol"] = symbol
-        response = await self.client.post("/capi/v2/order/closePositions", data=data)
-        if isinstance(response, list):
-            return response
-        return []
-
-    async def cancel_all_orders(
+        page_size: int = 100,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Order]:
+        """Iterate over order history across pages, newest first (async).
+
+        Use with ``async for``; see TradeAPI.iter_order_history.
+        """
+        cursor = TimeCursor(ORDER_HISTORY_PAGE, page_size, start_time=start_time, end_time=end_time)
+
+        async def fetch(page_end: Optional[int]) -> List[Order]:
+            return await self.get_order_history(
+                symbol=symbol, page_size=page_size, create_date=page_end
+            )
+
+        return aiter_time_pages(fetch, cursor, prefetch=prefetch)  # type: ignore[return-value]
+
+    def iter_history_plan(
         self,
-        cancel_order_type: str,
-        symbol: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
-        """Cancel all orders (async)."""
-        data: Dict[str, Any] = {"cancelOrderType": cancel_order_type}
-        if symbol:
-            data["symbol"] = symbol
-        response = await self.client.post("/capi/v2/order/cancelAllOrders", data=data)
-        if isinstance(response, list):
-            return response
-        return []
+        symbol: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        delegate_type: Optional[int] = None,
+        page_size: int = 100,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over history plan orders across pages, newest first (async).
+
+        Use with ``async for``; see TradeAPI.iter_history_plan.
+        """
+        cursor = TimeCursor(HISTORY_PLAN_PAGE, page_size, start_time=start_time, end_time=end_time)
+
+        async def fetch(page_end: Optional[int]) -> Dict[str, Any]:
+            return await self.get_history_plan(
+                symbol,
+                start_time=start_time,
+                end_time=page_end,
+                delegate_type=delegate_type,
+                page_size=page_size,
+            )
+
+        return aiter_time_pages(fetch, cursor, prefetch=prefetch)
@@ -0,0 +1,339 @@
+"""Asynchronous HTTP client for Weex API, based on aiohttp."""
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union
+
+import aiohttp
+from yarl import URL
+
+from weex_sdk.cache import ResponseCache
+from weex_sdk.client import BASE_URL, BaseClient
+from weex_sdk.codec import JsonCodec, get_codec
+from weex_sdk.exceptions import WeexAPIError, WeexNetworkError, WeexRateLimitError
+from weex_sdk.logger import get_logger
+from weex_sdk.ratelimit import RateLimiter
+from weex_sdk.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from weex_sdk.api.account import AsyncAccountAPI
+    from weex_sdk.api.ai import AsyncAIAPI
+    from weex_sdk.api.market import AsyncMarketAPI
+    from weex_sdk.api.trade import AsyncTradeAPI
+    from weex_sdk.contracts import ContractRegistry
+
+logger = get_logger("client")
+
+
+class AsyncResponse:
+    """Buffered aiohttp response exposing the interface used by _handle_response."""
+
+    __slots__ = ("status", "content", "headers", "codec")
+
+    def __init__(
+        self, status: int, content: bytes, headers: Any, codec: Optional[JsonCodec] = None
+    ) -> None:
+        """Initialize response adapter.
+
+        Args:
+            status: HTTP status code
+            content: Raw response body
+            headers: Response headers
+            codec: JSON codec of the client that sent the request
+                (default: fastest installed backend)
+        """
+        self.status = status
+        self.content = content
+        self.headers = headers
+        self.codec = codec if codec is not None else get_codec()
+
+    @property
+    def text(self) -> str:
+        """Response body decoded as text."""
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """Parse response body as JSON."""
+        return self.codec.loads(self.content)
+
+
+class AsyncWeexClient(BaseClient):
+    """Asynchronous HTTP client for Weex API."""
+
+    API_CLASSES = {
+        "account": ("weex_sdk.api.account", "AsyncAccountAPI"),
+        "market": ("weex_sdk.api.market", "AsyncMarketAPI"),
+        "trade": ("weex_sdk.api.trade", "AsyncTradeAPI"),
+        "ai": ("weex_sdk.api.ai", "AsyncAIAPI"),
+        "contracts": ("weex_sdk.contracts", "ContractRegistry"),
+    }
+
+    def __init__(
+        self,
+        api_key: str,
+        secret_key: str,
+        passphrase: str,
+        base_url: str = BASE_URL,
+        locale: str = "en-US",
+        timeout: int = 30,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        json_codec: Union[None, str, JsonCodec] = None,
+        timestamp_provider: Optional[Callable[[], str]] = None,
+        response_cache: Union[None, bool, ResponseCache] = None,
+        connector_limit: int = 100,
+        connector_limit_per_host: int = 0,
+        dns_cache_ttl: Optional[int] = 10,
+        keepalive_timeout: float = 15.0,
+    ) -> None:
+        """Initialize asynchronous client.
+
+        Args:
+            api_key: API key
+            secret_key: Secret key
+            passphrase: API passphrase
+            base_url: Base URL for API
+            locale: Locale setting
+            timeout: Request timeout in seconds
+            rate_limiter: Rate limiter, may be shared between clients
+            retry_policy: Retry policy for transient failures
+            json_codec: JSON codec instance or backend name
+            timestamp_provider: Callable returning signing timestamps in milliseconds
+            response_cache: Cache for read-only GET responses, True for defaults
+            connector_limit: Maximum simultaneous connections, 0 for no limit (default: 100)
+            connector_limit_per_host: Maximum simultaneous connections per host,
+                0 for no limit (default: 0)
+            dns_cache_ttl: Seconds to cache DNS lookups, None to cache forever (default: 10)
+            keepalive_timeout: Seconds to keep idle connections open (default: 15)
+        """
+        super().__init__(
+            api_key,
+            secret_key,
+            passphrase,
+            base_url,
+            locale,
+            timeout,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            json_codec=json_codec,
+            timestamp_provider=timestamp_provider,
+            response_cache=response_cache,
+        )
+        self.connector_limit = connector_limit
+        self.connector_limit_per_host = connector_limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.client_timeout = aiohttp.ClientTimeout(total=timeout)
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncWeexClient":
+        """Async context manager entry."""
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+    async def open(self) -> "aiohttp.ClientSession":
+        """Create the shared connector and session if they are not open yet.
+
+        Must be called from the event loop that will use the client; requests
+        call it implicitly.
+
+        Returns:
+            Open client session
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connector_limit,
+                limit_per_host=self.connector_limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self.session = aiohttp.ClientSession(connector=connector, timeout=self.client_timeout)
+        return self.session
+
+    async def warmup(self, connections: int = 1, path: str = "/capi/v2/market/time") -> int:
+        """Pre-open connections so the first real requests skip the TLS handshake.
+
+        Args:
+            connections: Number of concurrent connections to open
+            path: Public endpoint used for warming (default: server time)
+
+        Returns:
+            Number of connections successfully opened
+        """
+        session = await self.open()
+        url = f"{self.base_url}{path}"
+        group = self.rate_limiter.group_for(path)
+
+        async def open_connection() -> bool:
+            await self.rate_limiter.acquire_async(group)
+            try:
+                async with session.get(url) as response:
+                    await response.read()
+                return True
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Warmup request failed: {e}")
+                return False
+
+        results = await asyncio.gather(*(open_connection() for _ in range(connections)))
+        opened = sum(results)
+        logger.info(f"Warmed up {opened}/{connections} connections to {self.base_url}")
+        return opened
+
+    async def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make async GET request.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            WeexAPIError: On API errors
+            WeexNetworkError: On network errors
+        """
+        if self.response_cache is not None:
+            return await self.response_cache.fetch_async(
+                path,
+                params,
+                lambda: self._request("GET", path, params=params),
+                namespace=self.api_key,
+            )
+        return await self._request("GET", path, params=params)
+
+    async def post(
+        self,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make async POST request.
+
+        Args:
+            path: API endpoint path
+            data: Request body data
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            WeexAPIError: On API errors
+            WeexNetworkError: On network errors
+        """
+        return await self._request("POST", path, data=data)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Send a request, retrying transient failures per the retry policy (async).
+
+        Args:
+            method: HTTP method (GET, POST)
+            path: API endpoint path
+            params: Query parameters
+            data: Request body data
+
+        Returns:
+            Parsed JSON response
+        """
+        attempt = 1
+        while True:
+            try:
+                return await self._send(method, path, params=params, data=data)
+            except WeexAPIError as e:
+                delay = self._next_retry_delay(e, attempt, method, path, data)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Wait for the rate limiter, then sign and send a request once (async).
+
+        Args:
+            method: HTTP method (GET, POST)
+            path: API endpoint path
+            params: Query parameters
+            data: Request body data
+
+        Returns:
+            Parsed JSON response
+        """
+        session = await self.open()
+
+        group = self.rate_limiter.group_for(path)
+        await self.rate_limiter.acquire_async(group, self.rate_limiter.weight_for(path))
+
+        # Sign after waiting so the timestamp is fresh when the request leaves
+        request = self._prepare_request(method, path, params=params, data=data)
+        self._log_request(request, params, data)
+
+        try:
+            async with session.request(
+                method,
+                URL(request.url, encoded=True),
+                headers=request.headers,
+                data=request.body,
+            ) as response:
+                content = await response.read()
+                buffered = AsyncResponse(response.status, content, response.headers, self.codec)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # Timeouts carry no message
+            reason = str(e) or type(e).__name__
+            logger.error(f"Network error: {reason}")
+            raise WeexNetworkError(f"Network error: {reason}") from e
+
+        try:
+            return self._handle_response(buffered)
+        except WeexRateLimitError as e:
+            self.rate_limiter.penalize(group, e.retry_after)
+            raise
+
+    async def close(self) -> None:
+        """Close the session and its connector."""
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    # API modules
+    @property
+    def account(self) -> "AsyncAccountAPI":
+        """Get Async Account API instance (created once per client)."""
+        return self._get_api("account")
+
+    @property
+    def market(self) -> "AsyncMarketAPI":
+        """Get Async Market API instance (created once per client)."""
+        return self._get_api("market")
+
+    @property
+    def trade(self) -> "AsyncTradeAPI":
+        """Get Async Trade API instance (created once per client)."""
+        return self._get_api("trade")
+
+    @property
+    def ai(self) -> "AsyncAIAPI":
+        """Get Async AI API instance (created once per client)."""
+        return self._get_api("ai")
+
+    @property
+    def contracts(self) -> "ContractRegistry":
+        """Get the contract metadata cache (created once per client); use ``get_async``."""
+        return self._get_api("contracts")
@@ -0,0 +1,379 @@
+"""Asynchronous WebSocket client for Weex API, based on websockets."""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional, Set, Union
+
+import websockets
+
+from weex_sdk.auth import RequestHeaders
+from weex_sdk.codec import JsonCodec, get_codec
+from weex_sdk.dispatch import AsyncCallbackDispatcher, Delivery
+from weex_sdk.exceptions import WeexNetworkError, WeexWebSocketError
+from weex_sdk.logger import get_logger
+from weex_sdk.models import WebSocketSubscription
+from weex_sdk.orderbook import OrderBook
+from weex_sdk.retry import RetryPolicy
+from weex_sdk.websocket import SNAPSHOT_RETRY, WS_PRIVATE_URL, WS_PUBLIC_URL, _SnapshotRequests
+
+logger = get_logger("websocket")
+
+
+class AsyncWeexWebSocket:
+    """Asynchronous WebSocket client for Weex API."""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        passphrase: Optional[str] = None,
+        is_private: bool = False,
+        reconnect_attempts: int = 10,
+        reconnect_delay: int = 1,
+        max_reconnect_delay: int = 60,
+        json_codec: Union[None, str, JsonCodec] = None,
+        timestamp_provider: Optional[Callable[[], str]] = None,
+        dispatcher: Union[None, bool, AsyncCallbackDispatcher] = None,
+    ) -> None:
+        """Initialize async WebSocket client.
+
+        Args:
+            api_key: API key (required for private channels)
+            secret_key: Secret key (required for private channels)
+            passphrase: API passphrase (required for private channels)
+            is_private: Whether to use private channel
+            reconnect_attempts: Maximum reconnection attempts
+            reconnect_delay: Initial reconnection delay in seconds
+            max_reconnect_delay: Maximum reconnection delay in seconds
+            json_codec: JSON codec instance or backend name
+            timestamp_provider: Callable returning signing timestamps in milliseconds
+            dispatcher: Runs callbacks on worker tasks instead of the receive
+                loop; True for a default AsyncCallbackDispatcher
+        """
+        self.api_key = api_key
+        self.secret_key = secret_key
+        self.passphrase = passphrase
+        self.is_private = is_private
+        self.reconnect_attempts = reconnect_attempts
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.codec = get_codec(json_codec)
+        self.timestamp_provider = timestamp_provider
+
+        self.ws: Optional[websockets.WebSocketClientProtocol] = None
+        self.subscriptions: Dict[str, WebSocketSubscription] = {}
+        self.current_reconnect_attempts = 0
+        self.connected = False
+        self.should_reconnect = True
+        self._receive_task: Optional[asyncio.Task] = None
+        self._owns_dispatcher = dispatcher is True
+        self.dispatcher: Optional[AsyncCallbackDispatcher] = (
+            AsyncCallbackDispatcher() if dispatcher is True else dispatcher or None
+        )
+        self._dispatched: Optional[Set[str]] = None
+
+        if is_private and (not api_key or not secret_key or not passphrase):
+            raise ValueError("API credentials required for private channels")
+
+    def _get_url(self) -> str:
+        """Get WebSocket URL."""
+        return WS_PRIVATE_URL if self.is_private else WS_PUBLIC_URL
+
+    def _get_headers(self) -> Optional[Dict[str, str]]:
+        """Get WebSocket headers."""
+        if not self.is_private:
+            return {"User-Agent": "weex-sdk-python"}
+
+        headers_builder = RequestHeaders(
+            api_key=self.api_key or "",
+            secret_key=self.secret_key or "",
+            passphrase=self.passphrase or "",
+            timestamp_provider=self.timestamp_provider,
+        )
+        return headers_builder.get_websocket_headers()
+
+    async def _handle_message(self, message: Union[str, bytes]) -> None:
+        """Handle incoming WebSocket messages."""
+        try:
+            data = self.codec.loads(message)
+            event = data.get("event")
+
+            if event == "ping":
+                await self._handle_ping(data)
+                return
+
+            if event == "subscribe" or event == "unsubscribe":
+                logger.info(f"Subscription event: {event}, channel: {data.get('channel')}")
+                return
+
+            if event == "payload":
+                channel = data.get("channel")
+                if channel and channel in self.subscriptions:
+                    subscription = self.subscriptions[channel]
+                    if self.dispatcher is not None and self._dispatches(channel):
+                        self.dispatcher.submit(channel, subscription.callback, data)
+                        return
+                    try:
+                        if asyncio.iscoroutinefunction(subscription.callback):
+                            await subscription.callback(data)
+                        else:
+                            subscription.callback(data)
+                    except Exception as e:
+                        logger.error(f"Error in callback for channel {channel}: {e}")
+
+        except ValueError as e:
+            logger.error(f"Failed to parse WebSocket message: {e}")
+        except Exception as e:
+            logger.error(f"Error handling WebSocket message: {e}")
+
+    async def _handle_ping(self, message: Dict[str, Any]) -> None:
+        """Handle ping and send pong."""
+        pong = {
+            "event": "pong",
+            "time": message.get("time"),
+        }
+        await self.send(self.codec.dumps_text(pong))
+        logger.debug("Sent pong response")
+
+    async def _receive_loop(self) -> None:
+        """Receive messages loop."""
+        try:
+            while self.connected and self.ws:
+                try:
+                    message = await asyncio.wait_for(self.ws.recv(), timeout=30.0)
+                    await self._handle_message(message)
+                except asyncio.TimeoutError:
+                    # Send ping to keep connection alive
+                    ping = {"event": "ping", "time": str(int(time.time() * 1000))}
+                    await self.send(self.codec.dumps_text(ping))
+                except websockets.exceptions.ConnectionClosed:
+                    break
+        except Exception as e:
+            logger.error(f"Receive loop error: {e}")
+        finally:
+            self.connected = False
+
+    async def _reconnect(self) -> None:
+        """Attempt reconnection with exponential backoff."""
+        if self.current_reconnect_attempts >= self.reconnect_attempts:
+            logger.error("Max reconnection attempts reached")
+            return
+
+        self.current_reconnect_attempts += 1
+        delay = min(
+            self.reconnect_delay * (2 ** (self.current_reconnect_attempts - 1)),
+            self.max_reconnect_delay,
+        )
+
+        logger.info(f"Reconnecting in {delay} seconds (attempt {self.current_reconnect_attempts})")
+        await asyncio.sleep(delay)
+
+        try:
+            await self.connect()
+        except Exception as e:
+            logger.error(f"Reconnection failed: {e}")
+
+    async def _resubscribe(self) -> None:
+        """Resubscribe to all channels."""
+        if not self.subscriptions:
+            return
+
+        logger.info(f"Resubscribing to {len(self.subscriptions)} channels")
+        # Copy: other tasks may register channels while sends are awaited
+        for channel, subscription in list(self.subscriptions.items()):
+            try:
+                await self._send_subscribe(channel, subscription.params)
+            except Exception as e:
+                logger.error(f"Failed to resubscribe to {channel}: {e}")
+
+    async def _send_subscribe(self, channel: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Send subscription message."""
+        message = {
+            "event": "subscribe",
+            "channel": channel,
+        }
+        if params:
+            message.update(params)
+        await self.send(self.codec.dumps_text(message))
+
+    async def connect(self) -> None:
+        """Connect to WebSocket server."""
+        url = self._get_url()
+        headers = self._get_headers()
+
+        logger.info(f"Connecting to WebSocket: {url}")
+
+        try:
+            self.ws = await websockets.connect(
+                url,
+                extra_headers=headers if headers else None,
+            )
+            self.connected = True
+            self.current_reconnect_attempts = 0
+
+            # Start receive loop
+            self._receive_task = asyncio.create_task(self._receive_loop())
+
+            # Resubscribe
+            await self._resubscribe()
+
+        except Exception as e:
+            logger.error(f"WebSocket connection failed: {e}")
+            self.connected = False
+            if self.should_reconnect:
+                await self._reconnect()
+            raise WeexNetworkError(f"WebSocket connection failed: {str(e)}") from e
+
+    async def send(self, message: str) -> None:
+        """Send message through WebSocket."""
+        if not self.ws or not self.connected:
+            raise WeexWebSocketError("WebSocket not connected")
+
+        try:
+            await self.ws.send(message)
+        except Exception as e:
+            logger.error(f"Failed to send message: {e}")
+            raise WeexWebSocketError(f"Failed to send message: {str(e)}") from e
+
+    def set_delivery(self, channel: str, delivery: Union[str, Delivery]) -> None:
+        """Set how messages of a channel reach its callback.
+
+        See WeexWebSocket.set_delivery; a default AsyncCallbackDispatcher,
+        running only the channels given a policy other than "all", is
+        created if the client has none.
+        """
+        policy = Delivery.parse(delivery)
+        if self.dispatcher is None:
+            if policy.mode == "all":
+                return
+            self.dispatcher = AsyncCallbackDispatcher()
+            self._owns_dispatcher = True
+            self._dispatched = set()
+        if self._dispatched is not None:
+            if policy.mode == "all":
+                self._dispatched.discard(channel)
+            else:
+                self._dispatched.add(channel)
+        self.dispatcher.configure(channel, delivery=policy)
+
+    def _dispatches(self, channel: str) -> bool:
+        """Check whether a channel's callback runs on the dispatcher."""
+        return self._dispatched is None or channel in self._dispatched
+
+    async def subscribe_ticker(
+        self,
+        symbol: str,
+        callback: Callable[[Dict[str, Any]], None],
+        delivery: Union[str, Delivery] = "all",
+    ) -> None:
+        """Subscribe to ticker channel."""
+        channel = f"ticker.{symbol}"
+        self.set_delivery(channel, delivery)
+        self.subscriptions[channel] = WebSocketSubscription(channel=channel, callback=callback)
+        await self._send_subscribe(channel)
+
+    async def subscribe_depth(
+        self,
+        symbol: str,
+        limit: int = 15,
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        delivery: Union[str, Delivery] = "all",
+    ) -> None:
+        """Subscribe to depth channel (see WeexWebSocket.subscribe_depth)."""
+        channel = f"depth.{symbol}.{limit}"
+        if callback:
+            self.set_delivery(channel, delivery)
+            self.subscriptions[channel] = WebSocketSubscription(channel=channel, callback=callback)
+        await self._send_subscribe(channel)
+
+    async def subscribe_order_book(
+        self,
+        symbol: str,
+        limit: int = 15,
+        callback: Optional[Callable[[OrderBook], Any]] = None,
+        book: Optional[OrderBook] = None,
+        snapshot_retry: RetryPolicy = SNAPSHOT_RETRY,
+    ) -> OrderBook:
+        """Maintain a local order book (see WeexWebSocket.subscribe_order_book)."""
+        channel = f"depth.{symbol}.{limit}"
+        if book is None:
+            book = OrderBook(symbol, max_levels=limit)
+        snapshots = _SnapshotRequests(snapshot_retry)
+        tasks: Set[asyncio.Task[None]] = set()
+
+        async def on_depth(message: Dict[str, Any]) -> None:
+            resyncs = book.resyncs
+            in_sync = book.apply_message(message)
+            if book.resyncs != resyncs and snapshots.start():
+                task = asyncio.ensure_future(self._request_snapshots(channel, book, snapshots))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            elif in_sync and callback:
+                result = callback(book)
+                if asyncio.iscoroutine(result):
+                    await result
+
+        await self.subscribe_depth(symbol, limit, callback=on_depth)
+        return book
+
+    async def _request_snapshots(
+        self, channel: str, book: OrderBook, snapshots: _SnapshotRequests
+    ) -> None:
+        """Resubscribe a depth channel until its book is back in sync."""
+        try:
+            while True:
+                await asyncio.sleep(snapshots.delay())
+                if snapshots.finish(book) or not self.should_reconnect:
+                    return
+                if channel not in self.subscriptions:
+                    return
+                try:
+                    await self.resubscribe(channel)
+                except WeexWebSocketError as e:
+                    logger.warning(f"Could not request a snapshot for {channel}: {e}")
+                snapshots.sent()
+                logger.info(f"Requested snapshot {snapshots.attempt} for {channel}")
+        finally:
+            snapshots.running = False
+
+    async def resubscribe(self, channel: str) -> None:
+        """Unsubscribe and subscribe again (see WeexWebSocket.resubscribe)."""
+        subscription = self.subscriptions.get(channel)
+        logger.info(f"Resubscribing to {channel}")
+        await self.send(self.codec.dumps_text({"event": "unsubscribe", "channel": channel}))
+        await self._send_subscribe(channel, subscription.params if subscription else None)
+
+    async def subscribe_account(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Subscribe to account channel (private)."""
+        if not self.is_private:
+            raise ValueError("Account channel requires private WebSocket connection")
+        channel = "account"
+        self.subscriptions[channel] = WebSocketSubscription(channel=channel, callback=callback)
+        await self._send_subscribe(channel)
+
+    async def subscribe_position(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Subscribe to position channel (private)."""
+        if not self.is_private:
+            raise ValueError("Position channel requires private WebSocket connection")
+        channel = "position"
+        self.subscriptions[channel] = WebSocketSubscription(channel=channel, callback=callback)
+        await self._send_subscribe(channel)
+
+    async def subscribe_order(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Subscribe to order channel (private)."""
+        if not self.is_private:
+            raise ValueError("Order channel requires private WebSocket connection")
+        channel = "orders"
+        self.subscriptions[channel] = WebSocketSubscription(channel=channel, callback=callback)
+        await self._send_subscribe(channel)
+
+    async def close(self) -> None:
+        """Close WebSocket connection."""
+        self.should_reconnect = False
+        self.connected = False
+        if self._receive_task:
+            self._receive_task.cancel()
+        if self.ws:
+            await self.ws.close()
+        if self._owns_dispatcher and self.dispatcher is not None:
+            await self.dispatcher.close()
@@ -4,6 +4,7 @@ import base64
 import hashlib
 import hmac
 import time
+from typing import Callable, Dict, Optional, Union
 
 
 class SignatureGenerator:
@@ -76,6 +77,149 @@ class SignatureGenerator:
         return base64.b64encode(signature).decode("utf-8")
 
 
+class Signer:
+    """Pre-keyed HMAC SHA256 signer for REST and WebSocket requests.
+
+    The secret key is encoded and fed to HMAC once; each request clones the
+    keyed state with ``copy()`` instead of re-deriving it. Static headers are
+    kept in a template so only the timestamp and signature change per call.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        secret_key: str,
+        passphrase: str,
+        locale: str = "en-US",
+        timestamp_provider: Optional[Callable[[], str]] = None,
+    ) -> None:
+        """Initialize signer.
+
+        Args:
+            api_key: API key
+            secret_key: Secret key for signature generation
+            passphrase: API passphrase
+            locale: Locale setting (default: en-US)
+            timestamp_provider: Callable returning the current time in milliseconds
+                as a string, e.g. ClockSync.timestamp (default: local clock)
+        """
+        self.api_key = api_key
+        self.passphrase = passphrase
+        self.locale = locale
+        self.timestamp_provider = timestamp_provider
+        self._mac = hmac.new(secret_key.encode("utf-8"), digestmod=hashlib.sha256)
+        self._header_template: Dict[str, str] = {
+            "ACCESS-KEY": api_key,
+            "ACCESS-PASSPHRASE": passphrase,
+            "Content-Type": "application/json",
+            "locale": locale,
+        }
+        self._ws_header_template: Dict[str, str] = {
+            "User-Agent": "weex-sdk-python",
+            "ACCESS-KEY": api_key,
+            "ACCESS-PASSPHRASE": passphrase,
+        }
+
+    def timestamp(self) -> str:
+        """Get the current timestamp in milliseconds for signing."""
+        if self.timestamp_provider is not None:
+            return self.timestamp_provider()
+        return str(int(time.time() * 1000))
+
+    @staticmethod
+    def build_message(
+        timestamp: str,
+        method: str,
+        request_path: str,
+        query_string: str = "",
+        body: Union[str, bytes] = b"",
+    ) -> bytes:
+        """Build the message to sign as bytes.
+
+        Args:
+            timestamp: Request timestamp (milliseconds)
+            method: HTTP method (GET, POST)
+            request_path: API endpoint path
+            query_string: Query string (without '?')
+            body: Request body (JSON string or bytes)
+
+        Returns:
+            Message bytes
+        """
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        if query_string:
+            prefix = f"{timestamp}{method.upper()}{request_path}?{query_string}"
+        else:
+            prefix = f"{timestamp}{method.upper()}{request_path}"
+        return prefix.encode("utf-8") + body
+
+    def sign(self, message: bytes) -> str:
+        """Sign a message with the pre-keyed HMAC state.
+
+        Args:
+            message: Message bytes
+
+        Returns:
+            Base64 encoded signature
+        """
+        mac = self._mac.copy()
+        mac.update(message)
+        return base64.b64encode(mac.digest()).decode("ascii")
+
+    def get_headers(
+        self,
+        method: str,
+        request_path: str,
+        query_string: str = "",
+        body: Union[str, bytes] = b"",
+        timestamp: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """Generate authenticated request headers.
+
+        Args:
+            method: HTTP method (GET, POST)
+            request_path: API endpoint path
+            query_string: Query string (without '?')
+            body: Request body (JSON string or bytes)
+            timestamp: Request timestamp (default: current time in milliseconds)
+
+        Returns:
+            Dictionary of request headers
+        """
+        if timestamp is None:
+            timestamp = self.timestamp()
+
+        headers = self._header_template.copy()
+        headers["ACCESS-SIGN"] = self.sign(
+            self.build_message(timestamp, method, request_path, query_string, body)
+        )
+        headers["ACCESS-TIMESTAMP"] = timestamp
+        return headers
+
+    def get_websocket_headers(
+        self,
+        request_path: str = "/v2/ws/private",
+        timestamp: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """Generate headers for WebSocket private channel connection.
+
+        Args:
+            request_path: WebSocket path (default: /v2/ws/private)
+            timestamp: Request timestamp (default: current time in milliseconds)
+
+        Returns:
+            Dictionary of WebSocket headers
+        """
+        if timestamp is None:
+            timestamp = self.timestamp()
+
+        headers = self._ws_header_template.copy()
+        headers["ACCESS-SIGN"] = self.sign(f"{timestamp}{request_path}".encode())
+        headers["ACCESS-TIMESTAMP"] = timestamp
+        return headers
+
+
 class RequestHeaders:
     """Build request headers for authenticated API requests."""
 
@@ -85,6 +229,7 @@ class RequestHeaders:
         secret_key: str,
         passphrase: str,
         locale: str = "en-US",
+        timestamp_provider: Optional[Callable[[], str]] = None,
     ) -> None:
         """Initialize request headers builder.
 
@@ -93,11 +238,20 @@ class RequestHeaders:
             secret_key: Secret key for signature generation
             passphrase: API passphrase
             locale: Locale setting (default: en-US)
+            timestamp_provider: Callable returning the current time in milliseconds
+                (default: local clock)
         """
         self.api_key = api_key
         self.secret_key = secret_key
         self.passphrase = passphrase
         self.locale = locale
+        self.signer = Signer(
+            api_key=api_key,
+            secret_key=secret_key,
+            passphrase=passphrase,
+            locale=locale,
+            timestamp_provider=timestamp_provider,
+        )
 
     def get_headers(
         self,
@@ -117,43 +271,17 @@ class RequestHeaders:
         Returns:
             Dictionary of request headers
         """
-        timestamp = str(int(time.time() * 1000))
-
-        signature = SignatureGenerator.generate_signature(
-            secret_key=self.secret_key,
-            timestamp=timestamp,
+        return self.signer.get_headers(
             method=method,
             request_path=request_path,
             query_string=query_string,
             body=body,
         )
 
-        return {
-            "ACCESS-KEY": self.api_key,
-            "ACCESS-SIGN": signature,
-            "ACCESS-TIMESTAMP": timestamp,
-            "ACCESS-PASSPHRASE": self.passphrase,
-            "Content-Type": "application/json",
-            "locale": self.locale,
-        }
-
     def get_websocket_headers(self) -> dict[str, str]:
         """Generate headers for WebSocket private channel connection.
 
         Returns:
             Dictionary of WebSocket headers
         """
-        timestamp = str(int(time.time() * 1000))
-
-        signature = SignatureGenerator.generate_websocket_signature(
-            secret_key=self.secret_key,
-            timestamp=timestamp,
-        )
-
-        return {
-            "User-Agent": "weex-sdk-python",
-            "ACCESS-KEY": self.api_key,
-            "ACCESS-SIGN": signature,
-            "ACCESS-TIMESTAMP": timestamp,
-            "ACCESS-PASSPHRASE": self.passphrase,
-        }
+        return self.signer.get_websocket_headers()
@@ -0,0 +1,220 @@
+"""Chunking and result merging for bulk order operations."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TypeVar
+
+from weex_sdk.exceptions import WeexAPIError
+
+T = TypeVar("T")
+
+# Maximum orders per /capi/v2/order/batchOrders request
+BATCH_ORDER_LIMIT = 20
+# IDs per /capi/v2/order/cancel_batch_orders request; the limit is not
+# documented, so use the batch placement limit
+BATCH_CANCEL_LIMIT = 20
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """Split a sequence into consecutive chunks of at most ``size`` items."""
+    if size < 1:
+        raise ValueError("size must be positive")
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+@dataclass
+class OrderOutcome:
+    """Result of one order in a bulk request.
+
+    Attributes:
+        client_oid: Client order ID sent with the order
+        order_id: Exchange order ID, None if the order was not placed
+        success: Whether the exchange accepted the order
+        error_code: Exchange or SDK error code on failure
+        error_message: Error description on failure
+    """
+
+    client_oid: Optional[str]
+    order_id: Optional[str]
+    success: bool
+    error_code: Optional[str] = None
+    error_message: Optional[str] = None
+
+
+@dataclass
+class BulkOrderResult:
+    """Per-order outcomes of a bulk placement, in input order.
+
+    Attributes:
+        outcomes: One outcome per submitted order
+        errors: Exceptions of chunks whose request failed as a whole
+        requests: Batch requests sent
+    """
+
+    outcomes: List[OrderOutcome] = field(default_factory=list)
+    errors: List[WeexAPIError] = field(default_factory=list)
+    requests: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """Whether every order was placed."""
+        return all(outcome.success for outcome in self.outcomes)
+
+    @property
+    def succeeded(self) -> List[OrderOutcome]:
+        """Outcomes of orders that were placed."""
+        return [outcome for outcome in self.outcomes if outcome.success]
+
+    @property
+    def failed(self) -> List[OrderOutcome]:
+        """Outcomes of orders that were not placed."""
+        return [outcome for outcome in self.outcomes if not outcome.success]
+
+    def by_client_oid(self) -> Dict[str, OrderOutcome]:
+        """Index outcomes by client order ID (orders without one are left out)."""
+        return {outcome.client_oid: outcome for outcome in self.outcomes if outcome.client_oid}
+
+
+def check_unique_client_oids(orders: Sequence[Dict[str, Any]]) -> None:
+    """Reject orders sharing a client order ID.
+
+    The exchange rejects duplicates, and results are matched to orders by
+    client order ID, so duplicates would be mapped to the same order.
+
+    Raises:
+        ValueError: If a client_oid appears more than once
+    """
+    seen = set()
+    duplicates = set()
+    for order in orders:
+        client_oid = order.get("client_oid")
+        if client_oid:
+            if client_oid in seen:
+                duplicates.add(str(client_oid))
+            seen.add(client_oid)
+    if duplicates:
+        raise ValueError(f"Duplicate client_oid in bulk orders: {', '.join(sorted(duplicates))}")
+
+
+def merge_batch_response(orders: Sequence[Dict[str, Any]], response: Any) -> List[OrderOutcome]:
+    """Pair a batch response's ``order_info`` entries with the submitted orders.
+
+    Entries are matched by ``client_oid`` and fall back to position for
+    orders sent without one. Orders missing from the response count as failed.
+
+    Args:
+        orders: Orders of one chunk as sent
+        response: batchOrders response
+
+    Returns:
+        One outcome per order, in chunk order
+    """
+    info = response.get("order_info") if isinstance(response, dict) else None
+    info = [entry for entry in info or [] if isinstance(entry, dict)]
+    by_oid = {str(entry["client_oid"]): entry for entry in info if entry.get("client_oid")}
+
+    outcomes = []
+    for index, order in enumerate(orders):
+        client_oid = order.get("client_oid")
+        entry = by_oid.get(str(client_oid)) if client_oid else None
+        if entry is None and not client_oid and index < len(info):
+            entry = info[index]
+        if entry is None:
+            outcomes.append(
+                OrderOutcome(client_oid, None, False, error_message="Order missing from response")
+            )
+            continue
+        success = bool(entry.get("result"))
+        outcomes.append(
+            OrderOutcome(
+                client_oid=client_oid,
+                order_id=str(entry["order_id"]) if entry.get("order_id") else None,
+                success=success,
+                error_code=None if success else entry.get("error_code") or None,
+                error_message=None if success else entry.get("error_message") or None,
+            )
+        )
+    return outcomes
+
+
+@dataclass
+class CancelOutcome:
+    """Result of cancelling one order in a bulk request.
+
+    Attributes:
+        order_id: Exchange order ID, if known
+        client_oid: Client order ID, if known
+        success: Whether the exchange cancelled the order
+        error_message: Error description on failure
+    """
+
+    order_id: Optional[str]
+    client_oid: Optional[str]
+    success: bool
+    error_message: Optional[str] = None
+
+
+def merge_cancel_response(
+    ids: Sequence[str], response: Any, id_key: str
+) -> Dict[str, CancelOutcome]:
+    """Pair a cancel_batch_orders response with the IDs of one chunk.
+
+    Args:
+        ids: Order IDs or client order IDs sent
+        response: cancel_batch_orders response
+        id_key: Result field matching ``ids`` ("order_id" or "client_oid")
+
+    Returns:
+        Outcome per ID; IDs missing from the response count as failed
+    """
+    entries: Dict[str, Dict[str, Any]] = {}
+    if isinstance(response, dict):
+        # failInfos first so a matching cancelOrderResultList entry wins
+        for field_name in ("failInfos", "cancelOrderResultList"):
+            for entry in response.get(field_name) or []:
+                if isinstance(entry, dict) and entry.get(id_key):
+                    entries[str(entry[id_key])] = {**entry, "_failed": field_name == "failInfos"}
+
+    outcomes = {}
+    for order_id in ids:
+        entry = entries.get(order_id)
+        if entry is None:
+            outcomes[order_id] = CancelOutcome(
+                order_id if id_key == "order_id" else None,
+                order_id if id_key == "client_oid" else None,
+                False,
+                "Order missing from response",
+            )
+            continue
+        success = bool(entry.get("result")) and not entry["_failed"]
+        message = entry.get("err_msg") or entry.get("errMsg") or entry.get("error_message")
+        outcomes[order_id] = CancelOutcome(
+            order_id=str(entry["order_id"]) if entry.get("order_id") else None,
+            client_oid=str(entry["client_oid"]) if entry.get("client_oid") else None,
+            success=success,
+            error_message=None if success else message or "Cancel failed",
+        )
+    return outcomes
+
+
+def failed_cancel_chunk(
+    ids: Sequence[str], id_key: str, error: WeexAPIError
+) -> Dict[str, CancelOutcome]:
+    """Mark every ID of a cancel chunk whose request failed as failed."""
+    return {
+        order_id: CancelOutcome(
+            order_id if id_key == "order_id" else None,
+            order_id if id_key == "client_oid" else None,
+            False,
+            str(error),
+        )
+        for order_id in ids
+    }
+
+
+def failed_chunk(orders: Sequence[Dict[str, Any]], error: WeexAPIError) -> List[OrderOutcome]:
+    """Mark every order of a chunk whose request failed as failed."""
+    return [
+        OrderOutcome(order.get("client_oid"), None, False, error.code, error.message)
+        for order in orders
+    ]
@@ -0,0 +1,263 @@
+"""Opt-in response cache for read-only GET endpoints."""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+from weex_sdk.endpoints import ENDPOINTS
+from weex_sdk.logger import get_logger
+
+logger = get_logger("cache")
+
+# Default time-to-live in seconds per cacheable path, from the endpoint table.
+# Paths not listed are never cached; order, position and balance data must
+# always be fresh.
+DEFAULT_TTLS: Dict[str, float] = {
+    path: endpoint.cache_ttl for path, endpoint in ENDPOINTS.items() if endpoint.cache_ttl
+}
+
+CacheKey = Tuple[Hashable, ...]
+
+
+class ResponseCache:
+    """LRU cache of parsed responses with per-path TTLs and single-flight loading.
+
+    Concurrent identical requests share one in-flight request: threads block
+    on the first caller's result, and asyncio tasks await a shared task, so a
+    burst of lookups for the same key costs one API call. Failures are not
+    cached; every waiter of a failed request receives the error.
+
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        max_entries: int = 1024,
+    ) -> None:
+        """Initialize response cache.
+
+        Args:
+            ttls: Seconds to keep responses per path; paths not listed are not
+                cached (default: DEFAULT_TTLS)
+            max_entries: Maximum cached responses before the least recently
+                used is evicted (default: 1024)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+
+        self.ttls: Dict[str, float] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        # key -> (expiry on the monotonic clock, value)
+        self._entries: OrderedDict[CacheKey, Tuple[float, Any]] = OrderedDict()
+        self._inflight: Dict[CacheKey, Future] = {}
+        self._inflight_async: Dict[Tuple[int, CacheKey], Any] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """Get the TTL of a path, or None if its responses are not cached."""
+        ttl = self.ttls.get(path)
+        return ttl if ttl is not None and ttl > 0 else None
+
+    def set_ttl(self, path: str, ttl: Optional[float]) -> None:
+        """Change the TTL of a path.
+
+        Args:
+            path: API endpoint path
+            ttl: Seconds to keep responses, None or 0 to stop caching the path
+        """
+        if ttl:
+            self.ttls[path] = ttl
+        else:
+            self.ttls.pop(path, None)
+            self.invalidate(path)
+
+    @staticmethod
+    def make_key(
+        path: str, params: Optional[Mapping[str, Any]] = None, namespace: Hashable = None
+    ) -> CacheKey:
+        """Build a cache key independent of parameter order.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters
+            namespace: Separates callers whose responses differ for the same
+                request, e.g. API keys for private endpoints
+
+        Returns:
+            Cache key
+        """
+        items = tuple(sorted((k, str(v)) for k, v in (params or {}).items() if v is not None))
+        return (namespace, path, items)
+
+    def _lookup(self, key: CacheKey) -> Tuple[bool, Any]:
+        """Get a live entry and mark it recently used; call with the lock held."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry[1]
+
+    def _store(self, key: CacheKey, value: Any, ttl: float) -> None:
+        """Store a value, evicting least recently used entries."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def fetch(
+        self,
+        path: str,
+        params: Optional[Mapping[str, Any]],
+        loader: Callable[[], Any],
+        namespace: Hashable = None,
+    ) -> Any:
+        """Get a response from the cache or load it once for all concurrent callers.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters
+            loader: Callable sending the request
+            namespace: Cache key namespace
+
+        Returns:
+            Parsed response
+        """
+        ttl = self.ttl_for(path)
+        if ttl is None:
+            return loader()
+
+        key = self.make_key(path, params, namespace)
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                self.hits += 1
+                return value
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = Future()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return flight.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            self._store(key, value, ttl)
+            flight.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    async def fetch_async(
+        self,
+        path: str,
+        params: Optional[Mapping[str, Any]],
+        loader: Callable[[], Awaitable[Any]],
+        namespace: Hashable = None,
+    ) -> Any:
+        """Get a response from the cache or load it once for all concurrent tasks.
+
+        The request runs in its own task, so cancelling one waiter does not
+        cancel the request for the others.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters
+            loader: Coroutine function sending the request
+            namespace: Cache key namespace
+
+        Returns:
+            Parsed response
+        """
+        ttl = self.ttl_for(path)
+        if ttl is None:
+            return await loader()
+
+        key = self.make_key(path, params, namespace)
+        # Tasks belong to one event loop; loops in other threads get their own flight
+        flight_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                self.hits += 1
+                return value
+            task = self._inflight_async.get(flight_key)
+            if task is None:
+                task = asyncio.ensure_future(self._load_async(flight_key, loader, ttl))
+                self._inflight_async[flight_key] = task
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    async def _load_async(
+        self, flight_key: Tuple[int, CacheKey], loader: Callable[[], Awaitable[Any]], ttl: float
+    ) -> Any:
+        """Run a loader for fetch_async and store its result."""
+        try:
+            value = await loader()
+            self._store(flight_key[1], value, ttl)
+            return value
+        finally:
+            with self._lock:
+                self._inflight_async.pop(flight_key, None)
+
+    def invalidate(self, path: Optional[str] = None) -> int:
+        """Drop cached responses.
+
+        Args:
+            path: Only drop responses of this path (default: all)
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            if path is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                return dropped
+            keys = [key for key in self._entries if key[1] == path]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters.
+
+        Returns:
+            Dictionary with hits, misses, coalesced (requests that joined an
+            in-flight request), evictions, entries and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            }
@@ -1,35 +1,111 @@
-"""HTTP client for Weex API (sync and async)."""
+"""HTTP client for Weex API.
 
-import json
-from typing import TYPE_CHECKING, Any, Dict, Optional
+AsyncWeexClient lives in weex_sdk.async_client so that the synchronous
+client does not import aiohttp; it is still importable from here.
+"""
+
+import importlib
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
-import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 
 from weex_sdk.auth import RequestHeaders
+from weex_sdk.cache import ResponseCache
+from weex_sdk.codec import JsonCodec, get_codec
 from weex_sdk.exceptions import (
+    WeexAPIError,
     WeexNetworkError,
     WeexRateLimitError,
     raise_exception_from_response,
 )
 from weex_sdk.logger import get_logger
-from weex_sdk.utils.helpers import sanitize_log_data
+from weex_sdk.ratelimit import RateLimiter
+from weex_sdk.retry import RetryPolicy
+from weex_sdk.utils.helpers import build_query_string, sanitize_log_data
 
 if TYPE_CHECKING:
-    from weex_sdk.api.account import AccountAPI, AsyncAccountAPI
-    from weex_sdk.api.ai import AIAPI, AsyncAIAPI
-    from weex_sdk.api.market import AsyncMarketAPI, MarketAPI
-    from weex_sdk.api.trade import AsyncTradeAPI, TradeAPI
+    from weex_sdk.api.account import AccountAPI
+    from weex_sdk.api.ai import AIAPI
+    from weex_sdk.api.market import MarketAPI
+    from weex_sdk.api.trade import TradeAPI
+    from weex_sdk.contracts import ContractRegistry
 
 logger = get_logger("client")
 
 # Base URL for Weex API
 BASE_URL = "https://api-contract.weex.com"
 
+# Names moved to weex_sdk.async_client, resolved on first access
+_ASYNC_NAMES = ("AsyncResponse", "AsyncWeexClient")
+
+
+@dataclass
+class PreparedRequest:
+    """Signed request ready to be sent as-is."""
+
+    method: str
+    path: str
+    url: str
+    headers: Dict[str, str]
+    body: bytes = b""
+
+
+class TunedHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that applies custom socket options to pooled connections."""
+
+    def __init__(
+        self,
+        socket_options: Optional[List[Tuple[int, int, int]]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize adapter.
+
+        Args:
+            socket_options: Socket options set on every new connection
+            **kwargs: Arguments for requests.adapters.HTTPAdapter
+        """
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Create the pool manager with the configured socket options."""
+        if self.socket_options is not None:
+            kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+def build_socket_options(
+    tcp_nodelay: bool = True, keep_alive: bool = True
+) -> List[Tuple[int, int, int]]:
+    """Build socket options for HTTP connections.
+
+    Args:
+        tcp_nodelay: Disable Nagle's algorithm
+        keep_alive: Enable TCP keep-alive probes on idle connections
+
+    Returns:
+        List of (level, option, value) tuples
+    """
+    options = []
+    if tcp_nodelay:
+        options.append((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1))
+    if keep_alive:
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    return options
+
 
 class BaseClient:
     """Base client with common functionality."""
 
+    # API module name -> (module path, class name), created on first access
+    API_CLASSES: Dict[str, Tuple[str, str]] = {}
+
     def __init__(
         self,
         api_key: str,
@@ -38,6 +114,11 @@ class BaseClient:
         base_url: str = BASE_URL,
         locale: str = "en-US",
         timeout: int = 30,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        json_codec: Union[None, str, JsonCodec] = None,
+        timestamp_provider: Optional[Callable[[], str]] = None,
+        response_cache: Union[None, bool, ResponseCache] = None,
     ) -> None:
         """Initialize base client.
 
@@ -48,6 +129,16 @@ class BaseClient:
             base_url: Base URL for API (default: production)
             locale: Locale setting (default: en-US)
             timeout: Request timeout in seconds (default: 30)
+            rate_limiter: Rate limiter, may be shared between clients
+                (default: a new RateLimiter with documented API limits)
+            retry_policy: Retry policy for transient failures
+                (default: RetryPolicy(); use max_attempts=1 to disable)
+            json_codec: JSON codec instance or backend name (orjson, ujson, json)
+                (default: fastest installed backend)
+            timestamp_provider: Callable returning the current time in milliseconds
+                for signing, e.g. ClockSync.timestamp (default: local clock)
+            response_cache: Cache for read-only GET responses; True for a
+                ResponseCache with default TTLs (default: no caching)
         """
         self.api_key = api_key
         self.secret_key = secret_key
@@ -60,7 +151,129 @@ class BaseClient:
             secret_key=secret_key,
             passphrase=passphrase,
             locale=locale,
+            timestamp_provider=timestamp_provider,
+        )
+        self.signer = self.headers_builder.signer
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.codec = get_codec(json_codec)
+        self.response_cache: Optional[ResponseCache] = (
+            ResponseCache() if response_cache is True else response_cache or None
+        )
+        self._apis: Dict[str, Any] = {}
+        self._apis_lock = threading.Lock()
+
+    def _get_api(self, name: str) -> Any:
+        """Get an API module instance, creating it once per client.
+
+        Args:
+            name: API module name (account, market, trade, ai, contracts)
+
+        Returns:
+            Cached API module instance
+        """
+        api = self._apis.get(name)
+        if api is not None:
+            return api
+
+        with self._apis_lock:
+            api = self._apis.get(name)
+            if api is None:
+                module_path, class_name = self.API_CLASSES[name]
+                api_class = getattr(importlib.import_module(module_path), class_name)
+                api = api_class(self)
+                self._apis[name] = api
+        return api
+
+    def _prepare_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> PreparedRequest:
+        """Encode, sign and assemble a request in one pass.
+
+        The query string and body are encoded exactly once; the same bytes are
+        signed and sent, so transports must not re-encode them.
+
+        Args:
+            method: HTTP method (GET, POST)
+            path: API endpoint path
+            params: Query parameters
+            data: Request body data
+
+        Returns:
+            Prepared request
+        """
+        query_string = build_query_string(params)
+        body = self.codec.dumps(data) if data else b""
+
+        headers = self.signer.get_headers(
+            method=method,
+            request_path=path,
+            query_string=query_string,
+            body=body,
+        )
+
+        url = f"{self.base_url}{path}"
+        if query_string:
+            url = f"{url}?{query_string}"
+
+        return PreparedRequest(method=method, path=path, url=url, headers=headers, body=body)
+
+    def _log_request(
+        self,
+        request: PreparedRequest,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Log an outgoing request with sensitive values masked.
+
+        Args:
+            request: Prepared request
+            params: Query parameters
+            data: Request body data
+        """
+        if request.method == "GET":
+            extra = {"params": params, "headers": sanitize_log_data(request.headers)}
+        else:
+            extra = {
+                "data": sanitize_log_data(data or {}),
+                "headers": sanitize_log_data(request.headers),
+            }
+        logger.debug(f"{request.method} {request.path}", extra=extra)
+
+    def _next_retry_delay(
+        self,
+        error: WeexAPIError,
+        attempt: int,
+        method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Optional[float]:
+        """Get the delay before retrying a failed request.
+
+        Args:
+            error: Exception raised by the attempt
+            attempt: Number of the failed attempt (starting at 1)
+            method: HTTP method (GET, POST)
+            path: API endpoint path
+            data: Request body data
+
+        Returns:
+            Delay in seconds, or None if the error should be raised
+        """
+        idempotent = self.retry_policy.is_idempotent(method, data, path)
+        if not self.retry_policy.should_retry(error, attempt, idempotent):
+            return None
+
+        delay = self.retry_policy.get_delay(attempt, getattr(error, "retry_after", None))
+        logger.warning(
+            f"{method} {path} failed: {error}; retrying in {delay:.2f}s "
+            f"(attempt {attempt + 1}/{self.retry_policy.max_attempts})"
         )
+        return delay
 
     def _handle_response(self, response: Any) -> Dict[str, Any]:
         """Handle API response and raise exceptions on errors.
@@ -82,11 +295,8 @@ class BaseClient:
             status_code = response.status_code
 
         try:
-            if hasattr(response, "json"):
-                data = response.json()
-            else:
-                data = json.loads(response.text)
-        except (json.JSONDecodeError, AttributeError):
+            data = self.codec.loads(response.content)
+        except ValueError:
             data = {"code": str(status_code), "msg": response.text or "Unknown error"}
 
         # Check for errors
@@ -116,10 +326,11 @@ class BaseClient:
                     code=code,
                     request_time=request_time,
                     retry_after=retry_after,
+                    status_code=status_code,
                 )
 
             # Raise appropriate exception
-            raise_exception_from_response(code, message, request_time)
+            raise_exception_from_response(code, message, request_time, status_code)
 
         return data
 
@@ -127,6 +338,14 @@ class BaseClient:
 class WeexClient(BaseClient):
     """Synchronous HTTP client for Weex API."""
 
+    API_CLASSES = {
+        "account": ("weex_sdk.api.account", "AccountAPI"),
+        "market": ("weex_sdk.api.market", "MarketAPI"),
+        "trade": ("weex_sdk.api.trade", "TradeAPI"),
+        "ai": ("weex_sdk.api.ai", "AIAPI"),
+        "contracts": ("weex_sdk.contracts", "ContractRegistry"),
+    }
+
     def __init__(
         self,
         api_key: str,
@@ -135,6 +354,16 @@ class WeexClient(BaseClient):
         base_url: str = BASE_URL,
         locale: str = "en-US",
         timeout: int = 30,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        json_codec: Union[None, str, JsonCodec] = None,
+        timestamp_provider: Optional[Callable[[], str]] = None,
+        response_cache: Union[None, bool, ResponseCache] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        tcp_nodelay: bool = True,
     ) -> None:
         """Initialize synchronous client.
 
@@ -145,9 +374,46 @@ class WeexClient(BaseClient):
             base_url: Base URL for API
             locale: Locale setting
             timeout: Request timeout in seconds
+            rate_limiter: Rate limiter, may be shared between clients
+            retry_policy: Retry policy for transient failures
+            json_codec: JSON codec instance or backend name
+            timestamp_provider: Callable returning signing timestamps in milliseconds
+            response_cache: Cache for read-only GET responses, True for defaults
+            pool_connections: Number of per-host connection pools to cache (default: 10)
+            pool_maxsize: Maximum connections kept per host; set to at least the
+                number of threads sharing the client (default: 10)
+            pool_block: Block when all connections of a host are in use instead of
+                opening (and later discarding) extra ones (default: False)
+            keep_alive: Reuse connections across requests and enable TCP keep-alive
+                (default: True)
+            tcp_nodelay: Disable Nagle's algorithm on connections (default: True)
         """
-        super().__init__(api_key, secret_key, passphrase, base_url, locale, timeout)
+        super().__init__(
+            api_key,
+            secret_key,
+            passphrase,
+            base_url,
+            locale,
+            timeout,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            json_codec=json_codec,
+            timestamp_provider=timestamp_provider,
+            response_cache=response_cache,
+        )
+        self.pool_maxsize = pool_maxsize
         self.session = requests.Session()
+        adapter = TunedHTTPAdapter(
+            socket_options=build_socket_options(tcp_nodelay=tcp_nodelay, keep_alive=keep_alive),
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=0,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
 
     def get(
         self,
@@ -167,41 +433,14 @@ class WeexClient(BaseClient):
             WeexAPIError: On API errors
             WeexNetworkError: On network errors
         """
-        url = f"{self.base_url}{path}"
-        query_string = ""
-        if params:
-            query_parts = []
-            for key, value in params.items():
-                if value is not None:
-                    if isinstance(value, list):
-                        for item in value:
-                            query_parts.append(f"{key}={item}")
-                    else:
-                        query_parts.append(f"{key}={value}")
-            query_string = "&".join(query_parts)
-
-        headers = self.headers_builder.get_headers(
-            method="GET",
-            request_path=path,
-            query_string=query_string,
-        )
-
-        logger.debug(
-            f"GET {path}",
-            extra={"params": params, "headers": sanitize_log_data(headers)},
-        )
-
-        try:
-            response = self.session.get(
-                url,
-                headers=headers,
-                params=params,
-                timeout=self.timeout,
+        if self.response_cache is not None:
+            return self.response_cache.fetch(
+                path,
+                params,
+                lambda: self._request("GET", path, params=params),
+                namespace=self.api_key,
             )
-            return self._handle_response(response)
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Network error: {e}")
-            raise WeexNetworkError(f"Network error: {str(e)}") from e
+        return self._request("GET", path, params=params)
 
     def post(
         self,
@@ -221,263 +460,158 @@ class WeexClient(BaseClient):
             WeexAPIError: On API errors
             WeexNetworkError: On network errors
         """
-        url = f"{self.base_url}{path}"
-        body = json.dumps(data) if data else ""
-
-        headers = self.headers_builder.get_headers(
-            method="POST",
-            request_path=path,
-            query_string="",
-            body=body,
-        )
-
-        logger.debug(
-            f"POST {path}",
-            extra={"data": sanitize_log_data(data or {}), "headers": sanitize_log_data(headers)},
-        )
-
-        try:
-            response = self.session.post(
-                url,
-                headers=headers,
-                data=body,
-                timeout=self.timeout,
-            )
-            return self._handle_response(response)
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Network error: {e}")
-            raise WeexNetworkError(f"Network error: {str(e)}") from e
+        return self._request("POST", path, data=data)
 
-    def close(self) -> None:
-        """Close the session."""
-        self.session.close()
-
-    # API modules
-    @property
-    def account(self) -> "AccountAPI":
-        """Get Account API instance."""
-        from weex_sdk.api.account import AccountAPI
-
-        return AccountAPI(self)
-
-    @property
-    def market(self) -> "MarketAPI":
-        """Get Market API instance."""
-        from weex_sdk.api.market import MarketAPI
-
-        return MarketAPI(self)
-
-    @property
-    def trade(self) -> "TradeAPI":
-        """Get Trade API instance."""
-        from weex_sdk.api.trade import TradeAPI
-
-        return TradeAPI(self)
-
-    @property
-    def ai(self) -> "AIAPI":
-        """Get AI API instance."""
-        from weex_sdk.api.ai import AIAPI
-
-        return AIAPI(self)
-
-
-class AsyncWeexClient(BaseClient):
-    """Asynchronous HTTP client for Weex API."""
-
-    def __init__(
-        self,
-        api_key: str,
-        secret_key: str,
-        passphrase: str,
-        base_url: str = BASE_URL,
-        locale: str = "en-US",
-        timeout: int = 30,
-    ) -> None:
-        """Initialize asynchronous client.
-
-        Args:
-            api_key: API key
-            secret_key: Secret key
-            passphrase: API passphrase
-            base_url: Base URL for API
-            locale: Locale setting
-            timeout: Request timeout in seconds
-        """
-        super().__init__(api_key, secret_key, passphrase, base_url, locale, timeout)
-        self.session: Optional[aiohttp.ClientSession] = None
-
-    async def __aenter__(self) -> "AsyncWeexClient":
-        """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
-        return self
-
-    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit."""
-        if self.session:
-            await self.session.close()
-
-    async def get(
+    def _request(
         self,
+        method: str,
         path: str,
         params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        """Make async GET request.
+        """Send a request, retrying transient failures per the retry policy.
 
         Args:
+            method: HTTP method (GET, POST)
             path: API endpoint path
             params: Query parameters
+            data: Request body data
 
         Returns:
             Parsed JSON response
-
-        Raises:
-            WeexAPIError: On API errors
-            WeexNetworkError: On network errors
         """
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-
-        url = f"{self.base_url}{path}"
-        query_string = ""
-        if params:
-            query_parts = []
-            for key, value in params.items():
-                if value is not None:
-                    if isinstance(value, list):
-                        for item in value:
-                            query_parts.append(f"{key}={item}")
-                    else:
-                        query_parts.append(f"{key}={value}")
-            query_string = "&".join(query_parts)
-
-        headers = self.headers_builder.get_headers(
-            method="GET",
-            request_path=path,
-            query_string=query_string,
-        )
-
-        logger.debug(
-            f"GET {path}",
-            extra={"params": params, "headers": sanitize_log_data(headers)},
-        )
-
-        try:
-            async with self.session.get(
-                url,
-                headers=headers,
-                params=params,
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-            ) as response:
-                # Read response text
-                text = await response.text()
-
-                # Create a mock response object for _handle_response
-                class MockResponse:
-                    def __init__(self, status: int, text: str, headers: Any) -> None:
-                        self.status = status
-                        self.text = text
-                        self.headers = headers
-
-                    def json(self) -> Dict[str, Any]:
-                        return json.loads(self.text)
-
-                mock_response = MockResponse(response.status, text, response.headers)
-                return self._handle_response(mock_response)
-        except aiohttp.ClientError as e:
-            logger.error(f"Network error: {e}")
-            raise WeexNetworkError(f"Network error: {str(e)}") from e
-
-    async def post(
+        attempt = 1
+        while True:
+            try:
+                return self._send(method, path, params=params, data=data)
+            except WeexAPIError as e:
+                delay = self._next_retry_delay(e, attempt, method, path, data)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def _send(
         self,
+        method: str,
         path: str,
+        params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        """Make async POST request.
+        """Wait for the rate limiter, then sign and send a request once.
 
         Args:
+            method: HTTP method (GET, POST)
             path: API endpoint path
+            params: Query parameters
             data: Request body data
 
         Returns:
             Parsed JSON response
-
-        Raises:
-            WeexAPIError: On API errors
-            WeexNetworkError: On network errors
         """
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-
-        url = f"{self.base_url}{path}"
-        body = json.dumps(data) if data else ""
+        group = self.rate_limiter.group_for(path)
+        self.rate_limiter.acquire(group, self.rate_limiter.weight_for(path))
 
-        headers = self.headers_builder.get_headers(
-            method="POST",
-            request_path=path,
-            query_string="",
-            body=body,
-        )
-
-        logger.debug(
-            f"POST {path}",
-            extra={"data": sanitize_log_data(data or {}), "headers": sanitize_log_data(headers)},
-        )
+        # Sign after waiting so the timestamp is fresh when the request leaves
+        request = self._prepare_request(method, path, params=params, data=data)
+        self._log_request(request, params, data)
 
         try:
-            async with self.session.post(
-                url,
-                headers=headers,
-                json=data,
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-            ) as response:
-                text = await response.text()
-
-                class MockResponse:
-                    def __init__(self, status: int, text: str, headers: Any) -> None:
-                        self.status = status
-                        self.text = text
-                        self.headers = headers
-
-                    def json(self) -> Dict[str, Any]:
-                        return json.loads(self.text)
-
-                mock_response = MockResponse(response.status, text, response.headers)
-                return self._handle_response(mock_response)
-        except aiohttp.ClientError as e:
+            response = self.session.request(
+                method,
+                request.url,
+                headers=request.headers,
+                data=request.body,
+                timeout=self.timeout,
+            )
+        except requests.exceptions.RequestException as e:
             logger.error(f"Network error: {e}")
             raise WeexNetworkError(f"Network error: {str(e)}") from e
 
-    async def close(self) -> None:
+        try:
+            return self._handle_response(response)
+        except WeexRateLimitError as e:
+            self.rate_limiter.penalize(group, e.retry_after)
+            raise
+
+    def warmup(self, connections: int = 1, path: str = "/capi/v2/market/time") -> int:
+        """Pre-open connections so the first real requests skip the TLS handshake.
+
+        Sends concurrent unauthenticated requests to a lightweight public
+        endpoint; each one leaves an established connection in the pool.
+
+        Args:
+            connections: Number of connections to open (capped at pool_maxsize)
+            path: Public endpoint used for warming (default: server time)
+
+        Returns:
+            Number of connections successfully opened
+        """
+        if connections > self.pool_maxsize:
+            logger.warning(
+                f"Warmup of {connections} connections capped at pool_maxsize={self.pool_maxsize}"
+            )
+            connections = self.pool_maxsize
+        if connections < 1:
+            return 0
+
+        url = f"{self.base_url}{path}"
+        group = self.rate_limiter.group_for(path)
+        # Hold every request at the barrier so they run concurrently on separate connections
+        barrier = threading.Barrier(connections)
+
+        def open_connection() -> bool:
+            self.rate_limiter.acquire(group)
+            try:
+                barrier.wait(timeout=self.timeout)
+            except threading.BrokenBarrierError:
+                pass
+            try:
+                self.session.get(url, timeout=self.timeout)
+                return True
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Warmup request failed: {e}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            opened = sum(executor.map(lambda _: open_connection(), range(connections)))
+
+        logger.info(f"Warmed up {opened}/{connections} connections to {self.base_url}")
+        return opened
+
+    def close(self) -> None:
         """Close the session."""
-        if self.session:
-            await self.session.close()
+        self.session.close()
 
     # API modules
     @property
-    def account(self) -> "AsyncAccountAPI":
-        """Get Async Account API instance."""
-        from weex_sdk.api.account import AsyncAccountAPI
-
-        return AsyncAccountAPI(self)
+    def account(self) -> "AccountAPI":
+        """Get Account API instance (created once per client)."""
+        return self._get_api("account")
 
     @property
-    def market(self) -> "AsyncMarketAPI":
-        """Get Async Market API instance."""
-        from weex_sdk.api.market import AsyncMarketAPI
-
-        return AsyncMarketAPI(self)
+    def market(self) -> "MarketAPI":
+        """Get Market API instance (created once per client)."""
+        return self._get_api("market")
 
     @property
-    def trade(self) -> "AsyncTradeAPI":
-        """Get Async Trade API instance."""
-        from weex_sdk.api.trade import AsyncTradeAPI
+    def trade(self) -> "TradeAPI":
+        """Get Trade API instance (created once per client)."""
+        return self._get_api("trade")
 
-        return AsyncTradeAPI(self)
+    @property
+    def ai(self) -> "AIAPI":
+        """Get AI API instance (created once per client)."""
+        return self._get_api("ai")
 
     @property
-    def ai(self) -> "AsyncAIAPI":
-        """Get Async AI API instance."""
-        from weex_sdk.api.ai import AsyncAIAPI
+    def contracts(self) -> "ContractRegistry":
+        """Get the contract metadata cache (created once per client)."""
+        return self._get_api("contracts")
+
 
-        return AsyncAIAPI(self)
+def __getattr__(name: str) -> Any:
+    """Import the aiohttp-based client on first access."""
+    if name in _ASYNC_NAMES:
+        return getattr(importlib.import_module("weex_sdk.async_client"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
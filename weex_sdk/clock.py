@@ -0,0 +1,280 @@
+"""Server clock synchronization for request timestamps."""
+
+import asyncio
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Mapping, NamedTuple, Optional
+
+from weex_sdk.exceptions import WeexAPIError
+from weex_sdk.logger import get_logger
+
+logger = get_logger("clock")
+
+
+class ClockSample(NamedTuple):
+    """Single server time measurement.
+
+    Attributes:
+        offset: Server time minus local time at the midpoint of the request (seconds)
+        rtt: Round-trip time of the request (seconds)
+    """
+
+    offset: float
+    rtt: float
+
+
+def parse_server_time(response: Mapping[str, Any]) -> float:
+    """Extract the server time from a ``get_server_time()`` response.
+
+    Args:
+        response: Server time response (epoch, iso, timestamp)
+
+    Returns:
+        Server time in seconds since the epoch
+
+    Raises:
+        ValueError: If the response carries no usable time
+    """
+    timestamp = response.get("timestamp")
+    if timestamp is not None:
+        return int(timestamp) / 1000.0
+    epoch = response.get("epoch")
+    if epoch is not None:
+        return float(epoch)
+    raise ValueError(f"Server time missing from response: {response}")
+
+
+class ClockSync:
+    """NTP-style estimate of the offset between the local and server clocks.
+
+    Each sample brackets a ``get_server_time()`` call with monotonic clock
+    readings and assumes the server stamped its reply halfway through the
+    round trip. The offset is the median of the lowest-RTT samples in a
+    sliding window, since slow round trips carry the largest error.
+
+    Timestamps are derived from the monotonic clock plus the estimated offset,
+    so wall clock steps on the host (NTP corrections, manual changes) do not
+    affect signed requests. Pass ``timestamp`` as the ``timestamp_provider``
+    of clients and WebSocket connections.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        samples_per_sync: int = 5,
+        window: int = 20,
+        best_samples: int = 3,
+        interval: float = 300.0,
+    ) -> None:
+        """Initialize clock synchronizer.
+
+        Args:
+            client: WeexClient or AsyncWeexClient used to query the server time
+            samples_per_sync: Requests sent per sync (default: 5)
+            window: Number of recent samples kept for the estimate (default: 20)
+            best_samples: Number of lowest-RTT samples used for the offset (default: 3)
+            interval: Seconds between background syncs (default: 300)
+        """
+        if samples_per_sync < 1 or window < 1 or best_samples < 1:
+            raise ValueError("samples_per_sync, window and best_samples must be positive")
+
+        self.client = client
+        self.samples_per_sync = samples_per_sync
+        self.best_samples = best_samples
+        self.interval = interval
+
+        # Wall clock time at monotonic zero, fixed so later wall clock steps are ignored
+        self._epoch = time.time() - time.monotonic()
+        self._samples: Deque[ClockSample] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.offset = 0.0
+        self.rtt: Optional[float] = None
+        self.sync_count = 0
+        self.failure_count = 0
+        self.last_sync: Optional[float] = None
+
+    def local_time(self) -> float:
+        """Get the local time in seconds derived from the monotonic clock."""
+        return self._epoch + time.monotonic()
+
+    def now(self) -> float:
+        """Get the estimated server time in seconds."""
+        return self._epoch + time.monotonic() + self.offset
+
+    def timestamp(self) -> str:
+        """Get the estimated server time in milliseconds, as used for signing."""
+        return str(int((self._epoch + time.monotonic() + self.offset) * 1000))
+
+    def add_sample(self, sent: float, received: float, server_time: float) -> ClockSample:
+        """Record a measurement and update the offset estimate.
+
+        Args:
+            sent: Monotonic time the request was sent
+            received: Monotonic time the response was received
+            server_time: Server time from the response in seconds since the epoch
+
+        Returns:
+            Recorded sample
+        """
+        rtt = received - sent
+        sample = ClockSample(
+            offset=server_time - (self._epoch + (sent + received) / 2.0),
+            rtt=rtt,
+        )
+        with self._lock:
+            self._samples.append(sample)
+            best = sorted(self._samples, key=lambda s: s.rtt)[: self.best_samples]
+            self.offset = statistics.median(s.offset for s in best)
+            self.rtt = best[0].rtt
+        return sample
+
+    def _finish_sync(self, collected: int, error: Optional[Exception]) -> float:
+        """Update sync counters after a round of samples.
+
+        Args:
+            collected: Number of successful samples
+            error: Last error raised while sampling
+
+        Returns:
+            Current offset in seconds
+
+        Raises:
+            WeexAPIError: If no sample succeeded
+        """
+        if not collected:
+            self.failure_count += 1
+            if error is not None:
+                raise error
+            raise WeexAPIError("Clock sync collected no samples")
+
+        self.sync_count += 1
+        self.last_sync = time.monotonic()
+        logger.info(
+            f"Clock synced: offset {self.offset * 1000:.1f}ms, "
+            f"rtt {(self.rtt or 0.0) * 1000:.1f}ms ({collected} samples)"
+        )
+        return self.offset
+
+    def sync(self, samples: Optional[int] = None) -> float:
+        """Sample the server time and update the offset estimate.
+
+        Args:
+            samples: Number of requests to send (default: samples_per_sync)
+
+        Returns:
+            Estimated offset in seconds (server minus local)
+
+        Raises:
+            WeexAPIError: If every request failed
+        """
+        collected = 0
+        error: Optional[Exception] = None
+        for _ in range(samples or self.samples_per_sync):
+            try:
+                sent = time.monotonic()
+                response = self.client.market.get_server_time()
+                received = time.monotonic()
+                self.add_sample(sent, received, parse_server_time(response))
+                collected += 1
+            except (WeexAPIError, ValueError) as e:
+                logger.warning(f"Clock sync sample failed: {e}")
+                error = e
+        return self._finish_sync(collected, error)
+
+    async def sync_async(self, samples: Optional[int] = None) -> float:
+        """Sample the server time and update the offset estimate (async).
+
+        Args:
+            samples: Number of requests to send (default: samples_per_sync)
+
+        Returns:
+            Estimated offset in seconds (server minus local)
+
+        Raises:
+            WeexAPIError: If every request failed
+        """
+        collected = 0
+        error: Optional[Exception] = None
+        for _ in range(samples or self.samples_per_sync):
+            try:
+                sent = time.monotonic()
+                response = await self.client.market.get_server_time()
+                received = time.monotonic()
+                self.add_sample(sent, received, parse_server_time(response))
+                collected += 1
+            except (WeexAPIError, ValueError) as e:
+                logger.warning(f"Clock sync sample failed: {e}")
+                error = e
+        return self._finish_sync(collected, error)
+
+    def start(self) -> None:
+        """Sync now and then every ``interval`` seconds in a daemon thread."""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="weex-clock-sync", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Background sync loop."""
+        while not self._stop_event.is_set():
+            try:
+                self.sync()
+            except Exception as e:
+                logger.error(f"Clock sync failed: {e}")
+            self._stop_event.wait(self.interval)
+
+    async def run_async(self) -> None:
+        """Sync now and then every ``interval`` seconds until stopped or cancelled.
+
+        Run it as a task on the event loop of an AsyncWeexClient::
+
+            task = asyncio.create_task(clock.run_async())
+        """
+        self._stop_event.clear()
+        while not self._stop_event.is_set():
+            try:
+                await self.sync_async()
+            except Exception as e:
+                logger.error(f"Clock sync failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop background syncing.
+
+        Args:
+            timeout: Seconds to wait for the background thread to exit
+        """
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def samples(self) -> List[ClockSample]:
+        """Samples in the current window, oldest first."""
+        with self._lock:
+            return list(self._samples)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get clock sync metrics.
+
+        Returns:
+            Dictionary with offset_ms, rtt_ms, samples, syncs, failures and
+            seconds_since_sync (None before the first sync)
+        """
+        last_sync = self.last_sync
+        return {
+            "offset_ms": self.offset * 1000.0,
+            "rtt_ms": self.rtt * 1000.0 if self.rtt is not None else None,
+            "samples": len(self._samples),
+            "syncs": self.sync_count,
+            "failures": self.failure_count,
+            "seconds_since_sync": (time.monotonic() - last_sync if last_sync is not None else None),
+        }
@@ -0,0 +1,159 @@
+"""JSON codecs for Weex API requests, responses and WebSocket messages."""
+
+import json
+from typing import Any, Dict, Optional, Type, Union
+
+# Input accepted by JsonCodec.loads
+JsonInput = Union[bytes, bytearray, memoryview, str]
+
+
+class JsonCodec:
+    """JSON codec based on the standard library.
+
+    Codecs encode to UTF-8 bytes, which are signed and sent as-is, and decode
+    bytes or str directly without an intermediate conversion. Decoding errors
+    are raised as ``ValueError`` subclasses for every backend.
+
+    Attributes:
+        name: Backend name
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        """Encode an object to JSON bytes.
+
+        Args:
+            obj: Object to encode
+            pretty: Indent output with 2 spaces (default: compact)
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return self.dumps_text(obj, pretty).encode("utf-8")
+
+    def dumps_text(self, obj: Any, pretty: bool = False) -> str:
+        """Encode an object to a JSON string (for text WebSocket frames).
+
+        Args:
+            obj: Object to encode
+            pretty: Indent output with 2 spaces (default: compact)
+
+        Returns:
+            JSON string
+        """
+        if pretty:
+            return json.dumps(obj, indent=2)
+        return json.dumps(obj, separators=(",", ":"))
+
+    def loads(self, data: JsonInput) -> Any:
+        """Decode JSON bytes or str.
+
+        Args:
+            data: JSON document
+
+        Returns:
+            Decoded object
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec based on orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Initialize codec.
+
+        Raises:
+            ImportError: If orjson is not installed
+        """
+        import orjson
+
+        self._orjson = orjson
+        self._option = orjson.OPT_NON_STR_KEYS
+        self._pretty_option = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        """Encode an object to JSON bytes."""
+        return self._orjson.dumps(obj, option=self._pretty_option if pretty else self._option)
+
+    def dumps_text(self, obj: Any, pretty: bool = False) -> str:
+        """Encode an object to a JSON string."""
+        return self.dumps(obj, pretty).decode("utf-8")
+
+    def loads(self, data: JsonInput) -> Any:
+        """Decode JSON bytes or str."""
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    """JSON codec based on ujson."""
+
+    name = "ujson"
+
+    def __init__(self) -> None:
+        """Initialize codec.
+
+        Raises:
+            ImportError: If ujson is not installed
+        """
+        import ujson
+
+        self._ujson = ujson
+
+    def dumps_text(self, obj: Any, pretty: bool = False) -> str:
+        """Encode an object to a JSON string."""
+        return self._ujson.dumps(obj, ensure_ascii=False, indent=2 if pretty else 0)
+
+    def loads(self, data: JsonInput) -> Any:
+        """Decode JSON bytes or str."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return self._ujson.loads(data)
+
+
+CODECS: Dict[str, Type[JsonCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    UjsonCodec.name: UjsonCodec,
+    JsonCodec.name: JsonCodec,
+}
+
+_default_codec: Optional[JsonCodec] = None
+
+
+def get_codec(codec: Union[None, str, JsonCodec] = None) -> JsonCodec:
+    """Resolve a codec name or instance.
+
+    Args:
+        codec: Codec instance, backend name (orjson, ujson, json), or None/"auto"
+            for the fastest installed backend
+
+    Returns:
+        Codec instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError: If the requested backend is not installed
+    """
+    global _default_codec
+
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is None or codec == "auto":
+        if _default_codec is None:
+            for codec_class in CODECS.values():
+                try:
+                    _default_codec = codec_class()
+                    break
+                except ImportError:
+                    continue
+        return _default_codec  # type: ignore[return-value]
+
+    codec_class = CODECS.get(codec)
+    if codec_class is None:
+        raise ValueError(f"Unknown JSON codec '{codec}', expected one of {sorted(CODECS)}")
+    return codec_class()
@@ -0,0 +1,344 @@
+"""Contract metadata cache with precomputed price and size precision."""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from weex_sdk.exceptions import WeexAPIError, WeexValidationError
+from weex_sdk.logger import get_logger
+from weex_sdk.models import Contract
+
+logger = get_logger("contracts")
+
+# Tolerance for float division noise when rounding to a step (e.g. 0.3 / 0.1)
+_EPSILON = 1e-9
+
+
+def _precision(value: Union[str, int, float, None], end_step: int = 1) -> Tuple[int, float]:
+    """Parse a precision field into (decimal places, step).
+
+    ``tick_size`` and ``size_increment`` hold the number of decimal places
+    (e.g. "1" for a 0.1 price step). Values with a decimal point are taken
+    as the step itself for compatibility with endpoints that report steps.
+
+    Args:
+        value: Precision field
+        end_step: Step of the last decimal digit (``priceEndStep``)
+
+    Returns:
+        Decimal places and step size
+    """
+    text = str(value if value is not None else "0").strip()
+    if "." in text or "e" in text.lower():
+        step = float(text)
+        if step <= 0:
+            raise ValueError(f"Invalid step '{text}'")
+        decimals = max(0, -math.floor(math.log10(step) + _EPSILON))
+        return decimals, step
+    decimals = int(text)
+    return decimals, round(end_step * 10.0**-decimals, decimals)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Convert an optional numeric string to float."""
+    if value is None or value == "":
+        return None
+    return float(value)
+
+
+def _round_to_step(value: float, step: float, decimals: int, mode: str) -> float:
+    """Round a value to a multiple of step.
+
+    Args:
+        value: Value to round
+        step: Step size
+        decimals: Decimal places of the step
+        mode: "down", "up" or "nearest"
+
+    Returns:
+        Rounded value
+    """
+    ratio = value / step
+    if mode == "down":
+        steps = math.floor(ratio + _EPSILON)
+    elif mode == "up":
+        steps = math.ceil(ratio - _EPSILON)
+    elif mode == "nearest":
+        steps = math.floor(ratio + 0.5)
+    else:
+        raise ValueError(f"Invalid rounding mode '{mode}'")
+    return round(steps * step, decimals)
+
+
+@dataclass(frozen=True)
+class ContractSpec:
+    """Parsed contract metadata.
+
+    Attributes:
+        symbol: Trading pair
+        price_decimals: Decimal places of prices
+        price_step: Price increment
+        size_decimals: Decimal places of order sizes
+        size_step: Order size increment
+        min_order_size: Minimum order size (base currency)
+        max_order_size: Maximum order size (base currency), None if unlimited
+        max_position_size: Maximum position size (base currency), None if unlimited
+        min_leverage: Minimum leverage
+        max_leverage: Maximum leverage
+        maker_fee_rate: Maker fee rate
+        taker_fee_rate: Taker fee rate
+        raw: Contract as returned by the API
+    """
+
+    symbol: str
+    price_decimals: int
+    price_step: float
+    size_decimals: int
+    size_step: float
+    min_order_size: float
+    max_order_size: Optional[float]
+    max_position_size: Optional[float]
+    min_leverage: int
+    max_leverage: int
+    maker_fee_rate: float
+    taker_fee_rate: float
+    raw: Contract
+
+    @classmethod
+    def from_contract(cls, contract: Contract) -> "ContractSpec":
+        """Parse a ``get_contracts()`` entry.
+
+        Args:
+            contract: Contract information
+
+        Returns:
+            Parsed contract metadata
+
+        Raises:
+            ValueError: If a numeric field is malformed
+        """
+        price_decimals, price_step = _precision(
+            contract.get("tick_size"), int(contract.get("priceEndStep") or 1)
+        )
+        size_decimals, size_step = _precision(contract.get("size_increment"))
+        return cls(
+            symbol=contract["symbol"],
+            price_decimals=price_decimals,
+            price_step=price_step,
+            size_decimals=size_decimals,
+            size_step=size_step,
+            min_order_size=_to_float(contract.get("minOrderSize")) or 0.0,
+            max_order_size=_to_float(contract.get("maxOrderSize")),
+            max_position_size=_to_float(contract.get("maxPositionSize")),
+            min_leverage=int(contract.get("minLeverage") or 1),
+            max_leverage=int(contract.get("maxLeverage") or 1),
+            maker_fee_rate=_to_float(contract.get("makerFeeRate")) or 0.0,
+            taker_fee_rate=_to_float(contract.get("takerFeeRate")) or 0.0,
+            raw=contract,
+        )
+
+    def round_price(self, price: float, mode: str = "nearest") -> float:
+        """Round a price to the price step.
+
+        Args:
+            price: Price
+            mode: "nearest", "down" or "up" (default: nearest)
+
+        Returns:
+            Rounded price
+        """
+        return _round_to_step(price, self.price_step, self.price_decimals, mode)
+
+    def round_size(self, size: float, mode: str = "down") -> float:
+        """Round an order size to the size step.
+
+        Args:
+            size: Order size
+            mode: "down", "up" or "nearest" (default: down, never exceeding the input)
+
+        Returns:
+            Rounded size
+        """
+        return _round_to_step(size, self.size_step, self.size_decimals, mode)
+
+    def format_price(self, price: float, mode: str = "nearest") -> str:
+        """Round a price and format it as the API expects."""
+        return f"{self.round_price(price, mode):.{self.price_decimals}f}"
+
+    def format_size(self, size: float, mode: str = "down") -> str:
+        """Round an order size and format it as the API expects."""
+        return f"{self.round_size(size, mode):.{self.size_decimals}f}"
+
+    def validate_size(self, size: float) -> None:
+        """Check an order size against the contract limits.
+
+        Args:
+            size: Order size
+
+        Raises:
+            WeexValidationError: If the size is outside the allowed range
+        """
+        if size < self.min_order_size - _EPSILON:
+            raise WeexValidationError(
+                f"{self.symbol} order size {size} below minimum {self.min_order_size}"
+            )
+        if self.max_order_size is not None and size > self.max_order_size + _EPSILON:
+            raise WeexValidationError(
+                f"{self.symbol} order size {size} above maximum {self.max_order_size}"
+            )
+
+    def prepare_order(
+        self, size: float, price: Optional[float] = None
+    ) -> Tuple[str, Optional[str]]:
+        """Round, validate and format an order's size and price.
+
+        Args:
+            size: Order size (rounded down)
+            price: Limit price (rounded to nearest), None for market orders
+
+        Returns:
+            Size and price strings ready for ``place_order``
+
+        Raises:
+            WeexValidationError: If the rounded size is outside the allowed range
+        """
+        rounded = self.round_size(size)
+        self.validate_size(rounded)
+        size_text = f"{rounded:.{self.size_decimals}f}"
+        return size_text, self.format_price(price) if price is not None else None
+
+
+class ContractRegistry:
+    """Cache of contract metadata indexed by symbol.
+
+    All contracts are fetched with one ``get_contracts()`` call and kept for
+    ``ttl`` seconds. If a refresh fails while cached data exists, the cached
+    data keeps being served and the refresh is retried on the next lookup.
+    Works with both WeexClient (``get``) and AsyncWeexClient (``get_async``).
+    """
+
+    def __init__(self, client: Any, ttl: float = 3600.0) -> None:
+        """Initialize registry.
+
+        Args:
+            client: WeexClient or AsyncWeexClient used to fetch contracts
+            ttl: Seconds before contract metadata is refreshed (default: 3600)
+        """
+        self.client = client
+        self.ttl = ttl
+        self._specs: Dict[str, ContractSpec] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def stale(self) -> bool:
+        """Whether the cached metadata is missing or older than the TTL."""
+        loaded_at = self._loaded_at
+        return loaded_at is None or time.monotonic() - loaded_at >= self.ttl
+
+    def _load(self, contracts: Iterable[Contract]) -> Dict[str, ContractSpec]:
+        """Replace the cached metadata."""
+        specs = {}
+        for contract in contracts or []:
+            try:
+                spec = ContractSpec.from_contract(contract)
+            except (KeyError, ValueError) as e:
+                logger.warning(f"Skipping malformed contract {contract.get('symbol')}: {e}")
+                continue
+            specs[spec.symbol] = spec
+        self._specs = specs
+        self._loaded_at = time.monotonic()
+        logger.debug(f"Loaded {len(specs)} contracts")
+        return specs
+
+    def refresh(self) -> Dict[str, ContractSpec]:
+        """Fetch all contracts now.
+
+        Returns:
+            Contract metadata by symbol
+
+        Raises:
+            WeexAPIError: On API errors
+        """
+        return self._load(self.client.market.get_contracts())
+
+    async def refresh_async(self) -> Dict[str, ContractSpec]:
+        """Fetch all contracts now (async).
+
+        Returns:
+            Contract metadata by symbol
+
+        Raises:
+            WeexAPIError: On API errors
+        """
+        return self._load(await self.client.market.get_contracts())
+
+    def invalidate(self) -> None:
+        """Force a refresh on the next lookup, e.g. after a new listing."""
+        self._loaded_at = None
+
+    def _lookup(self, symbol: str) -> ContractSpec:
+        """Get cached metadata for a symbol."""
+        spec = self._specs.get(symbol)
+        if spec is None:
+            raise WeexValidationError(f"Unknown contract symbol '{symbol}'")
+        return spec
+
+    def _refresh_failed(self, error: WeexAPIError) -> None:
+        """Keep serving cached metadata after a failed refresh, if there is any."""
+        if not self._specs:
+            raise error
+        logger.warning(f"Contract refresh failed, using cached metadata: {error}")
+
+    def get(self, symbol: str) -> ContractSpec:
+        """Get contract metadata, refreshing the cache when stale.
+
+        Args:
+            symbol: Trading pair
+
+        Returns:
+            Contract metadata
+
+        Raises:
+            WeexValidationError: If the symbol is not listed
+            WeexAPIError: If contracts could not be fetched and none are cached
+        """
+        if self.stale:
+            with self._lock:
+                # Another thread may have refreshed while we waited
+                if self.stale:
+                    try:
+                        self.refresh()
+                    except WeexAPIError as e:
+                        self._refresh_failed(e)
+        return self._lookup(symbol)
+
+    async def get_async(self, symbol: str) -> ContractSpec:
+        """Get contract metadata, refreshing the cache when stale (async).
+
+        Args:
+            symbol: Trading pair
+
+        Returns:
+            Contract metadata
+
+        Raises:
+            WeexValidationError: If the symbol is not listed
+            WeexAPIError: If contracts could not be fetched and none are cached
+        """
+        if self.stale:
+            try:
+                await self.refresh_async()
+            except WeexAPIError as e:
+                self._refresh_failed(e)
+        return self._lookup(symbol)
+
+    def symbols(self) -> List[str]:
+        """Get the symbols currently cached."""
+        return sorted(self._specs)
+
+    def __contains__(self, symbol: object) -> bool:
+        """Check whether a symbol is cached (does not refresh)."""
+        return symbol in self._specs
@@ -0,0 +1,427 @@
+"""Callback dispatchers that run WebSocket handlers off the receive path.
+
+A dispatcher queues each decoded message per channel and hands it to a
+pool of workers, so a slow handler never delays pings, pongs or other
+channels. Queues are bounded: when a channel falls behind, its oldest
+messages are dropped and counted.
+
+Each channel also has a delivery policy. ``all`` delivers every message,
+``conflate`` keeps only the newest message not yet handled, and
+``sample(interval)`` delivers the newest message at most once per interval.
+Consumers that only need the current state, such as ticker or depth
+renderers, stay current no matter how far behind they are.
+"""
+
+import asyncio
+import math
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from weex_sdk.logger import get_logger
+
+logger = get_logger("dispatch")
+
+Callback = Callable[[Dict[str, Any]], Any]
+
+DELIVERY_MODES = ("all", "conflate", "sample")
+
+
+@dataclass(frozen=True)
+class Delivery:
+    """How messages of a channel reach its callback.
+
+    Attributes:
+        mode: "all" (every message), "conflate" (only the newest message not
+            yet handled) or "sample" (the newest message at most once per interval)
+        interval: Seconds between deliveries in sample mode
+    """
+
+    mode: str = "all"
+    interval: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Validate the policy."""
+        if self.mode not in DELIVERY_MODES:
+            raise ValueError(f"Invalid delivery mode '{self.mode}'")
+        if self.mode == "sample" and not self.interval > 0:
+            raise ValueError("sample delivery requires a positive interval")
+
+    @classmethod
+    def sample(cls, interval: float) -> "Delivery":
+        """Deliver the newest message at most once per interval.
+
+        Args:
+            interval: Seconds between deliveries
+
+        Returns:
+            Sampling policy
+        """
+        return cls("sample", interval)
+
+    @classmethod
+    def parse(cls, value: Union[str, "Delivery", None]) -> "Delivery":
+        """Convert a mode name ("all", "conflate") or policy to a policy."""
+        if value is None:
+            return cls()
+        if isinstance(value, Delivery):
+            return value
+        return cls(value)
+
+
+ALL = Delivery("all")
+CONFLATE = Delivery("conflate")
+
+
+class _ChannelQueue:
+    """Pending messages, delivery policy and counters of one channel."""
+
+    def __init__(self, channel: str, max_size: int, ordered: bool, delivery: Delivery) -> None:
+        self.channel = channel
+        self.max_size = max_size
+        self.ordered = ordered
+        self.delivery = delivery
+        self.items: Deque[Any] = deque()
+        # Serialized channels are handed to one worker at a time
+        self.scheduled = False
+        self.last_delivery = -math.inf
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.high_water = 0
+
+    @property
+    def serialized(self) -> bool:
+        """Whether messages are delivered one at a time."""
+        return self.ordered or self.delivery.mode != "all"
+
+    @property
+    def limit(self) -> int:
+        """Pending messages kept before the oldest is dropped."""
+        return self.max_size if self.delivery.mode == "all" else 1
+
+    def delay(self) -> float:
+        """Seconds until the next delivery is due."""
+        if self.delivery.mode != "sample":
+            return 0.0
+        return max(0.0, self.last_delivery + self.delivery.interval - time.monotonic())
+
+
+class _BaseDispatcher(ABC):
+    """Per-channel queue bookkeeping shared by the threaded and async dispatchers."""
+
+    def __init__(self, workers: int = 4, max_queue: int = 1000, ordered: bool = True) -> None:
+        """Initialize dispatcher.
+
+        Args:
+            workers: Number of workers running callbacks (default: 4)
+            max_queue: Pending messages per channel before the oldest are
+                dropped (default: 1000)
+            ordered: Deliver each channel's messages one at a time in arrival
+                order; unordered channels run messages on several workers at
+                once (default: True)
+        """
+        if workers < 1 or max_queue < 1:
+            raise ValueError("workers and max_queue must be positive")
+
+        self.workers = workers
+        self.max_queue = max_queue
+        self.ordered = ordered
+        self._channels: Dict[str, _ChannelQueue] = {}
+        self._overrides: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        channel: str,
+        ordered: Optional[bool] = None,
+        max_queue: Optional[int] = None,
+        delivery: Union[None, str, Delivery] = None,
+    ) -> None:
+        """Override ordering, queue size or delivery policy for one channel.
+
+        Args:
+            channel: Channel name
+            ordered: Whether messages are delivered one at a time in order
+            max_queue: Pending messages before the oldest are dropped
+            delivery: "all", "conflate" or Delivery.sample(interval);
+                conflated and sampled channels are always delivered in order
+        """
+        if max_queue is not None and max_queue < 1:
+            raise ValueError("max_queue must be positive")
+        policy = Delivery.parse(delivery) if delivery is not None else None
+
+        with self._lock:
+            settings = self._overrides.setdefault(channel, {})
+            if ordered is not None:
+                settings["ordered"] = ordered
+            if max_queue is not None:
+                settings["max_size"] = max_queue
+            if policy is not None:
+                settings["delivery"] = policy
+            pending = self._channels.get(channel)
+            if pending is not None:
+                pending.ordered = settings.get("ordered", pending.ordered)
+                pending.max_size = settings.get("max_size", pending.max_size)
+                pending.delivery = settings.get("delivery", pending.delivery)
+
+    @abstractmethod
+    def _ensure_started(self) -> None:
+        """Start the workers if they are not running."""
+
+    @abstractmethod
+    def _wake(self, pending: _ChannelQueue, delay: float) -> None:
+        """Hand a channel to a worker after a delay in seconds."""
+
+    def submit(self, channel: str, callback: Callback, message: Dict[str, Any]) -> None:
+        """Queue a message for delivery to a callback.
+
+        Args:
+            channel: Channel the message arrived on
+            callback: Subscriber callback
+            message: Decoded message
+        """
+        self._ensure_started()
+        pending, delay = self._enqueue(channel, callback, message)
+        if delay is not None:
+            self._wake(pending, delay)
+
+    def _enqueue(
+        self, channel: str, callback: Callback, message: Any
+    ) -> Tuple[_ChannelQueue, Optional[float]]:
+        """Queue a message.
+
+        Returns:
+            The channel and the delay before a worker must take it, or None
+            for the delay if a worker already owns the channel
+        """
+        with self._lock:
+            pending = self._channels.get(channel)
+            if pending is None:
+                settings = self._overrides.get(channel, {})
+                pending = self._channels[channel] = _ChannelQueue(
+                    channel,
+                    settings.get("max_size", self.max_queue),
+                    settings.get("ordered", self.ordered),
+                    settings.get("delivery", ALL),
+                )
+            while len(pending.items) >= pending.limit:
+                pending.items.popleft()
+                pending.dropped += 1
+            pending.items.append((callback, message))
+            pending.high_water = max(pending.high_water, len(pending.items))
+
+            if not pending.serialized:
+                return pending, 0.0
+            if pending.scheduled:
+                return pending, None
+            pending.scheduled = True
+            return pending, pending.delay()
+
+    def _take(self, pending: _ChannelQueue) -> Optional[Any]:
+        """Pop the next message of a channel handed to a worker."""
+        with self._lock:
+            if pending.items:
+                pending.last_delivery = time.monotonic()
+                return pending.items.popleft()
+            pending.scheduled = False
+            return None
+
+    def _done(self, pending: _ChannelQueue, failed: bool) -> None:
+        """Record a delivery and give a serialized channel its next turn."""
+        with self._lock:
+            pending.delivered += 1
+            if failed:
+                pending.errors += 1
+            if not pending.serialized:
+                return
+            if not pending.items:
+                pending.scheduled = False
+                return
+            delay = pending.delay()
+        self._wake(pending, delay)
+
+    def _reset(self) -> None:
+        """Discard queued messages; call with the lock held."""
+        for pending in self._channels.values():
+            pending.items.clear()
+            pending.scheduled = False
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Get per-channel queue metrics.
+
+        Returns:
+            Mapping of channel to depth (pending messages), high_water
+            (largest depth seen), delivered, dropped (including messages
+            replaced by newer ones when conflating or sampling) and errors
+        """
+        with self._lock:
+            return {
+                channel: {
+                    "depth": len(pending.items),
+                    "high_water": pending.high_water,
+                    "delivered": pending.delivered,
+                    "dropped": pending.dropped,
+                    "errors": pending.errors,
+                }
+                for channel, pending in self._channels.items()
+            }
+
+
+class CallbackDispatcher(_BaseDispatcher):
+    """Runs WeexWebSocket callbacks on a pool of worker threads.
+
+    Workers start on the first message. Channels take turns one message at a
+    time, so a busy channel cannot starve the others.
+    """
+
+    def __init__(self, workers: int = 4, max_queue: int = 1000, ordered: bool = True) -> None:
+        """Initialize threaded dispatcher.
+
+        Args:
+            workers: Number of worker threads (default: 4)
+            max_queue: Pending messages per channel before the oldest are
+                dropped (default: 1000)
+            ordered: Deliver each channel's messages one at a time in arrival
+                order (default: True)
+        """
+        super().__init__(workers, max_queue, ordered)
+        self._ready: queue.SimpleQueue[Optional[_ChannelQueue]] = queue.SimpleQueue()
+        self._threads: List[threading.Thread] = []
+
+    def _ensure_started(self) -> None:
+        """Start the worker threads on first use."""
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(
+                    target=self._work, args=(self._ready,), name=f"weex-dispatch-{i}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _wake(self, pending: _ChannelQueue, delay: float) -> None:
+        """Hand a channel to a worker, via a timer when the delivery is not due yet."""
+        if delay <= 0:
+            self._ready.put(pending)
+            return
+        timer = threading.Timer(delay, self._ready.put, (pending,))
+        timer.daemon = True
+        timer.start()
+
+    def _work(self, ready: "queue.SimpleQueue[Optional[_ChannelQueue]]") -> None:
+        """Worker loop: deliver one message per turn until closed."""
+        while True:
+            pending = ready.get()
+            if pending is None:
+                return
+            item = self._take(pending)
+            if item is None:
+                continue
+            callback, message = item
+            failed = False
+            try:
+                callback(message)
+            except Exception as e:
+                failed = True
+                logger.error(f"Error in callback for channel {pending.channel}: {e}")
+            self._done(pending, failed)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop the workers and discard queued messages.
+
+        The next submitted message starts new workers, so a client can be
+        stopped and started again with the same dispatcher.
+
+        Args:
+            timeout: Maximum seconds to wait for each worker (default: no limit)
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+            # Workers and timers keep the old queue; new workers get a clean one
+            ready, self._ready = self._ready, queue.SimpleQueue()
+            self._reset()
+        for _ in threads:
+            ready.put(None)
+        current = threading.current_thread()
+        for thread in threads:
+            if thread is not current:
+                thread.join(timeout)
+
+
+class AsyncCallbackDispatcher(_BaseDispatcher):
+    """Runs AsyncWeexWebSocket callbacks on a pool of asyncio tasks.
+
+    Callbacks may be coroutine functions or plain functions. Worker tasks
+    start on the first message in the running event loop, and messages must
+    be submitted from that loop.
+    """
+
+    def __init__(self, workers: int = 4, max_queue: int = 1000, ordered: bool = True) -> None:
+        """Initialize async dispatcher.
+
+        Args:
+            workers: Number of worker tasks (default: 4)
+            max_queue: Pending messages per channel before the oldest are
+                dropped (default: 1000)
+            ordered: Deliver each channel's messages one at a time in arrival
+                order (default: True)
+        """
+        super().__init__(workers, max_queue, ordered)
+        self._ready: Optional[asyncio.Queue[_ChannelQueue]] = None
+        self._tasks: List[asyncio.Task[None]] = []
+
+    def _ensure_started(self) -> None:
+        """Start the worker tasks in the running loop on first use."""
+        if self._ready is None:
+            ready: asyncio.Queue[_ChannelQueue] = asyncio.Queue()
+            self._ready = ready
+            self._tasks = [asyncio.ensure_future(self._work(ready)) for _ in range(self.workers)]
+
+    def _wake(self, pending: _ChannelQueue, delay: float) -> None:
+        """Hand a channel to a worker, later when the delivery is not due yet."""
+        assert self._ready is not None
+        if delay <= 0:
+            self._ready.put_nowait(pending)
+        else:
+            asyncio.get_running_loop().call_later(delay, self._ready.put_nowait, pending)
+
+    async def _work(self, ready: "asyncio.Queue[_ChannelQueue]") -> None:
+        """Worker loop: deliver one message per turn until cancelled."""
+        while True:
+            pending = await ready.get()
+            item = self._take(pending)
+            if item is None:
+                continue
+            callback, message = item
+            failed = False
+            try:
+                result = callback(message)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                failed = True
+                logger.error(f"Error in callback for channel {pending.channel}: {e}")
+            self._done(pending, failed)
+
+    async def close(self) -> None:
+        """Cancel the worker tasks and discard queued messages.
+
+        The next submitted message starts new workers in the loop running
+        at that time.
+        """
+        with self._lock:
+            tasks, self._tasks = self._tasks, []
+            self._ready = None
+            self._reset()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,350 @@
+"""Concurrent historical candle downloader."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
+
+from weex_sdk.logger import get_logger
+
+logger = get_logger("downloader")
+
+# Candle interval in milliseconds per granularity
+GRANULARITY_MS: Dict[str, int] = {
+    "1m": 60_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "30m": 1_800_000,
+    "1h": 3_600_000,
+    "4h": 14_400_000,
+    "12h": 43_200_000,
+    "1d": 86_400_000,
+    "1w": 604_800_000,
+}
+
+# Candle open times are multiples of the interval plus this offset; weeks start
+# on Monday while the Unix epoch fell on a Thursday
+GRANULARITY_OFFSET_MS: Dict[str, int] = {"1w": 4 * 86_400_000}
+
+# Maximum rows returned by /capi/v2/market/historyCandles
+MAX_HISTORY_CANDLES = 100
+
+# (symbol, granularity, price_type)
+SeriesKey = Tuple[str, str, str]
+
+
+class CandleSink(Protocol):
+    """Destination for downloaded candles."""
+
+    def last_timestamp(self, symbol: str, granularity: str, price_type: str) -> Optional[int]:
+        """Get the open time of the newest stored candle, or None if there is none."""
+        ...
+
+    def write(
+        self, symbol: str, granularity: str, price_type: str, candles: List[List[str]]
+    ) -> None:
+        """Store candles sorted by open time; each is a raw API row."""
+        ...
+
+
+class MemorySink:
+    """CandleSink keeping candles in memory, keyed by series and open time."""
+
+    def __init__(self) -> None:
+        """Initialize empty sink."""
+        self.series: Dict[SeriesKey, Dict[int, List[str]]] = {}
+
+    def last_timestamp(self, symbol: str, granularity: str, price_type: str) -> Optional[int]:
+        """Get the open time of the newest stored candle."""
+        candles = self.series.get((symbol, granularity, price_type))
+        return max(candles) if candles else None
+
+    def write(
+        self, symbol: str, granularity: str, price_type: str, candles: List[List[str]]
+    ) -> None:
+        """Store candles, replacing any with the same open time."""
+        series = self.series.setdefault((symbol, granularity, price_type), {})
+        for candle in candles:
+            series[int(candle[0])] = candle
+
+    def candles(self, symbol: str, granularity: str, price_type: str = "LAST") -> List[List[str]]:
+        """Get stored candles of a series sorted by open time."""
+        series = self.series.get((symbol, granularity, price_type), {})
+        return [series[timestamp] for timestamp in sorted(series)]
+
+
+@dataclass
+class DownloadStats:
+    """Outcome of downloading one series.
+
+    Attributes:
+        requests: API requests sent
+        candles: Candles written to the sink
+        missing: Expected candles the exchange did not return after refilling
+        gaps: Missing ranges as (first, last) open times in milliseconds
+    """
+
+    requests: int = 0
+    candles: int = 0
+    missing: int = 0
+    gaps: List[Tuple[int, int]] = field(default_factory=list)
+
+
+def align_time(timestamp: int, granularity: str, round_up: bool = False) -> int:
+    """Align a timestamp to a candle open time.
+
+    Args:
+        timestamp: Time in milliseconds
+        granularity: Candle interval
+        round_up: Round to the next open time instead of the previous one
+
+    Returns:
+        Candle open time in milliseconds
+    """
+    step = GRANULARITY_MS[granularity]
+    offset = GRANULARITY_OFFSET_MS.get(granularity, 0)
+    aligned = (timestamp - offset) // step * step + offset
+    if round_up and aligned < timestamp:
+        aligned += step
+    return aligned
+
+
+def _runs(timestamps: List[int], step: int) -> List[Tuple[int, int]]:
+    """Group sorted timestamps into contiguous (first, last) runs."""
+    runs: List[Tuple[int, int]] = []
+    for timestamp in timestamps:
+        if runs and timestamp == runs[-1][1] + step:
+            runs[-1] = (runs[-1][0], timestamp)
+        else:
+            runs.append((timestamp, timestamp))
+    return runs
+
+
+class CandleDownloader:
+    """Download candle history concurrently through AsyncMarketAPI.
+
+    A time range is split into windows of at most 100 candles. Windows are
+    fetched concurrently (requests still pass through the client's rate
+    limiter) and written to the sink strictly in time order, so the sink's
+    last timestamp is always a safe point to resume from. Candles missing
+    from a window are requested again before the window is written.
+
+    Sinks that also implement ``missing_ranges(symbol, granularity,
+    price_type, start_time, end_time)`` (such as MarketStore) are asked which
+    ranges they lack, and only those are downloaded when resuming.
+    """
+
+    def __init__(
+        self,
+        market: Any,
+        sink: CandleSink,
+        concurrency: int = 8,
+        window_size: int = MAX_HISTORY_CANDLES,
+        gap_retries: int = 1,
+        write_batch: int = 1000,
+    ) -> None:
+        """Initialize downloader.
+
+        Args:
+            market: AsyncMarketAPI instance (e.g. ``async_client.market``)
+            sink: Destination for candles
+            concurrency: Maximum requests in flight across all series (default: 8)
+            window_size: Candles per request, at most 100 (default: 100)
+            gap_retries: Times a window's missing candles are requested again (default: 1)
+            write_batch: Candles collected before each sink write (default: 1000)
+        """
+        if not 1 <= window_size <= MAX_HISTORY_CANDLES:
+            raise ValueError(f"window_size must be between 1 and {MAX_HISTORY_CANDLES}")
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+
+        self.market = market
+        self.sink = sink
+        self.concurrency = concurrency
+        self.window_size = window_size
+        self.gap_retries = gap_retries
+        self.write_batch = write_batch
+
+    async def download(
+        self,
+        symbols: Sequence[str],
+        granularities: Sequence[str],
+        start_time: int,
+        end_time: Optional[int] = None,
+        price_type: str = "LAST",
+        resume: bool = True,
+    ) -> Dict[SeriesKey, DownloadStats]:
+        """Download every symbol and granularity combination concurrently.
+
+        Args:
+            symbols: Trading pairs
+            granularities: Candle intervals (1m, 5m, 15m, 30m, 1h, 4h, 12h, 1d, 1w)
+            start_time: Range start in milliseconds (inclusive)
+            end_time: Range end in milliseconds (exclusive, default: now);
+                only closed candles are downloaded
+            price_type: Price type: LAST, MARK, INDEX (default: LAST)
+            resume: Skip candles the sink already holds (default: True)
+
+        Returns:
+            Download statistics per (symbol, granularity, price_type)
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        keys = [
+            (symbol, granularity, price_type) for symbol in symbols for granularity in granularities
+        ]
+        results = await asyncio.gather(
+            *(self._download_series(key, start_time, end_time, resume, semaphore) for key in keys)
+        )
+        return dict(zip(keys, results))
+
+    async def download_series(
+        self,
+        symbol: str,
+        granularity: str,
+        start_time: int,
+        end_time: Optional[int] = None,
+        price_type: str = "LAST",
+        resume: bool = True,
+    ) -> DownloadStats:
+        """Download a single series.
+
+        Args:
+            symbol: Trading pair
+            granularity: Candle interval
+            start_time: Range start in milliseconds (inclusive)
+            end_time: Range end in milliseconds (exclusive, default: now)
+            price_type: Price type: LAST, MARK, INDEX (default: LAST)
+            resume: Skip candles the sink already holds (default: True)
+
+        Returns:
+            Download statistics
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        return await self._download_series(
+            (symbol, granularity, price_type), start_time, end_time, resume, semaphore
+        )
+
+    async def _download_series(
+        self,
+        key: SeriesKey,
+        start_time: int,
+        end_time: Optional[int],
+        resume: bool,
+        semaphore: Any,
+    ) -> DownloadStats:
+        """Fetch a series window by window and write completed windows in order."""
+        symbol, granularity, price_type = key
+        if granularity not in GRANULARITY_MS:
+            raise ValueError(f"Unknown granularity '{granularity}'")
+        step = GRANULARITY_MS[granularity]
+
+        start = align_time(start_time, granularity, round_up=True)
+        # Exclusive bound on open times; the current candle is still changing
+        end = align_time(int(time.time() * 1000), granularity)
+        if end_time is not None:
+            end = min(end, align_time(end_time, granularity, round_up=True))
+
+        ranges = [(start, end)]
+        if resume:
+            missing_ranges = getattr(self.sink, "missing_ranges", None)
+            if missing_ranges is not None:
+                ranges = missing_ranges(symbol, granularity, price_type, start, end)
+            else:
+                last = self.sink.last_timestamp(symbol, granularity, price_type)
+                if last is not None and last >= start:
+                    ranges = [(last + step, end)]
+
+        stats = DownloadStats()
+        span = self.window_size * step
+        windows = [
+            (window_start, min(window_start + span, range_end))
+            for range_start, range_end in ranges
+            for window_start in range(range_start, range_end, span)
+        ]
+        if not windows:
+            return stats
+        logger.info(
+            f"Downloading {symbol} {granularity} {price_type}: "
+            f"{sum((e - s) // step for s, e in ranges)} candles in {len(windows)} requests"
+        )
+
+        # Sliding window of tasks: results are awaited in order, later windows
+        # keep downloading meanwhile, and at most `concurrency` are buffered
+        pending: Dict[int, asyncio.Future[List[List[str]]]] = {}
+        launched = 0
+        # Completed windows are written in batches, including when a later
+        # window fails, so the sink never misses a window that was fetched
+        batch: List[List[str]] = []
+        try:
+            for index in range(len(windows)):
+                while launched < len(windows) and launched - index < self.concurrency:
+                    window_start, window_end = windows[launched]
+                    pending[launched] = asyncio.ensure_future(
+                        self._fetch_window(key, window_start, window_end, semaphore, stats)
+                    )
+                    launched += 1
+                batch.extend(await pending.pop(index))
+                if len(batch) >= self.write_batch:
+                    self.sink.write(symbol, granularity, price_type, batch)
+                    stats.candles += len(batch)
+                    batch = []
+        finally:
+            for task in pending.values():
+                task.cancel()
+            if batch:
+                self.sink.write(symbol, granularity, price_type, batch)
+                stats.candles += len(batch)
+
+        if stats.missing:
+            logger.warning(
+                f"{symbol} {granularity} {price_type}: {stats.missing} candles missing "
+                f"in {len(stats.gaps)} gaps"
+            )
+        return stats
+
+    async def _fetch_window(
+        self,
+        key: SeriesKey,
+        window_start: int,
+        window_end: int,
+        semaphore: Any,
+        stats: DownloadStats,
+    ) -> List[List[str]]:
+        """Fetch one window, refilling missing candles, and return it sorted."""
+        symbol, granularity, price_type = key
+        step = GRANULARITY_MS[granularity]
+        candles: Dict[int, List[str]] = {}
+        missing_runs = [(window_start, window_end - step)]
+
+        for attempt in range(self.gap_retries + 1):
+            for first, last in missing_runs:
+                # startTime/endTime bracket the run by 1ms, so the run is covered
+                # whether the exchange treats the bounds as inclusive or exclusive
+                async with semaphore:
+                    rows = await self.market.get_history_candles(
+                        symbol,
+                        granularity,
+                        start_time=first - 1,
+                        end_time=last + 1,
+                        limit=MAX_HISTORY_CANDLES,
+                        price_type=price_type,
+                    )
+                stats.requests += 1
+                for row in rows:
+                    timestamp = int(row[0])
+                    if window_start <= timestamp < window_end:
+                        candles[timestamp] = row
+
+            missing = [t for t in range(window_start, window_end, step) if t not in candles]
+            missing_runs = _runs(missing, step)
+            if not missing_runs:
+                break
+            if attempt < self.gap_retries:
+                logger.debug(
+                    f"{symbol} {granularity}: refilling {len(missing)} missing candles "
+                    f"from window {window_start}"
+                )
+
+        stats.missing += sum((last - first) // step + 1 for first, last in missing_runs)
+        stats.gaps.extend(missing_runs)
+        return [candles[timestamp] for timestamp in sorted(candles)]
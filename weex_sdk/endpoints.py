@@ -0,0 +1,109 @@
+"""Per-endpoint metadata used by the rate limiter, response cache and retry policy.
+
+Every REST endpoint the SDK calls is described once here. The client layers
+look up an endpoint's path to decide how to throttle, cache and retry it,
+and API methods generated from weex_sdk.api.spec take their HTTP method
+from it.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+# Rate limit groups
+GROUP_ORDER = "order"
+GROUP_CANCEL = "cancel"
+GROUP_MARKET = "market"
+GROUP_ACCOUNT = "account"
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """Metadata of one REST endpoint.
+
+    Attributes:
+        path: API endpoint path
+        method: HTTP method (GET, POST)
+        group: Rate limit group
+        weight: Tokens charged against the group per request. Market and
+            account groups use the documented IP and UID weights; order and
+            cancel groups are limited by request count, so their weight is 1
+        cache_ttl: Seconds a response may be reused, None if never cached
+        idempotent: Whether the request may be resent after a failure. None
+            leaves the decision to the request: GETs are always retried and
+            POSTs only when they carry a client order ID
+    """
+
+    path: str
+    method: str
+    group: str
+    weight: float = 1.0
+    cache_ttl: Optional[float] = None
+    idempotent: Optional[bool] = None
+
+
+def _table(*endpoints: Endpoint) -> Dict[str, Endpoint]:
+    """Index endpoints by path."""
+    return {endpoint.path: endpoint for endpoint in endpoints}
+
+
+ENDPOINTS: Dict[str, Endpoint] = _table(
+    # Market data (IP weight)
+    Endpoint("/capi/v2/market/time", "GET", GROUP_MARKET, 1),
+    Endpoint("/capi/v2/market/contracts", "GET", GROUP_MARKET, 10, cache_ttl=60.0),
+    Endpoint("/capi/v2/market/depth", "GET", GROUP_MARKET, 1),
+    Endpoint("/capi/v2/market/tickers", "GET", GROUP_MARKET, 40, cache_ttl=1.0),
+    Endpoint("/capi/v2/market/ticker", "GET", GROUP_MARKET, 1, cache_ttl=1.0),
+    Endpoint("/capi/v2/market/trades", "GET", GROUP_MARKET, 5),
+    Endpoint("/capi/v2/market/candles", "GET", GROUP_MARKET, 1),
+    Endpoint("/capi/v2/market/historyCandles", "GET", GROUP_MARKET, 5),
+    Endpoint("/capi/v2/market/index", "GET", GROUP_MARKET, 1, cache_ttl=1.0),
+    Endpoint("/capi/v2/market/open_interest", "GET", GROUP_MARKET, 2, cache_ttl=5.0),
+    Endpoint("/capi/v2/market/funding_time", "GET", GROUP_MARKET, 1, cache_ttl=10.0),
+    Endpoint("/capi/v2/market/getHistoryFundRate", "GET", GROUP_MARKET, 5, cache_ttl=60.0),
+    Endpoint("/capi/v2/market/currentFundRate", "GET", GROUP_MARKET, 1, cache_ttl=5.0),
+    # Account (UID weight); setters of absolute values are safe to resend
+    Endpoint("/capi/v2/account/getAccounts", "GET", GROUP_ACCOUNT, 5),
+    Endpoint("/capi/v2/account/getAccount", "GET", GROUP_ACCOUNT, 1),
+    Endpoint("/capi/v2/account/assets", "GET", GROUP_ACCOUNT, 10),
+    Endpoint("/capi/v2/account/bills", "POST", GROUP_ACCOUNT, 5, idempotent=True),
+    Endpoint("/capi/v2/account/settings", "GET", GROUP_ACCOUNT, 1, cache_ttl=5.0),
+    Endpoint("/capi/v2/account/leverage", "POST", GROUP_ACCOUNT, 20, idempotent=True),
+    Endpoint("/capi/v2/account/adjustMargin", "POST", GROUP_ACCOUNT, 30, idempotent=False),
+    Endpoint("/capi/v2/account/modifyAutoAppendMargin", "POST", GROUP_ACCOUNT, 30, idempotent=True),
+    Endpoint("/capi/v2/account/position/allPosition", "GET", GROUP_ACCOUNT, 15),
+    Endpoint("/capi/v2/account/position/singlePosition", "GET", GROUP_ACCOUNT, 3),
+    Endpoint(
+        "/capi/v2/account/position/changeHoldModel", "POST", GROUP_ACCOUNT, 50, idempotent=True
+    ),
+    # Order placement and cancellation (request count)
+    Endpoint("/capi/v2/order/placeOrder", "POST", GROUP_ORDER),
+    Endpoint("/capi/v2/order/batchOrders", "POST", GROUP_ORDER),
+    Endpoint("/capi/v2/order/plan_order", "POST", GROUP_ORDER),
+    Endpoint("/capi/v2/order/placeTpSlOrder", "POST", GROUP_ORDER),
+    Endpoint("/capi/v2/order/modifyTpSlOrder", "POST", GROUP_ORDER, idempotent=True),
+    Endpoint("/capi/v2/order/closePositions", "POST", GROUP_ORDER, idempotent=False),
+    Endpoint("/capi/v2/order/cancel_order", "POST", GROUP_CANCEL),
+    Endpoint("/capi/v2/order/cancel_batch_orders", "POST", GROUP_CANCEL),
+    Endpoint("/capi/v2/order/cancel_plan", "POST", GROUP_CANCEL),
+    Endpoint("/capi/v2/order/cancelAllOrders", "POST", GROUP_CANCEL),
+    # Order queries (UID weight)
+    Endpoint("/capi/v2/order/detail", "GET", GROUP_ACCOUNT, 2),
+    Endpoint("/capi/v2/order/history", "GET", GROUP_ACCOUNT, 10),
+    Endpoint("/capi/v2/order/current", "GET", GROUP_ACCOUNT, 2),
+    Endpoint("/capi/v2/order/fills", "GET", GROUP_ACCOUNT, 5),
+    Endpoint("/capi/v2/order/currentPlan", "GET", GROUP_ACCOUNT, 3),
+    Endpoint("/capi/v2/order/historyPlan", "GET", GROUP_ACCOUNT, 10),
+    Endpoint("/capi/v2/order/uploadAiLog", "POST", GROUP_ACCOUNT, 1),
+)
+
+
+def endpoint_for(path: str) -> Optional[Endpoint]:
+    """Get the metadata of an endpoint.
+
+    Args:
+        path: API endpoint path
+
+    Returns:
+        Endpoint metadata, None for paths not in ENDPOINTS
+    """
+    return ENDPOINTS.get(path)
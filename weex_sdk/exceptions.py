@@ -11,6 +11,7 @@ class WeexAPIError(Exception):
         message: str,
         code: Optional[str] = None,
         request_time: Optional[int] = None,
+        status_code: Optional[int] = None,
     ) -> None:
         """Initialize Weex API exception.
 
@@ -18,11 +19,13 @@ class WeexAPIError(Exception):
             message: Error message
             code: Error code from API response
             request_time: Request timestamp
+            status_code: HTTP status code (None if no response was received)
         """
         super().__init__(message)
         self.message = message
         self.code = code
         self.request_time = request_time
+        self.status_code = status_code
 
     def __str__(self) -> str:
         """Return string representation of exception."""
@@ -46,6 +49,7 @@ class WeexRateLimitError(WeexAPIError):
         code: Optional[str] = None,
         request_time: Optional[int] = None,
         retry_after: Optional[int] = None,
+        status_code: Optional[int] = 429,
     ) -> None:
         """Initialize rate limit error.
 
@@ -54,8 +58,9 @@ class WeexRateLimitError(WeexAPIError):
             code: Error code
             request_time: Request timestamp
             retry_after: Seconds to wait before retrying
+            status_code: HTTP status code (default: 429)
         """
-        super().__init__(message, code, request_time)
+        super().__init__(message, code, request_time, status_code)
         self.retry_after = retry_after
 
 
@@ -110,6 +115,7 @@ def raise_exception_from_response(
     code: str,
     message: str,
     request_time: Optional[int] = None,
+    status_code: Optional[int] = None,
 ) -> None:
     """Raise appropriate exception based on error code.
 
@@ -117,9 +123,12 @@ def raise_exception_from_response(
         code: Error code from API response
         message: Error message
         request_time: Request timestamp
+        status_code: HTTP status code
 
     Raises:
         WeexAPIError: Appropriate exception based on error code
     """
     exception_class = ERROR_CODE_MAP.get(code, WeexAPIError)
-    raise exception_class(message=message, code=code, request_time=request_time)
+    raise exception_class(
+        message=message, code=code, request_time=request_time, status_code=status_code
+    )
@@ -0,0 +1,250 @@
+"""Columnar NumPy frames for candle and trade data.
+
+Market endpoints return candles and trades as nested lists of strings. The
+frames here hold the same data as one NumPy array per column, parsed in a
+single vectorized pass, which takes a fraction of the memory and lets
+indicators run on whole columns at once.
+
+Requires NumPy: ``pip install "weex-sdk[frames]"``.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        'weex_sdk.frames requires NumPy; install it with: pip install "weex-sdk[frames]"'
+    ) from e
+
+from weex_sdk.models import Trade
+
+F = TypeVar("F", bound="_Frame")
+
+
+class _Frame:
+    """Fixed set of equal-length NumPy columns ordered by a time column."""
+
+    # (attribute, dtype) per column
+    COLUMNS: Tuple[Tuple[str, Any], ...] = ()
+    # Column holding the time in milliseconds
+    TIME_COLUMN = ""
+    # Column identifying a row when dropping duplicates
+    KEY_COLUMN = ""
+
+    def __init__(self, **columns: Any) -> None:
+        """Initialize frame from column arrays.
+
+        Args:
+            **columns: One array-like per column in COLUMNS
+
+        Raises:
+            ValueError: If a column is missing or lengths differ
+        """
+        length: Optional[int] = None
+        for name, dtype in self.COLUMNS:
+            if name not in columns:
+                raise ValueError(f"{type(self).__name__} missing column '{name}'")
+            array = np.asarray(columns[name], dtype=dtype)
+            if array.ndim != 1 or (length is not None and len(array) != length):
+                raise ValueError(f"{type(self).__name__} columns must be 1-D of equal length")
+            length = len(array)
+            setattr(self, name, array)
+
+    @classmethod
+    def empty(cls: Type[F]) -> F:
+        """Create a frame with no rows."""
+        return cls(**{name: np.empty(0, dtype=dtype) for name, dtype in cls.COLUMNS})
+
+    @property
+    def columns(self) -> Dict[str, Any]:
+        """Column arrays keyed by name."""
+        return {name: getattr(self, name) for name, _ in self.COLUMNS}
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the column arrays in bytes."""
+        return sum(getattr(self, name).nbytes for name, _ in self.COLUMNS)
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return len(getattr(self, self.TIME_COLUMN))
+
+    def __getitem__(self: F, index: Any) -> F:
+        """Select rows by slice, boolean mask or integer index array."""
+        if isinstance(index, (int, np.integer)):
+            index = slice(index, index + 1 or None)
+        return type(self)(**{name: getattr(self, name)[index] for name, _ in self.COLUMNS})
+
+    def __repr__(self) -> str:
+        """Summarize the frame."""
+        times = getattr(self, self.TIME_COLUMN)
+        span = f", {times[0]}..{times[-1]}" if len(times) else ""
+        return f"{type(self).__name__}(rows={len(times)}{span})"
+
+    def between(self: F, start_time: Optional[int] = None, end_time: Optional[int] = None) -> F:
+        """Select rows in a time range with a binary search.
+
+        Args:
+            start_time: Range start in milliseconds (inclusive)
+            end_time: Range end in milliseconds (exclusive)
+
+        Returns:
+            Frame sharing memory with this one
+        """
+        times = getattr(self, self.TIME_COLUMN)
+        lo = 0 if start_time is None else int(np.searchsorted(times, start_time, side="left"))
+        hi = len(times) if end_time is None else int(np.searchsorted(times, end_time, side="left"))
+        return self[lo:hi]
+
+    def sorted(self: F) -> F:
+        """Get the rows ordered by time (stable)."""
+        times = getattr(self, self.TIME_COLUMN)
+        if len(times) < 2 or bool(np.all(times[1:] >= times[:-1])):
+            return self
+        return self[np.argsort(times, kind="stable")]
+
+    @classmethod
+    def concat(cls: Type[F], frames: Iterable[F], dedupe: bool = True) -> F:
+        """Join frames into one ordered by time.
+
+        Args:
+            frames: Frames to join, e.g. successive history pages
+            dedupe: Keep only the last occurrence of each key (default: True)
+
+        Returns:
+            Combined frame
+        """
+        frames = [frame for frame in frames if len(frame)]
+        if not frames:
+            return cls.empty()
+
+        combined = cls(
+            **{
+                name: np.concatenate([getattr(frame, name) for frame in frames])
+                for name, _ in cls.COLUMNS
+            }
+        )
+        if dedupe:
+            keys = getattr(combined, cls.KEY_COLUMN)
+            # Unique over the reversed keys finds the last occurrence of each
+            _, first = np.unique(keys[::-1], return_index=True)
+            if len(first) < len(keys):
+                combined = combined[np.sort(len(keys) - 1 - first)]
+        return combined.sorted()
+
+
+class CandleFrame(_Frame):
+    """Candles as NumPy columns, ordered by open time.
+
+    Attributes:
+        timestamp: Open time in milliseconds (int64)
+        open: Opening price (float64)
+        high: Highest price (float64)
+        low: Lowest price (float64)
+        close: Closing price (float64)
+        base_volume: Volume in the base currency (float64)
+        quote_volume: Volume in the quote currency (float64)
+    """
+
+    COLUMNS = (
+        ("timestamp", np.int64),
+        ("open", np.float64),
+        ("high", np.float64),
+        ("low", np.float64),
+        ("close", np.float64),
+        ("base_volume", np.float64),
+        ("quote_volume", np.float64),
+    )
+    TIME_COLUMN = "timestamp"
+    KEY_COLUMN = "timestamp"
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[Union[str, float]]]) -> "CandleFrame":
+        """Parse candle rows as returned by the candle endpoints.
+
+        Args:
+            rows: ``[timestamp, open, high, low, close, base_volume, quote_volume]``
+                rows of strings or numbers
+
+        Returns:
+            Frame ordered by open time
+
+        Raises:
+            ValueError: If a row is malformed
+        """
+        if not len(rows):
+            return cls.empty()
+
+        # One conversion for the whole table; millisecond timestamps are far
+        # below 2**53 so they survive the float64 round trip exactly
+        table = np.array(rows, dtype=np.float64)
+        if table.ndim != 2 or table.shape[1] < len(cls.COLUMNS):
+            raise ValueError(f"Candle rows must have {len(cls.COLUMNS)} fields")
+        return cls(
+            timestamp=table[:, 0].astype(np.int64),
+            **{name: table[:, i] for i, (name, _) in enumerate(cls.COLUMNS) if i},
+        ).sorted()
+
+    def to_rows(self) -> List[List[str]]:
+        """Convert back to API-style rows of strings."""
+        return [
+            [str(row[0])] + [repr(float(value)) for value in row[1:]]
+            for row in zip(*(getattr(self, name).tolist() for name, _ in self.COLUMNS))
+        ]
+
+
+class TradeFrame(_Frame):
+    """Trades as NumPy columns, ordered by time.
+
+    Attributes:
+        ticket_id: Trade ID (object array of str)
+        time: Trade time in milliseconds (int64)
+        price: Trade price (float64)
+        size: Trade size (float64)
+        value: Trade value (float64)
+        is_buyer_maker: Whether the buyer was the maker (bool)
+    """
+
+    COLUMNS = (
+        ("ticket_id", object),
+        ("time", np.int64),
+        ("price", np.float64),
+        ("size", np.float64),
+        ("value", np.float64),
+        ("is_buyer_maker", np.bool_),
+    )
+    TIME_COLUMN = "time"
+    KEY_COLUMN = "ticket_id"
+
+    @classmethod
+    def from_records(cls, records: Sequence[Trade]) -> "TradeFrame":
+        """Parse trade records as returned by ``get_trades``.
+
+        Args:
+            records: Trade dictionaries
+
+        Returns:
+            Frame ordered by time
+        """
+        if not len(records):
+            return cls.empty()
+
+        # Gather the numeric fields into one table and convert it at once
+        table = np.array(
+            [
+                (record["time"], record["price"], record["size"], record["value"])
+                for record in records
+            ],
+            dtype=np.float64,
+        )
+        return cls(
+            ticket_id=np.array([record.get("ticketId", "") for record in records], dtype=object),
+            time=table[:, 0].astype(np.int64),
+            price=table[:, 1],
+            size=table[:, 2],
+            value=table[:, 3],
+            is_buyer_maker=np.array(
+                [bool(record.get("isBuyerMaker")) for record in records], dtype=np.bool_
+            ),
+        ).sorted()
@@ -0,0 +1,418 @@
+"""Local order book maintained from depth snapshots and incremental updates.
+
+Each side keeps its prices in a sorted list next to a price -> size map.
+Size changes on existing levels are dictionary updates, new and removed
+levels are placed with a binary search, and the best level is always the
+first list entry, so views of the top of the book never sort.
+
+Depth updates carry a ``startVersion``/``endVersion`` range. The book checks
+that each update continues from the last applied version and that the best
+bid stays below the best ask. When either check fails the book marks itself
+out of sync, buffers further updates and replays them on top of the next
+versioned snapshot.
+"""
+
+import threading
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from weex_sdk.logger import get_logger
+
+logger = get_logger("orderbook")
+
+Level = Tuple[float, float]
+# asks, bids, startVersion, endVersion, timestamp
+_Update = Tuple[Iterable[Any], Iterable[Any], Optional[int], Optional[int], Optional[int]]
+
+
+def _parse_level(entry: Any) -> Optional[Level]:
+    """Parse a ``{"price", "size"}`` dict or ``[price, size]`` pair."""
+    if isinstance(entry, dict):
+        price, size = entry.get("price"), entry.get("size")
+    elif isinstance(entry, (list, tuple)) and len(entry) >= 2:
+        price, size = entry[0], entry[1]
+    else:
+        return None
+    try:
+        return float(price), float(size)
+    except (TypeError, ValueError):
+        return None
+
+
+def _version(value: Any) -> Optional[int]:
+    """Parse a version number, None if missing or malformed."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class BookSide:
+    """Price levels of one side, best first.
+
+    Prices are stored as sort keys in ascending order: the price itself for
+    asks and the negated price for bids.
+    """
+
+    def __init__(self, descending: bool) -> None:
+        """Initialize book side.
+
+        Args:
+            descending: Whether the best price is the highest (bids)
+        """
+        self.descending = descending
+        self._keys: List[float] = []
+        self._sizes: Dict[float, float] = {}
+
+    def __len__(self) -> int:
+        """Number of price levels."""
+        return len(self._keys)
+
+    def _key(self, price: float) -> float:
+        return -price if self.descending else price
+
+    def _price(self, key: float) -> float:
+        return -key if self.descending else key
+
+    def clear(self) -> None:
+        """Remove all levels."""
+        self._keys.clear()
+        self._sizes.clear()
+
+    def set(self, price: float, size: float) -> None:
+        """Set the size at a price; a size of zero or less removes the level."""
+        exists = price in self._sizes
+        if size > 0:
+            if not exists:
+                key = self._key(price)
+                self._keys.insert(bisect_left(self._keys, key), key)
+            self._sizes[price] = size
+        elif exists:
+            del self._sizes[price]
+            del self._keys[bisect_left(self._keys, self._key(price))]
+
+    def size_at(self, price: float) -> float:
+        """Get the size at a price (0 if there is no level)."""
+        return self._sizes.get(price, 0.0)
+
+    def best(self) -> Optional[Level]:
+        """Get the best (price, size), or None if the side is empty."""
+        if not self._keys:
+            return None
+        price = self._price(self._keys[0])
+        return price, self._sizes[price]
+
+    def top(self, n: Optional[int] = None) -> List[Level]:
+        """Get up to n levels as (price, size), best first (default: all)."""
+        keys = self._keys if n is None else self._keys[:n]
+        sizes = self._sizes
+        return [(price, sizes[price]) for price in map(self._price, keys)]
+
+    def truncate(self, n: int) -> None:
+        """Keep only the n best levels."""
+        for key in self._keys[n:]:
+            del self._sizes[self._price(key)]
+        del self._keys[n:]
+
+
+class OrderBook:
+    """Order book of one symbol built from depth snapshots and updates.
+
+    Feed it WebSocket depth messages with ``apply_message`` (SNAPSHOT
+    replaces the book, CHANGED updates it) or REST snapshots from
+    ``MarketAPI.get_depth`` with ``apply_depth``. All methods are
+    thread-safe, so one thread can update the book while others read it.
+
+    ``ready`` is False until the first snapshot and whenever a version gap
+    or crossed book is detected; until the next snapshot arrives updates
+    are buffered (up to ``max_buffer``) and ``resyncs`` counts how often
+    that happened. ``WeexWebSocket.subscribe_order_book`` requests the new
+    snapshot automatically.
+
+    Example:
+        >>> book = OrderBook("cmt_btcusdt", max_levels=15)
+        >>> ws.subscribe_depth("cmt_btcusdt", 15, callback=book.apply_message)
+        >>> book.best_bid(), book.best_ask(), book.vwap("buy", 2.5)
+    """
+
+    def __init__(
+        self,
+        symbol: Optional[str] = None,
+        max_levels: Optional[int] = None,
+        max_buffer: int = 1000,
+    ) -> None:
+        """Initialize order book.
+
+        Args:
+            symbol: Trading pair; messages for other symbols are ignored
+            max_levels: Levels kept per side, e.g. the depth channel's 15 or
+                200, so levels pushed out of range do not linger (default: all)
+            max_buffer: Updates buffered while waiting for a snapshot; the
+                oldest are dropped beyond this
+        """
+        self.symbol = symbol
+        self.max_levels = max_levels
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        self.ready = False
+        # endVersion of the last applied update, if the feed provides one
+        self.version: Optional[int] = None
+        self.timestamp: Optional[int] = None
+        self.resyncs = 0
+        self._pending: Deque[_Update] = deque(maxlen=max_buffer)
+        self._lock = threading.RLock()
+
+    def _apply_levels(self, side: BookSide, levels: Iterable[Any]) -> None:
+        """Apply level updates to one side."""
+        for entry in levels or ():
+            parsed = _parse_level(entry)
+            if parsed is not None:
+                side.set(*parsed)
+
+    def _trim(self) -> None:
+        """Drop levels beyond max_levels; call with the lock held."""
+        if self.max_levels is not None:
+            self.bids.truncate(self.max_levels)
+            self.asks.truncate(self.max_levels)
+
+    def apply_snapshot(
+        self,
+        asks: Iterable[Any],
+        bids: Iterable[Any],
+        version: Optional[int] = None,
+        timestamp: Optional[int] = None,
+    ) -> bool:
+        """Replace the book.
+
+        Updates buffered while the book was out of sync are replayed on top
+        of a versioned snapshot. Updates without a version, or all of them
+        when the snapshot has none (REST snapshots), cannot be ordered
+        against it and are discarded.
+
+        Args:
+            asks: Ask levels as ``{"price", "size"}`` dicts or ``[price, size]`` pairs
+            bids: Bid levels in the same format
+            version: Book version after the snapshot
+            timestamp: Snapshot time in milliseconds
+
+        Returns:
+            Whether the book is in sync afterwards
+        """
+        with self._lock:
+            self.asks.clear()
+            self.bids.clear()
+            self._apply_levels(self.asks, asks)
+            self._apply_levels(self.bids, bids)
+            self._trim()
+            self.version = version
+            self.timestamp = timestamp
+            self.ready = True
+
+            pending = [u for u in self._pending if version is not None and u[3] is not None]
+            self._pending.clear()
+            for update in pending:
+                # Updates already covered by the snapshot are skipped
+                self._update(update)
+            return self.ready
+
+    def apply_changes(
+        self,
+        asks: Iterable[Any],
+        bids: Iterable[Any],
+        version: Optional[int] = None,
+        timestamp: Optional[int] = None,
+        start_version: Optional[int] = None,
+    ) -> bool:
+        """Apply incremental updates; a size of zero removes a level.
+
+        Updates whose version range ends at or before the book's version are
+        ignored. An update starting after the next expected version, or one
+        that leaves the book crossed, puts the book out of sync.
+
+        Args:
+            asks: Changed ask levels
+            bids: Changed bid levels
+            version: Book version after the update (endVersion)
+            timestamp: Update time in milliseconds
+            start_version: First version covered by the update (startVersion)
+
+        Returns:
+            Whether the book is in sync afterwards; False while waiting for
+            a snapshot, with the update buffered
+        """
+        with self._lock:
+            return self._update((asks, bids, start_version, version, timestamp))
+
+    def _update(self, update: _Update) -> bool:
+        """Apply or buffer one update; call with the lock held."""
+        asks, bids, start, end, timestamp = update
+        if not self.ready:
+            self._pending.append(update)
+            return False
+        if self.version is not None and end is not None:
+            if end <= self.version:
+                return True
+            if start is not None and start > self.version + 1:
+                self._out_of_sync(f"expected version {self.version + 1}, got {start}")
+                self._pending.append(update)
+                return False
+
+        self._apply_levels(self.asks, asks)
+        self._apply_levels(self.bids, bids)
+        self._trim()
+        if end is not None:
+            self.version = end
+        if timestamp is not None:
+            self.timestamp = timestamp
+
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is not None and ask is not None and bid[0] >= ask[0]:
+            self._out_of_sync(f"crossed book, bid {bid[0]} >= ask {ask[0]}")
+            return False
+        return True
+
+    def _out_of_sync(self, reason: str) -> None:
+        """Stop trusting the book until the next snapshot; call with the lock held."""
+        self.ready = False
+        self.resyncs += 1
+        logger.warning(
+            f"Order book {self.symbol or ''} out of sync ({reason}), waiting for snapshot"
+        )
+
+    def apply_depth(self, depth: Dict[str, Any]) -> bool:
+        """Replace the book with a ``MarketAPI.get_depth`` response.
+
+        REST snapshots carry no version, so the next update is accepted
+        without a continuity check and buffered updates are discarded.
+
+        Args:
+            depth: Depth response with asks, bids and timestamp
+
+        Returns:
+            Whether the book is in sync afterwards
+        """
+        timestamp = depth.get("timestamp")
+        return self.apply_snapshot(
+            depth.get("asks") or [],
+            depth.get("bids") or [],
+            timestamp=int(timestamp) if timestamp else None,
+        )
+
+    def apply_message(self, message: Dict[str, Any]) -> bool:
+        """Apply a depth channel message; usable directly as the subscribe_depth callback.
+
+        Args:
+            message: WebSocket payload message with a ``data`` list
+
+        Returns:
+            Whether the book is in sync afterwards
+        """
+        with self._lock:
+            for payload in message.get("data") or ():
+                if not isinstance(payload, dict):
+                    continue
+                if self.symbol and payload.get("symbol") not in (None, self.symbol):
+                    continue
+                asks, bids = payload.get("asks") or [], payload.get("bids") or []
+                version = _version(payload.get("endVersion"))
+                if payload.get("depthType") == "SNAPSHOT":
+                    self.apply_snapshot(asks, bids, version)
+                else:
+                    self._update((asks, bids, _version(payload.get("startVersion")), version, None))
+            return self.ready
+
+    def best_bid(self) -> Optional[Level]:
+        """Get the highest bid as (price, size)."""
+        with self._lock:
+            return self.bids.best()
+
+    def best_ask(self) -> Optional[Level]:
+        """Get the lowest ask as (price, size)."""
+        with self._lock:
+            return self.asks.best()
+
+    def top_bids(self, n: Optional[int] = None) -> List[Level]:
+        """Get up to n bids as (price, size), highest first (default: all)."""
+        with self._lock:
+            return self.bids.top(n)
+
+    def top_asks(self, n: Optional[int] = None) -> List[Level]:
+        """Get up to n asks as (price, size), lowest first (default: all)."""
+        with self._lock:
+            return self.asks.top(n)
+
+    def _touch(self) -> Tuple[Optional[Level], Optional[Level]]:
+        with self._lock:
+            return self.bids.best(), self.asks.best()
+
+    def spread(self) -> Optional[float]:
+        """Get best ask minus best bid, None if a side is empty."""
+        bid, ask = self._touch()
+        if bid is None or ask is None:
+            return None
+        return ask[0] - bid[0]
+
+    def mid_price(self) -> Optional[float]:
+        """Get the midpoint of the best bid and ask, None if a side is empty."""
+        bid, ask = self._touch()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
+
+    def microprice(self) -> Optional[float]:
+        """Get the size-weighted mid price, None if a side is empty.
+
+        The price leans towards the side with less size at the touch, where
+        the next trade is more likely to move the price.
+        """
+        bid, ask = self._touch()
+        if bid is None or ask is None:
+            return None
+        (bid_price, bid_size), (ask_price, ask_size) = bid, ask
+        return (bid_price * ask_size + ask_price * bid_size) / (bid_size + ask_size)
+
+    def is_crossed(self) -> bool:
+        """Check whether the best bid is at or above the best ask."""
+        bid, ask = self._touch()
+        return bid is not None and ask is not None and bid[0] >= ask[0]
+
+    def cumulative(self, side: str, n: Optional[int] = None) -> List[Level]:
+        """Get running totals of size from the top of one side.
+
+        Args:
+            side: "bids" or "asks"
+            n: Number of levels (default: all)
+
+        Returns:
+            (price, cumulative size) per level, best first
+        """
+        levels = self.top_bids(n) if side == "bids" else self.top_asks(n)
+        total = 0.0
+        result = []
+        for price, size in levels:
+            total += size
+            result.append((price, total))
+        return result
+
+    def vwap(self, side: str, size: float) -> Optional[float]:
+        """Get the average price of filling a market order against the book.
+
+        Args:
+            side: "buy" (walks the asks) or "sell" (walks the bids)
+            size: Order size in the base currency
+
+        Returns:
+            Volume-weighted average fill price, None if the book is too thin
+        """
+        if size <= 0:
+            raise ValueError("size must be positive")
+        levels = self.top_asks() if side == "buy" else self.top_bids()
+        remaining, cost = size, 0.0
+        for price, available in levels:
+            take = min(remaining, available)
+            cost += take * price
+            remaining -= take
+            if remaining <= 0:
+                return cost / size
+        return None
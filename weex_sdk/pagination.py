@@ -0,0 +1,207 @@
+"""Time-cursor pagination for history endpoints."""
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from weex_sdk.logger import get_logger
+
+logger = get_logger("pagination")
+
+
+@dataclass(frozen=True)
+class PageSpec:
+    """Shape of a paginated history response.
+
+    Attributes:
+        id_key: Record field identifying a record (used to drop duplicates)
+        time_keys: Record fields holding the creation time in milliseconds,
+            tried in order
+        items_key: Response field holding the records, None if the response
+            is the list itself
+        has_more_key: Response field telling whether more pages exist, None
+            to assume more pages while pages are full
+    """
+
+    id_key: str
+    time_keys: Tuple[str, ...]
+    items_key: Optional[str] = None
+    has_more_key: Optional[str] = None
+
+
+class TimeCursor:
+    """Walk a history endpoint backwards in time, newest records first.
+
+    Each page is requested with an end time equal to the oldest timestamp of
+    the previous page. The end time is inclusive, so records sharing that
+    millisecond are requested again and dropped by ID; only the IDs at the
+    current boundary are remembered, keeping memory bounded by page size.
+    """
+
+    def __init__(
+        self,
+        spec: PageSpec,
+        page_size: int,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+    ) -> None:
+        """Initialize cursor.
+
+        Args:
+            spec: Response shape
+            page_size: Records requested per page
+            start_time: Oldest creation time to return (milliseconds, inclusive)
+            end_time: Newest creation time to return (milliseconds, default: now)
+        """
+        self.spec = spec
+        self.page_size = page_size
+        self.start_time = start_time
+        self.end_time = end_time
+        self.done = False
+        self._boundary_ids: Set[Any] = set()
+
+    def _timestamp(self, record: Dict[str, Any]) -> int:
+        """Get a record's creation time in milliseconds."""
+        for key in self.spec.time_keys:
+            value = record.get(key)
+            if value is not None:
+                return int(value)
+        raise ValueError(f"Record has none of the time fields {self.spec.time_keys}")
+
+    def _items(self, response: Any) -> Tuple[List[Dict[str, Any]], Optional[bool]]:
+        """Extract records and the has-more flag from a response."""
+        if isinstance(response, list):
+            return response, None
+        if not isinstance(response, dict):
+            return [], None
+        items = response.get(self.spec.items_key) if self.spec.items_key else None
+        has_more = response.get(self.spec.has_more_key) if self.spec.has_more_key else None
+        return items or [], has_more
+
+    def consume(self, response: Any) -> List[Dict[str, Any]]:
+        """Process a page and advance the cursor.
+
+        Args:
+            response: Raw endpoint response
+
+        Returns:
+            Records not returned before, in page order
+        """
+        items, has_more = self._items(response)
+        if not items:
+            self.done = True
+            return []
+
+        timestamps = [self._timestamp(item) for item in items]
+        oldest = min(timestamps)
+        oldest_ids: Set[Any] = set()
+        records = []
+        for item, timestamp in zip(items, timestamps):
+            record_id = item.get(self.spec.id_key)
+            if timestamp == oldest:
+                oldest_ids.add(record_id)
+            if self.start_time is not None and timestamp < self.start_time:
+                continue
+            if timestamp == self.end_time and record_id in self._boundary_ids:
+                continue
+            records.append(item)
+
+        if oldest == self.end_time:
+            if not records:
+                # A full page of one millisecond: step past it rather than loop forever
+                logger.warning(
+                    f"More than {self.page_size} records at {oldest}ms; "
+                    "some records at this timestamp may be skipped"
+                )
+                oldest -= 1
+                oldest_ids = set()
+            else:
+                oldest_ids |= self._boundary_ids
+
+        self.end_time = oldest
+        self._boundary_ids = oldest_ids
+
+        if has_more is None:
+            has_more = len(items) >= self.page_size
+        if not has_more or (self.start_time is not None and oldest <= self.start_time):
+            self.done = True
+        return records
+
+
+def iter_time_pages(
+    fetch: Callable[[Optional[int]], Any],
+    cursor: TimeCursor,
+    prefetch: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """Yield records from successive pages.
+
+    Args:
+        fetch: Callable requesting one page for the given end time
+        cursor: Pagination state
+        prefetch: Request the next page in a background thread while the
+            current one is consumed
+
+    Yields:
+        Records, newest first
+    """
+    if not prefetch:
+        while not cursor.done:
+            yield from cursor.consume(fetch(cursor.end_time))
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="weex-prefetch")
+    pending: Optional[Future[Any]] = executor.submit(fetch, cursor.end_time)
+    try:
+        while pending is not None:
+            records = cursor.consume(pending.result())
+            pending = None if cursor.done else executor.submit(fetch, cursor.end_time)
+            yield from records
+    finally:
+        if pending is not None:
+            pending.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiter_time_pages(
+    fetch: Callable[[Optional[int]], Awaitable[Any]],
+    cursor: TimeCursor,
+    prefetch: bool = False,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield records from successive pages (async).
+
+    Args:
+        fetch: Coroutine function requesting one page for the given end time
+        cursor: Pagination state
+        prefetch: Request the next page in a task while the current one is consumed
+
+    Yields:
+        Records, newest first
+    """
+    if not prefetch:
+        while not cursor.done:
+            for record in cursor.consume(await fetch(cursor.end_time)):
+                yield record
+        return
+
+    pending: Optional[asyncio.Future[Any]] = asyncio.ensure_future(fetch(cursor.end_time))
+    try:
+        while pending is not None:
+            records = cursor.consume(await pending)
+            pending = None if cursor.done else asyncio.ensure_future(fetch(cursor.end_time))
+            for record in records:
+                yield record
+    finally:
+        if pending is not None:
+            pending.cancel()
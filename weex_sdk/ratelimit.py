@@ -0,0 +1,238 @@
+"""Client-side rate limiting for Weex API requests."""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from weex_sdk.endpoints import (
+    ENDPOINTS,
+    GROUP_ACCOUNT,
+    GROUP_CANCEL,
+    GROUP_MARKET,
+    GROUP_ORDER,
+    endpoint_for,
+)
+from weex_sdk.logger import get_logger
+
+logger = get_logger("ratelimit")
+
+# Default limits as (tokens per second, burst capacity), based on the API documentation:
+# IP and UID limits are 1000 weight per 10 seconds; placing and cancelling orders
+# (including trigger orders) is limited to 10 requests per second.
+DEFAULT_LIMITS: Dict[str, Tuple[float, float]] = {
+    GROUP_ORDER: (10.0, 10.0),
+    GROUP_CANCEL: (10.0, 10.0),
+    GROUP_MARKET: (100.0, 1000.0),
+    GROUP_ACCOUNT: (100.0, 1000.0),
+}
+
+# Seconds to pause a group after a 429 without a Retry-After header
+DEFAULT_RETRY_AFTER = 1.0
+
+ORDER_PATHS = frozenset(path for path, e in ENDPOINTS.items() if e.group == GROUP_ORDER)
+CANCEL_PATHS = frozenset(path for path, e in ENDPOINTS.items() if e.group == GROUP_CANCEL)
+
+
+class TokenBucket:
+    """Thread-safe token bucket usable from both sync and async code.
+
+    Callers reserve tokens under a lock and then sleep outside of it, so a
+    single bucket can be shared by threads and event loops at the same time.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update."""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Reserve tokens and return how long the caller must wait.
+
+        Args:
+            tokens: Number of tokens (request weight)
+
+        Returns:
+            Seconds to wait before sending
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until tokens are available.
+
+        Args:
+            tokens: Number of tokens (request weight)
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        """Wait asynchronously until tokens are available.
+
+        Args:
+            tokens: Number of tokens (request weight)
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the given number of seconds.
+
+        Args:
+            seconds: Pause duration
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._blocked_until = max(self._blocked_until, now + seconds)
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+
+    def set_rate(self, rate: float, capacity: Optional[float] = None) -> None:
+        """Change the refill rate and optionally the capacity.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (default: unchanged)
+        """
+        if rate <= 0 or (capacity is not None and capacity <= 0):
+            raise ValueError("rate and capacity must be positive")
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+            if capacity is not None:
+                self.capacity = capacity
+                self._tokens = min(self._tokens, capacity)
+
+
+class RateLimiter:
+    """Per endpoint-group rate limiter shared by clients and API modules.
+
+    A single instance may be passed to several ``WeexClient`` and
+    ``AsyncWeexClient`` objects that use the same API key or IP.
+    """
+
+    def __init__(self, limits: Optional[Mapping[str, Tuple[float, float]]] = None) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            limits: Mapping of group name to (tokens per second, burst capacity).
+                Groups missing from the mapping are not limited; pass ``{}``
+                to disable client-side limiting (default: DEFAULT_LIMITS)
+        """
+        if limits is None:
+            limits = DEFAULT_LIMITS
+        self.buckets: Dict[str, TokenBucket] = {
+            group: TokenBucket(rate, capacity) for group, (rate, capacity) in limits.items()
+        }
+
+    @staticmethod
+    def group_for(path: str) -> str:
+        """Get the endpoint group for an API path.
+
+        Args:
+            path: API endpoint path
+
+        Returns:
+            Group name (order, cancel, market or account)
+        """
+        endpoint = endpoint_for(path)
+        if endpoint is not None:
+            return endpoint.group
+        if path.startswith("/capi/v2/market/"):
+            return GROUP_MARKET
+        return GROUP_ACCOUNT
+
+    @staticmethod
+    def weight_for(path: str) -> float:
+        """Get the tokens a request to an API path costs in its group.
+
+        Args:
+            path: API endpoint path
+
+        Returns:
+            Request weight (1 for paths not in ENDPOINTS)
+        """
+        endpoint = endpoint_for(path)
+        return endpoint.weight if endpoint is not None else 1.0
+
+    def acquire(self, group: str, weight: float = 1.0) -> None:
+        """Block until a request in the group may be sent.
+
+        Args:
+            group: Endpoint group
+            weight: Request weight
+        """
+        bucket = self.buckets.get(group)
+        if bucket:
+            bucket.acquire(weight)
+
+    async def acquire_async(self, group: str, weight: float = 1.0) -> None:
+        """Wait asynchronously until a request in the group may be sent.
+
+        Args:
+            group: Endpoint group
+            weight: Request weight
+        """
+        bucket = self.buckets.get(group)
+        if bucket:
+            await bucket.acquire_async(weight)
+
+    def penalize(self, group: str, retry_after: Optional[float] = None) -> None:
+        """Pause a group after the server answered with 429.
+
+        Args:
+            group: Endpoint group
+            retry_after: Seconds from the Retry-After header (default: DEFAULT_RETRY_AFTER)
+        """
+        seconds = retry_after if retry_after is not None else DEFAULT_RETRY_AFTER
+        bucket = self.buckets.get(group)
+        if bucket:
+            logger.warning(f"Rate limited on '{group}' endpoints, pausing for {seconds}s")
+            bucket.pause(seconds)
+
+    def configure_from_account(self, account: Mapping[str, Any]) -> None:
+        """Seed the order group from the account's order creation limit.
+
+        Args:
+            account: ``get_accounts()`` response or its ``account`` object
+                (AccountInfo) containing ``createOrderRateLimitPerMinute``
+        """
+        info = account.get("account", account)
+        per_minute = info.get("createOrderRateLimitPerMinute") if info else None
+        if not per_minute:
+            return
+
+        rate = float(per_minute) / 60.0
+        bucket = self.buckets.get(GROUP_ORDER)
+        if bucket:
+            bucket.set_rate(min(rate, bucket.rate), min(float(per_minute), bucket.capacity))
+        else:
+            self.buckets[GROUP_ORDER] = TokenBucket(rate, float(per_minute))
+        logger.info(f"Order rate limit set from account: {per_minute}/min")
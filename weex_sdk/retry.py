@@ -0,0 +1,106 @@
+"""Retry policy for transient Weex API failures."""
+
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Type
+
+from weex_sdk.endpoints import endpoint_for
+from weex_sdk.exceptions import WeexAPIError, WeexNetworkError
+
+# Body keys that make a POST safe to resend: the exchange rejects duplicate client order IDs
+IDEMPOTENCY_KEYS: Tuple[str, ...] = ("client_oid", "clientOid", "clientOrderId")
+
+
+@dataclass
+class RetryPolicy:
+    """Retry configuration with jittered exponential backoff.
+
+    GET requests are always considered idempotent. POST requests are only
+    retried when their body carries a client order ID, so a resent order is
+    rejected by the exchange instead of being placed twice. Endpoints with an
+    ``idempotent`` flag in weex_sdk.endpoints override both rules.
+
+    Attributes:
+        max_attempts: Total attempts including the first one (1 disables retries)
+        backoff_base: Delay before the first retry in seconds
+        backoff_max: Upper bound for a single delay in seconds
+        jitter: Fraction of each delay that is randomized (0 to 1)
+        retry_statuses: HTTP status codes that are retried
+        retry_exceptions: Exception classes that are retried regardless of status
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    jitter: float = 0.5
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retry_exceptions: Tuple[Type[BaseException], ...] = (WeexNetworkError,)
+
+    @staticmethod
+    def is_idempotent(
+        method: str, data: Optional[Dict[str, Any]] = None, path: Optional[str] = None
+    ) -> bool:
+        """Check whether a request may be sent more than once.
+
+        Args:
+            method: HTTP method (GET, POST)
+            data: Request body data
+            path: API endpoint path; its ``idempotent`` flag in ENDPOINTS takes
+                precedence over the checks below
+
+        Returns:
+            True if the request is safe to retry
+        """
+        endpoint = endpoint_for(path) if path else None
+        if endpoint is not None and endpoint.idempotent is not None:
+            return endpoint.idempotent
+        if method.upper() == "GET":
+            return True
+        if not data:
+            return False
+        if any(data.get(key) for key in IDEMPOTENCY_KEYS):
+            return True
+
+        # Batch orders are idempotent when every order carries its own client ID
+        orders = data.get("orderDataList")
+        if orders:
+            return all(
+                isinstance(order, dict) and any(order.get(key) for key in IDEMPOTENCY_KEYS)
+                for order in orders
+            )
+        return False
+
+    def should_retry(self, error: BaseException, attempt: int, idempotent: bool) -> bool:
+        """Decide whether a failed attempt should be retried.
+
+        Args:
+            error: Exception raised by the attempt
+            attempt: Number of the failed attempt (starting at 1)
+            idempotent: Whether the request is safe to resend
+
+        Returns:
+            True if the request should be retried
+        """
+        if not idempotent or attempt >= self.max_attempts:
+            return False
+        if isinstance(error, self.retry_exceptions):
+            return True
+        status_code = getattr(error, "status_code", None)
+        return isinstance(error, WeexAPIError) and status_code in self.retry_statuses
+
+    def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Get the delay before the next attempt.
+
+        Args:
+            attempt: Number of the failed attempt (starting at 1)
+            retry_after: Server-provided delay in seconds, used as a lower bound
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.backoff_base * (2 ** (attempt - 1)), self.backoff_max)
+        if self.jitter:
+            delay -= delay * self.jitter * random.random()
+        if retry_after is not None:
+            delay = max(delay, float(retry_after))
+        return delay
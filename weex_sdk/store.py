@@ -0,0 +1,394 @@
+"""On-disk columnar store for candles and trades.
+
+Each series is a directory holding one file per column of fixed-width
+little-endian values. Rows are kept sorted by time, so the time column
+doubles as the index: range queries binary-search the memory-mapped time
+column and return frames whose arrays point straight into the page cache.
+
+Layout under the store root::
+
+    candles/<symbol>/<granularity>/<price_type>/<column>.bin
+    trades/<symbol>/<column>.bin
+
+Requires NumPy: ``pip install "weex-sdk[frames]"``.
+"""
+
+import os
+import shutil
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+import numpy as np
+
+from weex_sdk.downloader import GRANULARITY_MS, align_time
+from weex_sdk.frames import CandleFrame, TradeFrame, _Frame
+from weex_sdk.logger import get_logger
+
+logger = get_logger("store")
+
+# On-disk dtype per column
+CANDLE_LAYOUT: Tuple[Tuple[str, str], ...] = (
+    ("timestamp", "<i8"),
+    ("open", "<f8"),
+    ("high", "<f8"),
+    ("low", "<f8"),
+    ("close", "<f8"),
+    ("base_volume", "<f8"),
+    ("quote_volume", "<f8"),
+)
+# Trade IDs are UUIDs, stored as fixed-width ASCII
+TICKET_ID_BYTES = 36
+TRADE_LAYOUT: Tuple[Tuple[str, str], ...] = (
+    ("ticket_id", f"S{TICKET_ID_BYTES}"),
+    ("time", "<i8"),
+    ("price", "<f8"),
+    ("size", "<f8"),
+    ("value", "<f8"),
+    ("is_buyer_maker", "|b1"),
+)
+
+
+class _ColumnSeries:
+    """One series stored as a directory of column files sorted by time."""
+
+    def __init__(
+        self,
+        directory: str,
+        frame_cls: Type[_Frame],
+        layout: Tuple[Tuple[str, str], ...],
+    ) -> None:
+        """Initialize series, recovering from an interrupted rewrite.
+
+        Args:
+            directory: Series directory
+            frame_cls: Frame type read and written
+            layout: (column, on-disk dtype) pairs matching the frame columns
+        """
+        self.directory = directory
+        self.frame_cls = frame_cls
+        self.layout = [(name, np.dtype(dtype)) for name, dtype in layout]
+        self.time_column = frame_cls.TIME_COLUMN
+        self.key_column = frame_cls.KEY_COLUMN
+
+        staged = directory + ".new"
+        if not os.path.isdir(directory) and os.path.isdir(staged):
+            os.replace(staged, directory)
+        shutil.rmtree(staged, ignore_errors=True)
+        shutil.rmtree(directory + ".old", ignore_errors=True)
+
+    def _path(self, name: str, directory: Optional[str] = None) -> str:
+        """Get the file holding a column."""
+        return os.path.join(directory or self.directory, f"{name}.bin")
+
+    def __len__(self) -> int:
+        """Number of complete rows.
+
+        Columns are appended one after another, so after a crash some files
+        may hold extra trailing values; only rows present in every column count.
+        """
+        length: Optional[int] = None
+        for name, dtype in self.layout:
+            try:
+                rows = os.path.getsize(self._path(name)) // dtype.itemsize
+            except FileNotFoundError:
+                return 0
+            length = rows if length is None else min(length, rows)
+        return length or 0
+
+    def _column(self, name: str, dtype: Any, length: int) -> Any:
+        """Memory-map the first ``length`` values of a column read-only."""
+        if not length:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(self._path(name), dtype=dtype, mode="r", shape=(length,))
+
+    def times(self) -> Any:
+        """Memory-mapped time column."""
+        dtype = dict(self.layout)[self.time_column]
+        return self._column(self.time_column, dtype, len(self))
+
+    def read(self, start_time: Optional[int] = None, end_time: Optional[int] = None) -> Any:
+        """Read rows in a time range.
+
+        Args:
+            start_time: Range start in milliseconds (inclusive)
+            end_time: Range end in milliseconds (exclusive)
+
+        Returns:
+            Frame whose numeric columns are views of the memory-mapped files
+        """
+        length = len(self)
+        times = self._column(self.time_column, dict(self.layout)[self.time_column], length)
+        lo = 0 if start_time is None else int(np.searchsorted(times, start_time, side="left"))
+        hi = length if end_time is None else int(np.searchsorted(times, end_time, side="left"))
+
+        columns = {}
+        for name, dtype in self.layout:
+            column = self._column(name, dtype, length)[lo:hi]
+            if dtype.kind == "S":
+                column = np.char.decode(column, "ascii")
+            columns[name] = column
+        return self.frame_cls(**columns)
+
+    def _encode(self, frame: _Frame) -> Dict[str, Any]:
+        """Convert frame columns to their on-disk dtypes."""
+        columns = {}
+        for name, dtype in self.layout:
+            column = np.asarray(getattr(frame, name))
+            if dtype.kind == "S":
+                column = column.astype(str)
+                if len(column) and int(np.char.str_len(column).max()) > dtype.itemsize:
+                    raise ValueError(f"'{name}' values longer than {dtype.itemsize} characters")
+            columns[name] = column.astype(dtype)
+        return columns
+
+    def _append(self, frame: _Frame, length: int) -> None:
+        """Append rows that sort after every stored row."""
+        os.makedirs(self.directory, exist_ok=True)
+        columns = self._encode(frame)
+        # Time column last: a torn append never exposes rows without times
+        names = [name for name, _ in self.layout if name != self.time_column]
+        for name in names + [self.time_column]:
+            with open(self._path(name), "ab") as f:
+                # Drop values past the last complete row left by a torn append
+                f.truncate(length * dict(self.layout)[name].itemsize)
+                f.write(columns[name].tobytes())
+
+    def _rewrite(self, frame: _Frame) -> None:
+        """Replace the series with ``frame``, swapping directories at the end."""
+        staged = self.directory + ".new"
+        old = self.directory + ".old"
+        shutil.rmtree(staged, ignore_errors=True)
+        os.makedirs(staged)
+        for name, column in self._encode(frame).items():
+            column.tofile(self._path(name, staged))
+
+        if os.path.isdir(self.directory):
+            os.replace(self.directory, old)
+        os.replace(staged, self.directory)
+        shutil.rmtree(old, ignore_errors=True)
+
+    def write(self, frame: _Frame) -> int:
+        """Store rows, skipping rows already stored.
+
+        Rows newer than the stored data are appended. Rows that fall inside
+        the stored range and are not stored yet force a rewrite of the series.
+
+        Args:
+            frame: Rows to store
+
+        Returns:
+            Number of rows added
+        """
+        frame = frame.sorted()
+        length = len(self)
+        if not len(frame):
+            return 0
+        if not length:
+            self._append(frame, 0)
+            return len(frame)
+
+        times = self.times()
+        last = times[-1]
+        new_times = getattr(frame, self.time_column)
+        split = int(np.searchsorted(new_times, last, side="right"))
+
+        if split:
+            # Rows at or before the last stored time may already be stored
+            head = frame[:split]
+            stored = self.read(int(new_times[0]), None)
+            known = np.isin(getattr(head, self.key_column), getattr(stored, self.key_column))
+            head = head[~known]
+            if len(head) and int(getattr(head, self.time_column)[0]) < last:
+                # Stored rows win, matching what a reader has already seen
+                merged = self.frame_cls.concat([head, frame[split:], self.read()])
+                self._rewrite(merged)
+                logger.debug(f"Rewrote {self.directory} to insert {len(head)} rows")
+                return len(head) + len(frame) - split
+            frame = self.frame_cls.concat([head, frame[split:]], dedupe=False)
+
+        if len(frame):
+            self._append(frame, length)
+        return len(frame)
+
+
+def _component(value: str) -> str:
+    """Validate a path component taken from a symbol or series name."""
+    if not value or value in (".", "..") or "/" in value or os.sep in value:
+        raise ValueError(f"Invalid series name component '{value}'")
+    return value
+
+
+class MarketStore:
+    """Local store of candles and trades backed by memory-mapped column files.
+
+    Implements the CandleSink interface, including ``missing_ranges``, so a
+    CandleDownloader writing into it only requests candles not stored yet.
+    A store is safe to share between threads of one process: reads take the
+    writers' lock while they open the column files, so they never run into a
+    rewrite swapping the series directory. Frames already returned keep the
+    files they were read from. Concurrent writers in different processes are
+    not supported.
+    """
+
+    def __init__(self, root: Union[str, "os.PathLike[str]"]) -> None:
+        """Initialize store.
+
+        Args:
+            root: Directory holding the store (created on first write)
+        """
+        self.root = os.path.expanduser(os.fspath(root))
+        self._series: Dict[Tuple[str, ...], _ColumnSeries] = {}
+        self._lock = threading.Lock()
+
+    def _candle_series(self, symbol: str, granularity: str, price_type: str) -> _ColumnSeries:
+        """Get the series of one symbol, granularity and price type."""
+        key = ("candles", symbol, granularity, price_type)
+        series = self._series.get(key)
+        if series is None:
+            directory = os.path.join(self.root, *map(_component, key))
+            series = self._series.setdefault(
+                key, _ColumnSeries(directory, CandleFrame, CANDLE_LAYOUT)
+            )
+        return series
+
+    def _trade_series(self, symbol: str) -> _ColumnSeries:
+        """Get the trade series of one symbol."""
+        key = ("trades", symbol)
+        series = self._series.get(key)
+        if series is None:
+            directory = os.path.join(self.root, *map(_component, key))
+            series = self._series.setdefault(
+                key, _ColumnSeries(directory, TradeFrame, TRADE_LAYOUT)
+            )
+        return series
+
+    def candles(
+        self,
+        symbol: str,
+        granularity: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        price_type: str = "LAST",
+    ) -> CandleFrame:
+        """Read stored candles by open time.
+
+        Args:
+            symbol: Trading pair
+            granularity: Candle interval
+            start_time: Range start in milliseconds (inclusive)
+            end_time: Range end in milliseconds (exclusive)
+            price_type: Price type: LAST, MARK, INDEX (default: LAST)
+
+        Returns:
+            CandleFrame backed by the memory-mapped files
+        """
+        series = self._candle_series(symbol, granularity, price_type)
+        with self._lock:
+            return series.read(start_time, end_time)
+
+    def write_candles(
+        self, symbol: str, granularity: str, frame: CandleFrame, price_type: str = "LAST"
+    ) -> int:
+        """Store candles; candles already stored are kept as they are.
+
+        Args:
+            symbol: Trading pair
+            granularity: Candle interval
+            frame: Candles to store
+            price_type: Price type: LAST, MARK, INDEX (default: LAST)
+
+        Returns:
+            Number of candles added
+        """
+        series = self._candle_series(symbol, granularity, price_type)
+        with self._lock:
+            return series.write(frame)
+
+    def trades(
+        self, symbol: str, start_time: Optional[int] = None, end_time: Optional[int] = None
+    ) -> TradeFrame:
+        """Read stored trades by time.
+
+        Args:
+            symbol: Trading pair
+            start_time: Range start in milliseconds (inclusive)
+            end_time: Range end in milliseconds (exclusive)
+
+        Returns:
+            TradeFrame backed by the memory-mapped files (trade IDs are decoded copies)
+        """
+        series = self._trade_series(symbol)
+        with self._lock:
+            return series.read(start_time, end_time)
+
+    def write_trades(self, symbol: str, frame: TradeFrame) -> int:
+        """Store trades; trades already stored (same ID) are skipped.
+
+        Args:
+            symbol: Trading pair
+            frame: Trades to store, e.g. from ``get_trades_frame``
+
+        Returns:
+            Number of trades added
+        """
+        series = self._trade_series(symbol)
+        with self._lock:
+            return series.write(frame)
+
+    # CandleSink interface
+
+    def last_timestamp(self, symbol: str, granularity: str, price_type: str) -> Optional[int]:
+        """Get the open time of the newest stored candle."""
+        series = self._candle_series(symbol, granularity, price_type)
+        with self._lock:
+            times = series.times()
+        return int(times[-1]) if len(times) else None
+
+    def write(
+        self, symbol: str, granularity: str, price_type: str, candles: List[List[str]]
+    ) -> None:
+        """Store raw API candle rows."""
+        self.write_candles(symbol, granularity, CandleFrame.from_rows(candles), price_type)
+
+    def missing_ranges(
+        self,
+        symbol: str,
+        granularity: str,
+        price_type: str,
+        start_time: int,
+        end_time: int,
+    ) -> List[Tuple[int, int]]:
+        """Find open times in a range with no stored candle.
+
+        Args:
+            symbol: Trading pair
+            granularity: Candle interval
+            price_type: Price type: LAST, MARK, INDEX
+            start_time: Range start in milliseconds (inclusive)
+            end_time: Range end in milliseconds (exclusive)
+
+        Returns:
+            Missing ranges as (first open time, exclusive end) pairs, ascending
+        """
+        step = GRANULARITY_MS[granularity]
+        start = align_time(start_time, granularity, round_up=True)
+        end = align_time(end_time, granularity, round_up=True)
+        if start >= end:
+            return []
+
+        series = self._candle_series(symbol, granularity, price_type)
+        with self._lock:
+            times = series.times()
+        lo, hi = np.searchsorted(times, [start, end], side="left")
+        times = np.asarray(times[lo:hi])
+        if not len(times):
+            return [(start, end)]
+
+        ranges = []
+        if times[0] > start:
+            ranges.append((start, int(times[0])))
+        for i in np.nonzero(np.diff(times) > step)[0]:
+            ranges.append((int(times[i]) + step, int(times[i + 1])))
+        if times[-1] + step < end:
+            ranges.append((int(times[-1]) + step, end))
+        return ranges
@@ -2,6 +2,7 @@
 
 import time
 from typing import Any, Dict, List, Optional, Union
+from urllib.parse import quote
 
 
 def get_current_timestamp_ms() -> int:
@@ -13,9 +14,13 @@ def get_current_timestamp_ms() -> int:
     return int(time.time() * 1000)
 
 
-def build_query_string(params: Dict[str, Any]) -> str:
+def build_query_string(params: Optional[Dict[str, Any]]) -> str:
     """Build query string from parameters dictionary.
 
+    This is the canonical encoding used for both signing and sending GET
+    requests: None values are skipped, list values are repeated per item and
+    keys/values are percent-encoded, preserving insertion order.
+
     Args:
         params: Dictionary of query parameters
 
@@ -25,21 +30,17 @@ def build_query_string(params: Dict[str, Any]) -> str:
     if not params:
         return ""
 
-    # Filter out None values
-    filtered_params = {k: v for k, v in params.items() if v is not None}
-
-    if not filtered_params:
-        return ""
-
-    # Build query string
     query_parts = []
-    for key, value in filtered_params.items():
+    for key, value in params.items():
+        if value is None:
+            continue
+        encoded_key = quote(str(key), safe="")
         if isinstance(value, list):
             # Handle list values
             for item in value:
-                query_parts.append(f"{key}={item}")
+                query_parts.append(f"{encoded_key}={quote(str(item), safe='')}")
         else:
-            query_parts.append(f"{key}={value}")
+            query_parts.append(f"{encoded_key}={quote(str(value), safe='')}")
 
     return "&".join(query_parts)
 
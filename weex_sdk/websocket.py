@@ -1,18 +1,26 @@
-"""WebSocket client for Weex API (sync and async)."""
+"""WebSocket client for Weex API.
 
-import asyncio
-import json
+AsyncWeexWebSocket lives in weex_sdk.async_websocket so that the threaded
+client does not import websockets; it is still importable from here.
+"""
+
+import importlib
+import math
+import random
 import threading
 import time
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Set, Union
 
 import websocket
-import websockets
 
 from weex_sdk.auth import RequestHeaders
-from weex_sdk.exceptions import WeexNetworkError, WeexWebSocketError
+from weex_sdk.codec import JsonCodec, get_codec
+from weex_sdk.dispatch import CallbackDispatcher, Delivery
+from weex_sdk.exceptions import WeexWebSocketError
 from weex_sdk.logger import get_logger
 from weex_sdk.models import WebSocketSubscription
+from weex_sdk.orderbook import OrderBook
+from weex_sdk.retry import RetryPolicy
 
 logger = get_logger("websocket")
 
@@ -20,6 +28,56 @@ logger = get_logger("websocket")
 WS_PUBLIC_URL = "wss://ws-contract.weex.com/v2/ws/public"
 WS_PRIVATE_URL = "wss://ws-contract.weex.com/v2/ws/private"
 
+# Spacing of snapshot requests for an out-of-sync order book. Each request
+# costs two of the 240 subscription operations allowed per hour, so the
+# delay grows to two minutes while the book stays out of sync.
+SNAPSHOT_RETRY = RetryPolicy(backoff_base=2.0, backoff_max=120.0, jitter=0.2)
+
+# Names moved to weex_sdk.async_websocket, resolved on first access
+_ASYNC_NAMES = ("AsyncWeexWebSocket",)
+
+
+class _SnapshotRequests:
+    """Backoff state of the snapshot requests for one order book.
+
+    Consecutive requests are spaced by the policy's growing delay; the count
+    starts over once no request was needed for backoff_max seconds.
+    """
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self.policy = policy
+        self.attempt = 0
+        self.due = -math.inf
+        self.running = False
+        self._lock = threading.Lock()
+
+    def start(self) -> bool:
+        """Claim the request loop; False if one is already running."""
+        with self._lock:
+            if self.running:
+                return False
+            self.running = True
+            return True
+
+    def finish(self, book: OrderBook) -> bool:
+        """Release the request loop if the book is back in sync."""
+        with self._lock:
+            if book.ready:
+                self.running = False
+            return not self.running
+
+    def delay(self) -> float:
+        """Seconds until the next request may be sent."""
+        now = time.monotonic()
+        if now - self.due > self.policy.backoff_max:
+            self.attempt = 0
+        return max(0.0, self.due - now)
+
+    def sent(self) -> None:
+        """Record a request."""
+        self.attempt += 1
+        self.due = time.monotonic() + self.policy.get_delay(self.attempt)
+
 
 class WeexWebSocket:
     """Synchronous WebSocket client for Weex API."""
@@ -33,6 +91,10 @@ class WeexWebSocket:
         reconnect_attempts: int = 10,
         reconnect_delay: int = 1,
         max_reconnect_delay: int = 60,
+        json_codec: Union[None, str, JsonCodec] = None,
+        timestamp_provider: Optional[Callable[[], str]] = None,
+        reconnect_jitter: float = 0.5,
+        dispatcher: Union[None, bool, CallbackDispatcher] = None,
     ) -> None:
         """Initialize WebSocket client.
 
@@ -44,6 +106,15 @@ class WeexWebSocket:
             reconnect_attempts: Maximum reconnection attempts (default: 10)
             reconnect_delay: Initial reconnection delay in seconds (default: 1)
             max_reconnect_delay: Maximum reconnection delay in seconds (default: 60)
+            json_codec: JSON codec instance or backend name (orjson, ujson, json)
+                (default: fastest installed backend)
+            timestamp_provider: Callable returning the current time in milliseconds
+                for signing, e.g. ClockSync.timestamp (default: local clock)
+            reconnect_jitter: Fraction of each reconnection delay that is
+                randomized, so many clients do not reconnect in lockstep (default: 0.5)
+            dispatcher: Runs callbacks on worker threads instead of the receive
+                thread; True for a default CallbackDispatcher (default: callbacks
+                run inline)
         """
         self.api_key = api_key
         self.secret_key = secret_key
@@ -52,6 +123,9 @@ class WeexWebSocket:
         self.reconnect_attempts = reconnect_attempts
         self.reconnect_delay = reconnect_delay
         self.max_reconnect_delay = max_reconnect_delay
+        self.reconnect_jitter = reconnect_jitter
+        self.codec = get_codec(json_codec)
+        self.timestamp_provider = timestamp_provider
 
         self.ws: Optional[websocket.WebSocketApp] = None
         self.subscriptions: Dict[str, WebSocketSubscription] = {}
@@ -59,6 +133,16 @@ class WeexWebSocket:
         self.connected = False
         self.should_reconnect = True
         self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._connected_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._owns_dispatcher = dispatcher is True
+        self.dispatcher: Optional[CallbackDispatcher] = (
+            CallbackDispatcher() if dispatcher is True else dispatcher or None
+        )
+        # Channels routed through a dispatcher created by set_delivery; None
+        # when the caller supplied the dispatcher, which then runs every channel
+        self._dispatched: Optional[Set[str]] = None
 
         if is_private and (not api_key or not secret_key or not passphrase):
             raise ValueError("API credentials required for private channels")
@@ -84,10 +168,11 @@ class WeexWebSocket:
             api_key=self.api_key or "",
             secret_key=self.secret_key or "",
             passphrase=self.passphrase or "",
+            timestamp_provider=self.timestamp_provider,
         )
         return headers_builder.get_websocket_headers()
 
-    def _on_message(self, ws: websocket.WebSocketApp, message: str) -> None:
+    def _on_message(self, ws: websocket.WebSocketApp, message: Union[str, bytes]) -> None:
         """Handle incoming WebSocket messages.
 
         Args:
@@ -95,7 +180,7 @@ class WeexWebSocket:
             message: Received message
         """
         try:
-            data = json.loads(message)
+            data = self.codec.loads(message)
             event = data.get("event")
 
             # Handle ping/pong
@@ -113,12 +198,17 @@ class WeexWebSocket:
                 channel = data.get("channel")
                 if channel and channel in self.subscriptions:
                     subscription = self.subscriptions[channel]
+                    if self.dispatcher is not None and self._dispatches(channel):
+                        # After close() a late message must not restart the workers
+                        if not self._stopped.is_set():
+                            self.dispatcher.submit(channel, subscription.callback, data)
+                        return
                     try:
                         subscription.callback(data)
                     except Exception as e:
                         logger.error(f"Error in callback for channel {channel}: {e}")
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"Failed to parse WebSocket message: {e}")
         except Exception as e:
             logger.error(f"Error handling WebSocket message: {e}")
@@ -133,7 +223,7 @@ class WeexWebSocket:
             "event": "pong",
             "time": message.get("time"),
         }
-        self.send(json.dumps(pong))
+        self.send(self.codec.dumps_text(pong))
         logger.debug("Sent pong response")
 
     def _on_error(self, ws: websocket.WebSocketApp, error: Exception) -> None:
@@ -145,6 +235,7 @@ class WeexWebSocket:
         """
         logger.error(f"WebSocket error: {error}")
         self.connected = False
+        self._connected_event.clear()
 
     def _on_close(self, ws: websocket.WebSocketApp, close_status_code: int, close_msg: str) -> None:
         """Handle WebSocket close.
@@ -156,10 +247,7 @@ class WeexWebSocket:
         """
         logger.info(f"WebSocket closed: {close_status_code} - {close_msg}")
         self.connected = False
-
-        # Attempt reconnection if enabled
-        if self.should_reconnect and self.current_reconnect_attempts < self.reconnect_attempts:
-            self._reconnect()
+        self._connected_event.clear()
 
     def _on_open(self, ws: websocket.WebSocketApp) -> None:
         """Handle WebSocket open.
@@ -173,26 +261,64 @@ class WeexWebSocket:
 
         # Resubscribe to all channels
         self._resubscribe()
+        self._connected_event.set()
 
-    def _reconnect(self) -> None:
-        """Attempt to reconnect with exponential backoff."""
-        if self.current_reconnect_attempts >= self.reconnect_attempts:
-            logger.error("Max reconnection attempts reached")
-            return
+    def _reconnect_delay(self, attempt: int) -> float:
+        """Get the jittered exponential backoff before a reconnection attempt.
 
-        self.current_reconnect_attempts += 1
-        delay = min(
-            self.reconnect_delay * (2 ** (self.current_reconnect_attempts - 1)),
-            self.max_reconnect_delay,
-        )
+        Args:
+            attempt: Number of the reconnection attempt (starting at 1)
 
-        logger.info(f"Reconnecting in {delay} seconds (attempt {self.current_reconnect_attempts})")
-        time.sleep(delay)
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.reconnect_delay * (2 ** (attempt - 1)), self.max_reconnect_delay)
+        if self.reconnect_jitter:
+            delay -= delay * self.reconnect_jitter * random.random()
+        return delay
 
-        try:
-            self.connect()
-        except Exception as e:
-            logger.error(f"Reconnection failed: {e}")
+    def _run(self) -> None:
+        """Connect and reconnect until closed or out of reconnection attempts.
+
+        Each connection runs to completion before the next one starts, so
+        reconnecting never nests calls. Every connection builds fresh headers,
+        which re-signs private logins, and resubscribes when it opens.
+        """
+        while not self._stopped.is_set():
+            with self._lock:
+                # close() holds the lock while stopping, so no new socket starts after it
+                if self._stopped.is_set():
+                    break
+                url = self._get_url()
+                logger.info(f"Connecting to WebSocket: {url}")
+                self.ws = websocket.WebSocketApp(
+                    url,
+                    header=self._get_headers() or None,
+                    on_message=self._on_message,
+                    on_error=self._on_error,
+                    on_close=self._on_close,
+                    on_open=self._on_open,
+                )
+            try:
+                self.ws.run_forever()
+            except Exception as e:
+                logger.error(f"WebSocket connection failed: {e}")
+            self.connected = False
+            self._connected_event.clear()
+
+            if self._stopped.is_set() or not self.should_reconnect:
+                break
+            if self.current_reconnect_attempts >= self.reconnect_attempts:
+                logger.error("Max reconnection attempts reached")
+                break
+
+            self.current_reconnect_attempts += 1
+            delay = self._reconnect_delay(self.current_reconnect_attempts)
+            logger.info(
+                f"Reconnecting in {delay:.2f} seconds (attempt {self.current_reconnect_attempts})"
+            )
+            # Returns early when close() is called during the wait
+            self._stopped.wait(delay)
 
     def _resubscribe(self) -> None:
         """Resubscribe to all previously subscribed channels."""
@@ -200,7 +326,8 @@ class WeexWebSocket:
             return
 
         logger.info(f"Resubscribing to {len(self.subscriptions)} channels")
-        for channel, subscription in self.subscriptions.items():
+        # Copy: callers may register channels from other threads meanwhile
+        for channel, subscription in list(self.subscriptions.items()):
             try:
                 self._send_subscribe(channel, subscription.params)
             except Exception as e:
@@ -213,6 +340,11 @@ class WeexWebSocket:
             channel: Channel name
             params: Optional subscription parameters
         """
+        if not self.connected and channel in self.subscriptions:
+            # Registered subscriptions are sent when the connection opens
+            logger.debug(f"Deferring subscription to {channel} until connected")
+            return
+
         message = {
             "event": "subscribe",
             "channel": channel,
@@ -220,7 +352,7 @@ class WeexWebSocket:
         if params:
             message.update(params)
 
-        self.send(json.dumps(message))
+        self.send(self.codec.dumps_text(message))
 
     def _send_unsubscribe(self, channel: str) -> None:
         """Send unsubscription message.
@@ -232,26 +364,56 @@ class WeexWebSocket:
             "event": "unsubscribe",
             "channel": channel,
         }
-        self.send(json.dumps(message))
+        self.send(self.codec.dumps_text(message))
 
     def connect(self) -> None:
-        """Connect to WebSocket server."""
-        url = self._get_url()
-        headers = self._get_headers()
-
-        logger.info(f"Connecting to WebSocket: {url}")
-
-        self.ws = websocket.WebSocketApp(
-            url,
-            header=headers if headers else None,
-            on_message=self._on_message,
-            on_error=self._on_error,
-            on_close=self._on_close,
-            on_open=self._on_open,
-        )
+        """Connect to WebSocket server and block until the connection is closed.
+
+        Reconnects automatically; use start() to run the connection on a
+        background thread instead.
+        """
+        self._stopped.clear()
+        self.should_reconnect = True
+        self._run()
+
+    def start(self) -> None:
+        """Run the connection on a background thread and return immediately.
+
+        Reconnects with jittered exponential backoff until stop() is called
+        or reconnection attempts are exhausted.
+
+        Raises:
+            WeexWebSocketError: If already running
+        """
+        if self._thread is not None and self._thread.is_alive():
+            raise WeexWebSocketError("WebSocket already running")
+        self._stopped.clear()
+        self.should_reconnect = True
+        self._thread = threading.Thread(target=self._run, name="weex-websocket", daemon=True)
+        self._thread.start()
+
+    def wait_connected(self, timeout: Optional[float] = None) -> bool:
+        """Block until the connection is open and subscriptions were sent.
+
+        Args:
+            timeout: Maximum seconds to wait (default: no limit)
 
-        # Run in a separate thread
-        self.ws.run_forever()
+        Returns:
+            True if connected, False on timeout
+        """
+        return self._connected_event.wait(timeout)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Close the connection and wait for the background thread to exit.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread and each
+                dispatcher worker (default: no limit)
+        """
+        self.close(timeout)
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
 
     def send(self, message: str) -> None:
         """Send message through WebSocket.
@@ -271,14 +433,52 @@ class WeexWebSocket:
             logger.error(f"Failed to send message: {e}")
             raise WeexWebSocketError(f"Failed to send message: {str(e)}") from e
 
-    def subscribe_ticker(self, symbol: str, callback: Callable[[Dict[str, Any]], None]) -> None:
+    def _dispatches(self, channel: str) -> bool:
+        """Check whether a channel's callback runs on the dispatcher."""
+        return self._dispatched is None or channel in self._dispatched
+
+    def set_delivery(self, channel: str, delivery: Union[str, Delivery]) -> None:
+        """Set how messages of a channel reach its callback.
+
+        Policies other than "all" skip messages when the callback falls
+        behind, so they run callbacks through the dispatcher. If the client
+        has none, a default CallbackDispatcher is created that only runs
+        the channels given such a policy; all other callbacks stay inline.
+
+        Args:
+            channel: Channel name
+            delivery: "all", "conflate" or Delivery.sample(interval)
+        """
+        policy = Delivery.parse(delivery)
+        if self.dispatcher is None:
+            if policy.mode == "all":
+                return
+            self.dispatcher = CallbackDispatcher()
+            self._owns_dispatcher = True
+            self._dispatched = set()
+        if self._dispatched is not None:
+            if policy.mode == "all":
+                self._dispatched.discard(channel)
+            else:
+                self._dispatched.add(channel)
+        self.dispatcher.configure(channel, delivery=policy)
+
+    def subscribe_ticker(
+        self,
+        symbol: str,
+        callback: Callable[[Dict[str, Any]], None],
+        delivery: Union[str, Delivery] = "all",
+    ) -> None:
         """Subscribe to ticker channel.
 
         Args:
             symbol: Trading pair symbol
             callback: Callback function for ticker updates
+            delivery: "all" (default), "conflate" (only the newest update not
+                yet handled) or Delivery.sample(interval); see set_delivery
         """
         channel = f"ticker.{symbol}"
+        self.set_delivery(channel, delivery)
         self.subscriptions[channel] = WebSocketSubscription(
             channel=channel,
             callback=callback,
@@ -313,22 +513,95 @@ class WeexWebSocket:
         symbol: str,
         limit: int = 15,
         callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        delivery: Union[str, Delivery] = "all",
     ) -> None:
         """Subscribe to depth channel.
 
+        Conflated or sampled delivery skips incremental updates, so only use
+        it when the callback does not rebuild the book from them.
+
         Args:
             symbol: Trading pair symbol
             limit: Depth limit (15 or 200)
             callback: Callback function for depth updates
+            delivery: "all" (default), "conflate" (only the newest update not
+                yet handled) or Delivery.sample(interval); see set_delivery
         """
         channel = f"depth.{symbol}.{limit}"
         if callback:
+            self.set_delivery(channel, delivery)
             self.subscriptions[channel] = WebSocketSubscription(
                 channel=channel,
                 callback=callback,
             )
         self._send_subscribe(channel)
 
+    def subscribe_order_book(
+        self,
+        symbol: str,
+        limit: int = 15,
+        callback: Optional[Callable[[OrderBook], None]] = None,
+        book: Optional[OrderBook] = None,
+        snapshot_retry: RetryPolicy = SNAPSHOT_RETRY,
+    ) -> OrderBook:
+        """Maintain a local order book from the depth channel.
+
+        Every depth message is applied to the book. When the book detects a
+        version gap or a crossed book, the channel is resubscribed so the
+        server pushes a new snapshot; updates received meanwhile are
+        buffered and replayed on top of it. Until the snapshot arrives the
+        request is repeated with backoff, in case it was dropped or
+        rate limited.
+
+        Args:
+            symbol: Trading pair symbol
+            limit: Depth limit (15 or 200)
+            callback: Called with the book after each message that leaves it in sync
+            book: Book to update (default: a new OrderBook keeping limit levels)
+            snapshot_retry: Backoff between snapshot requests (default: SNAPSHOT_RETRY)
+
+        Returns:
+            The order book being maintained
+        """
+        channel = f"depth.{symbol}.{limit}"
+        if book is None:
+            book = OrderBook(symbol, max_levels=limit)
+        snapshots = _SnapshotRequests(snapshot_retry)
+
+        def on_depth(message: Dict[str, Any]) -> None:
+            resyncs = book.resyncs
+            in_sync = book.apply_message(message)
+            if book.resyncs != resyncs and snapshots.start():
+                threading.Thread(
+                    target=self._request_snapshots,
+                    args=(channel, book, snapshots),
+                    name=f"weex-snapshot-{channel}",
+                    daemon=True,
+                ).start()
+            elif in_sync and callback:
+                callback(book)
+
+        self.subscribe_depth(symbol, limit, callback=on_depth)
+        return book
+
+    def _request_snapshots(
+        self, channel: str, book: OrderBook, snapshots: _SnapshotRequests
+    ) -> None:
+        """Resubscribe a depth channel until its book is back in sync."""
+        try:
+            while not self._stopped.wait(snapshots.delay()):
+                if snapshots.finish(book) or channel not in self.subscriptions:
+                    return
+                try:
+                    self.resubscribe(channel)
+                except WeexWebSocketError as e:
+                    # The snapshot also arrives with the resubscription after reconnecting
+                    logger.warning(f"Could not request a snapshot for {channel}: {e}")
+                snapshots.sent()
+                logger.info(f"Requested snapshot {snapshots.attempt} for {channel}")
+        finally:
+            snapshots.running = False
+
     def subscribe_trades(
         self,
         symbol: str,
@@ -434,248 +707,40 @@ class WeexWebSocket:
             self._send_unsubscribe(channel)
             del self.subscriptions[channel]
 
-    def close(self) -> None:
-        """Close WebSocket connection."""
-        self.should_reconnect = False
-        if self.ws:
-            self.ws.close()
-        self.connected = False
+    def resubscribe(self, channel: str) -> None:
+        """Unsubscribe and subscribe again, e.g. to get a new depth snapshot.
 
+        Args:
+            channel: Channel name
 
-class AsyncWeexWebSocket:
-    """Asynchronous WebSocket client for Weex API."""
+        Raises:
+            WeexWebSocketError: If not connected
+        """
+        subscription = self.subscriptions.get(channel)
+        logger.info(f"Resubscribing to {channel}")
+        self._send_unsubscribe(channel)
+        self._send_subscribe(channel, subscription.params if subscription else None)
 
-    def __init__(
-        self,
-        api_key: Optional[str] = None,
-        secret_key: Optional[str] = None,
-        passphrase: Optional[str] = None,
-        is_private: bool = False,
-        reconnect_attempts: int = 10,
-        reconnect_delay: int = 1,
-        max_reconnect_delay: int = 60,
-    ) -> None:
-        """Initialize async WebSocket client.
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Close WebSocket connection, stop reconnecting and close an owned dispatcher.
 
         Args:
-            api_key: API key (required for private channels)
-            secret_key: Secret key (required for private channels)
-            passphrase: API passphrase (required for private channels)
-            is_private: Whether to use private channel
-            reconnect_attempts: Maximum reconnection attempts
-            reconnect_delay: Initial reconnection delay in seconds
-            max_reconnect_delay: Maximum reconnection delay in seconds
+            timeout: Maximum seconds to wait for each dispatcher worker
+                (default: no limit)
         """
-        self.api_key = api_key
-        self.secret_key = secret_key
-        self.passphrase = passphrase
-        self.is_private = is_private
-        self.reconnect_attempts = reconnect_attempts
-        self.reconnect_delay = reconnect_delay
-        self.max_reconnect_delay = max_reconnect_delay
-
-        self.ws: Optional[websockets.WebSocketClientProtocol] = None
-        self.subscriptions: Dict[str, WebSocketSubscription] = {}
-        self.current_reconnect_attempts = 0
+        with self._lock:
+            self.should_reconnect = False
+            self._stopped.set()
+            if self.ws:
+                self.ws.close()
         self.connected = False
-        self.should_reconnect = True
-        self._receive_task: Optional[asyncio.Task] = None
+        self._connected_event.clear()
+        if self._owns_dispatcher and self.dispatcher is not None:
+            self.dispatcher.close(timeout)
 
-        if is_private and (not api_key or not secret_key or not passphrase):
-            raise ValueError("API credentials required for private channels")
 
-    def _get_url(self) -> str:
-        """Get WebSocket URL."""
-        return WS_PRIVATE_URL if self.is_private else WS_PUBLIC_URL
-
-    def _get_headers(self) -> Optional[Dict[str, str]]:
-        """Get WebSocket headers."""
-        if not self.is_private:
-            return {"User-Agent": "weex-sdk-python"}
-
-        headers_builder = RequestHeaders(
-            api_key=self.api_key or "",
-            secret_key=self.secret_key or "",
-            passphrase=self.passphrase or "",
-        )
-        return headers_builder.get_websocket_headers()
-
-    async def _handle_message(self, message: str) -> None:
-        """Handle incoming WebSocket messages."""
-        try:
-            data = json.loads(message)
-            event = data.get("event")
-
-            if event == "ping":
-                await self._handle_ping(data)
-                return
-
-            if event == "subscribe" or event == "unsubscribe":
-                logger.info(f"Subscription event: {event}, channel: {data.get('channel')}")
-                return
-
-            if event == "payload":
-                channel = data.get("channel")
-                if channel and channel in self.subscriptions:
-                    subscription = self.subscriptions[channel]
-                    try:
-                        if asyncio.iscoroutinefunction(subscription.callback):
-                            await subscription.callback(data)
-                        else:
-                            subscription.callback(data)
-                    except Exception as e:
-                        logger.error(f"Error in callback for channel {channel}: {e}")
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse WebSocket message: {e}")
-        except Exception as e:
-            logger.error(f"Error handling WebSocket message: {e}")
-
-    async def _handle_ping(self, message: Dict[str, Any]) -> None:
-        """Handle ping and send pong."""
-        pong = {
-            "event": "pong",
-            "time": message.get("time"),
-        }
-        await self.send(json.dumps(pong))
-        logger.debug("Sent pong response")
-
-    async def _receive_loop(self) -> None:
-        """Receive messages loop."""
-        try:
-            while self.connected and self.ws:
-                try:
-                    message = await asyncio.wait_for(self.ws.recv(), timeout=30.0)
-                    await self._handle_message(message)
-                except asyncio.TimeoutError:
-                    # Send ping to keep connection alive
-                    ping = {"event": "ping", "time": str(int(time.time() * 1000))}
-                    await self.send(json.dumps(ping))
-                except websockets.exceptions.ConnectionClosed:
-                    break
-        except Exception as e:
-            logger.error(f"Receive loop error: {e}")
-        finally:
-            self.connected = False
-
-    async def _reconnect(self) -> None:
-        """Attempt reconnection with exponential backoff."""
-        if self.current_reconnect_attempts >= self.reconnect_attempts:
-            logger.error("Max reconnection attempts reached")
-            return
-
-        self.current_reconnect_attempts += 1
-        delay = min(
-            self.reconnect_delay * (2 ** (self.current_reconnect_attempts - 1)),
-            self.max_reconnect_delay,
-        )
-
-        logger.info(f"Reconnecting in {delay} seconds (attempt {self.current_reconnect_attempts})")
-        await asyncio.sleep(delay)
-
-        try:
-            await self.connect()
-        except Exception as e:
-            logger.error(f"Reconnection failed: {e}")
-
-    async def _resubscribe(self) -> None:
-        """Resubscribe to all channels."""
-        if not self.subscriptions:
-            return
-
-        logger.info(f"Resubscribing to {len(self.subscriptions)} channels")
-        for channel, subscription in self.subscriptions.items():
-            try:
-                await self._send_subscribe(channel, subscription.params)
-            except Exception as e:
-                logger.error(f"Failed to resubscribe to {channel}: {e}")
-
-    async def _send_subscribe(self, channel: str, params: Optional[Dict[str, Any]] = None) -> None:
-        """Send subscription message."""
-        message = {
-            "event": "subscribe",
-            "channel": channel,
-        }
-        if params:
-            message.update(params)
-        await self.send(json.dumps(message))
-
-    async def connect(self) -> None:
-        """Connect to WebSocket server."""
-        url = self._get_url()
-        headers = self._get_headers()
-
-        logger.info(f"Connecting to WebSocket: {url}")
-
-        try:
-            self.ws = await websockets.connect(
-                url,
-                extra_headers=headers if headers else None,
-            )
-            self.connected = True
-            self.current_reconnect_attempts = 0
-
-            # Start receive loop
-            self._receive_task = asyncio.create_task(self._receive_loop())
-
-            # Resubscribe
-            await self._resubscribe()
-
-        except Exception as e:
-            logger.error(f"WebSocket connection failed: {e}")
-            self.connected = False
-            if self.should_reconnect:
-                await self._reconnect()
-            raise WeexNetworkError(f"WebSocket connection failed: {str(e)}") from e
-
-    async def send(self, message: str) -> None:
-        """Send message through WebSocket."""
-        if not self.ws or not self.connected:
-            raise WeexWebSocketError("WebSocket not connected")
-
-        try:
-            await self.ws.send(message)
-        except Exception as e:
-            logger.error(f"Failed to send message: {e}")
-            raise WeexWebSocketError(f"Failed to send message: {str(e)}") from e
-
-    async def subscribe_ticker(
-        self, symbol: str, callback: Callable[[Dict[str, Any]], None]
-    ) -> None:
-        """Subscribe to ticker channel."""
-        channel = f"ticker.{symbol}"
-        self.subscriptions[channel] = WebSocketSubscription(channel=channel, callback=callback)
-        await self._send_subscribe(channel)
-
-    async def subscribe_account(self, callback: Callable[[Dict[str, Any]], None]) -> None:
-        """Subscribe to account channel (private)."""
-        if not self.is_private:
-            raise ValueError("Account channel requires private WebSocket connection")
-        channel = "account"
-        self.subscriptions[channel] = WebSocketSubscription(channel=channel, callback=callback)
-        await self._send_subscribe(channel)
-
-    async def subscribe_position(self, callback: Callable[[Dict[str, Any]], None]) -> None:
-        """Subscribe to position channel (private)."""
-        if not self.is_private:
-            raise ValueError("Position channel requires private WebSocket connection")
-        channel = "position"
-        self.subscriptions[channel] = WebSocketSubscription(channel=channel, callback=callback)
-        await self._send_subscribe(channel)
-
-    async def subscribe_order(self, callback: Callable[[Dict[str, Any]], None]) -> None:
-        """Subscribe to order channel (private)."""
-        if not self.is_private:
-            raise ValueError("Order channel requires private WebSocket connection")
-        channel = "orders"
-        self.subscriptions[channel] = WebSocketSubscription(channel=channel, callback=callback)
-        await self._send_subscribe(channel)
-
-    async def close(self) -> None:
-        """Close WebSocket connection."""
-        self.should_reconnect = False
-        self.connected = False
-        if self._receive_task:
-            self._receive_task.cancel()
-        if self.ws:
-            await self.ws.close()
+def __getattr__(name: str) -> Any:
+    """Import the websockets-based client on first access."""
+    if name in _ASYNC_NAMES:
+        return getattr(importlib.import_module("weex_sdk.async_websocket"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")